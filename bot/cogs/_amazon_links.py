@@ -1,11 +1,10 @@
 # Before: https://www.amazon.com/dp/B0042TVKZY/
 # After: https://www.amazon.com/dp/B0042TVKZY/?tag=darthminos0f-20
-import inspect
 import os
 import re
 import traceback
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.messaging import Messaging
 from bot.tacobot import TacoBot
@@ -15,7 +14,7 @@ from discord.ext import commands
 class AmazonLinkCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "amazon_links")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -28,7 +27,7 @@ class AmazonLinkCog(TacobotCog):
     @commands.Cog.listener()
     async def on_message(self, message):
         guild_id = 0
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # if in a DM, ignore
             if message.guild is None:
@@ -1,7 +1,6 @@
 # This cog will message the user if they leave the discord and ask them
 # the reason for leaving.
 
-import inspect
 import os
 import traceback
 
@@ -16,7 +15,7 @@ from discord.ext import commands
 class LeaveSurveyCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "leave_survey")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -38,7 +37,7 @@ class LeaveSurveyCog(TacobotCog):
         await self.ask_survey(ctx.author)
 
     async def ask_survey(self, member):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = member.guild.id
         try:
             try:
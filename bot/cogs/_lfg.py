@@ -1,9 +1,8 @@
-import inspect
 import os
 
 import discord
 from bot import tacobot  # pylint: disable=relative-beyond-top-level
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from discord.ext import commands
 
@@ -11,7 +10,7 @@ from discord.ext import commands
 class LookingForGamersCog(TacobotCog):
     def __init__(self, bot: tacobot.TacoBot) -> None:
         super().__init__(bot, "lfg")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
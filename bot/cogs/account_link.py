@@ -1,4 +1,3 @@
-import inspect
 import os
 import traceback
 import typing
@@ -8,6 +7,7 @@ from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums.system_actions import SystemActions
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.mongodb.twitch import TwitchDatabase
 from bot.tacobot import TacoBot
@@ -20,7 +20,7 @@ class AccountLink(TacobotCog):
 
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "account_link")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -37,14 +37,15 @@ class AccountLink(TacobotCog):
     @app_commands.guild_only()
     @app_commands.describe(code="The code you received to verify your Twitch account.")
     async def verify(self, interaction: discord.Interaction, code: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if interaction.guild:
             guild_id = interaction.guild.id
         else:
             return
         try:
-            result = self.twitch_db.link_twitch_to_discord_from_code(interaction.user.id, code)
-            self.tracking_db.track_system_action(
+            result = await executor.run(self.twitch_db.link_twitch_to_discord_from_code, interaction.user.id, code)
+            await executor.run(
+                self.tracking_db.track_system_action,
                 guild_id=guild_id,
                 action=SystemActions.LINK_TWITCH_TO_DISCORD,
                 data={"user_id": str(interaction.user.id), "code": code},
@@ -58,7 +59,8 @@ class AccountLink(TacobotCog):
                 await interaction.response.send_message(
                     content=self.settings.get_string(guild_id, key="account_link_unknown_code_message"), ephemeral=True
                 )
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=interaction.channel.id if interaction.channel else None,
                 userId=interaction.user.id,
@@ -74,14 +76,14 @@ class AccountLink(TacobotCog):
     )
     @app_commands.guild_only()
     async def request(self, interaction: discord.Interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if interaction.guild:
             guild_id = interaction.guild.id
         else:
             return
         try:
             code = utils.get_random_string(length=6)
-            result = self.twitch_db.set_twitch_discord_link_code(interaction.user.id, code)
+            result = await executor.run(self.twitch_db.set_twitch_discord_link_code, interaction.user.id, code)
             if result:
                 await interaction.response.send_message(
                     content=self.settings.get_string(guild_id, key="account_link_notice_message", code=code),
@@ -91,7 +93,8 @@ class AccountLink(TacobotCog):
                 await interaction.response.send_message(
                     content=self.settings.get_string(guild_id, key="account_link_save_error_message"), ephemeral=True
                 )
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=interaction.channel.id if interaction.channel else None,
                 userId=interaction.user.id,
@@ -105,7 +108,7 @@ class AccountLink(TacobotCog):
     @commands.command()
     @commands.guild_only()
     async def link(self, ctx, *, code: typing.Union[str, None] = None):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
@@ -114,8 +117,9 @@ class AccountLink(TacobotCog):
 
             if code:
                 try:
-                    result = self.twitch_db.link_twitch_to_discord_from_code(ctx.author.id, code)
-                    self.tracking_db.track_system_action(
+                    result = await executor.run(self.twitch_db.link_twitch_to_discord_from_code, ctx.author.id, code)
+                    await executor.run(
+                        self.tracking_db.track_system_action,
                         guild_id=guild_id,
                         action=SystemActions.LINK_TWITCH_TO_DISCORD,
                         data={"user_id": str(ctx.author.id), "code": code},
@@ -154,7 +158,7 @@ class AccountLink(TacobotCog):
                     # generate code
                     code = utils.get_random_string(length=6)
                     # save code to db
-                    result = self.twitch_db.set_twitch_discord_link_code(ctx.author.id, code)
+                    result = await executor.run(self.twitch_db.set_twitch_discord_link_code, ctx.author.id, code)
                     notice_message = self.settings.get_string(guild_id, "account_link_notice_message", code=code)
                     if result:
                         try:
@@ -178,7 +182,8 @@ class AccountLink(TacobotCog):
                     self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
                     await self.messaging.notify_of_error(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -38,7 +38,6 @@ handles the upsert behavior keyed on guild, channel & message IDs.
 """
 
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -48,8 +47,10 @@ import pytz
 from bot import tacobot  # pylint: disable=no-name-in-module
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
 from bot.lib.messaging import Messaging
 from bot.lib.models.AnnouncementEntry import AnnouncementEntry
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.announcements import AnnouncementsDatabase
 from discord.ext import commands
 
@@ -80,7 +81,7 @@ class AnnouncementsCog(TacobotCog):
             The running bot instance used for event dispatch and settings access.
         """
         super().__init__(bot, "announcements")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -88,6 +89,7 @@ class AnnouncementsCog(TacobotCog):
         self.messaging = Messaging(bot)
 
         self.announcements_db = AnnouncementsDatabase()
+        self.message_interest = MessageInterest(bots=True)
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
@@ -106,7 +108,7 @@ class AnnouncementsCog(TacobotCog):
             The guild that just became available (can be None in rare cases
             from upstream library edge conditions; safely ignored).
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if guild is None:
                 return
@@ -134,21 +136,25 @@ class AnnouncementsCog(TacobotCog):
             # update the last_import time in the settings
             date = datetime.datetime.now(pytz.UTC)
             timestamp = utils.to_timestamp(date)
-            self.settings.settings_db.set_setting(guild.id, self.SETTINGS_SECTION, 'last_import', timestamp)
+            await executor.run(
+                self.settings.settings_db.set_setting, guild.id, self.SETTINGS_SECTION, 'last_import', timestamp
+            )
 
         except Exception as e:
             self.log.error(guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    async def on_message(self, ctx: MessageContext) -> None:
         """Track a newly created guild message if it matches channel filters.
 
+        Called by the bot's message pipeline for messages in guilds, including
+        messages from bots and webhooks (announcements are often posted by them).
+
         Parameters
         ----------
-        message : discord.Message
-            The created message event payload.
+        ctx : MessageContext
+            The per-message context built by the pipeline.
         """
-        await self._track_announcement(message)
+        await self._track_announcement(ctx.message)
 
     @commands.Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
@@ -224,7 +230,7 @@ class AnnouncementsCog(TacobotCog):
         deleted : bool, optional
             Whether the message has been deleted (soft delete). Defaults to False.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if not message.guild:
                 return
@@ -240,7 +246,9 @@ class AnnouncementsCog(TacobotCog):
             deleted_at: typing.Optional[int] = (
                 int(utils.to_timestamp(datetime.datetime.now(pytz.UTC))) if deleted else None
             )
-            self.announcements_db.track_announcement(AnnouncementEntry.from_message(message, deleted_at=deleted_at))
+            await executor.run(
+                self.announcements_db.track_announcement, AnnouncementEntry.from_message(message, deleted_at=deleted_at)
+            )
 
         except Exception as e:
             self.log.error(
@@ -1,45 +1,39 @@
-import inspect
 import json
 import os
 import traceback
 
 import discord
+from bot.lib import utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tacos import TacosDatabase
 from bot.tacobot import TacoBot
-from discord.ext import commands
 from openai import OpenAI
 
 
 class Assistant(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "assistant")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self.tacos_db = TacosDatabase()
+        # other bots may mention the assistant; only the bot's own messages are ignored
+        self.message_interest = MessageInterest(bots=True, predicate=self._is_mentioned)
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
-    @commands.Cog.listener()
-    @commands.guild_only()
-    async def on_message(self, message):
-        _method = inspect.stack()[0][3]
-        guild_id = 0
-        if message.guild:
-            guild_id = message.guild.id
-        else:
-            return
+    def _is_mentioned(self, ctx: MessageContext) -> bool:
+        if not self.bot.user or ctx.message.author == self.bot.user:
+            return False
+        return ctx.message.content.startswith(self.bot.user.mention)
 
-        if message.author == self.bot.user:
-            return
+    async def on_message(self, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        message = ctx.message
+        guild_id = ctx.guild_id
         try:
-            if not self.bot or not self.bot.user:
-                return
-
-            if not message.content.startswith(self.bot.user.mention):
-                return
-
             cog_settings = self.get_cog_settings(guild_id)
             if not cog_settings.get("enabled", False):
                 return
@@ -54,7 +48,7 @@ class Assistant(TacobotCog):
             channels = json.dumps(await self._get_channels(guild_id))
             self.log.debug(guild_id, f"{self._module}.{self._class}.{_method}", f"Channels: {channels}")
             user_prompt = message.content.replace(self.bot.user.mention, "").strip()
-            user_json = self._get_user_json(guild_id, message.author)
+            user_json = await self._get_user_json(guild_id, message.author)
             openai = OpenAI()
             airesponse = openai.chat.completions.create(
                 model="gpt-3.5-turbo",
@@ -74,18 +68,18 @@ class Assistant(TacobotCog):
         except Exception as ex:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", f"{str(ex)}", traceback.format_exc())
 
-    def _get_user_json(self, guildId: int, user: discord.Member) -> str:
-        _method = inspect.stack()[0][3]
+    async def _get_user_json(self, guildId: int, user: discord.Member) -> str:
+        _method = utils.get_method_name()
         try:
             # get_tacos_count(self, guildId: int, userId: int)
-            taco_count = self.tacos_db.get_tacos_count(guildId=guildId, userId=user.id)
+            taco_count = await executor.run(self.tacos_db.get_tacos_count, guildId=guildId, userId=user.id)
             return json.dumps({"name": user.mention, "id": user.id, "mention": user.mention, "taco_count": taco_count})
         except Exception as ex:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", f"{str(ex)}", traceback.format_exc())
             return ""
 
     async def _get_message_content_for_prompt(self, guildId: int, channelId: int, messageId: int) -> str:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild = await self.bot.fetch_guild(guildId)
             channel = await guild.fetch_channel(channelId)
@@ -98,7 +92,7 @@ class Assistant(TacobotCog):
             return ""
 
     async def _get_channels(self, guildId: int) -> list[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             channels = []
             for g in [x for x in self.bot.guilds if x.id == guildId]:
@@ -1,23 +1,23 @@
-import asyncio
 import datetime
-import inspect
 import os
 import traceback
 import typing
-from random import random, randrange
+from random import random
 
 import discord
 import pytz
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.birthdays import BirthdaysDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
 from discord import app_commands
 from discord.ext import commands
-from discord.ext.commands import Context
+
+JOB_NAME = "birthday"
 
 
 class Birthday(TacobotCog):
@@ -25,7 +25,7 @@ class Birthday(TacobotCog):
 
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "birthday")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -40,7 +40,7 @@ class Birthday(TacobotCog):
     @app_commands.guild_only()
     @group.command(name="add", description="Add your birthday")
     async def birthday_add_app(self, interaction: discord.Interaction, month: int, day: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = 0
             if interaction.guild:
@@ -49,8 +49,8 @@ class Birthday(TacobotCog):
                 return
 
             user = interaction.user
-            user_bday_set = self.birthdays_db.get_user_birthday(guild_id, user.id)
-            self.birthdays_db.add_user_birthday(guild_id, user.id, month, day)
+            user_bday_set = await executor.run(self.birthdays_db.get_user_birthday, guild_id, user.id)
+            await executor.run(self.birthdays_db.add_user_birthday, guild_id, user.id, month, day)
 
             if not user_bday_set:
                 taco_settings = self.get_tacos_settings(guild_id)
@@ -72,7 +72,8 @@ class Birthday(TacobotCog):
                 ephemeral=True,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=interaction.channel.id if interaction.channel else None,
                 userId=user.id,
@@ -86,7 +87,7 @@ class Birthday(TacobotCog):
     @commands.group(name="birthday", aliases=["bday"])
     @commands.guild_only()
     async def birthday(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.invoked_subcommand is not None:
             return
 
@@ -143,8 +144,8 @@ class Birthday(TacobotCog):
                     timeout=60,
                 )
 
-            user_bday_set = self.birthdays_db.get_user_birthday(guild_id, ctx.author.id)
-            self.birthdays_db.add_user_birthday(guild_id, ctx.author.id, month, day)
+            user_bday_set = await executor.run(self.birthdays_db.get_user_birthday, guild_id, ctx.author.id)
+            await executor.run(self.birthdays_db.add_user_birthday, guild_id, ctx.author.id, month, day)
 
             if not user_bday_set:
                 taco_settings = self.get_tacos_settings(guild_id)
@@ -171,7 +172,8 @@ class Birthday(TacobotCog):
                 delete_after=10,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -186,16 +188,18 @@ class Birthday(TacobotCog):
     @birthday.command(name="check")
     @commands.guild_only()
     async def check_birthday(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
                 guild_id = ctx.guild.id
                 await ctx.message.delete()
 
-            await self._birthday_event_process(ctx)
+            # runs today's job now unless it already ran; the next scheduled run then skips today
+            await self.bot.scheduler.run_now(JOB_NAME, guild_id)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -205,294 +209,144 @@ class Birthday(TacobotCog):
             )
         except Exception as e:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
-            self.birthdays_db.untrack_birthday_check(guild_id)
             await self.messaging.notify_of_error(ctx)
 
-    def was_checked_today(self, guildId: int):
-        _method = inspect.stack()[0][3]
-        try:
-            return self.birthdays_db.birthday_was_checked_today(guildId)
-        except Exception as e:
-            self.log.error(guildId, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
-            return False
+    async def cog_load(self) -> None:
+        await super().cog_load()
+        self.bot.scheduler.add_daily(JOB_NAME, self._birthday_job, self.get_schedule)
 
-    def get_todays_birthdays(self, guildId: int):
-        _method = inspect.stack()[0][3]
-        try:
-            date = datetime.datetime.now(tz=pytz.timezone(self.settings.timezone))
-            month = date.month
-            day = date.day
-            birthdays = self.birthdays_db.get_user_birthdays(guildId, month, day)
-            return birthdays
-        except Exception as e:
-            self.log.error(guildId, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
-            return []
+    async def cog_unload(self) -> None:
+        await super().cog_unload()
+        self.bot.scheduler.remove(JOB_NAME)
 
-    async def add_user_to_birthday_role(self, ctx: Context, birthdays: typing.List[typing.Dict]):
-        _method = inspect.stack()[0][3]
-        # add all birthday users to the birthday role from settings.role
-        birthday_role = None
-        guild_id = 0
+    def get_schedule(self, guildId: int) -> typing.Optional[typing.Tuple[datetime.time, datetime.tzinfo]]:
+        """When the birthday job runs for the guild: ``check_time`` (``HH:MM``, default midnight) in
+        ``timezone`` (default the bot's ``TZ``) from the birthday settings. ``None`` while disabled."""
         try:
-            if ctx.guild:
-                guild_id = ctx.guild.id
-            else:
-                return
-
-            await asyncio.sleep(0.5)
-            if self.was_checked_today(guild_id):
-                return
-
-            cog_settings = self.get_cog_settings(guild_id)
-            if not cog_settings:
-                self.log.warn(
-                    guild_id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"No birthday settings found for guild {guild_id}",
-                )
-                return
-
-            # is it enabled?
-            if not cog_settings.get("enabled", False):
-                self.log.debug(
-                    guild_id, f"{self._module}.{self._class}.{_method}", f"birthday is disabled for guild {guild_id}"
-                )
-                return
-
-            # get the role from the settings
-            role_id = cog_settings.get("role", None)
-            if not role_id:
-                self.log.warn(
-                    guild_id, f"{self._module}.{self._class}.{_method}", f"No birthday role found for guild {guild_id}"
-                )
-                return
-            birthday_role = discord.utils.get(ctx.guild.roles, id=int(role_id))
-            if not birthday_role:
-                self.log.warn(
-                    guild_id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"Could not find birthday role {role_id} for guild {guild_id}",
-                )
-                return
-
-            for birthday in birthdays:
-                user_id = int(birthday["user_id"])
-                member = await self.discord_helper.get_or_fetch_member(guildId=guild_id, userId=user_id)
-                if member:
-                    await self.discord_helper.add_remove_roles(
-                        user=member, check_list=[], add_list=[birthday_role.id], remove_list=[], allow_everyone=True
-                    )
-        except Exception as e:
-            self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
+            cog_settings = self.get_cog_settings(guildId)
+        except Exception:
+            # no birthday settings for the guild or globally
+            return None
+        if not cog_settings.get("enabled", False):
+            return None
+        check_time = datetime.time.fromisoformat(str(cog_settings.get("check_time", "00:00")))
+        tz = pytz.timezone(cog_settings.get("timezone", self.settings.timezone))
+        return check_time, tz
+
+    async def get_todays_birthdays(self, guildId: int, day: datetime.date) -> typing.List[typing.Dict]:
+        birthdays = await executor.run(self.birthdays_db.get_user_birthdays, guildId, day.month, day.day)
+        if birthdays is None:
+            # the DAO logged the error; raise so the scheduler retries instead of completing the day
+            raise Exception(f"Unable to read birthdays for {day.isoformat()}")
+        return birthdays
+
+    def _get_birthday_role(self, guild: discord.Guild) -> typing.Optional[discord.Role]:
+        _method = utils.get_method_name()
+        guild_id = guild.id
+        cog_settings = self.get_cog_settings(guild_id)
+        role_id = cog_settings.get("role", None)
+        if not role_id:
+            self.log.warn(
+                guild_id, f"{self._module}.{self._class}.{_method}", f"No birthday role found for guild {guild_id}"
+            )
+            return None
+        birthday_role = discord.utils.get(guild.roles, id=int(role_id))
+        if not birthday_role:
+            self.log.warn(
+                guild_id,
+                f"{self._module}.{self._class}.{_method}",
+                f"Could not find birthday role {role_id} for guild {guild_id}",
+            )
+        return birthday_role
 
-    async def clear_birthday_role(self, ctx: Context):
-        # clear all users from the birthday role from settings.role
-        _method = inspect.stack()[0][3]
+    async def add_user_to_birthday_role(self, guild: discord.Guild, birthdays: typing.List[typing.Dict]) -> None:
         # add all birthday users to the birthday role from settings.role
-        birthday_role = None
-        guild_id = 0
-        try:
-            if ctx.guild:
-                guild_id = ctx.guild.id
-            else:
-                return
-
-            await asyncio.sleep(0.5)
-            if self.was_checked_today(guild_id):
-                return
-
-            cog_settings = self.get_cog_settings(guild_id)
-            if not cog_settings:
-                self.log.warn(
-                    guild_id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"No birthday settings found for guild {guild_id}",
-                )
-                return
-
-            # is it enabled?
-            if not cog_settings.get("enabled", False):
-                self.log.debug(
-                    guild_id, f"{self._module}.{self._class}.{_method}", f"birthday is disabled for guild {guild_id}"
-                )
-                return
-
-            # get the role from the settings
-            role_id = cog_settings.get("role", None)
-            if not role_id:
-                self.log.warn(
-                    guild_id, f"{self._module}.{self._class}.{_method}", f"No birthday role found for guild {guild_id}"
-                )
-                return
-            birthday_role = discord.utils.get(ctx.guild.roles, id=int(role_id))
-            if not birthday_role:
-                self.log.warn(
-                    guild_id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"Could not find birthday role {role_id} for guild {guild_id}",
-                )
-                return
-            # remove all users from the role
-            for member in birthday_role.members:
-                await self.discord_helper.add_remove_roles(
-                    user=member, check_list=[], add_list=[], remove_list=[birthday_role.id], allow_everyone=True
-                )
-        except Exception as e:
-            self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
+        birthday_role = self._get_birthday_role(guild)
+        if not birthday_role:
             return
-
-    async def send_birthday_message(self, ctx: Context, birthdays: typing.List[typing.Dict]):
-        _method = inspect.stack()[0][3]
-        guild_id = 0
-        try:
-            if ctx.guild:
-                guild_id = ctx.guild.id
-
-            await asyncio.sleep(0.5)
-            if self.was_checked_today(guild_id):
-                return
-
-            # user started streaming
-            cog_settings = self.get_cog_settings(guild_id)
-            if not cog_settings:
-                self.log.warn(
-                    guild_id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"No birthday settings found for guild {guild_id}",
-                )
-                return
-            if not cog_settings.get("enabled", False):
-                self.log.debug(
-                    guild_id, f"{self._module}.{self._class}.{_method}", f"birthday is disabled for guild {guild_id}"
+        for birthday in birthdays:
+            user_id = int(birthday["user_id"])
+            member = await self.discord_helper.get_or_fetch_member(guildId=guild.id, userId=user_id)
+            if member:
+                await self.discord_helper.add_remove_roles(
+                    user=member, check_list=[], add_list=[birthday_role.id], remove_list=[], allow_everyone=True
                 )
-                return
 
-            if len(birthdays) == 0:
-                return
+    async def clear_birthday_role(self, guild: discord.Guild) -> None:
+        # clear all users from the birthday role from settings.role
+        birthday_role = self._get_birthday_role(guild)
+        if not birthday_role:
+            return
+        for member in birthday_role.members:
+            await self.discord_helper.add_remove_roles(
+                user=member, check_list=[], add_list=[], remove_list=[birthday_role.id], allow_everyone=True
+            )
 
-            # get all the users
-            users = []
-            for birthday in birthdays:
-                user = await self.discord_helper.get_or_fetch_member(guildId=guild_id, userId=int(birthday["user_id"]))
-                # user = ctx.guild.get_member(int(birthday["user_id"])).mention
-
-                if user:
-                    users.append(user.mention)
-
-            # Get a random birthday message
-
-            # These should be pulled from database settings
-            birthday_messages = cog_settings.get("messages", [])
-            birthday_images = cog_settings.get("images", [])
-            output_channel_id = cog_settings.get("channel_id", "0")
-
-            # output_channel = ctx.guild.get_channel(int(output_channel_id))
-            output_channel = await self.discord_helper.get_or_fetch_channel(channelId=int(output_channel_id))
-            if output_channel:
-                message = birthday_messages[int(random() * len(birthday_messages))]
-                image = birthday_images[int(random() * len(birthday_images))]
-
-                date = datetime.datetime.now(tz=None)
-                month_name = date.strftime("%B")
-                month_day = date.strftime("%d")
-                fields = [
-                    {"name": self.settings.get_string(guild_id, "month"), "value": month_name, "inline": True},
-                    {"name": self.settings.get_string(guild_id, "day"), "value": month_day, "inline": True},
-                ]
-                await self.messaging.send_embed(
-                    channel=output_channel,
-                    title=self.settings.get_string(guild_id, "birthday_wishes_title"),
-                    message=self.settings.get_string(guild_id, "birthday_wishes_message", message=message, users=""),
-                    image=image,
-                    color=None,
-                    content=" ".join(users),
-                    fields=fields,
-                )
-            else:
-                self.log.debug(
-                    guild_id, f"{self._module}.{self._class}.{_method}", f"Could not find channel {output_channel_id}"
-                )
+    async def send_birthday_message(
+        self, guild: discord.Guild, day: datetime.date, birthdays: typing.List[typing.Dict]
+    ) -> None:
+        _method = utils.get_method_name()
+        guild_id = guild.id
+        if len(birthdays) == 0:
+            return
 
-        except Exception as e:
-            self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
+        cog_settings = self.get_cog_settings(guild_id)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        _method = inspect.stack()[0][3]
-        guild_id = 0
-        try:
-            if message.guild:
-                guild_id = message.guild.id
+        # get all the users
+        users = []
+        for birthday in birthdays:
+            user = await self.discord_helper.get_or_fetch_member(guildId=guild_id, userId=int(birthday["user_id"]))
+            if user:
+                users.append(user.mention)
 
-            await self._birthday_event_process(message)
-        except Exception as e:
-            self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
-            self.birthdays_db.untrack_birthday_check(guild_id)
+        # Get a random birthday message
+        birthday_messages = cog_settings.get("messages", [])
+        birthday_images = cog_settings.get("images", [])
+        output_channel_id = cog_settings.get("channel_id", "0")
 
-    @commands.Cog.listener()
-    async def on_member_update(self, before, after):
-        _method = inspect.stack()[0][3]
-        guild_id = 0
-        try:
-            if after.guild:
-                guild_id = after.guild.id
-
-            await self._birthday_event_process(after)
-        except Exception as e:
-            self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
-            self.birthdays_db.untrack_birthday_check(guild_id)
-
-    @commands.Cog.listener()
-    async def on_member_join(self, member):
-        _method = inspect.stack()[0][3]
-        guild_id = 0
-        try:
-            if member.guild:
-                guild_id = member.guild.id
+        output_channel = await self.discord_helper.get_or_fetch_channel(channelId=int(output_channel_id))
+        if output_channel:
+            message = birthday_messages[int(random() * len(birthday_messages))]
+            image = birthday_images[int(random() * len(birthday_images))]
 
-            await self._birthday_event_process(member)
-        except Exception as e:
-            self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
+            fields = [
+                {"name": self.settings.get_string(guild_id, "month"), "value": day.strftime("%B"), "inline": True},
+                {"name": self.settings.get_string(guild_id, "day"), "value": day.strftime("%d"), "inline": True},
+            ]
+            await self.messaging.send_embed(
+                channel=output_channel,
+                title=self.settings.get_string(guild_id, "birthday_wishes_title"),
+                message=self.settings.get_string(guild_id, "birthday_wishes_message", message=message, users=""),
+                image=image,
+                color=None,
+                content=" ".join(users),
+                fields=fields,
+            )
+        else:
+            self.log.debug(
+                guild_id, f"{self._module}.{self._class}.{_method}", f"Could not find channel {output_channel_id}"
+            )
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        pass
+    async def _birthday_job(self, guildId: int, day: datetime.date) -> None:
+        """Daily birthday run for one guild, called by the scheduler once per guild-local ``day``.
 
-    async def _birthday_event_process(self, ctx: Context):
-        _method = inspect.stack()[0][3]
-        guild_id = 0
-        if ctx.guild:
-            guild_id = ctx.guild.id
-        else:
+        Exceptions propagate so the scheduler marks the run failed and retries it.
+        """
+        _method = utils.get_method_name()
+        guild = self.bot.get_guild(guildId)
+        if guild is None:
             return
 
-        try:
-            await asyncio.sleep(randrange(1, 5, 1))
-            # check if the birthday check is enabled
-            # check if the birthday check has not ran today yet
-            if self.was_checked_today(guild_id):
-                return
-            # get if there are any birthdays today in the database
-            birthdays = self.get_todays_birthdays(guild_id) or []
-            await self.clear_birthday_role(ctx)
-
-            await asyncio.sleep(randrange(1, 5, 1))
-            # double check
-            if self.was_checked_today(guild_id):
-                return
-            # wish the users a happy birthday
-            if len(birthdays) > 0:
-                self.log.debug(
-                    guild_id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"Sending birthday wishes from check_birthday for {guild_id}",
-                )
-                await self.send_birthday_message(ctx, birthdays)
-                await self.add_user_to_birthday_role(ctx, birthdays)
-            # track the check
-            self.birthdays_db.track_birthday_check(guild_id)
-        except Exception as e:
-            raise e
+        birthdays = await self.get_todays_birthdays(guildId, day)
+        await self.clear_birthday_role(guild)
+        if len(birthdays) > 0:
+            self.log.debug(
+                guildId, f"{self._module}.{self._class}.{_method}", f"Sending birthday wishes for {guildId}"
+            )
+            await self.send_birthday_message(guild, day, birthdays)
+            await self.add_user_to_birthday_role(guild, birthdays)
+        # keep the birthday_checks history; the job_runs lease is what prevents repeat runs
+        await executor.run(self.birthdays_db.track_birthday_check, guildId)
 
 
 async def setup(bot):
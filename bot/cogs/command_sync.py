@@ -1,10 +1,9 @@
-import inspect
 import os
 import typing
 
 import discord
 from bot import tacobot  # pylint: disable=no-name-in-module
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.messaging import Messaging
 from discord.ext import commands
@@ -14,7 +13,7 @@ from discord.ext.commands import Context, Greedy
 class CommandSyncCog(TacobotCog):
     def __init__(self, bot: tacobot.TacoBot) -> None:
         super().__init__(bot, "command_sync")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -35,7 +34,7 @@ class CommandSyncCog(TacobotCog):
     async def sync(
         self, ctx: Context, guilds: Greedy[discord.Object], spec: typing.Optional[typing.Literal["~", "*", "^"]] = None
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id if ctx.guild else 0
         try:
             await ctx.message.delete()
@@ -1,7 +1,7 @@
-import inspect
 import os
 import traceback
 
+from bot.lib import utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.tacobot import TacoBot
 from discord.ext import commands
@@ -10,7 +10,7 @@ from discord.ext import commands
 class Events(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "tacobot")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -19,7 +19,7 @@ class Events(TacobotCog):
 
     @commands.Cog.listener()
     async def on_ready(self):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(
             0, f"{self._module}.{self._class}.{_method}", f"Logged in as {self.bot.user.name}:{self.bot.user.id}"
         )
@@ -30,17 +30,17 @@ class Events(TacobotCog):
 
     @commands.Cog.listener()
     async def on_disconnect(self):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Bot Disconnected")
 
     @commands.Cog.listener()
     async def on_resumed(self):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Bot Session Resumed")
 
     @commands.Cog.listener()
     async def on_error(self, event, *args, **kwargs):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.error(0, f"{self._module}.{self._class}.{_method}", f"{str(event)}", traceback.format_exc())
 
 
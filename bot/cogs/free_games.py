@@ -1,7 +1,6 @@
-import inspect
 import os
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.messaging import Messaging
 from bot.lib.mongodb.tracking import TrackingDatabase
@@ -13,7 +12,7 @@ class FreeGamesCog(TacobotCog):
 
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "free_games")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -1,6 +1,5 @@
 import asyncio
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -12,6 +11,7 @@ from bot.lib.enums import tacotypes
 from bot.lib.enums.permissions import TacoPermissions
 from bot.lib.enums.system_actions import SystemActions
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.gamekeys import GameKeysDatabase
 from bot.lib.mongodb.tacos import TacosDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
@@ -25,7 +25,7 @@ from discord.ext import commands
 class GameKeysCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "game_keys")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -42,7 +42,7 @@ class GameKeysCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_ready(self):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             guild_id = self.bot.guilds[0].id
@@ -57,10 +57,12 @@ class GameKeysCog(TacobotCog):
                 return
 
             reward_channel_id = cog_settings.get("reward_channel_id", "0")
-            offer = self.gamekeys_db.find_open_game_key_offer(guild_id=guild_id, channel_id=int(reward_channel_id))
+            offer = await executor.run(
+                self.gamekeys_db.find_open_game_key_offer, guild_id=guild_id, channel_id=int(reward_channel_id)
+            )
 
             if offer:
-                game_data = self.gamekeys_db.get_game_key_data(str(offer["game_key_id"]))
+                game_data = await executor.run(self.gamekeys_db.get_game_key_data, str(offer["game_key_id"]))
                 if game_data:
                     default_cost = cog_settings.get("cost", 500)
                     cost = game_data.get("cost", default_cost)
@@ -78,7 +80,7 @@ class GameKeysCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_guild_available(self, guild):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # context = self.discord_helper.create_context(
             #     bot=self.bot, author=self.bot.user, channel=guild.system_channel, guild=guild
@@ -98,7 +100,7 @@ class GameKeysCog(TacobotCog):
     @commands.guild_only()
     @commands.has_permissions(administrator=True)
     async def open(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
@@ -106,7 +108,8 @@ class GameKeysCog(TacobotCog):
             await ctx.message.delete()
             await self._create_offer(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -122,7 +125,7 @@ class GameKeysCog(TacobotCog):
     @commands.guild_only()
     @commands.has_permissions(administrator=True)
     async def close(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
@@ -130,7 +133,8 @@ class GameKeysCog(TacobotCog):
             await ctx.message.delete()
             await self._close_offer(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -143,7 +147,7 @@ class GameKeysCog(TacobotCog):
             await self.messaging.notify_of_error(ctx)
 
     async def _create_offer(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = 0
             if ctx.guild:
@@ -171,7 +175,7 @@ class GameKeysCog(TacobotCog):
                 )
                 return
 
-            offer = self.gamekeys_db.find_open_game_key_offer(guild_id, reward_channel.id)
+            offer = await executor.run(self.gamekeys_db.find_open_game_key_offer, guild_id, reward_channel.id)
             if offer:
                 self.log.error(
                     guild_id,
@@ -180,7 +184,7 @@ class GameKeysCog(TacobotCog):
                 )
                 return
 
-            game_data = self.gamekeys_db.get_random_game_key_data(guild_id=guild_id)
+            game_data = await executor.run(self.gamekeys_db.get_random_game_key_data, guild_id=guild_id)
             if not game_data:
                 await reward_channel.send(
                     self.settings.get_string(guild_id, "game_key_no_keys_found_message"), delete_after=10
@@ -305,7 +309,9 @@ class GameKeysCog(TacobotCog):
             await self.bot.change_presence(activity=discord.Game(name=f"{game_data['title']} ({cost} {tacos_word})"))
 
             # record offer
-            self.gamekeys_db.open_game_key_offer(game_data["id"], guild_id, offer_message.id, ctx.channel.id)
+            await executor.run(
+                self.gamekeys_db.open_game_key_offer, game_data["id"], guild_id, offer_message.id, ctx.channel.id
+            )
         except Exception as e:
             self.log.error(ctx.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
@@ -324,7 +330,7 @@ class GameKeysCog(TacobotCog):
         )
 
     async def _reset_offer_callback(self, interaction: discord.Interaction):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if interaction.response.is_done():
             self.log.debug(
                 interaction.guild.id,
@@ -358,7 +364,7 @@ class GameKeysCog(TacobotCog):
 
         try:
             # get the total taco count for the user
-            taco_count = self.tacos_db.get_tacos_count(guild_id, interaction.user.id) or 0
+            taco_count = await executor.run(self.tacos_db.get_tacos_count, guild_id, interaction.user.id) or 0
             tacos_word = self.settings.get_string(guild_id, "taco_plural")
             if taco_count == 1:
                 tacos_word = self.settings.get_string(guild_id, "taco_singular")
@@ -390,7 +396,7 @@ class GameKeysCog(TacobotCog):
                 guild_id, f"{self._module}.{self._class}.{_method}", f"Claiming offer {interaction.data['custom_id']}"
             )
             # charge the user the reset cost
-            self.tacos_db.remove_tacos(guild_id, ctx.author.id, reset_cost)
+            await executor.run(self.tacos_db.remove_tacos, guild_id, ctx.author.id, reset_cost)
 
             await self.discord_helper.tacos_log(
                 guild_id=guild_id,
@@ -402,7 +408,8 @@ class GameKeysCog(TacobotCog):
                 total_tacos=taco_count - reset_cost,
             )
 
-            self.tacos_db.track_tacos_log(
+            await executor.run(
+                self.tacos_db.track_tacos_log,
                 guildId=guild_id,
                 fromUserId=ctx.author.id,
                 toUserId=self.bot.user.id,
@@ -411,8 +418,11 @@ class GameKeysCog(TacobotCog):
                 type=tacotypes.TacoTypes.get_db_type_from_taco_type(tacotypes.TacoTypes.GAME_KEY_RESET),
             )
 
-            self.tracking_db.track_system_action(
-                guild_id=guild_id, action=SystemActions.GAME_KEY_RESET, data={"user_id": str(ctx.author.id)}
+            await executor.run(
+                self.tracking_db.track_system_action,
+                guild_id=guild_id,
+                action=SystemActions.GAME_KEY_RESET,
+                data={"user_id": str(ctx.author.id)},
             )
             # create a new offer
             await self._create_offer(ctx)
@@ -420,7 +430,7 @@ class GameKeysCog(TacobotCog):
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
 
     async def _claim_offer_callback(self, interaction: discord.Interaction):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if interaction.response.is_done():
             self.log.debug(
                 interaction.guild.id,
@@ -432,7 +442,9 @@ class GameKeysCog(TacobotCog):
         ctx = None
 
         # does user have permission to claim game?
-        if self.permissions.has_taco_permission(guild_id, interaction.user, TacoPermissions.CLAIM_GAME_DISABLED):
+        if await executor.run(
+            self.permissions.has_taco_permission, guild_id, interaction.user, TacoPermissions.CLAIM_GAME_DISABLED
+        ):
             await interaction.response.send_message("You do not have permission to claim this game.", ephemeral=True)
             return
 
@@ -458,7 +470,7 @@ class GameKeysCog(TacobotCog):
             # if false, the claim failed and we need to re-enable the view
             if not claim_result:
                 # create a claim view
-                game_data = self.gamekeys_db.get_game_key_data(interaction.data["custom_id"])
+                game_data = await executor.run(self.gamekeys_db.get_game_key_data, interaction.data["custom_id"])
                 if game_data:
                     cog_settings = self.get_cog_settings(guild_id)
                     default_cost = cog_settings.get("cost", 500)
@@ -485,7 +497,8 @@ class GameKeysCog(TacobotCog):
             else:
                 await self._create_offer(ctx)
 
-            self.tracking_db.track_system_action(
+            await executor.run(
+                self.tracking_db.track_system_action,
                 guild_id=guild_id,
                 action=SystemActions.GAME_KEY_CLAIM,
                 data={"user_id": str(ctx.author.id), "game_key_id": interaction.data["custom_id"]},
@@ -495,7 +508,7 @@ class GameKeysCog(TacobotCog):
 
     # , interaction: discord.Interaction, error: Exception, item: discord.ui.Item
     async def _claim_timeout_callback(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # create context from interaction
             ctx = self.discord_helper.create_context(
@@ -516,7 +529,7 @@ class GameKeysCog(TacobotCog):
     #     await asyncio.sleep((60 * 60 * 24) * 2)
 
     async def _close_offer(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the current offer and close it
         try:
             guild_id = 0
@@ -541,7 +554,7 @@ class GameKeysCog(TacobotCog):
                 )
                 return
 
-            offer = self.gamekeys_db.find_open_game_key_offer(guild_id, reward_channel.id)
+            offer = await executor.run(self.gamekeys_db.find_open_game_key_offer, guild_id, reward_channel.id)
             if offer:
                 try:
                     offer_message = await reward_channel.fetch_message(int(offer["message_id"]))
@@ -558,7 +571,7 @@ class GameKeysCog(TacobotCog):
                     )
                     pass
 
-                self.gamekeys_db.close_game_key_offer_by_message(guild_id, int(offer["message_id"]))
+                await executor.run(self.gamekeys_db.close_game_key_offer_by_message, guild_id, int(offer["message_id"]))
                 await self.bot.change_presence(activity=None)
             else:
                 self.log.debug(
@@ -571,7 +584,7 @@ class GameKeysCog(TacobotCog):
             await self.messaging.notify_of_error(ctx)
 
     async def _claim_offer(self, ctx, game_id: str) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # claim the offer
             guild_id = 0
@@ -595,8 +608,8 @@ class GameKeysCog(TacobotCog):
             claim_time_period = limits.get("time_period", 3600)
             if claim_limit >= 1:
                 # get the number of redemptions in time_period
-                claim_count = self.gamekeys_db.get_claimed_key_count_in_timeframe(
-                    guild_id, ctx.author.id, claim_time_period
+                claim_count = await executor.run(
+                    self.gamekeys_db.get_claimed_key_count_in_timeframe, guild_id, ctx.author.id, claim_time_period
                 )
                 if claim_count >= claim_limit:
                     await ctx.channel.send(
@@ -630,7 +643,7 @@ class GameKeysCog(TacobotCog):
                 f"Claiming offer {game_id} for guild {guild_id} in channel {reward_channel.name}",
             )
 
-            offer = self.gamekeys_db.find_open_game_key_offer(guild_id, reward_channel.id)
+            offer = await executor.run(self.gamekeys_db.find_open_game_key_offer, guild_id, reward_channel.id)
             if not offer:
                 self.log.warn(
                     guild_id,
@@ -640,8 +653,8 @@ class GameKeysCog(TacobotCog):
                 return False
 
             # get the game data from the offer game_key_id
-            game_data = self.gamekeys_db.get_game_key_offer_data(
-                guild_id=guild_id, game_key_id=str(offer["game_key_id"])
+            game_data = await executor.run(
+                self.gamekeys_db.get_game_key_offer_data, guild_id=guild_id, game_key_id=str(offer["game_key_id"])
             )
             if not game_data:
                 self.log.warn(
@@ -663,7 +676,9 @@ class GameKeysCog(TacobotCog):
                 tacos_word = self.settings.get_string(guild_id, "taco_plural")
 
             # does the user have enough tacos?
-            taco_count: typing.Optional[int] = self.tacos_db.get_tacos_count(guild_id, ctx.author.id)
+            taco_count: typing.Optional[int] = await executor.run(
+                self.tacos_db.get_tacos_count, guild_id, ctx.author.id
+            )
             if taco_count and taco_count < cost:
                 await ctx.channel.send(
                     self.settings.get_string(
@@ -761,11 +776,12 @@ class GameKeysCog(TacobotCog):
                 )
                 return False
             # set the game as claimed
-            self.gamekeys_db.claim_game_key_offer(game_id, ctx.author.id)
+            await executor.run(self.gamekeys_db.claim_game_key_offer, game_id, ctx.author.id)
             # remove the tacos from the user
-            self.tacos_db.remove_tacos(guild_id, ctx.author.id, cost)
+            await executor.run(self.tacos_db.remove_tacos, guild_id, ctx.author.id, cost)
 
-            self.tacos_db.track_tacos_log(
+            await executor.run(
+                self.tacos_db.track_tacos_log,
                 guildId=guild_id,
                 fromUserId=ctx.author.id,
                 toUserId=self.bot.user.id,
@@ -812,7 +828,7 @@ class GameKeysCog(TacobotCog):
 
     # import current game key offer and add it to the client as a view
     async def _init_exiting_offer(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if not ctx.guild:
             return
 
@@ -841,7 +857,9 @@ class GameKeysCog(TacobotCog):
                 )
                 return
 
-            offer = self.gamekeys_db.find_open_game_key_offer(guild_id=guild_id, channel_id=reward_channel.id)
+            offer = await executor.run(
+                self.gamekeys_db.find_open_game_key_offer, guild_id=guild_id, channel_id=reward_channel.id
+            )
             if offer:
                 # add the view
                 self.log.info(
@@ -890,7 +908,7 @@ class GameKeysCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if not interaction.guild:
             return
         try:
@@ -930,7 +948,7 @@ class GameKeysCog(TacobotCog):
                 return
 
             # get the game data to check if the custom_id IS a game id
-            game_data = self.gamekeys_db.get_game_key_data(str(game_id))
+            game_data = await executor.run(self.gamekeys_db.get_game_key_data, str(game_id))
             if not game_data:
                 self.log.debug(
                     interaction.guild.id,
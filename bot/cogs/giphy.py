@@ -1,4 +1,3 @@
-import inspect
 import json
 import math
 import os
@@ -7,9 +6,10 @@ import uuid
 from random import random
 from urllib import parse, request
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
 from discord.ext import commands
@@ -18,7 +18,7 @@ from discord.ext import commands
 class Giphy(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "giphy")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -31,7 +31,7 @@ class Giphy(TacobotCog):
     @commands.command(name='giphy', aliases=['gif'])
     @commands.guild_only()
     async def giphy(self, ctx, *, query: str = "tacos"):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
@@ -69,7 +69,8 @@ class Giphy(TacobotCog):
                 # embed.set_image(url=data['data'][random_index]['images']['original']['url'])
                 # await ctx.send(embed=embed)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -1,4 +1,3 @@
-import inspect
 import math
 import os
 import re
@@ -7,6 +6,7 @@ import traceback
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
 from discord.ext import commands
@@ -15,7 +15,7 @@ from discord.ext import commands
 class HelpCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "tacobot")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -28,7 +28,7 @@ class HelpCog(TacobotCog):
 
     @commands.command(name='changelog', aliases=['changes', "cl"])
     async def changelog(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             await ctx.message.delete()
             guild_id = 0
@@ -80,7 +80,8 @@ class HelpCog(TacobotCog):
                     )
                 page += 1
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -102,7 +103,8 @@ class HelpCog(TacobotCog):
             await ctx.message.delete()
         if command is None:
             await self.root_help(ctx)
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -112,7 +114,8 @@ class HelpCog(TacobotCog):
             )
         else:
             await self.subcommand_help(ctx, command, subcommand)
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -122,7 +125,7 @@ class HelpCog(TacobotCog):
             )
 
     async def subcommand_help(self, ctx, command: str = "", subcommand: str = ""):
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         if ctx.guild:
             guild_id = ctx.guild.id
         else:
@@ -212,7 +215,7 @@ class HelpCog(TacobotCog):
             await self.messaging.notify_of_error(ctx)
 
     async def root_help(self, ctx):
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         if ctx.guild:
             guild_id = ctx.guild.id
         else:
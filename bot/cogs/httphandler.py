@@ -1,9 +1,8 @@
-import inspect
 import os
 import traceback
 from importlib import import_module
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.messaging import Messaging
 from bot.lib.mongodb.tracking import TrackingDatabase
@@ -18,7 +17,7 @@ class HttpHandlerCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "webhook")
 
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -33,7 +32,7 @@ class HttpHandlerCog(TacobotCog):
 
     @commands.Cog.listener("on_ready")
     async def initialize_server(self):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             settings = self.get_cog_settings()
             if not settings.get("enabled", False):
@@ -65,8 +64,14 @@ class HttpHandlerCog(TacobotCog):
         except Exception as e:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", f"{e}", traceback.format_exc())
 
+    async def cog_unload(self) -> None:
+        await super().cog_unload()
+        if self.http_server is not None:
+            # stop accepting connections and let in-flight requests finish
+            await self.http_server.close()
+
     def load_webhook_handlers(self):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if not os.path.exists("bot/lib/http/handlers"):
                 self.log.error(0, f"{self._module}.{self._class}.{_method}", "No handlers found")
@@ -109,7 +114,7 @@ class HttpHandlerCog(TacobotCog):
             )
 
     def recursive_load_handlers(self, path: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if not self.http_server:
                 self.log.error(0, f"{self._module}.{self._class}.{_method}", "No http server found")
@@ -1,12 +1,14 @@
-import inspect
 import os
 import traceback
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.introductions import IntroductionsDatabase
 from bot.lib.mongodb.settings import SettingsDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
@@ -17,7 +19,7 @@ from discord.ext import commands
 class IntroductionCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "introduction")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -28,6 +30,15 @@ class IntroductionCog(TacobotCog):
         self.settings_db = SettingsDatabase()
         self.introductions_db = IntroductionsDatabase()
         self.tracking_db = TrackingDatabase()
+        self.message_interest = MessageInterest(
+            commands=False,
+            message_types=frozenset({discord.MessageType.default}),
+            predicate=lambda ctx: not ctx.message.author.system
+            and str(ctx.channel_id) in ctx.get_settings(self.SETTINGS_SECTION).get("channels", []),
+        )
+        self.reaction_interest = ReactionInterest(
+            section="introduction", emojis=lambda section: section.get("approval_emoji", ['🌟', '⭐'])
+        )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
@@ -39,7 +50,7 @@ class IntroductionCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def introduction_import(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
 
         try:
@@ -56,7 +67,9 @@ class IntroductionCog(TacobotCog):
 
             tracked_users = []
             # get all the users that already have tracked introductions
-            existing_introductions = [int(u['user_id']) for u in self.introductions_db.get_user_introductions(guild_id)]
+            existing_introductions = [
+                int(u['user_id']) for u in await executor.run(self.introductions_db.get_user_introductions, guild_id)
+            ]
 
             for channel_id in channels:
                 channel = await self.discord_helper.get_or_fetch_channel(channelId=int(channel_id))
@@ -117,7 +130,8 @@ class IntroductionCog(TacobotCog):
 
                     # add the user to the tracked users list
                     tracked_users.append(message.author.id)
-                    self.tracking_db.track_user_introduction(
+                    await executor.run(
+                        self.tracking_db.track_user_introduction,
                         guild_id=guild_id,
                         user_id=message.author.id,
                         channel_id=channel.id,
@@ -126,7 +140,13 @@ class IntroductionCog(TacobotCog):
                     )
 
             # set the was_imported flag to true
-            self.settings_db.set_setting(guildId=guild_id, name=self.SETTINGS_SECTION, key="was_imported", value=True)
+            await executor.run(
+                self.settings_db.set_setting,
+                guildId=guild_id,
+                name=self.SETTINGS_SECTION,
+                key="was_imported",
+                value=True,
+            )
 
             await self.messaging.send_embed(
                 channel=ctx.channel,
@@ -140,35 +160,13 @@ class IntroductionCog(TacobotCog):
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", f"{e}", traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
 
-    @commands.Cog.listener()
-    @commands.guild_only()
-    async def on_message(self, message: discord.Message) -> None:
-        _method = inspect.stack()[0][3]
-        if not message.guild:
-            return
-
-        guild_id = message.guild.id
+    async def on_message(self, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        message = ctx.message
+        guild_id = ctx.guild_id
         try:
-            if message.author.bot or message.author.system:
-                return
-
-            # ignore messages that are commands
-            for prefix in await self.bot.command_prefix(message):
-                if message.content.startswith(prefix):
-                    return
-
-            cog_settings = self.get_cog_settings(guild_id)
-            channels = cog_settings.get("channels", [])
-
-            if not channels or str(message.channel.id) not in channels:
-                return
-
-            if message.type != discord.MessageType.default:
-                # we dont care about any other message type
-                return
-
             # is this user already tracked?
-            tracked_user = self.introductions_db.get_user_introduction(guild_id, message.author.id)
+            tracked_user = await executor.run(self.introductions_db.get_user_introduction, guild_id, message.author.id)
             if tracked_user:
                 return
 
@@ -193,7 +191,8 @@ class IntroductionCog(TacobotCog):
                 taco_amount=0,
             )
 
-            self.tracking_db.track_user_introduction(
+            await executor.run(
+                self.tracking_db.track_user_introduction,
                 guild_id=guild_id,
                 user_id=message.author.id,
                 channel_id=message.channel.id,
@@ -201,7 +200,8 @@ class IntroductionCog(TacobotCog):
                 approved=False,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=message.channel.id if message.channel else None,
                 userId=message.author.id,
@@ -214,32 +214,26 @@ class IntroductionCog(TacobotCog):
         except Exception as e:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", f"{e}", traceback.format_exc())
 
-    @commands.Cog.listener()
-    @commands.guild_only()
-    async def on_raw_reaction_add(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id or 0
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            if guild_id == 0:
-                return
-            if payload.event_type != 'REACTION_ADD':
+            if payload.member and (payload.member.bot or payload.member.system):
                 return
 
-            if payload.member.bot or payload.member.system:
-                return
-
-            cog_settings = self.get_cog_settings(guild_id)
+            cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
             approval_emoji = cog_settings.get("approval_emoji", ['🌟', '⭐'])
             channels = cog_settings.get("channels", [])
             if not channels or str(payload.channel_id) not in channels:
                 return
 
-            # get the channel
-            channel = await self.discord_helper.get_or_fetch_channel(payload.channel_id)
-            if not channel:
+            # is the added emoji an approval emoji?
+            if payload.emoji.name not in approval_emoji:
                 return
+
             # get the original message
-            message = await channel.fetch_message(payload.message_id)
+            message = await ctx.get_message()
             if not message:
                 return
             author = message.author
@@ -247,11 +241,7 @@ class IntroductionCog(TacobotCog):
             if payload.user_id != author.id:
                 return
 
-            # is the added emoji an approval emoji?
-            if payload.emoji.name not in approval_emoji:
-                return
-
-            tracked_user = self.introductions_db.get_user_introduction(guild_id, message.author.id)
+            tracked_user = await executor.run(self.introductions_db.get_user_introduction, guild_id, message.author.id)
             if tracked_user and tracked_user.get('approved', False):
                 return
 
@@ -265,7 +255,8 @@ class IntroductionCog(TacobotCog):
                 taco_amount=0,
             )
 
-            self.tracking_db.track_user_introduction(
+            await executor.run(
+                self.tracking_db.track_user_introduction,
                 guild_id=guild_id,
                 user_id=message.author.id,
                 channel_id=message.channel.id,
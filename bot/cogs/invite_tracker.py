@@ -1,13 +1,14 @@
 import datetime
-import inspect
 import os
 import traceback
-import typing
 
+import discord
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.invite_cache import InviteCache
 from bot.lib.enums import tacotypes
 from bot.lib.enums.system_actions import SystemActions
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.invites import InvitesDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
@@ -17,7 +18,7 @@ from discord.ext import commands
 class InviteTracker(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "tacobot")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -26,82 +27,101 @@ class InviteTracker(TacobotCog):
         self.invites_db = InvitesDatabase()
         self.tracking_db = TrackingDatabase()
 
-        self.invites = {}
+        self.invite_cache = InviteCache()
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         for guild in self.bot.guilds:
-            guild_id = guild.id
-            self.invites[guild_id] = await guild.invites()
-
-            for invite in self.invites[guild_id]:
-                invite_payload = self.get_payload_for_invite(invite)
-                self.invites_db.track_invite_code(guild_id, invite.code, invite_payload, None)
+            await self._seed_guild(guild)
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "InviteTracker ready")
 
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild) -> None:
+        await self._seed_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild) -> None:
+        self.invite_cache.forget(guild.id)
+
     @commands.Cog.listener()
     async def on_invite_create(self, invite) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = invite.guild.id
-        self.invites[invite.guild.id] = await invite.guild.invites()
+        self.invite_cache.add(invite)
 
-        for invite in self.invites[guild_id]:
-            self.log.debug(guild_id, f"{self._module}.{self._class}.{_method}", f"adding invite: {invite.code}")
-            invite_payload = self.get_payload_for_invite(invite)
-            self.invites_db.track_invite_code(guild_id, invite.code, invite_payload, None)
+        self.log.debug(guild_id, f"{self._module}.{self._class}.{_method}", f"adding invite: {invite.code}")
+        invite_payload = self.get_payload_for_invite(invite)
+        await executor.run(self.invites_db.track_invite_code, guild_id, invite.code, invite_payload, None)
 
     @commands.Cog.listener()
     async def on_invite_delete(self, invite) -> None:
-        self.invites[invite.guild.id] = await invite.guild.invites()
+        self.invite_cache.remove(invite)
 
     @commands.Cog.listener()
     async def on_member_join(self, member) -> None:
         guild_id = member.guild.id
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
-            invites_before_join = self.invites[member.guild.id]
-            invites_after_join = await member.guild.invites()
-            for invite in invites_before_join:
-                found_code = self.find_invite_by_code(invites_after_join, invite.code)
-                if found_code is not None and invite.uses < found_code.uses:
-                    self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Invite used: " + invite.code)
-                    self.invites[member.guild.id] = invites_after_join
-
-                    inviter = invite.inviter
-                    if inviter is not None and not inviter.bot:
-                        timestamp = utils.to_timestamp(datetime.datetime.utcnow())
-
-                        # track the invite. add the invite to the database if it doesn't exist. add the new user to the invite
-                        invite_payload = self.get_payload_for_invite(invite)
-
-                        invite_use_payload = {"user_id": str(member.id), "timestamp": timestamp}
-
-                        self.invites_db.track_invite_code(guild_id, invite.code, invite_payload, invite_use_payload)
-                        await self.discord_helper.taco_give_user(
-                            guild_id,
-                            self.bot.user,
-                            inviter,
-                            self.settings.get_string(guild_id, "taco_reason_invite", user=member.name),
-                            tacotypes.TacoTypes.USER_INVITE,
-                        )
-                        self.tracking_db.track_system_action(
-                            guild_id=guild_id,
-                            action=SystemActions.USER_INVITE,
-                            data={
-                                "inviter_id": str(inviter.id),
-                                "inviter_name": inviter.name,
-                                "invited_id": str(member.id),
-                                "invited_name": member.name,
-                                "invite_code": invite.code,
-                            },
-                        )
-                    return
+            if member.bot:
+                # bots are added through OAuth, not invites
+                return
+            invite = await self.invite_cache.attribute(member.guild, member.id)
+            if invite is None:
+                return
+            self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Invite used: " + invite.code)
+
+            inviter = invite.inviter
+            if inviter is not None and not inviter.bot:
+                timestamp = utils.to_timestamp(datetime.datetime.utcnow())
+
+                # track the invite. add the invite to the database if it doesn't exist. add the new user to the invite
+                invite_payload = self.get_payload_for_invite(invite)
+
+                invite_use_payload = {"user_id": str(member.id), "timestamp": timestamp}
+
+                await executor.run(
+                    self.invites_db.track_invite_code, guild_id, invite.code, invite_payload, invite_use_payload
+                )
+                await self.discord_helper.taco_give_user(
+                    guild_id,
+                    self.bot.user,
+                    inviter,
+                    self.settings.get_string(guild_id, "taco_reason_invite", user=member.name),
+                    tacotypes.TacoTypes.USER_INVITE,
+                )
+                await executor.run(
+                    self.tracking_db.track_system_action,
+                    guild_id=guild_id,
+                    action=SystemActions.USER_INVITE,
+                    data={
+                        "inviter_id": str(inviter.id),
+                        "inviter_name": inviter.name,
+                        "invited_id": str(member.id),
+                        "invited_name": member.name,
+                        "invite_code": invite.code,
+                    },
+                )
         except Exception as e:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
 
+    async def _seed_guild(self, guild) -> None:
+        _method = utils.get_method_name()
+        try:
+            invites = await self.invite_cache.refresh(guild)
+        except discord.Forbidden:
+            self.log.warn(guild.id, f"{self._module}.{self._class}.{_method}", "Missing permission to list invites")
+            return
+        except Exception as e:
+            self.log.error(guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
+            return
+
+        for invite in invites:
+            invite_payload = self.get_payload_for_invite(invite)
+            await executor.run(self.invites_db.track_invite_code, guild.id, invite.code, invite_payload, None)
+
     def get_payload_for_invite(self, invite) -> dict:
         return {
             "id": invite.id,
@@ -117,12 +137,6 @@ class InviteTracker(TacobotCog):
             "url": invite.url,
         }
 
-    def find_invite_by_code(self, inviteList, code) -> typing.Optional[dict]:
-        for invite in inviteList:
-            if invite.code == code:
-                return invite
-        return None
-
 
 async def setup(bot) -> None:
     await bot.add_cog(InviteTracker(bot))
@@ -1,12 +1,12 @@
-import inspect
 import os
 import traceback
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums import tacotypes
 from bot.lib.enums.system_actions import SystemActions
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tacos import TacosDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
@@ -16,7 +16,7 @@ from discord.ext import commands
 class JoinLeaveTracker(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "tacobot")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -27,17 +27,18 @@ class JoinLeaveTracker(TacobotCog):
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # remove all tacos from the user
         guild_id = member.guild.id
         try:
             if not member or member.bot or member.system:
                 return
 
-            _method = inspect.stack()[0][3]
+            _method = utils.get_method_name()
             self.log.debug(guild_id, f"{self._module}.{self._class}.{_method}", f"{member} left the server")
-            self.taco_db.remove_all_tacos(guild_id, member.id)
-            self.taco_db.track_tacos_log(
+            await executor.run(self.taco_db.remove_all_tacos, guild_id, member.id)
+            await executor.run(
+                self.taco_db.track_tacos_log,
                 guildId=guild_id,
                 toUserId=member.id,
                 fromUserId=self.bot.user.id,
@@ -45,16 +46,19 @@ class JoinLeaveTracker(TacobotCog):
                 reason="leaving the server",
                 type=tacotypes.TacoTypes.get_db_type_from_taco_type(tacotypes.TacoTypes.LEAVE_SERVER),
             )
-            self.tracking_db.track_user_join_leave(guildId=guild_id, userId=member.id, join=False)
-            self.tracking_db.track_system_action(
-                guild_id=guild_id, action=SystemActions.LEAVE_SERVER, data={"user_id": str(member.id)}
+            await executor.run(self.tracking_db.track_user_join_leave, guildId=guild_id, userId=member.id, join=False)
+            await executor.run(
+                self.tracking_db.track_system_action,
+                guild_id=guild_id,
+                action=SystemActions.LEAVE_SERVER,
+                data={"user_id": str(member.id)},
             )
         except Exception as ex:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
 
     @commands.Cog.listener()
     async def on_member_join(self, member) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = member.guild.id
         try:
             if not member or member.bot or member.system:
@@ -68,9 +72,12 @@ class JoinLeaveTracker(TacobotCog):
                 tacotypes.TacoTypes.JOIN_SERVER,
             )
 
-            self.tracking_db.track_user_join_leave(guildId=guild_id, userId=member.id, join=True)
-            self.tracking_db.track_system_action(
-                guild_id=guild_id, action=SystemActions.JOIN_SERVER, data={"user_id": str(member.id)}
+            await executor.run(self.tracking_db.track_user_join_leave, guildId=guild_id, userId=member.id, join=True)
+            await executor.run(
+                self.tracking_db.track_system_action,
+                guild_id=guild_id,
+                action=SystemActions.JOIN_SERVER,
+                data={"user_id": str(member.id)},
             )
         except Exception as ex:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
@@ -1,5 +1,4 @@
 import asyncio
-import inspect
 import os
 import traceback
 import typing
@@ -11,7 +10,8 @@ from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums import tacotypes
 from bot.lib.enums.system_actions import SystemActions
 from bot.lib.messaging import Messaging
-from bot.lib.mongodb.live import LiveDatabase
+from bot.lib.mongodb import executor
+from bot.lib.mongodb.live import LiveDatabase, LiveIndex
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.mongodb.twitch import TwitchDatabase
 from bot.tacobot import TacoBot
@@ -21,7 +21,7 @@ from discord.ext import commands
 class LiveNow(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "live_now")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -35,9 +35,31 @@ class LiveNow(TacobotCog):
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
+    async def cog_load(self) -> None:
+        await super().cog_load()
+        # load who is live up front so presence updates can be answered from memory
+        await executor.run(self.live_db.seed_live_index)
+
+    @commands.Cog.listener()
+    async def on_presence_update(self, before: discord.Member, after: discord.Member) -> None:
+        # discord.py 2.x reports activity changes here; on_member_update is kept for anything it still carries
+        await self.on_streaming_update(before, after)
+
     @commands.Cog.listener()
-    async def on_member_update(self, before, after):
-        _method = inspect.stack()[0][3]
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        await self.on_streaming_update(before, after)
+
+    @staticmethod
+    def get_streaming_activities(member: discord.Member) -> typing.Dict[str, discord.Streaming]:
+        """The member's streaming activities keyed by platform as ``live_tracked`` stores it, one per platform."""
+        streams: typing.Dict[str, discord.Streaming] = {}
+        for activity in member.activities:
+            if activity.type == discord.ActivityType.streaming and getattr(activity, "platform", None):
+                streams.setdefault(LiveIndex.normalize(activity.platform), activity)  # type: ignore[arg-type]
+        return streams
+
+    async def on_streaming_update(self, before: discord.Member, after: discord.Member) -> None:
+        _method = utils.get_method_name()
         guild_id = 0
         if before.guild:
             guild_id = before.guild.id
@@ -45,6 +67,16 @@ class LiveNow(TacobotCog):
             guild_id = after.guild.id
 
         try:
+            after_streaming_activities = self.get_streaming_activities(after)
+            live_platforms = LiveDatabase.live.platforms(guild_id, after.id)
+            # fast path: most presence updates do not change what the member is streaming, so they need
+            # no settings and no database. live_platforms is None until the index is seeded.
+            if live_platforms is not None:
+                if not after_streaming_activities and not live_platforms:
+                    return
+                if after_streaming_activities and after_streaming_activities.keys() <= live_platforms:
+                    return
+
             cog_settings = self.get_cog_settings(guild_id)
 
             if not cog_settings.get("enabled", False):
@@ -53,55 +85,26 @@ class LiveNow(TacobotCog):
             # get the tacos settings
             taco_settings = self.get_tacos_settings(guild_id)
 
-            before_streaming_activities = []
-            after_streaming_activities = []
-
-            before_streaming_activities_temp = [
-                a for a in before.activities if a.type == discord.ActivityType.streaming
-            ]
-            after_streaming_activities_temp = [a for a in after.activities if a.type == discord.ActivityType.streaming]
-
-            if len(before_streaming_activities_temp) == 0:
-                if before.activity and before.activity.type == discord.ActivityType.streaming:
-                    before_streaming_activities = [before.activity]
-            if len(after_streaming_activities_temp) == 0:
-                if after.activity and after.activity.type == discord.ActivityType.streaming:
-                    after_streaming_activities = [after.activity]
-
-            for bsa in before_streaming_activities_temp:
-                # if item is not in the list, add it
-                if len([b for b in before_streaming_activities if b.platform.lower() == bsa.platform.lower()]) == 0:
-                    self.log.debug(
-                        guild_id,
-                        f"{self._module}.{self._class}.{_method}",
-                        f"Adding {bsa.platform} to before_streaming_activities for {before.display_name}",
-                    )
-                    before_streaming_activities.append(bsa)
-
-            for asa in after_streaming_activities_temp:
-                if len([a for a in after_streaming_activities if a.platform.lower() == asa.platform.lower()]) == 0:
-                    self.log.debug(
-                        guild_id,
-                        f"{self._module}.{self._class}.{_method}",
-                        f"Adding {asa.platform} to after_streaming_activities for {after.display_name}",
-                    )
-                    after_streaming_activities.append(asa)
-
             # WENT LIVE
-            for asa in after_streaming_activities:
-                await asyncio.sleep(1)
+            for platform, asa in after_streaming_activities.items():
+                if live_platforms is not None:
+                    # claimed before any await, so a duplicate event for the same change stops here
+                    if not LiveDatabase.live.claim(guild_id, after.id, platform):
+                        continue
+                else:
+                    await asyncio.sleep(1)
 
-                tracked = self.live_db.get_tracked_live(guild_id, after.id, asa.platform)
-                is_tracked = tracked is not None and len(tracked) > 0
-                # if it is already tracked, then we don't need to do anything
-                if is_tracked:
-                    self.log.debug(
-                        guild_id,
-                        f"{self._module}.{self._class}.{_method}",
-                        f"{after.display_name} is already tracked for {asa.platform}",
-                    )
-                    await self.add_live_roles(after, cog_settings)
-                    continue
+                    tracked = await executor.run(self.live_db.get_tracked_live, guild_id, after.id, asa.platform)
+                    is_tracked = tracked is not None and len(tracked) > 0
+                    # if it is already tracked, then we don't need to do anything
+                    if is_tracked:
+                        self.log.debug(
+                            guild_id,
+                            f"{self._module}.{self._class}.{_method}",
+                            f"{after.display_name} is already tracked for {asa.platform}",
+                        )
+                        await self.add_live_roles(after, cog_settings)
+                        continue
 
                 self.log.info(
                     guild_id,
@@ -110,20 +113,28 @@ class LiveNow(TacobotCog):
                 )
 
                 # if we get here, then we need to track the user live activity
-                self.live_db.track_live(guildId=guild_id, userId=after.id, platform=asa.platform, url=asa.url)
-                self.live_db.track_live_activity(
-                    guildId=guild_id, userId=after.id, live=True, platform=asa.platform, url=asa.url
+                await executor.run(
+                    self.live_db.track_live, guildId=guild_id, userId=after.id, platform=asa.platform, url=asa.url
+                )
+                await executor.run(
+                    self.live_db.track_live_activity,
+                    guildId=guild_id,
+                    userId=after.id,
+                    live=True,
+                    platform=asa.platform,
+                    url=asa.url,
                 )
 
                 await self.add_live_roles(after, cog_settings)
 
                 twitch_name: typing.Union[str, None] = None
+                streaming_activities = list(after_streaming_activities.values())
                 if asa.platform.lower() == "twitch":
-                    twitch_name = self.handle_twitch_live(after, after_streaming_activities)
+                    twitch_name = await self.handle_twitch_live(after, streaming_activities)
                 elif asa.platform.lower() == "youtube":
-                    self.handle_youtube_live(after, after_streaming_activities)
+                    self.handle_youtube_live(after, streaming_activities)
                 else:
-                    self.handle_other_live(after, after_streaming_activities)
+                    self.handle_other_live(after, streaming_activities)
 
                 logging_channel_id = cog_settings.get("logging_channel", None)
                 if logging_channel_id:
@@ -194,7 +205,8 @@ class LiveNow(TacobotCog):
 
             #     await self.remove_live_roles(before, cog_settings)
 
-            if len(before_streaming_activities) == 0 and len(after_streaming_activities) == 0:
+            # ENDED: nothing is streaming any more
+            if len(after_streaming_activities) == 0:
                 try:
                     await self.remove_live_roles(after, cog_settings)
                     await self.clean_up_live(guild_id, after.id)
@@ -232,7 +244,7 @@ class LiveNow(TacobotCog):
     def handle_other_live(
         self, user: discord.Member, activities: typing.List[discord.Streaming]
     ) -> typing.Union[str, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = user.guild.id
         # get non-youtube activities and non-twitch activities
         other_activities = [
@@ -259,7 +271,7 @@ class LiveNow(TacobotCog):
     def handle_youtube_live(
         self, user: discord.Member, activities: typing.List[discord.Streaming]
     ) -> typing.Union[str, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = user.guild.id
         # get only the youtube activity
         youtube_activities = [a for a in activities if a.platform is not None and a.platform.lower() == "youtube"]
@@ -283,17 +295,17 @@ class LiveNow(TacobotCog):
         )
         return None
 
-    def handle_twitch_live(
+    async def handle_twitch_live(
         self, user: discord.Member, activities: typing.List[discord.Streaming]
     ) -> typing.Union[str, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = user.guild.id
 
         # get only the twitch activity
         twitch_activities = [a for a in activities if a.platform is not None and a.platform.lower() == "twitch"]
 
         twitch_name: typing.Optional[str] = None
-        twitch_info = self.twitch_db.get_user_twitch_info(user.id)
+        twitch_info = await executor.run(self.twitch_db.get_user_twitch_info, user.id)
         if len(twitch_activities) > 1:
             self.log.warn(
                 guild_id,
@@ -320,8 +332,9 @@ class LiveNow(TacobotCog):
                 f"{self._module}.{self._class}.{_method}",
                 f"{user.display_name} has a different twitch name: {twitch_name}",
             )
-            self.twitch_db.set_user_twitch_info(user.id, twitch_name)
-            self.tracking_db.track_system_action(
+            await executor.run(self.twitch_db.set_user_twitch_info, user.id, twitch_name)
+            await executor.run(
+                self.tracking_db.track_system_action,
                 guild_id=guild_id,
                 action=SystemActions.LINK_TWITCH_TO_DISCORD,
                 data={"user_id": str(user.id), "twitch_name": twitch_name.lower()},
@@ -339,7 +352,7 @@ class LiveNow(TacobotCog):
     async def log_live_post(
         self, channel_id: int, activity: discord.Streaming, user: discord.Member, twitch_name: typing.Union[str, None]
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = user.guild.id
         # get the logging channel
         logging_channel = None
@@ -396,19 +409,29 @@ class LiveNow(TacobotCog):
             )
 
             # this should update the existing entry with the channel and message id
-            self.live_db.track_live(
-                guild_id, user.id, activity.platform, logging_channel.id, message.id, url=activity.url
+            await executor.run(
+                self.live_db.track_live,
+                guild_id,
+                user.id,
+                activity.platform,
+                logging_channel.id,
+                message.id,
+                url=activity.url,
             )
 
     async def clean_up_live(self, guild_id: int, user_id: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if guild_id is None or user_id is None:
             return
 
-        all_tracked_for_user = self.live_db.get_tracked_live_by_user(guildId=guild_id, userId=user_id)
-        tracked_count = len(all_tracked_for_user)
-        if all_tracked_for_user is None or tracked_count == 0:
+        all_tracked_for_user = await executor.run(
+            self.live_db.get_tracked_live_by_user, guildId=guild_id, userId=user_id
+        )
+        if not all_tracked_for_user:
+            # nothing in live_tracked (a go-live that failed to save): make sure the index agrees
+            LiveDatabase.live.remove(guild_id, user_id)
             return
+        tracked_count = len(all_tracked_for_user)
 
         user = await self.discord_helper.get_or_fetch_member(guildId=guild_id, userId=user_id)
         if user is None:
@@ -435,7 +458,7 @@ class LiveNow(TacobotCog):
                 f"{self._module}.{self._class}.{_method}",
                 f"{utils.get_user_display_name(user)} stopped streaming on {platform}",
             )
-            self.live_db.track_live_activity(guild_id, user.id, False, platform, url=url)
+            await executor.run(self.live_db.track_live_activity, guild_id, user.id, False, platform, url=url)
 
             if logging_channel:
                 message_id = tracked.get("message_id", None)
@@ -452,7 +475,7 @@ class LiveNow(TacobotCog):
                         )
 
             # remove all tracked items for this live platform (should only be one)
-            self.live_db.untrack_live(guild_id, user.id, platform)
+            await executor.run(self.live_db.untrack_live, guild_id, user.id, platform)
             await self.remove_live_roles(user, cog_settings)
 
     def find_platform_emoji(self, guild: discord.Guild, platform: str) -> typing.Union[discord.Emoji, None]:
@@ -463,7 +486,7 @@ class LiveNow(TacobotCog):
         return platform_emoji
 
     def get_user_profile_image(self, twitch_user: typing.Union[str, None]) -> typing.Union[str, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if twitch_user:
                 result = requests.get(f"http://decapi.me/twitch/avatar/{twitch_user}")
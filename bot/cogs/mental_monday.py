@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -7,8 +6,10 @@ import typing
 import discord
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.mentalmondays import MentalMondaysDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.permissions import Permissions
@@ -24,7 +25,7 @@ class MentalMondays(TacobotCog):
 
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "mentalmondays")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -36,13 +37,14 @@ class MentalMondays(TacobotCog):
         self.SELF_DESTRUCT_TIMEOUT = 30
         self.mentalmondays_db = MentalMondaysDatabase()
         self.tracking_db = TrackingDatabase()
+        self.reaction_interest = ReactionInterest(section="mentalmondays", emojis=self._reaction_emojis)
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
     @commands.group(name="mentalmondays", invoke_without_command=True)
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def mentalmondays(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.invoked_subcommand is not None:
             return
         guild_id = 0
@@ -134,7 +136,8 @@ class MentalMondays(TacobotCog):
             )
 
             # save the mentalmondays to the database
-            self.mentalmondays_db.save_mentalmondays(
+            await executor.run(
+                self.mentalmondays_db.save_mentalmondays,
                 guildId=guild_id,
                 message=twa.text,
                 image=twa.attachments[0].url,
@@ -143,7 +146,8 @@ class MentalMondays(TacobotCog):
                 message_id=mentalmondays_message.id,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -160,7 +164,7 @@ class MentalMondays(TacobotCog):
     @app_commands.default_permissions(administrator=True)
     @app_commands.guild_only()
     async def openai_app_command(self, ctx: discord.Interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if not utils.isAdmin(ctx, self.settings):
@@ -179,7 +183,8 @@ class MentalMondays(TacobotCog):
                 return
             await self._openai_generate(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.user.id,
@@ -195,7 +200,7 @@ class MentalMondays(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def openai(self, ctx: Context):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.message:
@@ -203,7 +208,8 @@ class MentalMondays(TacobotCog):
 
             await self._openai_generate(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -220,7 +226,7 @@ class MentalMondays(TacobotCog):
     @commands.guild_only()
     async def import_mentalmondays(self, ctx, message_id: int) -> None:
         """Import mentalmondays from an existing post"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         if ctx.guild:
             guild_id = ctx.guild.id
@@ -248,9 +254,10 @@ class MentalMondays(TacobotCog):
             if not message:
                 return
 
-            self._import_mentalmondays(message)
+            await self._import_mentalmondays(message)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -267,7 +274,7 @@ class MentalMondays(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def give(self, ctx, member: discord.Member) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
@@ -276,7 +283,8 @@ class MentalMondays(TacobotCog):
 
             await self.give_user_mentalmondays_tacos(ctx.guild.id, member.id, ctx.channel.id, None)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -289,21 +297,15 @@ class MentalMondays(TacobotCog):
             self.log.error(ctx.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
 
-    async def _on_raw_reaction_add_give(self, payload):
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
-
-        # check if the user that reacted is in the admin role
-        if not await self.permissions.is_admin(payload.user_id, guild_id):
-            self.log.debug(
-                guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
-            )
-            return
-        # in future, check if the user is in a defined role that can grant tacos (e.g. moderator)
+    async def _on_raw_reaction_add_give(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
 
         # get the message that was reacted to
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
+        message = await ctx.get_message(fresh=True)
+        if not message:
+            return
         message_author = message.author
         # react_user = await self.discord_helper.get_or_fetch_user(payload.user_id)
 
@@ -317,8 +319,8 @@ class MentalMondays(TacobotCog):
             )
             return
 
-        already_tracked = self.mentalmondays_db.mentalmondays_user_message_tracked(
-            guild_id, message_author.id, message.id
+        already_tracked = await executor.run(
+            self.mentalmondays_db.mentalmondays_user_message_tracked, guild_id, message_author.id, message.id
         )
         if not already_tracked:
             # log that we are giving tacos for this reaction
@@ -337,20 +339,15 @@ class MentalMondays(TacobotCog):
                 f"Message {payload.message_id} has already been tracked for mentalmondays. Skipping.",
             )
 
-    async def _on_raw_reaction_add_import(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def _on_raw_reaction_add_import(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
 
-        # check if the user that reacted is in the admin role
-        if not await self.permissions.is_admin(payload.user_id, guild_id):
-            self.log.debug(
-                guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
-            )
+        message = await ctx.get_message(fresh=True)
+        if not message:
             return
 
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
-
         # check if this reaction is the first one of this type on the message
         reactions = discord.utils.get(message.reactions, emoji=payload.emoji.name)
         if reactions and reactions.count > 1:
@@ -361,40 +358,43 @@ class MentalMondays(TacobotCog):
             )
             return
 
-        self._import_mentalmondays(message)
+        await self._import_mentalmondays(message)
+
+    def _reaction_emojis(self, cog_settings: dict) -> typing.List[str]:
+        if not cog_settings.get("enabled", False):
+            return []
+        return cog_settings.get("reaction_emoji", ["🇲"]) + cog_settings.get("import_emoji", ["🇮"])
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            if payload.event_type != "REACTION_ADD":
+            cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
+            if not cog_settings.get("enabled", False):
+                return
+
+            reaction_emojis = cog_settings.get("reaction_emoji", ["🇲"])
+            reaction_import_emojis = cog_settings.get("import_emoji", ["🇮"])
+            check_list = reaction_emojis + reaction_import_emojis
+            if str(payload.emoji.name) not in check_list:
                 return
 
             # check if the user that reacted is in the admin role
-            if not await self.permissions.is_admin(payload.user_id, guild_id):
+            if not await ctx.is_admin():
                 self.log.debug(
                     guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
                 )
                 return
 
-            react_user = await self.discord_helper.get_or_fetch_user(payload.user_id)
+            react_user = await ctx.get_user()
             if not react_user or react_user.bot or react_user.system:
                 return
 
-            cog_settings = self.get_cog_settings(guild_id)
-            if not cog_settings.get("enabled", False):
-                return
-
-            reaction_emojis = cog_settings.get("reaction_emoji", ["🇲"])
-            reaction_import_emojis = cog_settings.get("import_emoji", ["🇮"])
-            check_list = reaction_emojis + reaction_import_emojis
-            if str(payload.emoji.name) not in check_list:
-                return
-
             if str(payload.emoji.name) in reaction_emojis:
-                await self._on_raw_reaction_add_give(payload)
-                self.tracking_db.track_command_usage(
+                await self._on_raw_reaction_add_give(ctx)
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=payload.channel_id,
                     userId=payload.user_id,
@@ -422,8 +422,9 @@ class MentalMondays(TacobotCog):
             if today.weekday() != 0:  # 0 is monday
                 return
             if str(payload.emoji.name) in reaction_import_emojis:
-                await self._on_raw_reaction_add_import(payload)
-                self.tracking_db.track_command_usage(
+                await self._on_raw_reaction_add_import(ctx)
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=payload.channel_id,
                     userId=payload.user_id,
@@ -450,7 +451,7 @@ class MentalMondays(TacobotCog):
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
             # await self.messaging.notify_of_error(ctx)
 
-    def _import_mentalmondays(self, message: discord.Message):
+    async def _import_mentalmondays(self, message: discord.Message):
         if message is None or message.guild is None:
             return
         guild_id = message.guild.id
@@ -474,7 +475,8 @@ class MentalMondays(TacobotCog):
             "mentalmondays._import_mentalmondays",
             f"Importing mentalmondays message {message_id} from channel {channel_id} in guild {guild_id} for user {message_author.id} with text {text} and image {image_url}",
         )
-        self.mentalmondays_db.save_mentalmondays(
+        await executor.run(
+            self.mentalmondays_db.save_mentalmondays,
             guildId=guild_id,
             message=text or "",
             image=image_url,
@@ -486,7 +488,7 @@ class MentalMondays(TacobotCog):
     async def give_user_mentalmondays_tacos(
         self, guild_id: int, user_id: int, channel_id: int, message_id: int
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         ctx = None
         try:
             # create context
@@ -525,7 +527,7 @@ class MentalMondays(TacobotCog):
             )
 
             # track that the user answered the question.
-            self.mentalmondays_db.track_mentalmondays_answer(guild_id, member.id, message_id)
+            await executor.run(self.mentalmondays_db.track_mentalmondays_answer, guild_id, member.id, message_id)
 
             tacos_settings = self.get_tacos_settings(guild_id)
             amount = tacos_settings.get("mentalmondays_count", 5)
@@ -563,7 +565,7 @@ class MentalMondays(TacobotCog):
                 await self.messaging.notify_of_error(ctx)
 
     async def _openai_generate(self, ctx: typing.Union[Context, discord.Interaction]) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
 
         if ctx.guild:
@@ -667,7 +669,8 @@ class MentalMondays(TacobotCog):
                 content=message_content,
                 color=0x00FF00,
             )
-            self.mentalmondays_db.save_mentalmondays(
+            await executor.run(
+                self.mentalmondays_db.save_mentalmondays,
                 guildId=guild_id,
                 message=aiquestion,
                 image=None,
@@ -1,22 +1,26 @@
 # this is for restricted channels that only allow specific commands in chat.
-import inspect
 import os
 import re
 import traceback
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
-from discord.ext import commands
+
+MESSAGE_LINK_PATTERN = re.compile(
+    r'https:\/\/discord(?:app)?\.com\/channels\/(\d+)\/(\d+)\/(\d+)$', flags=re.MULTILINE | re.IGNORECASE
+)
 
 
 class MessagePreview(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "message_preview")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -24,26 +28,16 @@ class MessagePreview(TacobotCog):
         self.discord_helper = discordhelper.DiscordHelper(bot)
         self.messaging = Messaging(bot)
         self.tracking_db = TrackingDatabase()
+        self.message_interest = MessageInterest(patterns=(MESSAGE_LINK_PATTERN,))
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
-    @commands.Cog.listener()
-    async def on_message(self, message) -> None:
-        guild_id = 0
-        _method = inspect.stack()[0][3]
+    async def on_message(self, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        message = ctx.message
+        guild_id = ctx.guild_id
         try:
-            # if in a DM, ignore
-            if message.guild is None:
-                return
-            # if the message is from a bot, ignore
-            if message.author.bot:
-                return
-            guild_id = message.guild.id
-
-            pattern = re.compile(
-                r'https:\/\/discord(?:app)?\.com\/channels\/(\d+)\/(\d+)\/(\d+)$', flags=re.MULTILINE | re.IGNORECASE
-            )
-            match = pattern.search(message.content)
+            match = MESSAGE_LINK_PATTERN.search(message.content)
             if not match:
                 return
 
@@ -74,7 +68,8 @@ class MessagePreview(TacobotCog):
                     f"Guild ({ref_guild_id}) does not match this guild ({guild_id})",
                 )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=message.channel.id if message.channel else None,
                 userId=message.author.id,
@@ -85,7 +80,7 @@ class MessagePreview(TacobotCog):
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", f"{e}", traceback.format_exc())
 
     async def create_message_preview(self, ctx, message) -> discord.Message:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = message.guild.id
             target_channel = ctx.channel
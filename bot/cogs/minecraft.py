@@ -2,15 +2,15 @@
 # https://playerdb.co/
 # https://playerdb.co/api/player/minecraft/<name|uuid>
 
-import inspect
 import os
 import traceback
 
 import discord
 import requests
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.minecraft import MinecraftDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
@@ -21,7 +21,7 @@ from discord.ext.commands import Context
 class MinecraftCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "minecraft")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -37,21 +37,26 @@ class MinecraftCog(TacobotCog):
     # disable user from whitelist if they leave the discord
     @commands.Cog.listener()
     async def on_member_remove(self, member):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = member.guild.id
 
-            if not self.is_user_whitelisted(guild_id=guild_id, user_id=member.id):
+            if not await self.is_user_whitelisted(guild_id=guild_id, user_id=member.id):
                 return
-            mc_user = self.minecraft_db.get_minecraft_user(guildId=guild_id, userId=member.id)
+            mc_user = await executor.run(self.minecraft_db.get_minecraft_user, guildId=guild_id, userId=member.id)
             if not mc_user:
                 return
 
             self.log.debug(
                 member.guild.id, f"{self._module}.{self._class}.{_method}", f"Member {member.name} has left the server"
             )
-            self.minecraft_db.whitelist_minecraft_user(
-                guildId=guild_id, userId=member.id, username=mc_user['username'], uuid=mc_user['uuid'], whitelist=False
+            await executor.run(
+                self.minecraft_db.whitelist_minecraft_user,
+                guildId=guild_id,
+                userId=member.id,
+                username=mc_user['username'],
+                uuid=mc_user['uuid'],
+                whitelist=False,
             )
 
         except Exception as e:
@@ -59,7 +64,7 @@ class MinecraftCog(TacobotCog):
 
     @commands.group(name="minecraft", invoke_without_command=True)
     async def minecraft(self, ctx: Context):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.invoked_subcommand is not None:
             return
         guild_id = 0
@@ -70,7 +75,7 @@ class MinecraftCog(TacobotCog):
             await self.messaging.notify_of_error(ctx)
 
     async def status(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
@@ -98,7 +103,7 @@ class MinecraftCog(TacobotCog):
                 output_channel = ctx.author
                 AUTO_DELETE_TIMEOUT = None
 
-            if not self.is_user_whitelisted(guild_id, ctx.author.id):
+            if not await self.is_user_whitelisted(guild_id, ctx.author.id):
                 await self.messaging.send_embed(
                     channel=output_channel,
                     title=self.settings.get_string(guild_id, "minecraft_whitelist_title"),
@@ -161,7 +166,8 @@ class MinecraftCog(TacobotCog):
                 delete_after=AUTO_DELETE_TIMEOUT,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -177,7 +183,7 @@ class MinecraftCog(TacobotCog):
     @minecraft.command(name="start")
     @commands.guild_only()
     async def start_server(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
@@ -193,7 +199,7 @@ class MinecraftCog(TacobotCog):
                 output_channel = ctx.author
                 AUTO_DELETE_TIMEOUT = None
 
-            if not self.is_user_whitelisted(guild_id=guild_id, user_id=ctx.author.id):
+            if not await self.is_user_whitelisted(guild_id=guild_id, user_id=ctx.author.id):
                 await self.messaging.send_embed(
                     channel=output_channel,
                     title=self.settings.get_string(guild_id, "minecraft_control_title"),
@@ -255,7 +261,8 @@ class MinecraftCog(TacobotCog):
                 delete_after=AUTO_DELETE_TIMEOUT,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -272,7 +279,7 @@ class MinecraftCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def stop_server(self, ctx):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
@@ -339,7 +346,8 @@ class MinecraftCog(TacobotCog):
                 delete_after=AUTO_DELETE_TIMEOUT,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -355,14 +363,14 @@ class MinecraftCog(TacobotCog):
     @minecraft.command()
     @commands.guild_only()
     async def whitelist(self, ctx: Context):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
                 await ctx.message.delete()
                 guild_id = ctx.guild.id
 
-            if self.is_user_whitelisted(guild_id=guild_id, user_id=ctx.author.id):
+            if await self.is_user_whitelisted(guild_id=guild_id, user_id=ctx.author.id):
                 await self.messaging.send_embed(
                     channel=ctx.channel,
                     title=self.settings.get_string(guild_id, "minecraft_whitelist_title"),
@@ -487,8 +495,13 @@ class MinecraftCog(TacobotCog):
                     # if correct, add to whitelist
                     # check if user is in the whitelist
                     # minecraft_user = self.minecraft_db.get_minecraft_user(ctx.author.id)
-                    self.minecraft_db.whitelist_minecraft_user(
-                        guildId=guild_id, userId=ctx.author.id, username=mc_username, uuid=mc_uuid, whitelist=True
+                    await executor.run(
+                        self.minecraft_db.whitelist_minecraft_user,
+                        guildId=guild_id,
+                        userId=ctx.author.id,
+                        username=mc_username,
+                        uuid=mc_uuid,
+                        whitelist=True,
                     )
                     await self.messaging.send_embed(
                         channel=_ctx.channel,
@@ -520,8 +533,13 @@ class MinecraftCog(TacobotCog):
             # if correct, add to whitelist
             # check if user is in the whitelist
             # minecraft_user = self.minecraft_db.get_minecraft_user(ctx.author.id)
-            self.minecraft_db.whitelist_minecraft_user(
-                guildId=guild_id, userId=ctx.author.id, username=mc_username, uuid=mc_uuid, whitelist=True
+            await executor.run(
+                self.minecraft_db.whitelist_minecraft_user,
+                guildId=guild_id,
+                userId=ctx.author.id,
+                username=mc_username,
+                uuid=mc_uuid,
+                whitelist=True,
             )
             await self.messaging.send_embed(
                 channel=_ctx.channel,
@@ -533,7 +551,8 @@ class MinecraftCog(TacobotCog):
                 delete_after=30,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -546,9 +565,9 @@ class MinecraftCog(TacobotCog):
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
 
-    def is_user_whitelisted(self, guild_id: int, user_id: int):
+    async def is_user_whitelisted(self, guild_id: int, user_id: int):
         # check if user is in the whitelist
-        minecraft_user = self.minecraft_db.get_minecraft_user(guildId=guild_id, userId=user_id)
+        minecraft_user = await executor.run(self.minecraft_db.get_minecraft_user, guildId=guild_id, userId=user_id)
         if not minecraft_user:
             return False
 
@@ -559,7 +578,7 @@ class MinecraftCog(TacobotCog):
         return True
 
     def get_minecraft_status(self, guild_id: int = 0) -> dict:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # TODO: store url in settings
         result = requests.get("http://andeddu.bit13.local:10070/tacobot/minecraft/status")
         if result.status_code != 200:
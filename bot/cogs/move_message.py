@@ -3,23 +3,26 @@
 # and send the message to the new channel with the same content as the original.
 # it will identify the original author in the new embeded message that is sent by the bot.
 
-import inspect
 import os
 import traceback
 
 import discord
-from bot.lib import discordhelper, permissions
+from bot.lib import discordhelper, permissions, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
 from discord.ext import commands
 
+MOVE_EMOJI = '⏭️'
+
 
 class MoveMessageCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "move_message")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -27,38 +30,33 @@ class MoveMessageCog(TacobotCog):
         self.discord_helper = discordhelper.DiscordHelper(bot)
         self.messaging = Messaging(bot)
         self.tracking_db = TrackingDatabase()
+        self.reaction_interest = ReactionInterest(emojis=lambda section: [MOVE_EMOJI])
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload):
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            # ignore if not in a guild
-            if guild_id is None or guild_id == 0:
-                return
-            if payload.event_type != 'REACTION_ADD':
-                return
-
-            if str(payload.emoji) != '⏭️':
+            if str(payload.emoji) != MOVE_EMOJI:
                 return
 
-            channel = await self.discord_helper.get_or_fetch_channel(payload.channel_id)
+            channel = await ctx.get_channel()
             if channel is None:
                 return
-            message = await channel.fetch_message(payload.message_id)
+            message = await ctx.get_message()
             if message is None:
                 return
-            user = await self.discord_helper.get_or_fetch_user(payload.user_id)
+            user = await ctx.get_user()
             if user is None or user.bot or user.system:
                 return
 
-            react_member = await self.discord_helper.get_or_fetch_member(guild_id, user.id)
+            react_member = await ctx.get_member()
             if self.permissions.has_permission(react_member, discord.Permissions(manage_messages=True)):
                 # self.log.debug(guild_id, f"move_message.{_method}", f"{user.name} reacted to message {message.id} with {str(payload.emoji)}")
-                if str(payload.emoji) == '⏭️':
-                    ctx = self.discord_helper.create_context(
+                if str(payload.emoji) == MOVE_EMOJI:
+                    command_ctx = self.discord_helper.create_context(
                         bot=self.bot, message=message, channel=channel, author=user, guild=message.guild
                     )
 
@@ -67,23 +65,24 @@ class MoveMessageCog(TacobotCog):
                             message,
                             targetChannel=target_channel,
                             author=message.author,
-                            who=ctx.author,
+                            who=command_ctx.author,
                             reason="Moved by admin",
                         )
                         await message.delete()
 
                     await self.discord_helper.ask_channel(
-                        ctx=ctx,
+                        ctx=command_ctx,
                         title=self.settings.get_string(guild_id, "move_choose_channel_title"),
                         message=self.settings.get_string(guild_id, "move_choose_channel_message"),
                         timeout=60,
                         callback=callback,
                     )
 
-                    self.tracking_db.track_command_usage(
+                    await executor.run(
+                        self.tracking_db.track_command_usage,
                         guildId=guild_id,
-                        channelId=ctx.channel.id if ctx.channel else None,
-                        userId=ctx.author.id,
+                        channelId=command_ctx.channel.id if command_ctx.channel else None,
+                        userId=command_ctx.author.id,
                         command="move-message",
                         subcommand=None,
                         args=[
@@ -110,12 +109,12 @@ class MoveMessageCog(TacobotCog):
     @commands.guild_only()
     @commands.has_permissions(manage_messages=True)
     async def move(self, ctx, messageId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.invoked_subcommand is not None:
             return
 
         try:
-            _method = inspect.stack()[0][3]
+            _method = utils.get_method_name()
             if ctx.guild is None:
                 return
             await ctx.message.delete()
@@ -159,7 +158,8 @@ class MoveMessageCog(TacobotCog):
             )
             await message.delete()
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import math
 import os
 import traceback
@@ -8,6 +7,7 @@ from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums.system_actions import SystemActions
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.settings import SettingsDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.mongodb.whitelist import WhitelistDatabase
@@ -18,7 +18,7 @@ from discord.ext import commands
 class NewAccountCheckCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "account_age_check")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -44,15 +44,20 @@ class NewAccountCheckCog(TacobotCog):
     @commands.guild_only()
     async def set_minimum_account_age(self, ctx, minimum_age: int) -> None:
         """Set the minimum account age in days"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             await ctx.message.delete()
 
-            self.settings_db.set_setting(
-                guildId=guild_id, name=self.SETTINGS_SECTION, key="minimum_account_age", value=minimum_age
+            await executor.run(
+                self.settings_db.set_setting,
+                guildId=guild_id,
+                name=self.SETTINGS_SECTION,
+                key="minimum_account_age",
+                value=minimum_age,
             )
-            self.tracking_db.track_system_action(
+            await executor.run(
+                self.tracking_db.track_system_action,
                 guild_id=guild_id,
                 action=SystemActions.MINIMUM_ACCOUNT_AGE_SET,
                 data={"minimum_account_age": str(minimum_age), "set_by": str(ctx.author.id)},
@@ -71,13 +76,16 @@ class NewAccountCheckCog(TacobotCog):
     @commands.guild_only()
     async def whitelist_add(self, ctx, user_id: int) -> None:
         """Add a user to the whitelist to allow them to join if their account is newer than the minimum account age"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             await ctx.message.delete()
 
-            self.whitelist_db.add_user_to_join_whitelist(guild_id=guild_id, user_id=user_id, added_by=ctx.author.id)
-            self.tracking_db.track_system_action(
+            await executor.run(
+                self.whitelist_db.add_user_to_join_whitelist, guild_id=guild_id, user_id=user_id, added_by=ctx.author.id
+            )
+            await executor.run(
+                self.tracking_db.track_system_action,
                 guild_id=guild_id,
                 action=SystemActions.JOIN_WHITELIST_ADD,
                 data={"user_id": str(user_id), "added_by": str(ctx.author.id)},
@@ -99,13 +107,14 @@ class NewAccountCheckCog(TacobotCog):
     @commands.guild_only()
     async def whitelist_remove(self, ctx, user_id: int) -> None:
         """Remove a user from the join whitelist"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             await ctx.message.delete()
 
-            self.whitelist_db.remove_user_from_join_whitelist(guild_id=guild_id, user_id=user_id)
-            self.tracking_db.track_system_action(
+            await executor.run(self.whitelist_db.remove_user_from_join_whitelist, guild_id=guild_id, user_id=user_id)
+            await executor.run(
+                self.tracking_db.track_system_action,
                 guild_id=guild_id,
                 action=SystemActions.JOIN_WHITELIST_REMOVE,
                 data={"user_id": str(user_id), "removed_by": str(ctx.author.id)},
@@ -134,16 +143,16 @@ class NewAccountCheckCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_error(self, event, *args, **kwargs) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.error(0, f"{self._module}.{self._class}.{_method}", f"{str(event)}", traceback.format_exc())
 
     @commands.Cog.listener()
     async def on_member_join(self, member) -> None:
         guild_id = member.guild.id
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # check if the member is in the white list
-            whitelist = self.whitelist_db.get_user_join_whitelist(guild_id=guild_id)
+            whitelist = await executor.run(self.whitelist_db.get_user_join_whitelist, guild_id=guild_id)
 
             # if they are in the whitelist, let them in
             if member.id in [x["user_id"] for x in whitelist]:
@@ -170,7 +179,8 @@ class NewAccountCheckCog(TacobotCog):
                     f"Member {utils.get_user_display_name(member)} (ID: {member.id}) account age ({age_days} days) is less than {minimum_account_age} days.",
                 )
                 message = f"⚠️New Account⚠️: {member.name} account age ({age_days} days) is less than required minimum of {minimum_account_age} days."
-                self.tracking_db.track_system_action(
+                await executor.run(
+                    self.tracking_db.track_system_action,
                     guild_id=guild_id,
                     action=SystemActions.NEW_ACCOUNT_KICK,
                     data={"user_id": str(member.id), "reason": message, "account_age": age_days},
@@ -1,59 +1,60 @@
-import inspect
 import os
 import re
 import traceback
+import typing
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
+from bot.lib.discord.channel_index import ChannelConfigIndex
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
 from bot.lib.enums import tacotypes
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
 from discord.ext import commands
 
+# a link to an image uploaded to discord
+MEDIA_PATTERN = re.compile(
+    r"(https:\/\/)((?:cdn|media)\.discordapp\.(?:net|com))\/attachments\/\d+\/\d+\/\w+\.(png|jpe?g|gif|webp)",
+    re.MULTILINE | re.DOTALL | re.UNICODE | re.IGNORECASE,
+)
+
 
 class PhotoPostCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "photo_post")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
 
         self.discord_helper = discordhelper.DiscordHelper(bot)
         self.tracking_db = TrackingDatabase()
+        # channel id -> channel settings, per guild
+        self.channel_index = ChannelConfigIndex(self.SETTINGS_SECTION)
+        self.message_interest = MessageInterest(predicate=lambda ctx: self._get_post_channel(ctx) is not None)
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
+    async def cog_load(self) -> None:
+        await super().cog_load()
+        await executor.run(self.channel_index.warm, [guild.id for guild in self.bot.guilds])
+
     @commands.Cog.listener()
-    async def on_message(self, message):
-        _method = inspect.stack()[0][3]
-        guild_id = 0
+    async def on_guild_available(self, guild) -> None:
+        # cogs load before the gateway connects, so guilds are warmed as they arrive
+        await self.channel_index.refresh(guild.id)
+
+    async def on_message(self, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        message = ctx.message
+        guild_id = ctx.guild_id
         try:
-            if message.guild is not None:
-                guild_id = message.guild.id
-            if guild_id == 0:
-                return
-            # if the message is from a bot, ignore
-            if message.author.bot:
-                return
-
-            # check if message has a link to the image in it
-            media_regex = r"(https:\/\/)((?:cdn|media)\.discordapp\.(?:net|com))\/attachments\/\d+\/\d+\/\w+\.(png|jpe?g|gif|webp)"
-
-            # get the settings from settings
-            cog_settings = self.get_cog_settings(guild_id)
-
-            allowed_channel_list = [
-                c for c in cog_settings.get("channels", []) if str(c["id"]) == str(message.channel.id)
-            ]
-            post_channel = None
-            if allowed_channel_list:
-                post_channel = allowed_channel_list[0]
-
+            post_channel = self._get_post_channel(ctx)
             if not post_channel:
                 return
 
             # if the message is not a photo, ignore
-            matches = re.search(media_regex, message.content, re.MULTILINE | re.DOTALL | re.UNICODE | re.IGNORECASE)
+            matches = MEDIA_PATTERN.search(message.content)
             if not message.attachments and matches is None:
                 self.log.debug(
                     guild_id,
@@ -97,7 +98,8 @@ class PhotoPostCog(TacobotCog):
 
             # track the message in the database
             image_url = message.attachments[0].url if message.attachments else matches.group(0) if matches else None
-            self.tracking_db.track_photo_post(
+            await executor.run(
+                self.tracking_db.track_photo_post,
                 guildId=guild_id,
                 userId=message.author.id,
                 messageId=message.id,
@@ -111,6 +113,9 @@ class PhotoPostCog(TacobotCog):
         except Exception as e:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
 
+    def _get_post_channel(self, ctx: MessageContext) -> typing.Optional[dict]:
+        return self.channel_index.get(ctx.guild_id, ctx.channel_id)
+
 
 async def setup(bot):
     await bot.add_cog(PhotoPostCog(bot))
@@ -1,89 +1,94 @@
 # this is for restricted channels that only allow specific commands in chat.
 import asyncio
-import inspect
 import os
 import re
 import traceback
 import typing
+from dataclasses import dataclass
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
+from bot.lib.discord.channel_index import ChannelConfigIndex
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.tacobot import TacoBot
 from discord.ext import commands
 
 
+@dataclass(frozen=True)
+class RestrictedChannel:
+    # {
+    #   id: "",
+    #   allowed: ["", ""],
+    #   denied: ["", ""],
+    #   deny_message: "",
+    #   silent: true,
+    # }
+    silent: bool
+    allowed: typing.Tuple[re.Pattern, ...]
+    denied: typing.Tuple[re.Pattern, ...]
+    deny_message: typing.Optional[str]
+
+    @classmethod
+    def from_settings(cls, channel: dict) -> "RestrictedChannel":
+        return cls(
+            silent=channel.get("silent", True),
+            allowed=tuple(re.compile(r) for r in channel.get("allowed", [])),
+            denied=tuple(re.compile(r) for r in channel.get("denied", [])),
+            deny_message=channel.get("deny_message"),
+        )
+
+    def allows(self, content: str) -> bool:
+        # the message must match one of the allowed expressions and none of the denied ones
+        return any(r.search(content) for r in self.allowed) and not any(r.search(content) for r in self.denied)
+
+
 class RestrictedCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "restricted")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
 
         self.discord_helper = discordhelper.DiscordHelper(bot)
         self.messaging = Messaging(bot)
+        # channel id -> RestrictedChannel with its patterns compiled, per guild
+        self.channel_index = ChannelConfigIndex(self.SETTINGS_SECTION, prepare=RestrictedChannel.from_settings)
+        # commands are included: the allowed / denied patterns are usually commands
+        self.message_interest = MessageInterest(predicate=lambda ctx: self._get_restricted_channel(ctx) is not None)
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
+    async def cog_load(self) -> None:
+        await super().cog_load()
+        await executor.run(self.channel_index.warm, [guild.id for guild in self.bot.guilds])
+
     @commands.Cog.listener()
-    async def on_message(self, message) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = 0
-        try:
-            # if in a DM, ignore
-            if message.guild is None:
-                return
-            # if the message is from a bot, ignore
-            if message.author.bot:
-                return
+    async def on_guild_available(self, guild) -> None:
+        # cogs load before the gateway connects, so guilds are warmed as they arrive
+        await self.channel_index.refresh(guild.id)
 
-            guild_id = message.guild.id
-
-            # {
-            #   channels: [
-            #   {
-            #       id: "",
-            #       allowed: ["", ""],
-            #       denied: ["", ""],
-            #       deny_message: "",
-            #   ]
-            # }
-
-            # get the suggestion settings from settings
-            cog_settings = self.get_cog_settings(guild_id)
-
-            # get the suggestion channel ids from settings
-            restricted_channels: typing.List[dict] = [
-                c for c in cog_settings.get("channels", []) if str(c['id']) == str(message.channel.id)
-            ]
-            restricted_channel: typing.Union[dict, None] = None
-            if restricted_channels:
-                restricted_channel = restricted_channels[0]
-            # if channel.id is not in restricted_channel_ids[] return
-            if not restricted_channel:
+    async def on_message(self, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        message = ctx.message
+        guild_id = ctx.guild_id
+        try:
+            restricted_channel = self._get_restricted_channel(ctx)
+            if restricted_channel is None:
                 return
 
-            silent = restricted_channel.get('silent', True)
-            # get allowed commands from settings
-            allowed = restricted_channel.get("allowed", [])
-            # get denied commands from settings
-            denied = restricted_channel.get("denied", [])
-            # get the deny message from settings
-            deny_message = self.settings.get_string(guild_id, "restricted_deny_message")
-            if "deny_message" in restricted_channel:
-                deny_message = restricted_channel.get("deny_message")
-
-            # if message matches the allowed[] regular expressions then continue
-            if not any(re.search(r, message.content) for r in allowed) or any(
-                re.search(r, message.content) for r in denied
-            ):
+            if not restricted_channel.allows(message.content):
                 # wait
                 await asyncio.sleep(0.5)
                 await message.delete()
 
-                if not silent:
+                if not restricted_channel.silent:
+                    deny_message = restricted_channel.deny_message
+                    if deny_message is None:
+                        deny_message = self.settings.get_string(guild_id, "restricted_deny_message")
                     await self.messaging.send_embed(
                         channel=message.channel,
                         title=self.settings.get_string(guild_id, "restricted"),
@@ -98,6 +103,9 @@ class RestrictedCog(TacobotCog):
         except Exception as e:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", f"{e}", traceback.format_exc())
 
+    def _get_restricted_channel(self, ctx: MessageContext) -> typing.Optional[RestrictedChannel]:
+        return self.channel_index.get(ctx.guild_id, ctx.channel_id)
+
 
 async def setup(bot):
     await bot.add_cog(RestrictedCog(bot))
@@ -1,10 +1,9 @@
 import datetime
-import inspect
 import os
 import traceback
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums import tacotypes
 from bot.tacobot import TacoBot
@@ -14,7 +13,7 @@ from discord.ext import commands
 class ServerEventCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "tacobot")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -25,7 +24,7 @@ class ServerEventCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_scheduled_event_create(self, event: discord.ScheduledEvent) -> None:
-        _method: str = inspect.stack()[0][3]
+        _method: str = utils.get_method_name()
         if event is None or event.guild is None or event.creator is None:
             # if creator is none, no one to give tacos to
             return
@@ -44,7 +43,7 @@ class ServerEventCog(TacobotCog):
             return
 
     async def on_scheduled_event_delete(self, event: discord.ScheduledEvent) -> None:
-        _method: str = inspect.stack()[0][3]
+        _method: str = utils.get_method_name()
         if event is None or event.guild is None or event.creator is None:
             # if creator is none, no one to give tacos to
             return
@@ -72,7 +71,7 @@ class ServerEventCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_scheduled_event_update(self, before: discord.ScheduledEvent, after: discord.ScheduledEvent) -> None:
-        _method: str = inspect.stack()[0][3]
+        _method: str = utils.get_method_name()
         if before is None or before.guild is None or before.creator is None:
             # if creator is none, no one to give tacos to
             return
@@ -108,7 +107,7 @@ class ServerEventCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_scheduled_event_user_add(self, event: discord.ScheduledEvent, user: discord.User) -> None:
-        _method: str = inspect.stack()[0][3]
+        _method: str = utils.get_method_name()
         if event is None or event.guild is None or user is None:
             # if creator is none, no one to give tacos to
             return
@@ -128,7 +127,7 @@ class ServerEventCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_scheduled_event_user_remove(self, event: discord.ScheduledEvent, user: discord.User) -> None:
-        _method: str = inspect.stack()[0][3]
+        _method: str = utils.get_method_name()
         if event is None or event.guild is None or user is None:
             # if creator is none, no one to give tacos to
             return
@@ -1,4 +1,3 @@
-import inspect
 import os
 import traceback
 import typing
@@ -6,8 +5,10 @@ import typing
 import discord
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.reaction_router import REACTION_ADD, REACTION_REMOVE, ReactionContext, ReactionInterest
 from bot.lib.enums.system_actions import SystemActions
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.mongodb.twitch import TwitchDatabase
 from bot.tacobot import TacoBot
@@ -17,7 +18,7 @@ from discord.ext import commands
 class StreamTeamCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "streamteam")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -27,52 +28,49 @@ class StreamTeamCog(TacobotCog):
 
         self.twitch_db = TwitchDatabase()
         self.tracking_db = TrackingDatabase()
+        self.reaction_interest = ReactionInterest(
+            section="streamteam",
+            emojis=lambda section: section.get("emoji", []),
+            events=frozenset({REACTION_ADD, REACTION_REMOVE}),
+        )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_remove(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id or 0
-        try:
-            if guild_id is None or guild_id == 0:
-                return
-            if payload.event_type != 'REACTION_REMOVE':
-                return
-            channel = await self.bot.fetch_channel(payload.channel_id)
-            message = await channel.fetch_message(payload.message_id)
-            user = await self.discord_helper.get_or_fetch_user(payload.user_id)
-            if not user or user.bot or user.system:
-                return
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        if ctx.event == REACTION_ADD:
+            await self._on_reaction_add(ctx)
+        elif ctx.event == REACTION_REMOVE:
+            await self._on_reaction_remove(ctx)
 
+    async def _on_reaction_remove(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
+        try:
             # get the streamteam settings from settings
-            streamteam_settings = self.settings.get_settings(guild_id, self.SETTINGS_SECTION)
-            if not streamteam_settings:
-                # raise exception if there are no streamteam settings
-                self.log.error(
-                    guild_id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"No streamteam settings found for guild {guild_id}",
-                )
-                await self.discord_helper.notify_bot_not_initialized(message, "streamteam")
-                return
+            streamteam_settings = ctx.get_settings(self.SETTINGS_SECTION)
 
             # get the reaction emoji
             emoji = streamteam_settings["emoji"]
             team_name = streamteam_settings["name"]
             # get the message ids to check
             watch_message_ids = streamteam_settings["message_ids"]
-            # get the log channel id
-            log_channel_id = streamteam_settings["log_channel"]
-            log_channel = None
-            if log_channel_id:
-                log_channel = await self.discord_helper.get_or_fetch_channel(log_channel_id)
 
             # check if the message that is reacted to is in the list of message ids and the emoji is one that is configured.
-            if str(message.id) in watch_message_ids and str(payload.emoji) in emoji:
+            if str(payload.message_id) in watch_message_ids and str(payload.emoji) in emoji:
+                user = await ctx.get_user()
+                if not user or user.bot or user.system:
+                    return
+
+                # get the log channel id
+                log_channel_id = streamteam_settings["log_channel"]
+                log_channel = None
+                if log_channel_id:
+                    log_channel = await self.discord_helper.get_or_fetch_channel(log_channel_id)
+
                 # add user to the stream team requests
-                self.twitch_db.remove_stream_team_request(guild_id, user.id)
-                twitch_user = self.twitch_db.get_user_twitch_info(user.id)
+                await executor.run(self.twitch_db.remove_stream_team_request, guild_id, user.id)
+                twitch_user = await executor.run(self.twitch_db.get_user_twitch_info, user.id)
                 twitch_name = "UNKNOWN"
                 if twitch_user:
                     twitch_name = twitch_user['twitch_name']
@@ -91,7 +89,8 @@ class StreamTeamCog(TacobotCog):
                         color=0xFF0000,
                     )
 
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=payload.channel_id if payload.channel_id else None,
                     userId=payload.user_id,
@@ -116,25 +115,13 @@ class StreamTeamCog(TacobotCog):
         except Exception as ex:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
 
-    @commands.Cog.listener()
-    @commands.guild_only()
-    async def on_raw_reaction_add(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id or 0
+    async def _on_reaction_add(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            # ignore if not in a guild
-            if guild_id is None or guild_id == 0:
-                return
-            if payload.event_type != 'REACTION_ADD':
-                return
-            channel = await self.bot.fetch_channel(payload.channel_id)
-            message = await channel.fetch_message(payload.message_id)
-            user = await self.discord_helper.get_or_fetch_user(payload.user_id)
-            if user is None or user.system or user.bot:
-                return
-
             # get the streamteam settings from settings
-            cog_settings = self.get_cog_settings(guild_id)
+            cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
 
             # get the reaction emoji
             emoji = cog_settings.get("emoji", [])
@@ -145,24 +132,31 @@ class StreamTeamCog(TacobotCog):
 
             # get the message ids to check
             watch_message_ids = cog_settings.get("message_ids", [])
-            # get the log channel id
-            log_channel_id = cog_settings.get("log_channel", None)
-            log_channel = None
-            if log_channel_id:
-                log_channel = await self.discord_helper.get_or_fetch_channel(log_channel_id)
 
             # check if the message that is reacted to is in the list of message ids and the emoji is one that is configured.
-            if str(message.id) in watch_message_ids and str(payload.emoji) in emoji:
+            if str(payload.message_id) in watch_message_ids and str(payload.emoji) in emoji:
+                user = await ctx.get_user()
+                if user is None or user.system or user.bot:
+                    return
+
+                # get the log channel id
+                log_channel_id = cog_settings.get("log_channel", None)
+                log_channel = None
+                if log_channel_id:
+                    log_channel = await self.discord_helper.get_or_fetch_channel(log_channel_id)
+
                 unknown = self.settings.get_string(guild_id, "unknown")
                 # send a message to the user and ask them their twitch name if it is not yet set
                 twitch_name = unknown
-                twitch_info = self.twitch_db.get_user_twitch_info(user.id)
+                twitch_info = await executor.run(self.twitch_db.get_user_twitch_info, user.id)
                 if twitch_info:
                     twitch_name = twitch_info['twitch_name']
                     if twitch_name is None or twitch_name == "":
                         twitch_name = unknown
                 # add user to the stream team requests
-                self.twitch_db.add_stream_team_request(guildId=guild_id, userId=user.id, twitchName=twitch_name)
+                await executor.run(
+                    self.twitch_db.add_stream_team_request, guildId=guild_id, userId=user.id, twitchName=twitch_name
+                )
 
                 if log_channel:
                     twitch_name = unknown if twitch_name is None else twitch_name
@@ -175,7 +169,8 @@ class StreamTeamCog(TacobotCog):
                         color=0x00FF00,
                     )
 
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=payload.channel_id if payload.channel_id else None,
                     userId=payload.user_id,
@@ -209,7 +204,7 @@ class StreamTeamCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_error(self, event, *args, **kwargs) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.error(0, f"{self._module}.{self._class}.{_method}", f"{str(event)}", traceback.format_exc())
 
     @commands.group()
@@ -220,11 +215,11 @@ class StreamTeamCog(TacobotCog):
     @team.command()
     @commands.guild_only()
     async def invite(self, ctx, twitchName: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             if twitchName is None:
-                twitchInfo = self.twitch_db.get_user_twitch_info(ctx.author.id)
+                twitchInfo = await executor.run(self.twitch_db.get_user_twitch_info, ctx.author.id)
                 if twitchInfo is not None:
                     twitchName = twitchInfo['twitch_name']
             if twitchName is None:
@@ -250,7 +245,8 @@ class StreamTeamCog(TacobotCog):
 
             await self._invite_user(ctx, ctx.author, twitchName)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -267,12 +263,13 @@ class StreamTeamCog(TacobotCog):
     @commands.guild_only()
     @commands.has_permissions(manage_guild=True)
     async def invite_user(self, ctx, user: discord.User, twitchName: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             guild_id = ctx.guild.id if ctx.guild else 0
             await self._invite_user(ctx, user, twitchName)
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -285,7 +282,7 @@ class StreamTeamCog(TacobotCog):
             await self.messaging.notify_of_error(ctx)
 
     async def _invite_user(self, ctx, user: discord.User, twitchName: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             # get the streamteam settings from settings
@@ -311,13 +308,16 @@ class StreamTeamCog(TacobotCog):
                 log_channel = await self.discord_helper.get_or_fetch_channel(log_channel_id)
             team_name = streamteam_settings["name"]
 
-            self.twitch_db.set_user_twitch_info(user.id, twitchName)
-            self.tracking_db.track_system_action(
+            await executor.run(self.twitch_db.set_user_twitch_info, user.id, twitchName)
+            await executor.run(
+                self.tracking_db.track_system_action,
                 guild_id=guild_id,
                 action=SystemActions.LINK_TWITCH_TO_DISCORD,
                 data={"user_id": str(user.id), "twitch_name": twitch_name.lower()},
             )
-            self.twitch_db.add_stream_team_request(guildId=ctx.guild.id, twitchName=twitchName, userId=user.id)
+            await executor.run(
+                self.twitch_db.add_stream_team_request, guildId=ctx.guild.id, twitchName=twitchName, userId=user.id
+            )
 
             await self.messaging.send_embed(
                 channel=ctx.channel,
@@ -1,16 +1,17 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
 import uuid
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.reaction_router import REACTION_ADD, REACTION_REMOVE, ReactionContext, ReactionInterest
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
 from bot.lib.models.suggestionstates import SuggestionStates
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.settings import SettingsDatabase
 from bot.lib.mongodb.suggestions import SuggestionsDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
@@ -22,7 +23,7 @@ from discord.ext import commands
 class SuggestionsCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "suggestions")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -34,12 +35,18 @@ class SuggestionsCog(TacobotCog):
         self.settings_db = SettingsDatabase()
         self.suggestions_db = SuggestionsDatabase()
         self.tracking_db = TrackingDatabase()
+        # every reaction in a suggestion channel: unknown emoji are removed
+        self.reaction_interest = ReactionInterest(
+            section="suggestions",
+            channels=lambda section: [c["id"] for c in section.get("channels", [])],
+            events=frozenset({REACTION_ADD, REACTION_REMOVE}),
+        )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             self.log.debug(0, f"{self._module}.{self._class}.{_method}", "suggestion cog is ready")
             # await self.start_constant_ask()
@@ -69,13 +76,13 @@ class SuggestionsCog(TacobotCog):
                         )
                         ss['channels'].remove(c)
                 if changed:
-                    self.settings_db.add_settings(guild_id, self.SETTINGS_SECTION, ss)
+                    await executor.run(self.settings_db.add_settings, guild_id, self.SETTINGS_SECTION, ss)
         except Exception as e:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = channel.guild.id
 
@@ -93,13 +100,13 @@ class SuggestionsCog(TacobotCog):
             if tracked_channel and len(tracked_channel) > 0:
                 # if this channel was in the settings, remove it
                 ss['channels'].remove(tracked_channel[0])
-                self.settings_db.add_settings(guild_id, self.SETTINGS_SECTION, ss)
+                await executor.run(self.settings_db.add_settings, guild_id, self.SETTINGS_SECTION, ss)
 
         except Exception as e:
             self.log.error(channel.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
 
     async def create_suggestion(self, ctx, suggestion_settings) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         if ctx is None:
             return
@@ -115,7 +122,7 @@ class SuggestionsCog(TacobotCog):
             allowed_channel_ids = [int(c['id']) for c in ss_channels]
             allowed_channels = []
             for aci in allowed_channel_ids:
-                ac = await self.bot.fetch_channel(aci)
+                ac = await self.discord_helper.get_or_fetch_channel(aci)
                 if ac:
                     allowed_channels.append(f"<#{ac.id}>")
             ac_list = "\n".join(allowed_channels)
@@ -243,12 +250,12 @@ class SuggestionsCog(TacobotCog):
             "author_id": str(ctx.author.id),
             "suggestion": {"title": suggestion_title, "description": suggestion_message},
         }
-        self.suggestions_db.add_suggestion(guild_id, s_message.id, suggestion_data)
+        await executor.run(self.suggestions_db.add_suggestion, guild_id, s_message.id, suggestion_data)
 
     @commands.group(aliases=["suggestion"])
     @commands.guild_only()
     async def suggest(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.invoked_subcommand is not None:
             return
 
@@ -272,7 +279,8 @@ class SuggestionsCog(TacobotCog):
                     raise Exception("No suggestion settings found")
 
                 await self.create_suggestion(ctx, ss)
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=ctx.channel.id if ctx.channel else None,
                     userId=ctx.author.id,
@@ -292,53 +300,45 @@ class SuggestionsCog(TacobotCog):
             await ctx.message.delete()
         # await self.start_constant_ask()
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id if payload.guild_id else 0
-        try:
-            # ignore if not in a guild
-            if guild_id is None or guild_id == 0:
-                return
-            if payload.event_type != 'REACTION_ADD':
-                return
-            channel = await self.discord_helper.get_or_fetch_channel(payload.channel_id)
-            if channel is None:
-                return
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        if ctx.event == REACTION_ADD:
+            await self._on_reaction_add(ctx)
+        elif ctx.event == REACTION_REMOVE:
+            await self._on_reaction_remove(ctx)
 
-            message = await channel.fetch_message(payload.message_id)
-            user = await self.discord_helper.get_or_fetch_user(payload.user_id)
+    async def _on_reaction_add(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
+        try:
+            user = await ctx.get_user()
             if not user or user.bot or user.system:
                 return
 
             # get suggestion from database
-            suggestion = self.suggestions_db.get_suggestion(guild_id, payload.message_id)
+            suggestion = await executor.run(self.suggestions_db.get_suggestion, guild_id, payload.message_id)
             if not suggestion or suggestion['message_id'] != str(payload.message_id):
                 return
 
             author = await self.discord_helper.get_or_fetch_user(int(suggestion['author_id']))
 
-            ss = self.settings.get_settings(guild_id, self.SETTINGS_SECTION)
-            if not ss:
-                # raise exception if there are no suggestion settings
-                self.log.debug(
-                    guild_id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"No suggestion settings found for guild {guild_id}",
-                )
-                raise Exception("No suggestion settings found")
+            ss = ctx.get_settings(self.SETTINGS_SECTION)
 
-            channel_settings = [c for c in ss['channels'] if c['id'] == str(channel.id)]
+            channel_settings = [c for c in ss['channels'] if c['id'] == str(payload.channel_id)]
             if not channel_settings:
                 self.log.debug(
                     guild_id,
                     f"{self._module}.{self._class}.{_method}",
-                    f"No suggestion settings found for channel {channel.id}",
+                    f"No suggestion settings found for channel {payload.channel_id}",
                 )
                 return
             else:
                 channel_settings = channel_settings[0]
 
+            message = await ctx.get_message()
+            if not message:
+                return
+
             log_channel = None
             if 'log_channel_id' in channel_settings and channel_settings['log_channel_id'] != "":
                 if channel_settings['log_channel_id'] == "0" or channel_settings['log_channel_id'] is None:
@@ -377,7 +377,9 @@ class SuggestionsCog(TacobotCog):
                 else:
                     vote = 1
 
-                has_user_voted = self.suggestions_db.has_user_voted_on_suggestion(suggestion['id'], user.id)
+                has_user_voted = await executor.run(
+                    self.suggestions_db.has_user_voted_on_suggestion, suggestion['id'], user.id
+                )
                 if has_user_voted:
                     self.log.debug(
                         guild_id,
@@ -394,9 +396,10 @@ class SuggestionsCog(TacobotCog):
                     )
                     return
                 else:
-                    self.suggestions_db.vote_suggestion_by_id(suggestion['id'], user.id, vote)
+                    await executor.run(self.suggestions_db.vote_suggestion_by_id, suggestion['id'], user.id, vote)
 
-                    self.tracking_db.track_command_usage(
+                    await executor.run(
+                        self.tracking_db.track_command_usage,
                         guildId=guild_id,
                         channelId=payload.channel_id if payload.channel_id else None,
                         userId=payload.user_id,
@@ -419,7 +422,7 @@ class SuggestionsCog(TacobotCog):
                     )
                 pass
             # if the user reacted with an admin emoji and they are an admin
-            elif str(payload.emoji) in admin_emoji and await self.permissions.is_admin(user.id, guild_id):
+            elif str(payload.emoji) in admin_emoji and await ctx.is_admin():
                 states = SuggestionStates()
                 # change the state based on the emoji
                 if str(payload.emoji) == channel_settings["admin_approve_emoji"]:
@@ -442,8 +445,13 @@ class SuggestionsCog(TacobotCog):
                         )
                         or "No reason given."
                     )
-                    self.suggestions_db.set_state_suggestion_by_id(
-                        guild_id, suggestion['id'], states.APPROVED, user.id, reason
+                    await executor.run(
+                        self.suggestions_db.set_state_suggestion_by_id,
+                        guild_id,
+                        suggestion['id'],
+                        states.APPROVED,
+                        user.id,
+                        reason,
                     )
                     await self.update_suggestion_state(message, states.APPROVED, user, reason, author=author)
                 elif str(payload.emoji) == channel_settings["admin_consider_emoji"]:
@@ -466,8 +474,13 @@ class SuggestionsCog(TacobotCog):
                         )
                         or "No reason given."
                     )
-                    self.suggestions_db.set_state_suggestion_by_id(
-                        guild_id, suggestion['id'], states.CONSIDERED, user.id, reason
+                    await executor.run(
+                        self.suggestions_db.set_state_suggestion_by_id,
+                        guild_id,
+                        suggestion['id'],
+                        states.CONSIDERED,
+                        user.id,
+                        reason,
                     )
                     await self.update_suggestion_state(message, states.CONSIDERED, user, reason, author=author)
                 elif str(payload.emoji) == channel_settings["admin_implemented_emoji"]:
@@ -490,8 +503,13 @@ class SuggestionsCog(TacobotCog):
                         )
                         or "No reason given."
                     )
-                    self.suggestions_db.set_state_suggestion_by_id(
-                        guild_id, suggestion['id'], states.IMPLEMENTED, user.id, reason
+                    await executor.run(
+                        self.suggestions_db.set_state_suggestion_by_id,
+                        guild_id,
+                        suggestion['id'],
+                        states.IMPLEMENTED,
+                        user.id,
+                        reason,
                     )
                     await self.update_suggestion_state(message, states.IMPLEMENTED, user, reason, author=author)
                 elif str(payload.emoji) == channel_settings["admin_reject_emoji"]:
@@ -514,8 +532,13 @@ class SuggestionsCog(TacobotCog):
                         )
                         or "No reason given."
                     )
-                    self.suggestions_db.set_state_suggestion_by_id(
-                        guild_id, suggestion['id'], states.REJECTED, user.id, reason
+                    await executor.run(
+                        self.suggestions_db.set_state_suggestion_by_id,
+                        guild_id,
+                        suggestion['id'],
+                        states.REJECTED,
+                        user.id,
+                        reason,
                     )
                     await self.update_suggestion_state(message, states.REJECTED, user, reason, author=author)
                 elif str(payload.emoji) == channel_settings["admin_close_emoji"]:
@@ -552,8 +575,13 @@ class SuggestionsCog(TacobotCog):
                         )
                         or "Closed by admin."
                     )
-                    self.suggestions_db.set_state_suggestion_by_id(
-                        guild_id, suggestion['id'], states.CLOSED, user.id, reason
+                    await executor.run(
+                        self.suggestions_db.set_state_suggestion_by_id,
+                        guild_id,
+                        suggestion['id'],
+                        states.CLOSED,
+                        user.id,
+                        reason,
                     )
                     await self.update_suggestion_state(
                         message, states.CLOSED, user, reason, author=author, color=close_state_color
@@ -569,7 +597,7 @@ class SuggestionsCog(TacobotCog):
 
                     # add fields with the votes
                     # get the votes from the database
-                    votes = self.suggestions_db.get_suggestion_votes_by_id(suggestion['id']) or []
+                    votes = await executor.run(self.suggestions_db.get_suggestion_votes_by_id, suggestion['id']) or []
                     # get count of each type of vote. either -1, 0, or 1
                     up_votes = [vote for vote in votes if vote['vote'] == 1] or []
                     up_word = "Vote" if len(up_votes) == 1 else "Votes"
@@ -619,10 +647,13 @@ class SuggestionsCog(TacobotCog):
                         )
                         or "Deleted by admin."
                     )
-                    self.suggestions_db.delete_suggestion_by_id(guild_id, suggestion['id'], user.id, reason=reason)
+                    await executor.run(
+                        self.suggestions_db.delete_suggestion_by_id, guild_id, suggestion['id'], user.id, reason=reason
+                    )
                     await message.delete()
 
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=payload.channel_id if payload.channel_id else None,
                     userId=payload.user_id,
@@ -651,36 +682,34 @@ class SuggestionsCog(TacobotCog):
             self.log.error(guild_id, "trivia", str(e), traceback.format_exc())
             return
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_remove(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id if payload.guild_id else 0
+    async def _on_reaction_remove(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            if guild_id is None or guild_id == 0:
-                return
-            if payload.event_type != 'REACTION_REMOVE':
-                return
-            channel = await self.bot.fetch_channel(payload.channel_id)
-            message = await channel.fetch_message(payload.message_id)
-            user = await self.discord_helper.get_or_fetch_user(payload.user_id)
+            user = await ctx.get_user()
             if not user or user.bot or user.system:
                 return
 
             # get suggestion from database
-            suggestion = self.suggestions_db.get_suggestion(guild_id, payload.message_id)
+            suggestion = await executor.run(self.suggestions_db.get_suggestion, guild_id, payload.message_id)
             if not suggestion or suggestion['message_id'] != str(payload.message_id):
                 return
 
             author = await self.discord_helper.get_or_fetch_user(int(suggestion['author_id']))
 
-            cog_settings = self.get_cog_settings(guild_id)
+            cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
 
-            channel_settings = [c for c in cog_settings['channels'] if c['id'] == str(channel.id)]
+            channel_settings = [c for c in cog_settings['channels'] if c['id'] == str(payload.channel_id)]
             if not channel_settings:
                 return
             else:
                 channel_settings = channel_settings[0]
 
+            message = await ctx.get_message(fresh=True)
+            if not message:
+                return
+
             vote_emoji = [
                 channel_settings["vote_up_emoji"],
                 channel_settings["vote_neutral_emoji"],
@@ -704,12 +733,15 @@ class SuggestionsCog(TacobotCog):
                     f"{self._module}.{self._class}.{_method}",
                     f"{user.name} removed vote from suggestion {suggestion['id']}",
                 )
-                has_user_voted = self.suggestions_db.has_user_voted_on_suggestion(suggestion['id'], user.id)
+                has_user_voted = await executor.run(
+                    self.suggestions_db.has_user_voted_on_suggestion, suggestion['id'], user.id
+                )
                 if not has_user_voted:
                     return
                 else:
-                    self.suggestions_db.unvote_suggestion_by_id(guild_id, suggestion['id'], user.id)
-                    self.tracking_db.track_command_usage(
+                    await executor.run(self.suggestions_db.unvote_suggestion_by_id, guild_id, suggestion['id'], user.id)
+                    await executor.run(
+                        self.tracking_db.track_command_usage,
                         guildId=guild_id,
                         channelId=payload.channel_id if payload.channel_id else None,
                         userId=payload.user_id,
@@ -730,7 +762,7 @@ class SuggestionsCog(TacobotCog):
                             },
                         ],
                     )
-            elif str(payload.emoji) in admin_emoji and await self.permissions.is_admin(user.id, guild_id):
+            elif str(payload.emoji) in admin_emoji and await ctx.is_admin():
                 states = SuggestionStates()
 
                 # admin removed reaction. do we need to set the state back to Active?
@@ -761,29 +793,49 @@ class SuggestionsCog(TacobotCog):
                 if str(payload.emoji) == channel_settings["admin_reject_emoji"]:
                     if reject_count <= 0:
                         if implemented_count != 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.IMPLEMENTED, user.id, "Reject State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.IMPLEMENTED,
+                                user.id,
+                                "Reject State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.IMPLEMENTED, user, "Reject State Was Removed", author=author
                             )
                         elif consider_count != 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.CONSIDERED, user.id, "Reject State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.CONSIDERED,
+                                user.id,
+                                "Reject State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.CONSIDERED, user, "Reject State Was Removed", author=author
                             )
                         elif approve_count != 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.APPROVED, user.id, "Reject State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.APPROVED,
+                                user.id,
+                                "Reject State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.APPROVED, user, "Reject State Was Removed", author=author
                             )
                         else:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.ACTIVE, user.id, "Reject State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.ACTIVE,
+                                user.id,
+                                "Reject State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.ACTIVE, user, "Reject State Was Removed", author=author
@@ -791,29 +843,49 @@ class SuggestionsCog(TacobotCog):
                 elif str(payload.emoji) == channel_settings["admin_implemented_emoji"]:
                     if implemented_count <= 0:
                         if reject_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.REJECTED, user.id, "Implemented State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.REJECTED,
+                                user.id,
+                                "Implemented State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.REJECTED, user, "Implemented State Was Removed", author=author
                             )
                         elif consider_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.CONSIDERED, user.id, "Implemented State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.CONSIDERED,
+                                user.id,
+                                "Implemented State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.CONSIDERED, user, "Reject State Was Removed", author=author
                             )
                         elif approve_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.APPROVED, user.id, "Implemented State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.APPROVED,
+                                user.id,
+                                "Implemented State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.APPROVED, user, "Reject State Was Removed", author=author
                             )
                         else:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.ACTIVE, user.id, "Implemented State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.ACTIVE,
+                                user.id,
+                                "Implemented State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.ACTIVE, user, "Reject State Was Removed", author=author
@@ -821,29 +893,49 @@ class SuggestionsCog(TacobotCog):
                 elif str(payload.emoji) == channel_settings["admin_consider_emoji"]:
                     if consider_count <= 0:
                         if reject_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.REJECTED, user.id, "Consider State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.REJECTED,
+                                user.id,
+                                "Consider State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.REJECTED, user, "Consider State Was Removed", author=author
                             )
                         elif implemented_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.IMPLEMENTED, user.id, "Consider State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.IMPLEMENTED,
+                                user.id,
+                                "Consider State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.IMPLEMENTED, user, "Consider State Was Removed", author=author
                             )
                         elif approve_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.APPROVED, user.id, "Consider State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.APPROVED,
+                                user.id,
+                                "Consider State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.APPROVED, user, "Consider State Was Removed", author=author
                             )
                         else:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.ACTIVE, user.id, "Consider State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.ACTIVE,
+                                user.id,
+                                "Consider State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.ACTIVE, user, "Consider State Was Removed", author=author
@@ -851,34 +943,55 @@ class SuggestionsCog(TacobotCog):
                 elif str(payload.emoji) == channel_settings["admin_approve_emoji"]:
                     if approve_count <= 0:
                         if reject_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.REJECTED, user.id, "Approve State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.REJECTED,
+                                user.id,
+                                "Approve State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.REJECTED, user, "Approve State Was Removed", author=author
                             )
                         elif implemented_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.IMPLEMENTED, user.id, "Approve State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.IMPLEMENTED,
+                                user.id,
+                                "Approve State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.IMPLEMENTED, user, "Approve State Was Removed", author=author
                             )
                         elif consider_count > 0:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.CONSIDERED, user.id, "Approve State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.CONSIDERED,
+                                user.id,
+                                "Approve State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.CONSIDERED, user, "Approve State Was Removed", author=author
                             )
                         else:
-                            self.suggestions_db.set_state_suggestion_by_id(
-                                guild_id, suggestion['id'], states.ACTIVE, user.id, "Approve State Was Removed"
+                            await executor.run(
+                                self.suggestions_db.set_state_suggestion_by_id,
+                                guild_id,
+                                suggestion['id'],
+                                states.ACTIVE,
+                                user.id,
+                                "Approve State Was Removed",
                             )
                             await self.update_suggestion_state(
                                 message, states.ACTIVE, user, "Approve State Was Removed", author=author
                             )
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=payload.channel_id if payload.channel_id else None,
                     userId=payload.user_id,
@@ -930,7 +1043,7 @@ class SuggestionsCog(TacobotCog):
         await self.messaging.update_embed(message=message, fields=fields, color=color, author=author)
 
     def get_color_for_state(self, state: str) -> typing.Union[int, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         states = SuggestionStates()
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", f"The state is {state}")
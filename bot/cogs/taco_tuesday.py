@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import re
 import traceback
@@ -9,8 +8,10 @@ import discord
 import pytz
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tacotuesdays import TacoTuesdaysDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.permissions import Permissions
@@ -21,7 +22,7 @@ from discord.ext import commands
 class TacoTuesdayCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "tacotuesday")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -32,6 +33,7 @@ class TacoTuesdayCog(TacobotCog):
         self.SELF_DESTRUCT_TIMEOUT = 30
         self.tacotuesdays_db = TacoTuesdaysDatabase()
         self.tracking_db = TrackingDatabase()
+        self.reaction_interest = ReactionInterest(section="tacotuesday", emojis=self._reaction_emojis)
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
@@ -43,7 +45,7 @@ class TacoTuesdayCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def new(self, ctx, member: discord.Member, tweet: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             await ctx.message.delete()
@@ -85,11 +87,12 @@ class TacoTuesdayCog(TacobotCog):
             for emoji in init_emoji:
                 await result_message.add_reaction(emoji)
 
-            self._import_taco_tuesday(result_message, tweet)
+            await self._import_taco_tuesday(result_message, tweet)
 
             await self._set_taco_tuesday_user(ctx=ctx, member=member)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -107,14 +110,15 @@ class TacoTuesdayCog(TacobotCog):
     @commands.guild_only()
     async def set(self, ctx, member: discord.Member) -> None:
         """Sets the user associated with the taco tuesday"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             await ctx.message.delete()
 
             await self._set_taco_tuesday_user(ctx=ctx, member=member)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -132,14 +136,15 @@ class TacoTuesdayCog(TacobotCog):
     @commands.guild_only()
     async def give(self, ctx, member: discord.Member) -> None:
         """Gives the user tacos"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             guild_id = ctx.guild.id
             await ctx.message.delete()
 
             await self.give_user_tacotuesday_tacos(ctx.guild.id, member.id, ctx.channel.id)
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -151,20 +156,15 @@ class TacoTuesdayCog(TacobotCog):
             self.log.error(ctx.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
 
-    async def _on_raw_reaction_add_import(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def _on_raw_reaction_add_import(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
 
-        # check if the user that reacted is in the admin role
-        if not await self.permissions.is_admin(payload.user_id, guild_id):
-            self.log.debug(
-                guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
-            )
+        message = await ctx.get_message(fresh=True)
+        if not message:
             return
 
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
-
         # check if this reaction is the first one of this type on the message
         reactions = discord.utils.get(message.reactions, emoji=payload.emoji.name)
         if reactions and reactions.count > 1:
@@ -175,9 +175,10 @@ class TacoTuesdayCog(TacobotCog):
             )
             return
 
-        self._import_taco_tuesday(message)
+        await self._import_taco_tuesday(message)
 
-        self.tracking_db.track_command_usage(
+        await executor.run(
+            self.tracking_db.track_command_usage,
             guildId=guild_id,
             channelId=payload.channel_id if payload.channel_id else None,
             userId=payload.user_id,
@@ -199,21 +200,17 @@ class TacoTuesdayCog(TacobotCog):
             ],
         )
 
-    async def _on_raw_reaction_add_archive(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def _on_raw_reaction_add_archive(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
 
-        # check if the user that reacted is in the admin role
-        if not await self.permissions.is_admin(payload.user_id, guild_id):
-            self.log.debug(
-                guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
-            )
+        channel = await ctx.get_channel()
+        message = await ctx.get_message(fresh=True)
+        if not channel or not message:
             return
 
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
-
-        cog_settings = self.get_cog_settings(guild_id)
+        cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
 
         # check if message has the import emoji
         was_imported = False
@@ -249,7 +246,8 @@ class TacoTuesdayCog(TacobotCog):
 
         await self._archive_taco_tuesday(message, cog_settings)
 
-        self.tracking_db.track_command_usage(
+        await executor.run(
+            self.tracking_db.track_command_usage,
             guildId=guild_id,
             channelId=payload.channel_id if payload.channel_id else None,
             userId=payload.user_id,
@@ -271,18 +269,16 @@ class TacoTuesdayCog(TacobotCog):
             ],
         )
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
-        try:
-            if payload.event_type != "REACTION_ADD":
-                return
+    def _reaction_emojis(self, cog_settings: dict) -> typing.List[str]:
+        if not cog_settings.get("enabled", False):
+            return []
+        return cog_settings.get("archive_emoji", ["🔒"]) + cog_settings.get("import_emoji", ["🇮"])
 
-            # check if the user that reacted is in the admin role
-            # we really only do anything here if they are an admin
-            if not await self.permissions.is_admin(payload.user_id, guild_id):
-                return
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
+        try:
             ###
             # archive_enabled: true,
             # archive_emoji: [
@@ -290,17 +286,12 @@ class TacoTuesdayCog(TacobotCog):
             # ],
             # archive_channel_id: '948689068961706034',
             ###
-            cog_settings = self.get_cog_settings(guild_id)
+            cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
 
             if not cog_settings.get("enabled", False):
                 self.log.debug(guild_id, f"{self._module}.{self._class}.{_method}", "Taco Tuesday not enabled")
                 return
 
-            # get the reaction user
-            user = await self.discord_helper.get_or_fetch_member(guild_id, payload.user_id)
-            if not user or user.bot or user.system:
-                return
-
             # check if reaction is to archive the message
             reaction_archive_emojis = cog_settings.get("archive_emoji", ["🔒"])
             reaction_import_emojis = cog_settings.get("import_emoji", ["🇮"])
@@ -313,12 +304,22 @@ class TacoTuesdayCog(TacobotCog):
                 )
                 return
 
+            # check if the user that reacted is in the admin role
+            # we really only do anything here if they are an admin
+            if not await ctx.is_admin():
+                return
+
+            # get the reaction user
+            user = await ctx.get_member()
+            if not user or user.bot or user.system:
+                return
+
             if str(payload.emoji.name) in reaction_archive_emojis:
                 if cog_settings.get("archive_enabled", False):
                     self.log.debug(
                         guild_id, f"{self._module}.{self._class}.{_method}", "Archive is enabled. Archiving message"
                     )
-                    await self._on_raw_reaction_add_archive(payload)
+                    await self._on_raw_reaction_add_archive(ctx)
                     return
 
             today = datetime.datetime.now(tz=pytz.timezone(self.settings.timezone))
@@ -328,7 +329,7 @@ class TacoTuesdayCog(TacobotCog):
             if str(payload.emoji.name) in reaction_import_emojis:
                 # check if user is in the admin role
 
-                await self._on_raw_reaction_add_import(payload)
+                await self._on_raw_reaction_add_import(ctx)
                 return
 
         except Exception as ex:
@@ -336,7 +337,7 @@ class TacoTuesdayCog(TacobotCog):
             # await self.messaging.notify_of_error(ctx)
 
     async def _archive_taco_tuesday(self, message: discord.Message, cog_settings: dict = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = message.guild.id
         try:
             archive_channel_id = cog_settings.get("archive_channel_id", None)
@@ -358,8 +359,11 @@ class TacoTuesdayCog(TacobotCog):
                 return
 
             # get taco tuesday info
-            taco_tuesday_info = self.tacotuesdays_db.taco_tuesday_get_by_message(
-                guildId=guild_id, channelId=message.channel.id, messageId=message.id
+            taco_tuesday_info = await executor.run(
+                self.tacotuesdays_db.taco_tuesday_get_by_message,
+                guildId=guild_id,
+                channelId=message.channel.id,
+                messageId=message.id,
             )
             if taco_tuesday_info:
                 # get the user id
@@ -400,7 +404,8 @@ class TacoTuesdayCog(TacobotCog):
             )
 
             # Should Update the entry to the new channel and message id
-            self.tacotuesdays_db.taco_tuesday_update_message(
+            await executor.run(
+                self.tacotuesdays_db.taco_tuesday_update_message,
                 guildId=guild_id,
                 channelId=message.channel.id,
                 messageId=message.id,
@@ -423,13 +428,13 @@ class TacoTuesdayCog(TacobotCog):
             # await self.messaging.notify_of_error(ctx)
 
     async def _set_taco_tuesday_user(self, ctx: commands.Context, member: discord.Member) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.guild is None:
             raise Exception("This command can only be used in a guild")
 
         guild_id = ctx.guild.id
         cog_settings = self.get_cog_settings(guild_id)
-        self.tacotuesdays_db.taco_tuesday_set_user(guild_id, member.id)
+        await executor.run(self.tacotuesdays_db.taco_tuesday_set_user, guild_id, member.id)
 
         # get focus role id
         focus_role_id = cog_settings.get("focus_role", None)
@@ -447,8 +452,8 @@ class TacoTuesdayCog(TacobotCog):
             user=member, check_list=[], add_list=[focus_role_id], remove_list=[], allow_everyone=True
         )
 
-    def _import_taco_tuesday(self, message: discord.Message, tweet: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[0][3]
+    async def _import_taco_tuesday(self, message: discord.Message, tweet: typing.Optional[str] = None) -> None:
+        _method = utils.get_method_name()
         guild_id = message.guild.id
         channel_id = message.channel.id
         message_id = message.id
@@ -478,7 +483,8 @@ class TacoTuesdayCog(TacobotCog):
             f"{self._module}.{self._class}.{_method}",
             f"Importing TACO Tuesday message {message_id} from channel {channel_id} in guild {guild_id} for user {message_author.id} with text {text} and image {image_url}",
         )
-        self.tacotuesdays_db.save_taco_tuesday(
+        await executor.run(
+            self.tacotuesdays_db.save_taco_tuesday,
             guildId=guild_id,
             message=text or "",
             image=image_url or "",
@@ -489,7 +495,7 @@ class TacoTuesdayCog(TacobotCog):
         )
 
     async def give_user_tacotuesday_tacos(self, guild_id, user_id, channel_id) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         ctx = None
         try:
             # create context
@@ -518,7 +524,7 @@ class TacoTuesdayCog(TacobotCog):
             )
 
             # track that the user answered the question.
-            self.tacotuesdays_db.track_taco_tuesday(guild_id, member.id)
+            await executor.run(self.tacotuesdays_db.track_taco_tuesday, guild_id, member.id)
 
             tacos_settings = self.get_tacos_settings(guild_id)
             amount = tacos_settings.get("taco_tuesday_count", 250)
@@ -1,20 +1,20 @@
 # this watches channels, and requires a user to have tacos to post in the channel
-import inspect
 import os
 import traceback
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tacos import TacosDatabase
 from bot.tacobot import TacoBot
-from discord.ext import commands
 
 
 class TacoPostCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "tacopost")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -23,23 +23,17 @@ class TacoPostCog(TacobotCog):
         self.messaging = Messaging(bot)
 
         self.tacos_db = TacosDatabase()
+        self.message_interest = MessageInterest(predicate=self._is_tacopost_message)
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
-    @commands.Cog.listener()
-    async def on_message(self, message) -> None:
-        _method = inspect.stack()[0][3]
-        # if in a DM, ignore
-        if message.guild is None:
-            return
-
-        guild_id = message.guild.id
+    async def on_message(self, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        message = ctx.message
+        guild_id = ctx.guild_id
         user = message.author
         channel = message.channel
         try:
-            if message.author.bot:
-                return
-
             # get the settings for tacopost out of the settings
             tacopost_settings = self.settings.get_settings(guild_id, self.SETTINGS_SECTION)
             if not tacopost_settings:
@@ -88,7 +82,7 @@ class TacoPostCog(TacobotCog):
             # get required tacos cost for channel in CHANNELS[]
             taco_cost = [c for c in tacopost_channels if c['id'] == str(channel.id)][0]['cost']
             # get tacos count for user
-            taco_count = self.tacos_db.get_tacos_count(guild_id, user.id)
+            taco_count = await executor.run(self.tacos_db.get_tacos_count, guild_id, user.id)
             # if user has doesnt have enough tacos, send a message, and delete their message
             if taco_count is None or taco_count < taco_cost:
                 await self.messaging.send_embed(
@@ -103,7 +97,7 @@ class TacoPostCog(TacobotCog):
                 async def response_callback(response):
                     if response:
                         # remove the tacos from the user
-                        self.tacos_db.remove_tacos(guild_id, user.id, taco_cost)
+                        await executor.run(self.tacos_db.remove_tacos, guild_id, user.id, taco_cost)
                         # send the message that tacos have been removed
                         await self.messaging.send_embed(
                             channel=channel,
@@ -130,6 +124,13 @@ class TacoPostCog(TacobotCog):
         except Exception as ex:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
 
+    def _is_tacopost_message(self, ctx: MessageContext) -> bool:
+        tacopost_settings = self.settings.get_settings(ctx.guild_id, self.SETTINGS_SECTION)
+        if not tacopost_settings:
+            # on_message reports the missing settings
+            return True
+        return str(ctx.channel_id) in [c['id'] for c in tacopost_settings.get('channels', [])]
+
 
 async def setup(bot):
     await bot.add_cog(TacoPostCog(bot))
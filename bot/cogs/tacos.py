@@ -1,13 +1,15 @@
-import inspect
 import os
 import traceback
 import typing
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tacos import TacosDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
@@ -20,7 +22,7 @@ class TacosCog(TacobotCog):
 
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "tacos")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -32,6 +34,14 @@ class TacosCog(TacobotCog):
 
         self.tacos_db = TacosDatabase()
         self.tracking_db = TrackingDatabase()
+        # boosts, and replies to other users
+        self.message_interest = MessageInterest(
+            message_types=frozenset({discord.MessageType.premium_guild_subscription, discord.MessageType.default}),
+            predicate=lambda ctx: ctx.message.type != discord.MessageType.default or ctx.message.reference is not None,
+        )
+        self.reaction_interest = ReactionInterest(
+            section="tacos", emojis=lambda section: section.get("reaction_emojis", ["🌮"])
+        )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
@@ -43,11 +53,11 @@ class TacosCog(TacobotCog):
     @tacos.command(aliases=['purge'])
     @commands.has_permissions(administrator=True)
     async def remove_all_tacos(self, ctx, user: discord.Member, *, reason: typing.Union[str, None] = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = ctx.guild.id
             await ctx.message.delete()
-            self.tacos_db.remove_all_tacos(guild_id, user.id)
+            await executor.run(self.tacos_db.remove_all_tacos, guild_id, user.id)
             reason_msg = reason if reason else "No reason given."
             await self.messaging.send_embed(
                 channel=ctx.channel,
@@ -57,7 +67,8 @@ class TacosCog(TacobotCog):
             )
             await self.discord_helper.taco_purge_log(ctx.guild.id, user, ctx.author, reason_msg)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel.id else None,
                 userId=ctx.author.id,
@@ -74,19 +85,20 @@ class TacosCog(TacobotCog):
     async def _remove_all_tacos_interaction(
         self, interaction: discord.Interaction, user: discord.Member, reason: typing.Union[str, None] = None
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if interaction.guild:
             guild_id = interaction.guild.id
         else:
             return
         try:
-            self.tacos_db.remove_all_tacos(guild_id, user.id)
+            await executor.run(self.tacos_db.remove_all_tacos, guild_id, user.id)
             reason_msg = reason if reason else "No reason given."
             if interaction.channel:
                 await interaction.response.send_message(f"{user.mention} has lost all their tacos.", ephemeral=True)
             await self.discord_helper.taco_purge_log(guild_id, user, interaction.user, reason_msg)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=interaction.channel.id if interaction.channel else None,
                 userId=interaction.user.id,
@@ -119,7 +131,7 @@ class TacosCog(TacobotCog):
         amount: int,
         reason: typing.Optional[str] = None,
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = interaction.guild.id if interaction.guild else 0
         try:
             # if the user that ran the command is the same as member, then exit the function
@@ -147,7 +159,8 @@ class TacosCog(TacobotCog):
                 guild_id, interaction.user, user, reason_msg, tacotypes.TacoTypes.CUSTOM, taco_amount=amount
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=interaction.channel.id if interaction.channel else None,
                 userId=interaction.user.id,
@@ -163,7 +176,7 @@ class TacosCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def give(self, ctx, member: discord.Member, amount: int, *, reason: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             await ctx.message.delete()
@@ -209,7 +222,8 @@ class TacosCog(TacobotCog):
                 guild_id, ctx.author, member, reason_msg, tacotypes.TacoTypes.CUSTOM, taco_amount=amount
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel.id else None,
                 userId=ctx.author.id,
@@ -224,12 +238,12 @@ class TacosCog(TacobotCog):
 
     @group.command(name="count", description="Get the number of tacos you have")
     async def count_interaction(self, interaction: discord.Interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = interaction.guild.id if interaction.guild else 0
         try:
             await interaction.response.defer(ephemeral=True)
             # get taco count for message author
-            taco_count = self.tacos_db.get_tacos_count(guild_id, interaction.user.id)
+            taco_count = await executor.run(self.tacos_db.get_tacos_count, guild_id, interaction.user.id)
             tacos_word = self.settings.get_string(guild_id, "taco_singular")
             if taco_count is None:
                 taco_count = 0
@@ -246,7 +260,8 @@ class TacosCog(TacobotCog):
                 ephemeral=True,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=interaction.channel.id if interaction.channel else None,
                 userId=interaction.user.id,
@@ -259,14 +274,14 @@ class TacosCog(TacobotCog):
 
     @tacos.command()
     async def count(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
                 guild_id = ctx.guild.id
                 await ctx.message.delete()
             # get taco count for message author
-            taco_count = self.tacos_db.get_tacos_count(guild_id, ctx.author.id)
+            taco_count = await executor.run(self.tacos_db.get_tacos_count, guild_id, ctx.author.id)
             tacos_word = self.settings.get_string(guild_id, "taco_singular")
             if taco_count is None:
                 taco_count = 0
@@ -282,7 +297,8 @@ class TacosCog(TacobotCog):
                 delete_after=self.SELF_DESTRUCT_TIMEOUT,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel.id else None,
                 userId=ctx.author.id,
@@ -303,7 +319,7 @@ class TacosCog(TacobotCog):
     async def gift_interaction(
         self, interaction: discord.Interaction, user: discord.Member, amount: int, reason: typing.Optional[str] = None
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if interaction.guild:
             guild_id = interaction.guild.id
         else:
@@ -323,8 +339,8 @@ class TacosCog(TacobotCog):
             max_gift_tacos: int = taco_settings.get("max_gift_tacos", 10)
             max_gift_taco_timespan = taco_settings.get("max_gift_taco_timespan", 86400)
             # get the total number of tacos the user has gifted in the last 24 hours
-            total_gifted: int = self.tacos_db.get_total_gifted_tacos(
-                guild_id, interaction.user.id, max_gift_taco_timespan
+            total_gifted: int = await executor.run(
+                self.tacos_db.get_total_gifted_tacos, guild_id, interaction.user.id, max_gift_taco_timespan
             )
             remaining_gifts = max_gift_tacos - total_gifted
 
@@ -355,7 +371,7 @@ class TacosCog(TacobotCog):
             if reason:
                 reason_msg = f"{reason}"
 
-            self.tacos_db.add_taco_gift(guild_id, interaction.user.id, amount)
+            await executor.run(self.tacos_db.add_taco_gift, guild_id, interaction.user.id, amount)
             await interaction.response.send_message(
                 self.settings.get_string(
                     guild_id,
@@ -373,7 +389,8 @@ class TacosCog(TacobotCog):
                 guild_id, interaction.user, user, reason_msg, tacotypes.TacoTypes.CUSTOM, taco_amount=amount
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=interaction.channel.id if interaction.channel else None,
                 userId=interaction.user.id,
@@ -388,7 +405,7 @@ class TacosCog(TacobotCog):
     @tacos.command()
     @commands.guild_only()
     async def gift(self, ctx, member: discord.Member, amount: int, *, reason: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = ctx.guild.id
         try:
             # get taco count for message author
@@ -410,8 +427,8 @@ class TacosCog(TacobotCog):
             max_gift_tacos: int = taco_settings.get("max_gift_tacos", 10)
             max_gift_taco_timespan = taco_settings.get("max_gift_taco_timespan", 86400)
             # get the total number of tacos the user has gifted in the last 24 hours
-            total_gifted: int = self.tacos_db.get_total_gifted_tacos(
-                ctx.guild.id, ctx.author.id, max_gift_taco_timespan
+            total_gifted: int = await executor.run(
+                self.tacos_db.get_total_gifted_tacos, ctx.guild.id, ctx.author.id, max_gift_taco_timespan
             )
             remaining_gifts = max_gift_tacos - total_gifted
 
@@ -451,7 +468,7 @@ class TacosCog(TacobotCog):
             if reason:
                 reason_msg = f"{reason}"
 
-            self.tacos_db.add_taco_gift(ctx.guild.id, ctx.author.id, amount)
+            await executor.run(self.tacos_db.add_taco_gift, ctx.guild.id, ctx.author.id, amount)
             await self.messaging.send_embed(
                 channel=ctx.channel,
                 title=self.settings.get_string(guild_id, "taco_gift_title"),
@@ -472,7 +489,8 @@ class TacosCog(TacobotCog):
                 guild_id, ctx.author, member, reason_msg, tacotypes.TacoTypes.CUSTOM, taco_amount=amount
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel.id else None,
                 userId=ctx.author.id,
@@ -485,72 +503,48 @@ class TacosCog(TacobotCog):
             self.log.error(ctx.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
 
-    @commands.Cog.listener()
-    async def on_message(self, message) -> None:
-        _method = inspect.stack()[0][3]
+    async def on_message(self, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        message = ctx.message
         member = message.author
+        guild_id = ctx.guild_id
         try:
-            # if we are in a guild
-            if message.guild:
-                guild_id = message.guild.id
-
-                if not member or member.bot or member.system:
-                    return
-
-                if message.type == discord.MessageType.premium_guild_subscription:
-                    # add tacos to user that boosted the server
-                    await self.discord_helper.taco_give_user(
-                        guild_id,
-                        self.bot.user,
-                        member,
-                        self.settings.get_string(guild_id, "taco_reason_boost"),
-                        tacotypes.TacoTypes.BOOST,
-                    )
-                    return
+            if message.type == discord.MessageType.premium_guild_subscription:
+                # add tacos to user that boosted the server
+                await self.discord_helper.taco_give_user(
+                    guild_id,
+                    self.bot.user,
+                    member,
+                    self.settings.get_string(guild_id, "taco_reason_boost"),
+                    tacotypes.TacoTypes.BOOST,
+                )
+                return
 
-                if message.type == discord.MessageType.default:
-                    try:
-                        if message.reference is not None:
-                            ref = message.reference.resolved
-                            if ref is None:
-                                return
-                            if ref.author == message.author or ref.author == self.bot.user:
-                                self.log.debug(
-                                    guild_id,
-                                    f"{self._module}.{self._class}.{_method}",
-                                    f"Ignoring message reference from {ref.author}",
-                                )
-                                return
-                            # it is a reply to another user
-                            await self.discord_helper.taco_give_user(
-                                guild_id,
-                                self.bot.user,
-                                member,
-                                self.settings.get_string(guild_id, "taco_reason_reply", user=ref.author.name),
-                                tacotypes.TacoTypes.REPLY,
-                            )
-
-                    except Exception as e:
-                        self.log.error(
-                            guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc()
-                        )
-                        return
-
-            # if we are in a DM
-            else:
+            ref = message.reference.resolved
+            if ref is None:
                 return
+            if ref.author == message.author or ref.author == self.bot.user:
+                self.log.debug(
+                    guild_id, f"{self._module}.{self._class}.{_method}", f"Ignoring message reference from {ref.author}"
+                )
+                return
+            # it is a reply to another user
+            await self.discord_helper.taco_give_user(
+                guild_id,
+                self.bot.user,
+                member,
+                self.settings.get_string(guild_id, "taco_reason_reply", user=ref.author.name),
+                tacotypes.TacoTypes.REPLY,
+            )
         except Exception as ex:
-            self.log.error(member.guild.id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
+            self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            if payload.event_type != 'REACTION_ADD':
-                return
-
-            taco_settings = self.get_tacos_settings(guild_id)
+            taco_settings = ctx.get_settings("tacos")
 
             reaction_emojis = taco_settings.get("reaction_emojis", ["🌮"])
             if str(payload.emoji) not in reaction_emojis:
@@ -561,17 +555,21 @@ class TacosCog(TacobotCog):
             )
 
             if str(payload.emoji) in reaction_emojis:
-                user = await self.discord_helper.get_or_fetch_user(payload.user_id)
+                user = await ctx.get_user()
                 # ignore if the user is a bot or system
                 if not user or user.bot or user.system:
                     return
-                channel = await self.bot.fetch_channel(payload.channel_id)
-                message = await channel.fetch_message(payload.message_id)
+                channel = await ctx.get_channel()
+                message = await ctx.get_message()
+                if not channel or not message:
+                    return
                 # if the message is from a bot, or reacted by the author, ignore it
                 if message.author.bot or message.author.id == user.id:
                     return
 
-                has_reacted = self.tacos_db.get_taco_reaction(guild_id, user.id, channel.id, message.id)
+                has_reacted = await executor.run(
+                    self.tacos_db.get_taco_reaction, guild_id, user.id, channel.id, message.id
+                )
                 if has_reacted:
                     return
 
@@ -581,11 +579,13 @@ class TacosCog(TacobotCog):
                 max_gift_tacos = taco_settings.get("max_gift_tacos", 10)
                 max_gift_taco_timespan = taco_settings.get("max_gift_taco_timespan", 86400)
                 # get the total number of tacos the user has gifted in the last 24 hours
-                total_gifted = self.tacos_db.get_total_gifted_tacos(guild_id, user.id, max_gift_taco_timespan)
+                total_gifted = await executor.run(
+                    self.tacos_db.get_total_gifted_tacos, guild_id, user.id, max_gift_taco_timespan
+                )
                 # log the total number of tacos the user has gifted
                 remaining_gifts = max_gift_tacos - total_gifted
                 # track the user's taco reaction
-                self.tacos_db.add_taco_reaction(guild_id, user.id, channel.id, message.id)
+                await executor.run(self.tacos_db.add_taco_reaction, guild_id, user.id, channel.id, message.id)
                 # # give the user the reaction reward tacos
                 await self.discord_helper.taco_give_user(
                     guild_id,
@@ -595,7 +595,8 @@ class TacosCog(TacobotCog):
                     tacotypes.TacoTypes.REACT_REWARD,
                 )
 
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=payload.channel_id if payload.channel_id else None,
                     userId=payload.user_id,
@@ -619,7 +620,7 @@ class TacosCog(TacobotCog):
 
                 if reaction_count <= remaining_gifts:
                     # track that the user has gifted tacos via reactions
-                    self.tacos_db.add_taco_gift(guild_id, user.id, reaction_count)
+                    await executor.run(self.tacos_db.add_taco_gift, guild_id, user.id, reaction_count)
                     # give taco giver tacos too
                     await self.discord_helper.taco_give_user(
                         guild_id,
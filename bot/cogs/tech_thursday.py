@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -7,8 +6,10 @@ import typing
 import discord
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.techthurs import TechThursDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.permissions import Permissions
@@ -24,7 +25,7 @@ class TechThursdaysCog(TacobotCog):
 
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "techthurs")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -36,6 +37,10 @@ class TechThursdaysCog(TacobotCog):
 
         self.techthurs_db = TechThursDatabase()
         self.tracking_db = TrackingDatabase()
+        self.reaction_interest = ReactionInterest(
+            section="techthurs",
+            emojis=lambda section: section.get("reaction_emoji", ["💻"]) + section.get("import_emoji", ["🇮"]),
+        )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
@@ -43,7 +48,7 @@ class TechThursdaysCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def techthurs(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.invoked_subcommand is not None:
             return
         guild_id = 0
@@ -136,7 +141,8 @@ class TechThursdaysCog(TacobotCog):
             )
 
             # save the techthurs to the database
-            self.techthurs_db.save_techthurs(
+            await executor.run(
+                self.techthurs_db.save_techthurs,
                 guildId=guild_id,
                 message=twa.text,
                 image=twa.attachments[0].url,
@@ -145,7 +151,8 @@ class TechThursdaysCog(TacobotCog):
                 message_id=techthurs_message.id,
             )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -162,7 +169,7 @@ class TechThursdaysCog(TacobotCog):
     @app_commands.default_permissions(administrator=True)
     @app_commands.guild_only()
     async def openai_app_command(self, ctx: discord.Interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if not utils.isAdmin(ctx, self.settings):
@@ -181,7 +188,8 @@ class TechThursdaysCog(TacobotCog):
                 return
             await self._openai_generate(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.user.id,
@@ -197,7 +205,7 @@ class TechThursdaysCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def openai(self, ctx: Context):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.message:
@@ -205,7 +213,8 @@ class TechThursdaysCog(TacobotCog):
 
             await self._openai_generate(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -222,7 +231,7 @@ class TechThursdaysCog(TacobotCog):
     @commands.guild_only()
     async def import_techthurs(self, ctx, message_id: int) -> None:
         """Import techthurs from an existing post"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         if ctx.guild:
             guild_id = ctx.guild.id
@@ -255,9 +264,10 @@ class TechThursdaysCog(TacobotCog):
             if not message:
                 return
 
-            self._import_techthurs(message)
+            await self._import_techthurs(message)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -274,13 +284,14 @@ class TechThursdaysCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def give(self, ctx, member: discord.Member) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             await ctx.message.delete()
 
             await self.give_user_techthurs_tacos(ctx.guild.id, member.id, ctx.channel.id, None)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=ctx.guild.id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -293,23 +304,17 @@ class TechThursdaysCog(TacobotCog):
             self.log.error(ctx.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
 
-    async def _on_raw_reaction_add_give(self, payload):
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
-
-        # check if the user that reacted is in the admin role
-        if not await self.permissions.is_admin(payload.user_id, guild_id):
-            self.log.debug(
-                guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
-            )
-            return
-        # in future, check if the user is in a defined role that can grant tacos (e.g. moderator)
+    async def _on_raw_reaction_add_give(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
 
         # get the message that was reacted to
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
+        message = await ctx.get_message(fresh=True)
+        if not message:
+            return
         message_author = message.author
-        react_user = await self.discord_helper.get_or_fetch_user(payload.user_id)
+        react_user = await ctx.get_user()
 
         if not react_user or react_user.bot or react_user.system:
             return
@@ -324,7 +329,9 @@ class TechThursdaysCog(TacobotCog):
             )
             return
 
-        already_tracked = self.techthurs_db.techthurs_user_message_tracked(guild_id, message_author.id, message.id)
+        already_tracked = await executor.run(
+            self.techthurs_db.techthurs_user_message_tracked, guild_id, message_author.id, message.id
+        )
         if not already_tracked:
             # log that we are giving tacos for this reaction
             self.log.info(
@@ -334,7 +341,8 @@ class TechThursdaysCog(TacobotCog):
             )
             await self.give_user_techthurs_tacos(guild_id, message_author.id, payload.channel_id, payload.message_id)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=payload.guild_id,
                 channelId=payload.channel_id if payload.channel_id else None,
                 userId=payload.user_id,
@@ -362,20 +370,15 @@ class TechThursdaysCog(TacobotCog):
                 f"Message {payload.message_id} has already been tracked for techthurs. Skipping.",
             )
 
-    async def _on_raw_reaction_add_import(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def _on_raw_reaction_add_import(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
 
-        # check if the user that reacted is in the admin role
-        if not await self.permissions.is_admin(payload.user_id, guild_id):
-            self.log.debug(
-                guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
-            )
+        message = await ctx.get_message(fresh=True)
+        if not message:
             return
 
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
-
         # check if this reaction is the first one of this type on the message
         reactions = discord.utils.get(message.reactions, emoji=payload.emoji.name)
         if reactions and reactions.count > 1:
@@ -386,9 +389,10 @@ class TechThursdaysCog(TacobotCog):
             )
             return
 
-        self._import_techthurs(message)
+        await self._import_techthurs(message)
 
-        self.tracking_db.track_command_usage(
+        await executor.run(
+            self.tracking_db.track_command_usage,
             guildId=payload.guild_id,
             channelId=payload.channel_id if payload.channel_id else None,
             userId=payload.user_id,
@@ -410,35 +414,32 @@ class TechThursdaysCog(TacobotCog):
             ],
         )
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload):
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            if payload.event_type != "REACTION_ADD":
+            cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
+
+            reaction_emojis = cog_settings.get("reaction_emoji", ["💻"])
+            reaction_import_emojis = cog_settings.get("import_emoji", ["🇮"])
+            check_list = reaction_emojis + reaction_import_emojis
+            if str(payload.emoji.name) not in check_list:
                 return
 
             # check if the user that reacted is in the admin role
-            if not await self.permissions.is_admin(payload.user_id, guild_id):
+            if not await ctx.is_admin():
                 self.log.debug(
                     guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
                 )
                 return
 
-            react_user = await self.discord_helper.get_or_fetch_user(payload.user_id)
+            react_user = await ctx.get_user()
             if not react_user or react_user.bot or react_user.system:
                 return
 
-            cog_settings = self.get_cog_settings(guild_id)
-
-            reaction_emojis = cog_settings.get("reaction_emoji", ["💻"])
-            reaction_import_emojis = cog_settings.get("import_emoji", ["🇮"])
-            check_list = reaction_emojis + reaction_import_emojis
-            if str(payload.emoji.name) not in check_list:
-                return
-
             if str(payload.emoji.name) in reaction_emojis:
-                await self._on_raw_reaction_add_give(payload)
+                await self._on_raw_reaction_add_give(ctx)
                 return
 
             # is today thursday?
@@ -446,15 +447,15 @@ class TechThursdaysCog(TacobotCog):
             if today.weekday() != 3:  # 0 = Monday, 1=Tuesday, 2=Wednesday...
                 return
             if str(payload.emoji.name) in reaction_import_emojis:
-                await self._on_raw_reaction_add_import(payload)
+                await self._on_raw_reaction_add_import(ctx)
                 return
 
         except Exception as ex:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
             # await self.messaging.notify_of_error(ctx)
 
-    def _import_techthurs(self, message: discord.Message) -> None:
-        _method = inspect.stack()[0][3]
+    async def _import_techthurs(self, message: discord.Message) -> None:
+        _method = utils.get_method_name()
         guild_id = message.guild.id
         channel_id = message.channel.id
         message_id = message.id
@@ -476,7 +477,8 @@ class TechThursdaysCog(TacobotCog):
             f"{self._module}.{self._class}.{_method}",
             f"Importing techthurs message {message_id} from channel {channel_id} in guild {guild_id} for user {message_author.id} with text {text} and image {image_url}",
         )
-        self.techthurs_db.save_techthurs(
+        await executor.run(
+            self.techthurs_db.save_techthurs,
             guildId=guild_id,
             message=text or "",
             image=image_url,
@@ -486,7 +488,7 @@ class TechThursdaysCog(TacobotCog):
         )
 
     async def give_user_techthurs_tacos(self, guild_id, user_id, channel_id, message_id) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # create context
             # self, bot=None, author=None, guild=None, channel=None, message=None, invoked_subcommand=None, **kwargs
@@ -517,7 +519,7 @@ class TechThursdaysCog(TacobotCog):
             )
 
             # track that the user answered the question.
-            self.techthurs_db.track_techthurs_answer(guild_id, member.id, message_id)
+            await executor.run(self.techthurs_db.track_techthurs_answer, guild_id, member.id, message_id)
 
             tacos_settings = self.get_tacos_settings(guild_id)
             amount = tacos_settings.get("tech_thursday_count", 5)
@@ -554,7 +556,7 @@ class TechThursdaysCog(TacobotCog):
             await self.messaging.notify_of_error(ctx)
 
     async def _openai_generate(self, ctx: typing.Union[Context, discord.Interaction]) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
 
         if ctx.guild:
@@ -636,7 +638,8 @@ class TechThursdaysCog(TacobotCog):
                 content=message_content,
                 color=0x00FF00,
             )
-            self.techthurs_db.save_techthurs(
+            await executor.run(
+                self.techthurs_db.save_techthurs,
                 guildId=guild_id,
                 message=aiquestion,
                 image=None,
@@ -1,4 +1,3 @@
-import inspect
 import io
 import json
 import os
@@ -9,8 +8,10 @@ import aiohttp
 import discord
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.toqtd import TQOTDDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.permissions import Permissions
@@ -26,7 +27,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
 
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "tqotd")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -39,6 +40,9 @@ class TacoQuestionOfTheDayCog(TacobotCog):
 
         self.tqotd_db = TQOTDDatabase()
         self.tracking_db = TrackingDatabase()
+        self.reaction_interest = ReactionInterest(
+            section="tqotd", emojis=lambda section: section.get("tqotd_reaction_emoji", ["🇹"])
+        )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
@@ -46,7 +50,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def tqotd(self, ctx: Context) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.invoked_subcommand is not None:
             return
         guild_id = 0
@@ -144,9 +148,10 @@ class TacoQuestionOfTheDayCog(TacobotCog):
             )
 
             # save the TQOTD
-            self.tqotd_db.save_tqotd(guild_id, qotd.text, ctx.author.id)
+            await executor.run(self.tqotd_db.save_tqotd, guild_id, qotd.text, ctx.author.id)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -162,7 +167,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
     @app_commands.default_permissions(administrator=True)
     @app_commands.guild_only()
     async def openai_app_command(self, ctx: discord.Interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if not utils.isAdmin(ctx, self.settings):
@@ -181,7 +186,8 @@ class TacoQuestionOfTheDayCog(TacobotCog):
                 return
             await self._openai_generate(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.user.id,
@@ -197,7 +203,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def openai(self, ctx: Context):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.message:
@@ -205,7 +211,8 @@ class TacoQuestionOfTheDayCog(TacobotCog):
 
             await self._openai_generate(ctx)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -218,7 +225,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
             await self.messaging.notify_of_error(ctx)
 
     async def _openai_generate(self, ctx: typing.Union[Context, discord.Interaction]) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
 
         if ctx.guild:
@@ -278,7 +285,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
         system_prompt = ai_prompt.get("system", "")
         user_prompt = ai_prompt.get("user", "")
 
-        previous_questions = json.dumps(self.tqotd_db.get_all_tqotd_questions(guild_id))
+        previous_questions = json.dumps(await executor.run(self.tqotd_db.get_all_tqotd_questions, guild_id))
 
         self.log.debug(guild_id, f"{self._module}.{self._class}.{_method}", "Generating question using AI")
         self.log.debug(guild_id, f"{self._module}.{self._class}.{_method}", f"System Prompt: {system_prompt}")
@@ -311,7 +318,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
                 content=role_tag,
                 color=0x00FF00,
             )
-            self.tqotd_db.save_tqotd(guild_id, aiquestion, user.id)
+            await executor.run(self.tqotd_db.save_tqotd, guild_id, aiquestion, user.id)
             if isinstance(ctx, discord.Interaction):
                 # respond to the interaction
                 await ctx.response.send_message(content="Question generated", ephemeral=True)
@@ -331,14 +338,15 @@ class TacoQuestionOfTheDayCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def give(self, ctx, member: discord.Member) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             await ctx.message.delete()
             guild_id = ctx.guild.id
 
             await self.give_user_tqotd_tacos(ctx.guild.id, member.id, ctx.channel.id, None)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel else None,
                 userId=ctx.author.id,
@@ -351,15 +359,12 @@ class TacoQuestionOfTheDayCog(TacobotCog):
             self.log.error(ctx.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            if payload.event_type != 'REACTION_ADD':
-                return
-
-            cog_settings = self.get_cog_settings(guild_id)
+            cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
 
             reaction_emojis = cog_settings.get("tqotd_reaction_emoji", ["🇹"])
             # check if the reaction is in the list of ones we are looking for
@@ -368,14 +373,15 @@ class TacoQuestionOfTheDayCog(TacobotCog):
                 return
 
             # check if the user that reacted is in the admin role
-            if not await self.permissions.is_admin(payload.user_id, guild_id):
+            if not await ctx.is_admin():
                 self.log.debug(guild_id, f"tqotd.{_method}", f"User {payload.user_id} is not an admin")
                 return
             # in the future, check if the user is in a defined role that can grant tacos (e.g. moderator)
 
             # get the message that was reacted to
-            channel = self.bot.get_channel(payload.channel_id)
-            message = await channel.fetch_message(payload.message_id)
+            message = await ctx.get_message(fresh=True)
+            if not message:
+                return
             message_author = message.author
             # react_user = await self.discord_helper.get_or_fetch_user(payload.user_id)
 
@@ -385,7 +391,9 @@ class TacoQuestionOfTheDayCog(TacobotCog):
                 # self.log.debug(guild_id, f"{self._module}.{self._class}.{_method}", f"Reaction {payload.emoji.name} has already been added to message {payload.message_id}")
                 return
 
-            already_tracked = self.tqotd_db.tqotd_user_message_tracked(guild_id, message_author.id, message.id)
+            already_tracked = await executor.run(
+                self.tqotd_db.tqotd_user_message_tracked, guild_id, message_author.id, message.id
+            )
 
             if not already_tracked:
                 # log that we are giving tacos for this reaction
@@ -396,7 +404,8 @@ class TacoQuestionOfTheDayCog(TacobotCog):
                 )
                 await self.give_user_tqotd_tacos(guild_id, message_author.id, payload.channel_id, payload.message_id)
 
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=payload.channel_id if payload.channel_id else None,
                     userId=payload.user_id,
@@ -428,7 +437,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
 
     async def give_user_tqotd_tacos(self, guild_id, user_id, channel_id, message_id) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         ctx = None
         try:
             # create context
@@ -459,7 +468,7 @@ class TacoQuestionOfTheDayCog(TacobotCog):
                 bot=bot, guild=guild, author=member, channel=channel, message=message
             )
             # track that the user answered the question.
-            self.tqotd_db.track_tqotd_answer(guild_id, member.id, message_id)
+            await executor.run(self.tqotd_db.track_tqotd_answer, guild_id, member.id, message_id)
 
             tacos_settings = self.get_tacos_settings(guild_id)
 
@@ -1,7 +1,6 @@
 import asyncio
 import collections
 import html
-import inspect
 import os
 import random
 import traceback
@@ -13,6 +12,7 @@ from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
 from bot.lib.models.triviaquestion import TriviaQuestion
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
 from discord.ext import commands
@@ -22,7 +22,7 @@ from discord.ext.commands import Context
 class TriviaCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "trivia")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -39,7 +39,7 @@ class TriviaCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             self.log.debug(0, f"{self._module}.{self._class}.{_method}", "trivia cog is ready")
         except Exception as e:
@@ -48,7 +48,7 @@ class TriviaCog(TacobotCog):
     @commands.group(name="trivia", invoke_without_command=True)
     @commands.guild_only()
     async def trivia(self, ctx) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.invoked_subcommand is None:
@@ -62,7 +62,8 @@ class TriviaCog(TacobotCog):
                     )
                     return
 
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=ctx.channel.id if ctx.channel.id else None,
                     userId=ctx.author.id,
@@ -261,7 +262,7 @@ class TriviaCog(TacobotCog):
                             }
 
                             trivia_question = TriviaQuestion(**trivia_item)
-                            self.tracking_db.track_trivia_question(trivia_question)
+                            await executor.run(self.tracking_db.track_trivia_question, trivia_question)
                             break
                 else:
                     self.log.error(
@@ -274,7 +275,7 @@ class TriviaCog(TacobotCog):
             await self.messaging.notify_of_error(ctx)
 
     def get_question(self, ctx: Context) -> typing.Any:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             if ctx.guild:
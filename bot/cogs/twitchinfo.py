@@ -1,6 +1,5 @@
 # this cog will DM the user if they have not yet told the bot what their twitch name is if they interact with the bot.
 import collections
-import inspect
 import os
 import traceback
 import typing
@@ -12,6 +11,7 @@ from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums import tacotypes
 from bot.lib.enums.system_actions import SystemActions
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.mongodb.twitch import TwitchDatabase
 from bot.tacobot import TacoBot
@@ -21,7 +21,7 @@ from discord.ext import commands
 class TwitchInfoCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "twitchinfo")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -34,10 +34,6 @@ class TwitchInfoCog(TacobotCog):
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
-    @commands.Cog.listener()
-    async def on_message(self, message) -> None:
-        pass
-
     @commands.group()
     async def twitch(self, ctx) -> None:
         pass
@@ -61,7 +57,7 @@ class TwitchInfoCog(TacobotCog):
         if user is None or user == "":
             # specify channel
             return
-        twitch_info = self.twitch_db.get_user_twitch_info(user.id)
+        twitch_info = await executor.run(self.twitch_db.get_user_twitch_info, user.id)
         twitch_name = None
         if twitch_info:
             twitch_name = twitch_info["twitch_name"]
@@ -85,7 +81,8 @@ class TwitchInfoCog(TacobotCog):
                     delete_after=30,
                 )
 
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=ctx.channel.id if ctx.channel.id else None,
                     userId=ctx.author.id,
@@ -118,7 +115,7 @@ class TwitchInfoCog(TacobotCog):
         alt_ctx = collections.namedtuple("Context", ctx_dict.keys())(*ctx_dict.values())
 
         twitch_name = None
-        twitch_info = self.twitch_db.get_user_twitch_info(member.id)
+        twitch_info = await executor.run(self.twitch_db.get_user_twitch_info, member.id)
         # if ctx.author is administrator, then we can get the twitch name from the database
         if twitch_info is None:
             if ctx.author.guild_permissions.administrator or check_member is None:
@@ -130,8 +127,9 @@ class TwitchInfoCog(TacobotCog):
                     60,
                 )
                 if twitch_name is not None:
-                    self.twitch_db.set_user_twitch_info(ctx.author.id, twitch_name.lower().strip())
-                    self.tracking_db.track_system_action(
+                    await executor.run(self.twitch_db.set_user_twitch_info, ctx.author.id, twitch_name.lower().strip())
+                    await executor.run(
+                        self.tracking_db.track_system_action,
                         guild_id=guild_id,
                         action=SystemActions.LINK_TWITCH_TO_DISCORD,
                         data={"user_id": str(ctx.author.id), "twitch_name": twitch_name.lower()},
@@ -146,7 +144,8 @@ class TwitchInfoCog(TacobotCog):
                 color=0x00FF00,
             )
 
-        self.tracking_db.track_command_usage(
+        await executor.run(
+            self.tracking_db.track_command_usage,
             guildId=guild_id,
             channelId=ctx.channel.id if ctx.channel.id else None,
             userId=ctx.author.id,
@@ -162,7 +161,7 @@ class TwitchInfoCog(TacobotCog):
         self, ctx, user: discord.Member, twitch_name: typing.Optional[str] = None
     ) -> typing.Optional[str]:
         guild_id = 0
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             channel = ctx.author
             if ctx.guild:
@@ -180,8 +179,9 @@ class TwitchInfoCog(TacobotCog):
 
             if twitch_name is not None and user is not None:
                 twitch_name = utils.get_last_section_in_url(twitch_name.lower().strip())
-                self.twitch_db.set_user_twitch_info(user.id, twitch_name)
-                self.tracking_db.track_system_action(
+                await executor.run(self.twitch_db.set_user_twitch_info, user.id, twitch_name)
+                await executor.run(
+                    self.tracking_db.track_system_action,
                     guild_id=guild_id,
                     action=SystemActions.LINK_TWITCH_TO_DISCORD,
                     data={"user_id": str(user.id), "twitch_name": twitch_name.lower()},
@@ -194,7 +194,8 @@ class TwitchInfoCog(TacobotCog):
                     delete_after=30,
                 )
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel.id else None,
                 userId=ctx.author.id,
@@ -210,7 +211,7 @@ class TwitchInfoCog(TacobotCog):
 
     @twitch.command()
     async def set(self, ctx, twitch_name: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         try:
             resp_channel = ctx.author
@@ -243,7 +244,7 @@ class TwitchInfoCog(TacobotCog):
             self.log.debug(0, f"tqotd.{_method}", f"{ctx.author} requested to set twitch name {twitch_name}")
             if twitch_name is not None:
                 twitch_name = utils.get_last_section_in_url(twitch_name.lower().strip())
-                found_twitch = self.twitch_db.get_user_twitch_info(ctx.author.id)
+                found_twitch = await executor.run(self.twitch_db.get_user_twitch_info, ctx.author.id)
                 if found_twitch is None:
                     # only set if we haven't set it already.
                     taco_settings = self.get_tacos_settings(guild_id)
@@ -258,8 +259,9 @@ class TwitchInfoCog(TacobotCog):
                         taco_amount=taco_amount,
                     )
 
-                self.twitch_db.set_user_twitch_info(ctx.author.id, twitch_name)
-                self.tracking_db.track_system_action(
+                await executor.run(self.twitch_db.set_user_twitch_info, ctx.author.id, twitch_name)
+                await executor.run(
+                    self.tracking_db.track_system_action,
                     guild_id=guild_id,
                     action=SystemActions.LINK_TWITCH_TO_DISCORD,
                     data={"user_id": str(ctx.author.id), "twitch_name": twitch_name.lower()},
@@ -275,7 +277,8 @@ class TwitchInfoCog(TacobotCog):
                     delete_after=30,
                 )
 
-                self.tracking_db.track_command_usage(
+                await executor.run(
+                    self.tracking_db.track_command_usage,
                     guildId=guild_id,
                     channelId=ctx.channel.id if ctx.channel.id else None,
                     userId=ctx.author.id,
@@ -1,56 +1,43 @@
 # Before: https://twitter.com/MarkH90441396/status/1734689257946591509
 # After: https://vxtwitter.com/MarkH90441396/status/1734689257946591509
-import inspect
 import os
 import re
 import traceback
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
 from bot.lib.messaging import Messaging
 from bot.tacobot import TacoBot
-from discord.ext import commands
+
+TWITTER_LINK_PATTERN = re.compile(r"(https://(?:(?:www)\.)?(twitter|x)\.com/(.*)?/status/(.*)?)", flags=re.IGNORECASE)
 
 
 class TwitterPreviewCog(TacobotCog):
     def __init__(self, bot: TacoBot):
         super().__init__(bot, "twitter_preview")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
 
         self.discord_helper = discordhelper.DiscordHelper(bot)
         self.messaging = Messaging(bot)
+        self.message_interest = MessageInterest(
+            commands=False,
+            patterns=(TWITTER_LINK_PATTERN,),
+            predicate=lambda ctx: not ctx.message.author.system
+            and ctx.get_settings(self.SETTINGS_SECTION).get("enabled", False),
+        )
 
         self.log.debug(0, f"{self._module}.{_method}", "Initialized")
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        guild_id = 0
-        _method = inspect.stack()[0][3]
+    async def on_message(self, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        message = ctx.message
+        guild_id = ctx.guild_id
         try:
-            # if in a DM, ignore
-            if message.guild is None:
-                return
-            # if the message is from a bot, ignore
-            if message.author.bot or message.author.system:
-                return
-            guild_id = message.guild.id
-
-            cog_settings = self.get_cog_settings(guild_id)
-            if not cog_settings["enabled"]:
-                return
-
-            # check if message is a command
-            # get the command prefix
-            command_prefix = await self.bot.get_prefix(message)
-            for prefix in command_prefix:
-                if message.content.startswith(prefix):
-                    return
-
-            pattern = re.compile(r"(https://(?:(?:www)\.)?(twitter|x)\.com/(.*)?/status/(.*)?)", flags=re.IGNORECASE)
-            match = pattern.search(message.content)
+            match = TWITTER_LINK_PATTERN.search(message.content)
             if not match:
                 return
 
@@ -1,12 +1,15 @@
+import asyncio
 import datetime
-import inspect
 import os
 import traceback
+import typing
 
+import discord
 import pytz
 from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.models.DiscordUser import DiscordUser
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.tacobot import TacoBot
 from discord.ext import commands
@@ -15,7 +18,7 @@ from discord.ext import commands
 class UserLookupCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "user_lookup")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -23,11 +26,17 @@ class UserLookupCog(TacobotCog):
         self.discord_helper = discordhelper.DiscordHelper(bot)
 
         self.tracking_db = TrackingDatabase()
+        # on_member_update writes for the same member within this many seconds are collapsed into one
+        self.update_debounce = float(utils.dict_get(os.environ, "USER_LOOKUP_UPDATE_DEBOUNCE", default_value="5.0"))
+        # guild id -> user id -> content_hash last written to `users`, loaded on the guild's first import
+        self._user_hashes: typing.Dict[int, typing.Dict[str, str]] = {}
+        self._pending_updates: typing.Dict[typing.Tuple[int, int], discord.Member] = {}
+        self._flush_task: typing.Optional[asyncio.Task] = None
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
     @commands.Cog.listener()
     async def on_guild_available(self, guild) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if guild is None:
                 return
@@ -44,17 +53,18 @@ class UserLookupCog(TacobotCog):
             self.log.debug(
                 guild.id, f"{self._module}.{self._class}.{_method}", f"Performing full user import for guild {guild.id}"
             )
-            for member in guild.members:
-                self.log.debug(
-                    guild.id,
-                    f"{self._module}.{self._class}.{_method}",
-                    f"Tracking user {member.name} in guild {guild.name}",
-                )
-
-                self.tracking_db.track_discord_user(user=DiscordUser.fromUser(member))
+            users = [DiscordUser.fromUser(member) for member in guild.members]
+            written = await self._import_users(guild.id, users)
+            self.log.debug(
+                guild.id,
+                f"{self._module}.{self._class}.{_method}",
+                f"Imported {written} changed users of {len(users)} in guild {guild.name}",
+            )
             date = datetime.datetime.now(pytz.UTC)
             timestamp = utils.to_timestamp(date)
-            self.settings.settings_db.set_setting(guild.id, self.SETTINGS_SECTION, 'last_import', timestamp)
+            await executor.run(
+                self.settings.settings_db.set_setting, guild.id, self.SETTINGS_SECTION, 'last_import', timestamp
+            )
 
         except Exception as e:
             self.log.error(guild.id, f"{self._module}.{self._class}.{_method}", f"{e}", traceback.format_exc())
@@ -62,7 +72,7 @@ class UserLookupCog(TacobotCog):
     # on events, get the user id and username and store it in the database
     @commands.Cog.listener()
     async def on_member_join(self, member) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if member is None or member.guild is None:
                 return
@@ -71,13 +81,13 @@ class UserLookupCog(TacobotCog):
                 f"{self._module}.{self._class}.{_method}",
                 f"User {member.id} joined guild {member.guild.id}",
             )
-            self.tracking_db.track_discord_user(user=DiscordUser.fromUser(member))
+            await self._import_users(member.guild.id, [DiscordUser.fromUser(member)])
         except Exception as e:
             self.log.error(member.guild.id, f"{self._module}.{self._class}.{_method}", f"{e}", traceback.format_exc())
 
     @commands.Cog.listener()
     async def on_member_update(self, before, after) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if after is None or after.guild is None:
                 return
@@ -87,10 +97,42 @@ class UserLookupCog(TacobotCog):
                 f"{self._module}.{self._class}.{_method}",
                 f"User {after.id} updated in guild {after.guild.id}",
             )
-            self.tracking_db.track_discord_user(user=DiscordUser.fromUser(after))
+            self._pending_updates[(after.guild.id, after.id)] = after
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_updates_later())
         except Exception as e:
             self.log.error(after.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
 
+    async def cog_unload(self) -> None:
+        await super().cog_unload()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self._flush_updates()
+
+    async def _import_users(self, guildId: int, users: typing.List[DiscordUser]) -> int:
+        """Write the members whose stored data changed. Returns how many were written."""
+        hashes = self._user_hashes.get(guildId)
+        if hashes is None:
+            hashes = await executor.run(self.tracking_db.get_discord_user_hashes, guildId)
+            self._user_hashes[guildId] = hashes
+        return await executor.run(self.tracking_db.import_discord_users, guildId, users, hashes)
+
+    async def _flush_updates_later(self) -> None:
+        await asyncio.sleep(self.update_debounce)
+        await self._flush_updates()
+
+    async def _flush_updates(self) -> None:
+        _method = utils.get_method_name()
+        pending, self._pending_updates = self._pending_updates, {}
+        by_guild: typing.Dict[int, typing.List[DiscordUser]] = {}
+        for (guild_id, _), member in pending.items():
+            by_guild.setdefault(guild_id, []).append(DiscordUser.fromUser(member))
+        for guild_id, users in by_guild.items():
+            try:
+                await self._import_users(guild_id, users)
+            except Exception as e:
+                self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
+
 
 async def setup(bot):
     await bot.add_cog(UserLookupCog(bot))
@@ -1,8 +1,7 @@
-import inspect
 import os
 import traceback
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
 from bot.lib.enums import tacotypes
 from bot.tacobot import TacoBot
@@ -12,7 +11,7 @@ from discord.ext import commands
 class VoiceChatCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "voicechat")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -23,7 +22,7 @@ class VoiceChatCog(TacobotCog):
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if not member.guild:
             return
 
@@ -1,13 +1,14 @@
 import datetime
-import inspect
 import os
 import traceback
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.discord.ext.commands.TacobotCog import TacobotCog
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.enums import tacotypes
 from bot.lib.messaging import Messaging
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.mongodb.wdyctw import WDYCTWDatabase
 from bot.lib.permissions import Permissions
@@ -19,7 +20,7 @@ from discord.ext.commands import Context
 class WhatDoYouCallThisWednesdayCog(TacobotCog):
     def __init__(self, bot: TacoBot) -> None:
         super().__init__(bot, "wdyctw")
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -31,6 +32,10 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
 
         self.wdyctw_db = WDYCTWDatabase()
         self.tracking_db = TrackingDatabase()
+        self.reaction_interest = ReactionInterest(
+            section="wdyctw",
+            emojis=lambda section: section.get("reaction_emoji", ["🇼"]) + section.get("import_emoji", ["🇮"]),
+        )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Initialized")
 
@@ -38,7 +43,7 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
     @commands.has_permissions(administrator=True)
     @commands.guild_only()
     async def wdyctw(self, ctx: Context) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if ctx.invoked_subcommand is not None:
             return
         guild_id = 0
@@ -123,7 +128,8 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             )
 
             # save the WDYCTW to the database
-            self.wdyctw_db.save_wdyctw(
+            await executor.run(
+                self.wdyctw_db.save_wdyctw,
                 guildId=guild_id,
                 message=twa.text,
                 image=twa.attachments[0].url,
@@ -131,7 +137,8 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
                 channel_id=out_channel.id,
                 message_id=wdyctw_message.id,
             )
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel.id else None,
                 userId=ctx.author.id,
@@ -148,7 +155,7 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
     @commands.guild_only()
     async def import_wdyctw(self, ctx, message_id: int) -> None:
         """Import WDYCTW from an existing post"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         guild_id = 0
         if ctx.guild:
             guild_id = ctx.guild.id
@@ -169,9 +176,10 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             if not message:
                 return
 
-            self._import_wdyctw(message)
+            await self._import_wdyctw(message)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=guild_id,
                 channelId=ctx.channel.id if ctx.channel.id else None,
                 userId=ctx.author.id,
@@ -189,13 +197,14 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
     @commands.guild_only()
     async def give(self, ctx, member: discord.Member) -> None:
         """Give a user tacos for their WDYCTW"""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             await ctx.message.delete()
 
             await self.give_user_wdyctw_tacos(ctx.guild.id, member.id, ctx.channel.id, None)
 
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=ctx.guild.id,
                 channelId=ctx.channel.id if ctx.channel.id else None,
                 userId=ctx.author.id,
@@ -208,21 +217,15 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             self.log.error(ctx.guild.id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             await self.messaging.notify_of_error(ctx)
 
-    async def _on_raw_reaction_add_give(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
-
-        # check if the user that reacted is in the admin role
-        if not await self.permissions.is_admin(payload.user_id, guild_id):
-            self.log.debug(
-                guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
-            )
-            return
-        # in future, check if the user is in a defined role that can grant tacos (e.g. moderator)
+    async def _on_raw_reaction_add_give(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
 
         # get the message that was reacted to
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
+        message = await ctx.get_message(fresh=True)
+        if not message:
+            return
         message_author = message.author
         # react_user = await self.discord_helper.get_or_fetch_user(payload.user_id)
 
@@ -236,7 +239,9 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             )
             return
 
-        already_tracked = self.wdyctw_db.wdyctw_user_message_tracked(guild_id, message_author.id, message.id)
+        already_tracked = await executor.run(
+            self.wdyctw_db.wdyctw_user_message_tracked, guild_id, message_author.id, message.id
+        )
         if not already_tracked:
             # log that we are giving tacos for this reaction
             self.log.info(
@@ -245,7 +250,8 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
                 f"User {payload.user_id} reacted with {payload.emoji.name} to message {payload.message_id}",
             )
             await self.give_user_wdyctw_tacos(guild_id, message_author.id, payload.channel_id, payload.message_id)
-            self.tracking_db.track_command_usage(
+            await executor.run(
+                self.tracking_db.track_command_usage,
                 guildId=payload.guild_id,
                 channelId=payload.channel_id if payload.channel_id else None,
                 userId=payload.user_id,
@@ -273,20 +279,15 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
                 f"Message {payload.message_id} has already been tracked for WDYCTW. Skipping.",
             )
 
-    async def _on_raw_reaction_add_import(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def _on_raw_reaction_add_import(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
 
-        # check if the user that reacted is in the admin role
-        if not await self.permissions.is_admin(payload.user_id, guild_id):
-            self.log.debug(
-                guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
-            )
+        message = await ctx.get_message(fresh=True)
+        if not message:
             return
 
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
-
         # check if this reaction is the first one of this type on the message
         reactions = discord.utils.get(message.reactions, emoji=payload.emoji.name)
         if reactions and reactions.count > 1:
@@ -297,9 +298,10 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             )
             return
 
-        self._import_wdyctw(message)
+        await self._import_wdyctw(message)
 
-        self.tracking_db.track_command_usage(
+        await executor.run(
+            self.tracking_db.track_command_usage,
             guildId=payload.guild_id,
             channelId=payload.channel_id if payload.channel_id else None,
             userId=payload.user_id,
@@ -321,37 +323,34 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             ],
         )
 
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload) -> None:
-        _method = inspect.stack()[0][3]
-        guild_id = payload.guild_id
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        guild_id = ctx.guild_id
+        payload = ctx.payload
         try:
-            if payload.event_type != 'REACTION_ADD':
+            cog_settings = ctx.get_settings(self.SETTINGS_SECTION)
+
+            # check if the reaction is one of the ones we care about
+            reaction_emojis = cog_settings.get("reaction_emoji", ["🇼"])
+            reaction_import_emojis = cog_settings.get("import_emoji", ["🇮"])
+
+            check_list = reaction_emojis + reaction_import_emojis
+            if str(payload.emoji.name) not in check_list:
                 return
 
             # check if the user that reacted is in the admin role
-            if not await self.permissions.is_admin(payload.user_id, guild_id):
+            if not await ctx.is_admin():
                 self.log.debug(
                     guild_id, f"{self._module}.{self._class}.{_method}", f"User {payload.user_id} is not an admin"
                 )
                 return
 
-            react_user = await self.discord_helper.get_or_fetch_user(payload.user_id)
+            react_user = await ctx.get_user()
             if not react_user or react_user.bot or react_user.system:
                 return
 
-            cog_settings = self.get_cog_settings(guild_id)
-
-            # check if the reaction is one of the ones we care about
-            reaction_emojis = cog_settings.get("reaction_emoji", ["🇼"])
-            reaction_import_emojis = cog_settings.get("import_emoji", ["🇮"])
-
-            check_list = reaction_emojis + reaction_import_emojis
-            if str(payload.emoji.name) not in check_list:
-                return
-
             if str(payload.emoji.name) in reaction_emojis:
-                await self._on_raw_reaction_add_give(payload)
+                await self._on_raw_reaction_add_give(ctx)
                 return
 
             # check if it's Wednesday
@@ -359,15 +358,15 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             if today.weekday() != 2:  # 2 = Wednesday
                 return
             if str(payload.emoji.name) in reaction_import_emojis:
-                await self._on_raw_reaction_add_import(payload)
+                await self._on_raw_reaction_add_import(ctx)
                 return
 
         except Exception as ex:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
             # await self.messaging.notify_of_error(ctx)
 
-    def _import_wdyctw(self, message: discord.Message) -> None:
-        _method = inspect.stack()[0][3]
+    async def _import_wdyctw(self, message: discord.Message) -> None:
+        _method = utils.get_method_name()
         guild_id = message.guild.id
         channel_id = message.channel.id
         message_id = message.id
@@ -391,7 +390,8 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             f"{self._module}.{self._class}.{_method}",
             f"Importing WDYCTW message {message_id} from channel {channel_id} in guild {guild_id} for user {message_author.id} with text {text} and image {image_url}",
         )
-        self.wdyctw_db.save_wdyctw(
+        await executor.run(
+            self.wdyctw_db.save_wdyctw,
             guildId=guild_id,
             message=text or "",
             image=image_url,
@@ -401,7 +401,7 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
         )
 
     async def give_user_wdyctw_tacos(self, guild_id, user_id, channel_id, message_id) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # create context
             # self, bot=None, author=None, guild=None, channel=None, message=None, invoked_subcommand=None, **kwargs
@@ -432,7 +432,7 @@ class WhatDoYouCallThisWednesdayCog(TacobotCog):
             )
 
             # track that the user answered the question.
-            self.wdyctw_db.track_wdyctw_answer(guild_id, member.id, message_id)
+            await executor.run(self.wdyctw_db.track_wdyctw_answer, guild_id, member.id, message_id)
 
             tacos_settings = self.get_tacos_settings(guild_id)
 
@@ -1,9 +1,8 @@
-import inspect
 import os
 import traceback
 
 import discord
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
 
 
@@ -11,7 +10,7 @@ class ChannelSelect(discord.ui.Select):
     def __init__(self, ctx, placeholder: str, channels, allow_none: bool = False) -> None:
         max_items = 24 if not allow_none else 23
         super().__init__(placeholder=placeholder, min_values=1, max_values=1)
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self.ctx = ctx
@@ -48,7 +47,7 @@ class ChannelSelectView(discord.ui.View):
         timeout: int = 180,
     ) -> None:
         super().__init__(timeout=timeout)
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self.settings = settings.Settings()
@@ -65,7 +64,7 @@ class ChannelSelectView(discord.ui.View):
         self.add_item(self.channel_select)
 
     async def on_select(self, interaction: discord.Interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(self.ctx.guild.id, f"{self._module}.{_method}", "Item Selected")
         await interaction.response.defer()
         if self.select_callback is not None:
@@ -73,13 +72,13 @@ class ChannelSelectView(discord.ui.View):
             self.stop()
 
     async def on_timeout(self) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(self.ctx.guild.id, f"{self._module}.{_method}", "Timed out")
         self.clear_items()
         if self.timeout_callback is not None:
             await self.timeout_callback()
 
     async def on_error(self, error, item, interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.clear_items()
         self.log.error(self.ctx.guild.id, f"{self._module}.{_method}", str(error), traceback.format_exc())
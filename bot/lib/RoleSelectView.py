@@ -1,9 +1,8 @@
-import inspect
 import os
 import typing
 
 import discord
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
 
 
@@ -19,7 +18,7 @@ class RoleSelectView(discord.ui.View):
         timeout: int = 180,
     ):
         super().__init__(timeout=timeout)
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self.settings = settings.Settings()
@@ -54,7 +53,7 @@ class RoleSelect(discord.ui.Select):
     def __init__(self, ctx, placeholder: str, roles, allow_none: bool = False) -> None:
         max_items = 24 if not allow_none else 23
         super().__init__(placeholder=placeholder, min_values=1, max_values=1)
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self.ctx = ctx
@@ -1,10 +1,9 @@
-import inspect
 import os
 import traceback
 import typing
 
 import discord
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
 
 
@@ -17,7 +16,7 @@ class YesOrNoView(discord.ui.View):
         timeout: int = 60 * 5,
     ) -> None:
         super().__init__(timeout=timeout)
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self.settings = settings.Settings()
@@ -61,5 +60,5 @@ class YesOrNoView(discord.ui.View):
             await self.timeout_callback(self)
 
     async def on_error(self, error, item, interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.error(self.ctx.guild.id, f"{self._module}.{_method}", str(error), traceback.format_exc())
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import os
+import time
+import traceback
+import typing
+
+from bot.lib import logger, settings, utils
+from bot.lib.enums import loglevel
+from bot.lib.mongodb import executor
+from bot.lib.mongodb.settings import SettingsDatabase
+
+T = typing.TypeVar("T")
+
+
+class _GuildRoutes(typing.Generic[T]):
+    __slots__ = ("routes", "fingerprint", "generation", "checked_at")
+
+    def __init__(
+        self, routes: typing.Dict[str, T], fingerprint: str, generation: typing.Tuple[int, int], checked_at: float
+    ) -> None:
+        self.routes = routes
+        self.fingerprint = fingerprint
+        self.generation = generation
+        self.checked_at = checked_at
+
+
+class ChannelConfigIndex(typing.Generic[T]):
+    """Per-guild ``channel id -> prepared config`` lookup for a settings section with a ``channels`` list.
+
+    Cogs such as ``restricted`` and ``photo_post`` configure behaviour per channel. Instead of scanning
+    ``channels`` (and compiling regexes) for every message, each channel entry is passed through
+    ``prepare`` once when the guild's section is loaded, and lookups are a single dict access.
+
+    A guild's routes are re-checked when its section, or the global guild ``0`` section it falls back to,
+    is written in this process (``SettingsCache.section_generation``), and every ``refresh_seconds``
+    (defaults to the settings cache TTL), so edits made elsewhere are picked up on the same schedule as
+    before. A re-check that finds identical settings keeps the prepared routes. A channel whose
+    ``prepare`` fails is logged and left out of the index.
+
+    On the event loop, ``get`` never reads settings itself: a stale guild keeps answering from its current
+    routes while one refresh per guild runs on the database executor, and a guild that was never loaded
+    answers ``None`` until its load finishes. Cogs warm guilds as they become available. Off the loop
+    (executor threads, tests) stale and missing guilds are loaded inline.
+    """
+
+    def __init__(
+        self,
+        section: str,
+        prepare: typing.Optional[typing.Callable[[dict], T]] = None,
+        refresh_seconds: typing.Optional[float] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._module = os.path.basename(__file__)[:-3]
+        self._class = self.__class__.__name__
+        self.section = section
+        self.prepare: typing.Callable[[dict], typing.Any] = prepare or (lambda channel: channel)
+        self.refresh_seconds = SettingsDatabase.cache.ttl if refresh_seconds is None else refresh_seconds
+        self._clock = clock
+        self.settings = settings.Settings()
+        self.log = logger.Log(minimumLogLevel=loglevel.LogLevel[self.settings.log_level.upper()])
+        self._guilds: typing.Dict[int, _GuildRoutes] = {}
+        # background refreshes in flight, per guild; only touched on the event loop
+        self._refreshing: typing.Dict[int, asyncio.Task] = {}
+        self.builds = 0
+        self.refreshes = 0
+
+    def get(self, guildId: int, channelId: typing.Union[int, str]) -> typing.Optional[T]:
+        """Return the prepared config for the channel, or ``None`` if the channel is not configured."""
+        entry = self._guilds.get(guildId)
+        if entry is None or self._is_stale(guildId, entry):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                entry = self._load(guildId, entry)
+            else:
+                self._schedule_refresh(loop, guildId)
+                if entry is None:
+                    return None
+        return entry.routes.get(str(channelId))
+
+    def warm(self, guildIds: typing.Iterable[int]) -> None:
+        """Build the routes for each guild ahead of its first message."""
+        for guild_id in guildIds:
+            self._load(guild_id, self._guilds.get(guild_id))
+
+    async def refresh(self, guildId: int) -> None:
+        """Load the guild's routes on the database executor."""
+        await executor.run(self._load, guildId, self._guilds.get(guildId))
+
+    def invalidate(self, guildId: typing.Optional[int] = None) -> None:
+        if guildId is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guildId, None)
+
+    def stats(self) -> dict:
+        return {
+            "guilds": len(self._guilds),
+            "channels": sum(len(entry.routes) for entry in self._guilds.values()),
+            "builds": self.builds,
+            "refreshes": self.refreshes,
+        }
+
+    def _generation(self, guildId: int) -> typing.Tuple[int, int]:
+        cache = SettingsDatabase.cache
+        return (cache.section_generation(guildId, self.section), cache.section_generation(0, self.section))
+
+    def _is_stale(self, guildId: int, entry: _GuildRoutes) -> bool:
+        if entry.generation != self._generation(guildId):
+            return True
+        return self._clock() - entry.checked_at >= self.refresh_seconds
+
+    def _schedule_refresh(self, loop: asyncio.AbstractEventLoop, guildId: int) -> None:
+        if guildId in self._refreshing:
+            return
+        task = loop.create_task(self._refresh(guildId))
+        self._refreshing[guildId] = task
+
+    async def _refresh(self, guildId: int) -> None:
+        _method = utils.get_method_name()
+        try:
+            await self.refresh(guildId)
+        except Exception as e:
+            self.log.error(
+                guildId,
+                f"{self._module}.{self._class}.{_method}",
+                f"Unable to refresh '{self.section}' channels: {e}",
+                traceback.format_exc(),
+            )
+        finally:
+            self._refreshing.pop(guildId, None)
+
+    def _load(self, guildId: int, entry: typing.Optional[_GuildRoutes]) -> _GuildRoutes:
+        # read the generation first: a write that lands while we read makes the next lookup re-check
+        generation = self._generation(guildId)
+        section_settings = self.settings.get_settings(guildId, self.section)
+        if not section_settings:
+            section_settings = self.settings.get_settings(0, self.section)
+        fingerprint = json.dumps(section_settings, sort_keys=True, default=str)
+
+        self.refreshes += 1
+        if entry is not None and entry.fingerprint == fingerprint:
+            entry.generation = generation
+            entry.checked_at = self._clock()
+            return entry
+
+        routes = self._build(guildId, (section_settings or {}).get("channels", []))
+        entry = _GuildRoutes(routes, fingerprint, generation, self._clock())
+        self._guilds[guildId] = entry
+        return entry
+
+    def _build(self, guildId: int, channels: typing.List[dict]) -> typing.Dict[str, T]:
+        _method = utils.get_method_name()
+        self.builds += 1
+        routes: typing.Dict[str, T] = {}
+        for channel in channels:
+            try:
+                routes[str(channel["id"])] = self.prepare(channel)
+            except Exception as e:
+                self.log.error(
+                    guildId,
+                    f"{self._module}.{self._class}.{_method}",
+                    f"Skipping invalid '{self.section}' channel {channel.get('id', '?')}: {e}",
+                    traceback.format_exc(),
+                )
+        return routes
@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+import json
+import os
+import traceback
+import typing
+
+import discord
+from bot.lib import utils
+from bot.lib.mongodb import executor
+from bot.lib.mongodb.guilds import GuildsDatabase
+
+
+class CommandSync:
+    """Copies the global app commands into each guild and syncs only the guilds whose commands changed.
+
+    ``tree.sync(guild=...)`` is one REST call per guild. For every guild the local tree is rebuilt as
+    before (``clear_commands`` + ``copy_global_to``), then hashed: the serialized commands plus the
+    application id. The hash last synced to each guild is kept in ``app_command_syncs``; guilds whose hash
+    matches are skipped, and the rest are synced ``SYNC_APP_COMMANDS_CONCURRENCY`` at a time (discord.py
+    still waits out any rate limit). ``SYNC_APP_COMMANDS_FORCE=true`` syncs every guild, e.g. after the
+    commands were changed outside the bot.
+    """
+
+    def __init__(
+        self,
+        bot: typing.Any,
+        concurrency: typing.Optional[int] = None,
+        force: typing.Optional[bool] = None,
+    ) -> None:
+        self._module = os.path.basename(__file__)[:-3]
+        self._class = self.__class__.__name__
+        self.bot = bot
+        self.log = bot.log
+        self.guilds_db = GuildsDatabase()
+        if concurrency is None:
+            concurrency = int(utils.dict_get(os.environ, "SYNC_APP_COMMANDS_CONCURRENCY", default_value="4"))
+        self.concurrency = max(1, concurrency)
+        if force is None:
+            force = utils.str2bool(utils.dict_get(os.environ, "SYNC_APP_COMMANDS_FORCE", default_value="false"))
+        self.force = force
+        self.synced = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def tree_hash(self, guild: discord.abc.Snowflake) -> str:
+        """Hash of the commands the tree would sync to ``guild``."""
+        tree = self.bot.tree
+        commands = [command.to_dict(tree) for command in tree.get_commands(guild=guild)]
+        commands.sort(key=lambda command: (command.get("type", 1), command.get("name", "")))
+        payload = {"application_id": self.bot.application_id, "commands": commands}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    async def sync(self, guildIds: typing.Iterable[int]) -> None:
+        _method = utils.get_method_name()
+        tree = self.bot.tree
+        synced_hashes = {} if self.force else await executor.run(self.guilds_db.get_app_command_hashes)
+
+        pending: typing.List[typing.Tuple[int, str]] = []
+        for gid in guildIds:
+            guild = discord.Object(id=gid)
+            tree.clear_commands(guild=guild)
+            tree.copy_global_to(guild=guild)
+            digest = self.tree_hash(guild)
+            if synced_hashes.get(str(gid)) == digest:
+                self.skipped += 1
+                continue
+            pending.append((gid, digest))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(self._sync_guild(semaphore, gid, digest) for gid, digest in pending))
+        self.log.info(
+            0,
+            f"{self._module}.{self._class}.{_method}",
+            f"App commands synced to {self.synced} guilds, {self.skipped} unchanged, {self.failed} failed",
+        )
+
+    async def _sync_guild(self, semaphore: asyncio.Semaphore, gid: int, digest: str) -> None:
+        _method = utils.get_method_name()
+        async with semaphore:
+            try:
+                await self.bot.tree.sync(guild=discord.Object(id=gid))
+            except discord.errors.Forbidden as fe:
+                self.failed += 1
+                self.log.debug(
+                    gid, f"{self._module}.{self._class}.{_method}", f"Failed to sync app commands for guild {gid}: {fe}"
+                )
+                return
+            except Exception as e:
+                self.failed += 1
+                self.log.error(
+                    gid,
+                    f"{self._module}.{self._class}.{_method}",
+                    f"Failed to sync app commands for guild {gid}: {e}",
+                    traceback.format_exc(),
+                )
+                return
+        self.synced += 1
+        self.log.debug(gid, f"{self._module}.{self._class}.{_method}", f"Synced app commands for guild {gid}")
+        await executor.run(self.guilds_db.set_app_command_hash, gid, digest)
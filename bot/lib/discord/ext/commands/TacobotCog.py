@@ -1,10 +1,19 @@
+import typing
+
 from bot.lib import logger, settings
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest
+from bot.lib.discord.reaction_router import ReactionContext, ReactionInterest
 from bot.lib.enums import loglevel
 from bot.tacobot import TacoBot
 from discord.ext import commands
 
 
 class TacobotCog(commands.Cog):
+    # set in __init__ by cogs that handle messages; on_message(ctx) is then called by the bot's MessagePipeline
+    message_interest: typing.Optional[MessageInterest] = None
+    # set in __init__ by cogs that handle raw reactions; on_reaction(ctx) is then called by the bot's ReactionRouter
+    reaction_interest: typing.Optional[ReactionInterest] = None
+
     def __init__(self, bot: TacoBot, settingsSection: str) -> None:
         super().__init__()
         self.bot = bot
@@ -18,6 +27,24 @@ class TacobotCog(commands.Cog):
 
         self.log = logger.Log(minimumLogLevel=log_level)
 
+    async def cog_load(self) -> None:
+        if self.message_interest is not None:
+            self.bot.message_pipeline.register(self.qualified_name, self.on_message, self.message_interest)
+        if self.reaction_interest is not None:
+            self.bot.reaction_router.register(self.qualified_name, self.on_reaction, self.reaction_interest)
+
+    async def cog_unload(self) -> None:
+        if self.message_interest is not None:
+            self.bot.message_pipeline.unregister(self.qualified_name)
+        if self.reaction_interest is not None:
+            self.bot.reaction_router.unregister(self.qualified_name)
+
+    async def on_message(self, ctx: MessageContext) -> None:
+        pass
+
+    async def on_reaction(self, ctx: ReactionContext) -> None:
+        pass
+
     def get_cog_settings(self, guildId: int = 0) -> dict:
         return self.get_settings(guildId=guildId, section=self.SETTINGS_SECTION)
 
@@ -0,0 +1,218 @@
+import asyncio
+import collections
+import time
+import typing
+
+T = typing.TypeVar("T")
+CacheKey = typing.Tuple[typing.Any, ...]
+
+
+class FetchCache:
+    """Bounded LRU/TTL cache for objects fetched over Discord REST, with single-flight fetches.
+
+    Keys are tuples whose first item is the kind (``("user", id)``, ``("message", channelId, messageId)``, ...).
+    ``get_or_fetch`` returns a live entry, joins a fetch already running for the same key, or starts one;
+    concurrent callers for one key cause a single REST call. A fetch that raises raises for every caller
+    waiting on it and is not cached, and neither is a ``None`` result.
+
+    ``invalidate`` drops an entry and bumps the key's generation, so a fetch that was already running when
+    the gateway reported a change neither stores its (possibly stale) result nor is joined by later callers.
+    Only REST results belong here: the gateway cache (``bot.get_user`` and friends) is always checked first.
+    A ``maxsize`` or ``ttl`` of 0 or less disables caching, but concurrent fetches are still coalesced.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        ttls: typing.Optional[typing.Dict[str, float]] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # per-kind overrides, e.g. a shorter lifetime for messages whose reactions change often
+        self.ttls = dict(ttls or {})
+        self._clock = clock
+        self._entries: "collections.OrderedDict[CacheKey, typing.Tuple[float, typing.Any]]" = collections.OrderedDict()
+        self._inflight: typing.Dict[CacheKey, typing.Tuple[int, asyncio.Future]] = {}
+        self._generations: typing.Dict[CacheKey, int] = {}
+        self._counters: typing.Dict[str, typing.Dict[str, int]] = {}
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: CacheKey) -> typing.Any:
+        """Return the live entry for ``key`` or ``None``. Does not count towards the hit rate."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    async def get_or_fetch(self, key: CacheKey, fetch: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        kind = str(key[0])
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self._count(kind, "hits")
+                return entry[1]
+            del self._entries[key]
+
+        generation = self._generations.get(key, 0)
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] == generation:
+            self._count(kind, "coalesced")
+            # shield so one cancelled waiter does not cancel the fetch for the others
+            return await asyncio.shield(inflight[1])
+
+        self._count(kind, "misses")
+        return await self._fetch(key, fetch)
+
+    async def refresh(self, key: CacheKey, fetch: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        """Fetch ``key`` even when it is cached, for a caller that needs state newer than the cached copy.
+
+        The cached entry is dropped right away and replaced by the result; ``get_or_fetch`` callers that
+        arrive meanwhile join the refresh.
+        """
+        self._count(str(key[0]), "refreshes")
+        self._entries.pop(key, None)
+        if key in self._inflight:
+            # an older fetch still running must not overwrite the newer result when it finishes
+            self._generations[key] = self._generations.get(key, 0) + 1
+        return await self._fetch(key, fetch)
+
+    async def _fetch(self, key: CacheKey, fetch: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        generation = self._generations.get(key, 0)
+        future = asyncio.ensure_future(fetch())
+        self._inflight[key] = (generation, future)
+        try:
+            result = await asyncio.shield(future)
+        finally:
+            stale = self._generations.get(key, 0) != generation
+            current = self._inflight.get(key)
+            if current is not None and current[1] is future:
+                del self._inflight[key]
+            if key not in self._inflight:
+                self._generations.pop(key, None)
+        if result is not None and not stale:
+            self.set(key, result)
+        return result
+
+    def set(self, key: CacheKey, value: typing.Any) -> None:
+        if not self.enabled:
+            return
+        ttl = self.ttls.get(str(key[0]), self.ttl)
+        if ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: CacheKey) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+        # generations are only kept while a fetch for the key is running; see get_or_fetch
+        if key in self._inflight:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def invalidate_where(self, kind: str, predicate: typing.Callable[[CacheKey], bool]) -> None:
+        """Invalidate every entry (cached or being fetched) of ``kind`` whose key matches ``predicate``."""
+        keys = {k for k in self._entries if k[0] == kind and predicate(k)}
+        keys.update(k for k in self._inflight if k[0] == kind and predicate(k))
+        for key in keys:
+            self.invalidate(key)
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        for key in self._inflight:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def listen(self, bot: typing.Any) -> None:
+        """Invalidate entries from the gateway events that announce a change to them.
+
+        Reactions are not handled here: counts change on every reaction, and invalidating on each one would
+        make every reaction in a burst fetch the message again. Handlers that read ``message.reactions`` use
+        ``ReactionContext.get_message(fresh=True)``, which goes through ``refresh``.
+        """
+
+        async def message_changed(payload: typing.Any) -> None:
+            self.invalidate(("message", payload.channel_id, payload.message_id))
+
+        async def messages_deleted(payload: typing.Any) -> None:
+            for message_id in payload.message_ids:
+                self.invalidate(("message", payload.channel_id, message_id))
+
+        async def user_updated(before: typing.Any, after: typing.Any) -> None:
+            self.invalidate(("user", after.id))
+
+        async def member_updated(before: typing.Any, after: typing.Any) -> None:
+            self.invalidate(("member", after.guild.id, after.id))
+
+        async def member_removed(payload: typing.Any) -> None:
+            self.invalidate(("member", payload.guild_id, payload.user.id))
+
+        async def guild_updated(before: typing.Any, after: typing.Any) -> None:
+            self.invalidate(("guild", after.id))
+
+        async def channel_updated(before: typing.Any, after: typing.Any) -> None:
+            self.invalidate(("channel", after.id))
+
+        async def channel_deleted(channel: typing.Any) -> None:
+            self.invalidate(("channel", channel.id))
+            self.invalidate_where("message", lambda key: key[1] == channel.id)
+
+        async def thread_changed(payload: typing.Any) -> None:
+            self.invalidate(("channel", payload.thread_id))
+
+        async def roles_changed(*roles: typing.Any) -> None:
+            self.invalidate(("roles", roles[-1].guild.id))
+
+        for event, listener in (
+            ("on_raw_message_edit", message_changed),
+            ("on_raw_message_delete", message_changed),
+            ("on_raw_reaction_clear", message_changed),
+            ("on_raw_reaction_clear_emoji", message_changed),
+            ("on_raw_bulk_message_delete", messages_deleted),
+            ("on_user_update", user_updated),
+            ("on_member_update", member_updated),
+            ("on_raw_member_remove", member_removed),
+            ("on_guild_update", guild_updated),
+            ("on_guild_channel_update", channel_updated),
+            ("on_guild_channel_delete", channel_deleted),
+            ("on_raw_thread_update", thread_changed),
+            ("on_raw_thread_delete", thread_changed),
+            ("on_guild_role_create", roles_changed),
+            ("on_guild_role_update", roles_changed),
+            ("on_guild_role_delete", roles_changed),
+        ):
+            bot.add_listener(listener, event)
+
+    def stats(self) -> dict:
+        kinds = {}
+        for kind, counters in self._counters.items():
+            hits = counters.get("hits", 0) + counters.get("coalesced", 0)
+            lookups = hits + counters.get("misses", 0)
+            kinds[kind] = {**counters, "hit_rate": hits / lookups if lookups else 0.0}
+        hits = sum(c.get("hits", 0) + c.get("coalesced", 0) for c in self._counters.values())
+        lookups = hits + sum(c.get("misses", 0) for c in self._counters.values())
+        return {
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "kinds": kinds,
+        }
+
+    def _count(self, kind: str, counter: str) -> None:
+        counters = self._counters.setdefault(kind, {"hits": 0, "coalesced": 0, "misses": 0, "refreshes": 0})
+        counters[counter] += 1
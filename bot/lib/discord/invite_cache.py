@@ -0,0 +1,214 @@
+import asyncio
+import os
+import time
+import typing
+
+import discord
+from bot.lib import utils
+
+InviteFetcher = typing.Callable[[discord.Guild], typing.Awaitable[typing.List[discord.Invite]]]
+
+
+async def _fetch_invites(guild: discord.Guild) -> typing.List[discord.Invite]:
+    return await guild.invites()
+
+
+class _JoinBatch:
+    __slots__ = ("members", "started", "future")
+
+    def __init__(self) -> None:
+        self.members: typing.List[int] = []
+        # set once the refetch for this batch is under way; later joins start the next batch
+        self.started = False
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class InviteCache:
+    """Per-guild ``code -> discord.Invite`` cache that attributes member joins to invites.
+
+    The cache is seeded with one ``guild.invites()`` call per guild and then kept up to date from
+    ``on_invite_create`` / ``on_invite_delete``. Discord does not say which invite a member used, so a join
+    still needs a refetch to see whose ``uses`` went up, but:
+
+    * joins within ``refetch_delay`` seconds of each other share one refetch, and the uses it finds are
+      handed out to those members in join order
+    * an invite deleted because its last use was just taken (``uses == max_uses - 1``) is attributed to the
+      next join without a refetch, which also covers Discord deleting the invite before the join arrives
+    * guilds where the bot may not list invites are not asked again for ``forbidden_seconds``
+
+    Callers skip bots themselves; bots are added through OAuth and never use an invite.
+    """
+
+    def __init__(
+        self,
+        fetch: InviteFetcher = _fetch_invites,
+        refetch_delay: typing.Optional[float] = None,
+        exhausted_seconds: float = 30.0,
+        forbidden_seconds: float = 3600.0,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        if refetch_delay is None:
+            refetch_delay = float(utils.dict_get(os.environ, "INVITE_REFETCH_DELAY", default_value="1.0"))
+        self.refetch_delay = refetch_delay
+        self.exhausted_seconds = exhausted_seconds
+        self.forbidden_seconds = forbidden_seconds
+        self._clock = clock
+        self._invites: typing.Dict[int, typing.Dict[str, discord.Invite]] = {}
+        # invites deleted with one use left, most likely by the join that is about to be (or was just) reported
+        self._exhausted: typing.Dict[int, typing.List[typing.Tuple[float, discord.Invite]]] = {}
+        self._forbidden_until: typing.Dict[int, float] = {}
+        self._batches: typing.Dict[int, _JoinBatch] = {}
+        self._locks: typing.Dict[int, asyncio.Lock] = {}
+        self.fetches = 0
+        self.coalesced = 0
+        self.attributed = 0
+        self.unattributed = 0
+
+    def is_seeded(self, guildId: int) -> bool:
+        return guildId in self._invites
+
+    def seed(self, guildId: int, invites: typing.Iterable[discord.Invite]) -> None:
+        self._invites[guildId] = {invite.code: invite for invite in invites}
+
+    async def refresh(self, guild: discord.Guild) -> typing.List[discord.Invite]:
+        """Fetch and cache every invite of ``guild``. Raises ``discord.Forbidden`` without Manage Server."""
+        async with self._lock(guild.id):
+            invites = await self._fetch_guild(guild)
+            self.seed(guild.id, invites)
+            return invites
+
+    def get(self, guildId: int, code: str) -> typing.Optional[discord.Invite]:
+        return self._invites.get(guildId, {}).get(code)
+
+    def add(self, invite: discord.Invite) -> None:
+        if invite.guild is None:
+            return
+        self._invites.setdefault(invite.guild.id, {})[invite.code] = invite
+
+    def remove(self, invite: discord.Invite) -> None:
+        if invite.guild is None:
+            return
+        cached = self._invites.get(invite.guild.id, {}).pop(invite.code, None)
+        if cached is not None and self._one_use_left(cached):
+            self._exhausted.setdefault(invite.guild.id, []).append((self._clock(), cached))
+
+    def forget(self, guildId: int) -> None:
+        self._invites.pop(guildId, None)
+        self._exhausted.pop(guildId, None)
+        self._forbidden_until.pop(guildId, None)
+
+    async def attribute(self, guild: discord.Guild, memberId: int) -> typing.Optional[discord.Invite]:
+        """Return the invite ``memberId`` most likely joined with, or ``None`` if no use can be found."""
+        exhausted = self._take_exhausted(guild.id)
+        if exhausted is not None:
+            self.attributed += 1
+            return exhausted
+        if self._forbidden_until.get(guild.id, 0) > self._clock():
+            return None
+
+        batch = self._batches.get(guild.id)
+        if batch is None or batch.started:
+            batch = _JoinBatch()
+            self._batches[guild.id] = batch
+            asyncio.ensure_future(self._run_batch(guild, batch))
+        else:
+            self.coalesced += 1
+        batch.members.append(memberId)
+        uses = await asyncio.shield(batch.future)
+        invite = uses.get(memberId)
+        if invite is None:
+            self.unattributed += 1
+        else:
+            self.attributed += 1
+        return invite
+
+    def stats(self) -> dict:
+        return {
+            "guilds": len(self._invites),
+            "invites": sum(len(invites) for invites in self._invites.values()),
+            "fetches": self.fetches,
+            "coalesced": self.coalesced,
+            "attributed": self.attributed,
+            "unattributed": self.unattributed,
+        }
+
+    async def _run_batch(self, guild: discord.Guild, batch: _JoinBatch) -> None:
+        uses: typing.Dict[int, discord.Invite] = {}
+        try:
+            # give the rest of a join burst a moment to land in this batch
+            await asyncio.sleep(self.refetch_delay)
+            async with self._lock(guild.id):
+                batch.started = True
+                if self._batches.get(guild.id) is batch:
+                    del self._batches[guild.id]
+                seeded = guild.id in self._invites
+                before = self._invites.get(guild.id, {})
+                invites = await self._fetch_guild(guild)
+                self.seed(guild.id, invites)
+                if seeded:
+                    used = self._diff(before, self._invites[guild.id])
+                    # an exhausted invite whose delete event arrived while this batch was waiting
+                    while len(used) < len(batch.members):
+                        exhausted = self._take_exhausted(guild.id)
+                        if exhausted is None:
+                            break
+                        used.append(exhausted)
+                    uses = dict(zip(batch.members, used))
+        except discord.Forbidden:
+            # _fetch_guild remembered it; these joins stay unattributed
+            pass
+        except Exception as ex:
+            if not batch.future.done():
+                batch.future.set_exception(ex)
+            return
+        finally:
+            batch.started = True
+            if self._batches.get(guild.id) is batch:
+                del self._batches[guild.id]
+        if not batch.future.done():
+            batch.future.set_result(uses)
+
+    async def _fetch_guild(self, guild: discord.Guild) -> typing.List[discord.Invite]:
+        self.fetches += 1
+        try:
+            invites = await self._fetch(guild)
+        except discord.Forbidden:
+            self._forbidden_until[guild.id] = self._clock() + self.forbidden_seconds
+            raise
+        self._forbidden_until.pop(guild.id, None)
+        return list(invites)
+
+    def _diff(
+        self, before: typing.Dict[str, discord.Invite], after: typing.Dict[str, discord.Invite]
+    ) -> typing.List[discord.Invite]:
+        """One entry per use that happened between the two snapshots."""
+        used: typing.List[discord.Invite] = []
+        for code, old in before.items():
+            new = after.get(code)
+            if new is not None:
+                used.extend([old] * max(0, (new.uses or 0) - (old.uses or 0)))
+            elif self._one_use_left(old):
+                # deleted by the join itself, and the delete event has not arrived yet
+                used.append(old)
+        return used
+
+    def _take_exhausted(self, guildId: int) -> typing.Optional[discord.Invite]:
+        entries = self._exhausted.get(guildId)
+        now = self._clock()
+        while entries:
+            deleted_at, invite = entries.pop(0)
+            if now - deleted_at <= self.exhausted_seconds:
+                return invite
+        return None
+
+    def _lock(self, guildId: int) -> asyncio.Lock:
+        lock = self._locks.get(guildId)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[guildId] = lock
+        return lock
+
+    @staticmethod
+    def _one_use_left(invite: discord.Invite) -> bool:
+        return bool(invite.max_uses) and (invite.uses or 0) == invite.max_uses - 1  # type: ignore[operator]
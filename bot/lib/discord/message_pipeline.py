@@ -0,0 +1,182 @@
+import asyncio
+import os
+import re
+import time
+import traceback
+import typing
+from dataclasses import dataclass
+
+import discord
+from bot.lib import logger, settings, utils
+from bot.lib.enums import loglevel
+
+MessageHandler = typing.Callable[["MessageContext"], typing.Awaitable[None]]
+
+
+class MessageContext:
+    """Everything the message handlers used to work out on their own, computed once per message.
+
+    ``get_settings`` memoizes settings sections for the message, falling back to the global guild ``0``
+    the same way ``TacobotCog.get_settings`` does, so every handler sees the same snapshot.
+    """
+
+    def __init__(self, message: discord.Message, prefixes: typing.List[str], settings: settings.Settings) -> None:
+        self.message = message
+        self.guild_id: int = message.guild.id if message.guild else 0
+        self.channel_id: int = message.channel.id
+        self.is_bot: bool = bool(message.author.bot)
+        self.prefixes = prefixes
+        self.is_command: bool = any(message.content.startswith(prefix) for prefix in prefixes)
+        self._settings = settings
+        self._sections: typing.Dict[str, dict] = {}
+
+    def get_settings(self, section: str) -> dict:
+        cached = self._sections.get(section)
+        if cached is not None:
+            return cached
+        section_settings = self._settings.get_settings(self.guild_id, section)
+        if not section_settings:
+            section_settings = self._settings.get_settings(0, section)
+        if not section_settings:
+            raise Exception(f"No '{section}' settings found for guild {self.guild_id} or globally.")
+        self._sections[section] = section_settings
+        return section_settings
+
+
+@dataclass(frozen=True)
+class MessageInterest:
+    """Which messages a handler wants. Every condition that is set must match.
+
+    ``patterns`` match when any of them is found in the message content; ``predicate`` runs last and
+    is the place for settings-driven checks such as configured channels.
+    """
+
+    guild_only: bool = True
+    bots: bool = False
+    commands: bool = True
+    message_types: typing.Optional[typing.FrozenSet[discord.MessageType]] = None
+    patterns: typing.Tuple[re.Pattern, ...] = ()
+    predicate: typing.Optional[typing.Callable[[MessageContext], bool]] = None
+
+    def matches(self, ctx: MessageContext) -> bool:
+        message = ctx.message
+        if self.guild_only and message.guild is None:
+            return False
+        if not self.bots and ctx.is_bot:
+            return False
+        if not self.commands and ctx.is_command:
+            return False
+        if self.message_types is not None and message.type not in self.message_types:
+            return False
+        if self.patterns and not any(pattern.search(message.content) for pattern in self.patterns):
+            return False
+        if self.predicate is not None and not self.predicate(ctx):
+            return False
+        return True
+
+
+class _Registration:
+    __slots__ = ("name", "handler", "interest", "calls", "skipped", "errors", "total_seconds", "max_seconds")
+
+    def __init__(self, name: str, handler: MessageHandler, interest: MessageInterest) -> None:
+        self.name = name
+        self.handler = handler
+        self.interest = interest
+        self.calls = 0
+        self.skipped = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class MessagePipeline:
+    """The bot's single ``on_message`` listener.
+
+    Cogs register a handler with a ``MessageInterest`` (see ``TacobotCog.message_interest``). For each
+    message the pipeline builds one ``MessageContext``, then runs the handlers whose interest matches
+    concurrently, timing each one. A failing handler is logged and does not affect the others.
+    """
+
+    def __init__(self, bot: typing.Any) -> None:
+        self._module = os.path.basename(__file__)[:-3]
+        self._class = self.__class__.__name__
+        self.bot = bot
+        self.settings = settings.Settings()
+        self.log = logger.Log(minimumLogLevel=loglevel.LogLevel[self.settings.log_level.upper()])
+        self.slow_handler_seconds = (
+            float(utils.dict_get(os.environ, "MESSAGE_HANDLER_SLOW_MS", default_value="1000")) / 1000
+        )
+        self._handlers: typing.Dict[str, _Registration] = {}
+
+    def register(self, name: str, handler: MessageHandler, interest: MessageInterest) -> None:
+        self._handlers[name] = _Registration(name, handler, interest)
+
+    def unregister(self, name: str) -> None:
+        self._handlers.pop(name, None)
+
+    async def build_context(self, message: discord.Message) -> MessageContext:
+        prefixes = await self.bot.get_prefix(message)
+        if isinstance(prefixes, str):
+            prefixes = [prefixes]
+        return MessageContext(message, list(prefixes), self.settings)
+
+    async def dispatch(self, message: discord.Message) -> None:
+        if not self._handlers:
+            return
+        ctx = await self.build_context(message)
+        runs = []
+        for registration in list(self._handlers.values()):
+            if self._wants(registration, ctx):
+                runs.append(self._run(registration, ctx))
+            else:
+                registration.skipped += 1
+        if runs:
+            await asyncio.gather(*runs)
+
+    def _wants(self, registration: _Registration, ctx: MessageContext) -> bool:
+        _method = utils.get_method_name()
+        try:
+            return registration.interest.matches(ctx)
+        except Exception as e:
+            # usually a missing settings section for the guild
+            self.log.debug(ctx.guild_id, f"{self._module}.{self._class}.{_method}", f"{registration.name}: {e}")
+            return False
+
+    async def _run(self, registration: _Registration, ctx: MessageContext) -> None:
+        _method = utils.get_method_name()
+        start = time.perf_counter()
+        try:
+            await registration.handler(ctx)
+        except Exception as e:
+            registration.errors += 1
+            self.log.error(
+                ctx.guild_id,
+                f"{self._module}.{self._class}.{_method}",
+                f"{registration.name} failed: {e}",
+                traceback.format_exc(),
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            registration.calls += 1
+            registration.total_seconds += elapsed
+            registration.max_seconds = max(registration.max_seconds, elapsed)
+            if elapsed >= self.slow_handler_seconds:
+                self.log.warn(
+                    ctx.guild_id,
+                    f"{self._module}.{self._class}.{_method}",
+                    f"{registration.name} took {elapsed * 1000:.0f}ms for message {ctx.message.id}",
+                )
+
+    def stats(self) -> typing.Dict[str, dict]:
+        """Per-handler counters: ``calls``, ``skipped`` (interest did not match), ``errors`` and timings."""
+        return {
+            registration.name: {
+                "calls": registration.calls,
+                "skipped": registration.skipped,
+                "errors": registration.errors,
+                "total_ms": registration.total_seconds * 1000,
+                "max_ms": registration.max_seconds * 1000,
+                "avg_ms": (registration.total_seconds / registration.calls * 1000) if registration.calls else 0.0,
+            }
+            for registration in self._handlers.values()
+        }
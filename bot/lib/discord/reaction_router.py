@@ -0,0 +1,317 @@
+import asyncio
+import os
+import time
+import traceback
+import typing
+from dataclasses import dataclass
+
+import discord
+from bot.lib import discordhelper, logger, permissions, settings, utils
+from bot.lib.enums import loglevel
+from bot.lib.mongodb.settings import SettingsDatabase
+
+REACTION_ADD = "REACTION_ADD"
+REACTION_REMOVE = "REACTION_REMOVE"
+
+ReactionHandler = typing.Callable[["ReactionContext"], typing.Awaitable[None]]
+T = typing.TypeVar("T")
+
+
+class ReactionContext:
+    """One raw reaction event, with the lookups every interested handler would otherwise repeat.
+
+    ``get_user``, ``get_member``, ``get_channel``, ``get_message`` and ``is_admin`` each run at most once
+    per event; handlers running concurrently await the same lookup. Lookups go through ``DiscordHelper``, so
+    they return ``None`` for something that no longer exists (a deleted message, a member who left).
+    """
+
+    def __init__(
+        self,
+        payload: discord.RawReactionActionEvent,
+        settings: settings.Settings,
+        discordHelper: discordhelper.DiscordHelper,
+        perms: permissions.Permissions,
+    ) -> None:
+        self.payload = payload
+        self.event: str = payload.event_type
+        self.guild_id: int = payload.guild_id or 0
+        self.channel_id: int = payload.channel_id
+        self.message_id: int = payload.message_id
+        self.user_id: int = payload.user_id
+        # str() is the full custom emoji (<:name:id>); name is what some settings store instead
+        self.emoji: str = str(payload.emoji)
+        self.emoji_name: typing.Optional[str] = payload.emoji.name
+        self._settings = settings
+        self._discord_helper = discordHelper
+        self._permissions = perms
+        self._sections: typing.Dict[str, dict] = {}
+        self._lookups: typing.Dict[str, asyncio.Future] = {}
+
+    def emoji_in(self, emojis: typing.Iterable[str]) -> bool:
+        emojis = list(emojis)
+        return self.emoji in emojis or self.emoji_name in emojis
+
+    def get_settings(self, section: str) -> dict:
+        cached = self._sections.get(section)
+        if cached is not None:
+            return cached
+        section_settings = self._settings.get_settings(self.guild_id, section)
+        if not section_settings:
+            section_settings = self._settings.get_settings(0, section)
+        if not section_settings:
+            raise Exception(f"No '{section}' settings found for guild {self.guild_id} or globally.")
+        self._sections[section] = section_settings
+        return section_settings
+
+    async def get_user(self) -> typing.Optional[discord.User]:
+        return await self._once("user", lambda: self._discord_helper.get_or_fetch_user(self.user_id))
+
+    async def get_member(self) -> typing.Optional[discord.Member]:
+        if self.payload.member is not None:
+            return self.payload.member
+        return await self._once(
+            "member", lambda: self._discord_helper.get_or_fetch_member(self.guild_id, self.user_id)
+        )
+
+    async def get_channel(self) -> typing.Optional[typing.Union[discord.TextChannel, discord.Thread]]:
+        return await self._once("channel", lambda: self._discord_helper.get_or_fetch_channel(self.channel_id))
+
+    async def get_message(self, fresh: bool = False) -> typing.Optional[discord.Message]:
+        """The reacted message.
+
+        Pass ``fresh`` to read ``message.reactions``: the cached copy is not invalidated by reactions, so its
+        counts can predate this one. Handlers sharing the context share one fresh fetch.
+        """
+        if fresh:
+            return await self._once(
+                "fresh_message",
+                lambda: self._discord_helper.get_or_fetch_message(self.channel_id, self.message_id, fresh=True),
+            )
+        return await self._once(
+            "message", lambda: self._discord_helper.get_or_fetch_message(self.channel_id, self.message_id)
+        )
+
+    async def is_admin(self) -> bool:
+        async def check() -> bool:
+            member = await self.get_member()
+            if member is None:
+                return False
+            return await self._permissions.is_admin(member)
+
+        return await self._once("is_admin", check)
+
+    async def _once(self, key: str, factory: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        lookup = self._lookups.get(key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(factory())
+            self._lookups[key] = lookup
+        return await lookup
+
+
+@dataclass(frozen=True)
+class ReactionInterest:
+    """Which reactions a handler wants, derived from its settings ``section`` for each guild.
+
+    ``emojis`` returns the emoji the handler reacts to; ``channels`` returns channel ids where the handler
+    wants every reaction (for cogs that also act on unknown emoji). Both are called with the guild's
+    section (falling back to the global one) when the router builds that guild's index; a guild without
+    the section gets nothing. With no ``section`` they are called with an empty dict, for fixed emoji.
+    """
+
+    section: typing.Optional[str] = None
+    emojis: typing.Callable[[dict], typing.Iterable[str]] = lambda section: ()
+    channels: typing.Optional[typing.Callable[[dict], typing.Iterable[typing.Union[int, str]]]] = None
+    events: typing.FrozenSet[str] = frozenset({REACTION_ADD})
+
+
+class _Registration:
+    __slots__ = ("name", "handler", "interest", "calls", "errors", "total_seconds", "max_seconds")
+
+    def __init__(self, name: str, handler: ReactionHandler, interest: ReactionInterest) -> None:
+        self.name = name
+        self.handler = handler
+        self.interest = interest
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class _GuildIndex:
+    __slots__ = ("emojis", "channels", "generation", "version", "checked_at")
+
+    def __init__(
+        self,
+        emojis: typing.Dict[str, typing.Set[str]],
+        channels: typing.Dict[str, typing.Set[str]],
+        generation: int,
+        version: int,
+        checked_at: float,
+    ) -> None:
+        self.emojis = emojis
+        self.channels = channels
+        self.generation = generation
+        self.version = version
+        self.checked_at = checked_at
+
+
+class ReactionRouter:
+    """The bot's single ``on_raw_reaction_add`` / ``on_raw_reaction_remove`` listener.
+
+    Cogs register a handler with a ``ReactionInterest`` (see ``TacobotCog.reaction_interest``). The router
+    keeps a per-guild ``emoji -> handlers`` (and ``channel -> handlers``) index built from each handler's
+    settings section, so a reaction nobody cares about costs one lookup and no REST calls. Interested
+    handlers share one ``ReactionContext`` and run concurrently; a failing handler is logged and does not
+    affect the others.
+
+    A guild's index is rebuilt when a handler registers or unregisters, when the settings cache
+    ``generation`` moves, and every ``refresh_seconds`` (defaults to the settings cache TTL).
+    """
+
+    def __init__(
+        self,
+        bot: typing.Any,
+        refresh_seconds: typing.Optional[float] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._module = os.path.basename(__file__)[:-3]
+        self._class = self.__class__.__name__
+        self.bot = bot
+        self.settings = settings.Settings()
+        self.log = logger.Log(minimumLogLevel=loglevel.LogLevel[self.settings.log_level.upper()])
+        self.discord_helper = discordhelper.DiscordHelper(bot)
+        self.permissions = permissions.Permissions(bot)
+        self.refresh_seconds = SettingsDatabase.cache.ttl if refresh_seconds is None else refresh_seconds
+        self._clock = clock
+        self._handlers: typing.Dict[str, _Registration] = {}
+        self._guilds: typing.Dict[int, _GuildIndex] = {}
+        # bumped on register/unregister so every guild index is rebuilt on its next lookup
+        self._version = 0
+        self.dropped = 0
+        self.builds = 0
+
+    def register(self, name: str, handler: ReactionHandler, interest: ReactionInterest) -> None:
+        self._handlers[name] = _Registration(name, handler, interest)
+        self._version += 1
+
+    def unregister(self, name: str) -> None:
+        if self._handlers.pop(name, None) is not None:
+            self._version += 1
+
+    async def dispatch(self, payload: discord.RawReactionActionEvent) -> None:
+        if not self._handlers or payload.guild_id is None:
+            return
+        registrations = self.interested(
+            payload.guild_id, payload.channel_id, str(payload.emoji), payload.emoji.name, payload.event_type
+        )
+        if not registrations:
+            self.dropped += 1
+            return
+        ctx = ReactionContext(payload, self.settings, self.discord_helper, self.permissions)
+        await asyncio.gather(*(self._run(registration, ctx) for registration in registrations))
+
+    def interested(
+        self,
+        guildId: int,
+        channelId: int,
+        emoji: str,
+        emojiName: typing.Optional[str],
+        event: str = REACTION_ADD,
+    ) -> typing.List[_Registration]:
+        index = self._guilds.get(guildId)
+        if index is None or self._is_stale(index):
+            index = self._build(guildId)
+        names = set(index.emojis.get(emoji, ()))
+        if emojiName and emojiName != emoji:
+            names.update(index.emojis.get(emojiName, ()))
+        names.update(index.channels.get(str(channelId), ()))
+        registrations = []
+        for name in names:
+            registration = self._handlers.get(name)
+            if registration is not None and event in registration.interest.events:
+                registrations.append(registration)
+        return registrations
+
+    def invalidate(self, guildId: typing.Optional[int] = None) -> None:
+        if guildId is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guildId, None)
+
+    def stats(self) -> dict:
+        return {
+            "guilds": len(self._guilds),
+            "builds": self.builds,
+            "dropped": self.dropped,
+            "handlers": {
+                registration.name: {
+                    "calls": registration.calls,
+                    "errors": registration.errors,
+                    "total_ms": registration.total_seconds * 1000,
+                    "max_ms": registration.max_seconds * 1000,
+                }
+                for registration in self._handlers.values()
+            },
+        }
+
+    def _is_stale(self, index: _GuildIndex) -> bool:
+        if index.version != self._version or index.generation != SettingsDatabase.cache.generation:
+            return True
+        return self._clock() - index.checked_at >= self.refresh_seconds
+
+    def _build(self, guildId: int) -> _GuildIndex:
+        _method = utils.get_method_name()
+        # read the generation first: a write that lands while we read makes the next lookup rebuild
+        generation = SettingsDatabase.cache.generation
+        self.builds += 1
+        emojis: typing.Dict[str, typing.Set[str]] = {}
+        channels: typing.Dict[str, typing.Set[str]] = {}
+        sections: typing.Dict[str, typing.Optional[dict]] = {}
+        for registration in list(self._handlers.values()):
+            interest = registration.interest
+            try:
+                if interest.section is None:
+                    section_settings: typing.Optional[dict] = {}
+                else:
+                    if interest.section not in sections:
+                        guild_settings = self.settings.get_settings(guildId, interest.section)
+                        if not guild_settings:
+                            guild_settings = self.settings.get_settings(0, interest.section)
+                        sections[interest.section] = guild_settings
+                    section_settings = sections[interest.section]
+                    if not section_settings:
+                        continue
+                for emoji in interest.emojis(section_settings) or ():
+                    emojis.setdefault(str(emoji), set()).add(registration.name)
+                if interest.channels is not None:
+                    for channel_id in interest.channels(section_settings) or ():
+                        channels.setdefault(str(channel_id), set()).add(registration.name)
+            except Exception as e:
+                self.log.error(
+                    guildId,
+                    f"{self._module}.{self._class}.{_method}",
+                    f"Skipping reactions for {registration.name}: {e}",
+                    traceback.format_exc(),
+                )
+        index = _GuildIndex(emojis, channels, generation, self._version, self._clock())
+        self._guilds[guildId] = index
+        return index
+
+    async def _run(self, registration: _Registration, ctx: ReactionContext) -> None:
+        _method = utils.get_method_name()
+        start = time.perf_counter()
+        try:
+            await registration.handler(ctx)
+        except Exception as e:
+            registration.errors += 1
+            self.log.error(
+                ctx.guild_id,
+                f"{self._module}.{self._class}.{_method}",
+                f"{registration.name} failed: {e}",
+                traceback.format_exc(),
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            registration.calls += 1
+            registration.total_seconds += elapsed
+            registration.max_seconds = max(registration.max_seconds, elapsed)
@@ -1,6 +1,5 @@
 import asyncio
 import collections
-import inspect
 import os
 import traceback
 import typing
@@ -8,17 +7,26 @@ import typing
 import discord
 from bot.lib import logger, settings, utils
 from bot.lib.ChannelSelect import ChannelSelectView
+from bot.lib.discord.fetch_cache import FetchCache
 from bot.lib.enums import loglevel, tacotypes
 from bot.lib.messaging import Messaging
 from bot.lib.models.textwithattachments import TextWithAttachments
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tacos import TacosDatabase
 from bot.lib.RoleSelectView import RoleSelect, RoleSelectView
 from bot.lib.YesOrNoView import YesOrNoView
 
 
 class DiscordHelper:
+    # shared by every instance so a fetch made for one cog serves the others; see FetchCache.listen for invalidation
+    cache = FetchCache(
+        maxsize=int(utils.dict_get(os.environ, "DISCORD_FETCH_CACHE_SIZE", default_value="2048")),
+        ttl=float(utils.dict_get(os.environ, "DISCORD_FETCH_CACHE_TTL", default_value="300")),
+        ttls={"message": float(utils.dict_get(os.environ, "DISCORD_FETCH_CACHE_MESSAGE_TTL", default_value="30"))},
+    )
+
     def __init__(self, bot) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -59,7 +67,7 @@ class DiscordHelper:
         color: typing.Optional[int] = None,
         delete_original: bool = False,
     ) -> typing.Union[discord.Message, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if not message:
             self.log.debug(0, f"{self._module}.{self._class}.{_method}", "No message to move")
             return
@@ -190,7 +198,7 @@ class DiscordHelper:
         give_type: tacotypes.TacoTypes = tacotypes.TacoTypes.CUSTOM,
         taco_amount: int = 1,
     ):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # get taco settings
             taco_settings = self._get_tacos_settings(guildId=guildId)
@@ -208,7 +216,7 @@ class DiscordHelper:
 
             reason_msg = reason if reason else self.settings.get_string(guildId, "no_reason")
 
-            total_taco_count = self.tacos_db.add_tacos(guildId, toUser.id, taco_count)
+            total_taco_count = await executor.run(self.tacos_db.add_tacos, guildId, toUser.id, taco_count)
             await self.tacos_log(
                 guild_id=guildId,
                 toMember=toUser,
@@ -219,7 +227,8 @@ class DiscordHelper:
                 type=give_type,
             )
 
-            self.tacos_db.track_tacos_log(
+            await executor.run(
+                self.tacos_db.track_tacos_log,
                 guildId=guildId,
                 toUserId=toUser.id,
                 fromUserId=fromUser.id,
@@ -238,7 +247,7 @@ class DiscordHelper:
         fromMember: typing.Union[discord.User, discord.Member],
         reason: str,
     ):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             taco_settings = self._get_tacos_settings(guildId=guild_id)
             taco_log_channel_id = taco_settings["taco_log_channel_id"]
@@ -255,7 +264,8 @@ class DiscordHelper:
                         guild_id, "tacos_purged_log", touser=toMember.name, fromuser=fromMember.name, reason=reason
                     )
                 )
-            self.tacos_db.track_tacos_log(
+            await executor.run(
+                self.tacos_db.track_tacos_log,
                 guildId=guild_id,
                 toUserId=toMember.id,
                 fromUserId=fromMember.id,
@@ -276,7 +286,7 @@ class DiscordHelper:
         reason: str,
         type: tacotypes.TacoTypes = tacotypes.TacoTypes.CUSTOM,
     ):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             taco_settings = self._get_tacos_settings(guildId=guild_id)
             taco_log_channel_id = taco_settings["taco_log_channel_id"]
@@ -317,12 +327,12 @@ class DiscordHelper:
             self.log.error(guild_id, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
 
     async def get_or_fetch_user(self, userId: int) -> typing.Union[discord.User, None]:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         try:
             if userId:
                 user = self.bot.get_user(userId)
                 if not user:
-                    user = await self.bot.fetch_user(userId)
+                    user = await self.cache.get_or_fetch(("user", userId), lambda: self.bot.fetch_user(userId))
                 return user
             return None
         except discord.errors.NotFound as nf:
@@ -333,20 +343,22 @@ class DiscordHelper:
             return None
 
     async def get_or_fetch_member(self, guildId: int, userId: int) -> typing.Union[discord.Member, None]:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         try:
             if not guildId:
                 return None
             guild = self.bot.get_guild(guildId)
             if not guild:
-                guild = await self.bot.fetch_guild(guildId)
+                guild = await self.cache.get_or_fetch(("guild", guildId), lambda: self.bot.fetch_guild(guildId))
             if not guild:
                 return None
 
             if userId:
                 user = guild.get_member(userId)
                 if not user:
-                    user = await guild.fetch_member(userId)
+                    user = await self.cache.get_or_fetch(
+                        ("member", guild.id, userId), lambda: guild.fetch_member(userId)
+                    )
                 return user
             return None
         except discord.errors.NotFound:
@@ -356,14 +368,15 @@ class DiscordHelper:
             return None
 
     async def get_or_fetch_role(self, guild: discord.Guild, roleId: int) -> typing.Union[discord.Role, None]:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         try:
             if not guild:
                 return None
             if roleId:
                 role = guild.get_role(roleId)
                 if not role:
-                    roles = [r for r in await guild.fetch_roles() if r.id == roleId]
+                    fetched = await self.cache.get_or_fetch(("roles", guild.id), guild.fetch_roles)
+                    roles = [r for r in fetched or [] if r.id == roleId]
                     if roles and len(roles) > 0:
                         role = roles[0]
                     else:
@@ -377,12 +390,14 @@ class DiscordHelper:
     async def get_or_fetch_channel(
         self, channelId: int
     ) -> typing.Optional[typing.Union[discord.TextChannel, discord.DMChannel, discord.Thread]]:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         try:
             if channelId:
                 chan = self.bot.get_channel(channelId)
                 if not chan:
-                    chan = await self.bot.fetch_channel(channelId)
+                    chan = await self.cache.get_or_fetch(
+                        ("channel", channelId), lambda: self.bot.fetch_channel(channelId)
+                    )
                 return chan
             else:
                 return None
@@ -400,6 +415,35 @@ class DiscordHelper:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
             return None
 
+    async def get_or_fetch_message(
+        self, channelId: int, messageId: int, fresh: bool = False
+    ) -> typing.Optional[discord.Message]:
+        """Return the message, from the fetch cache unless ``fresh`` asks for a new REST fetch.
+
+        Use ``fresh`` when reading state the cache is not invalidated for, such as ``message.reactions``.
+        """
+        _method = utils.get_method_name(1)
+        try:
+            if not channelId or not messageId:
+                return None
+
+            async def fetch() -> typing.Optional[discord.Message]:
+                channel = await self.get_or_fetch_channel(channelId)
+                if channel is None or not hasattr(channel, "fetch_message"):
+                    return None
+                return await channel.fetch_message(messageId)  # type: ignore[union-attr]
+
+            key = ("message", channelId, messageId)
+            if fresh:
+                return await self.cache.refresh(key, fetch)
+            return await self.cache.get_or_fetch(key, fetch)
+        except discord.errors.NotFound as nf:
+            self.log.warn(0, f"{self._module}.{self._class}.{_method}", str(nf), traceback.format_exc())
+            return None
+        except Exception as ex:
+            self.log.error(0, f"{self._module}.{self._class}.{_method}", str(ex), traceback.format_exc())
+            return None
+
     def get_by_name_or_id(self, iterable, nameOrId: typing.Union[int, str]):
         if isinstance(nameOrId, str):
             return discord.utils.get(iterable, name=str(nameOrId))
@@ -459,7 +503,7 @@ class DiscordHelper:
     async def ask_channel_by_name_or_id(
         self, ctx, title: str = "TacoBot", description: str = "Enter the name of the channel", timeout: int = 60
     ):
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         try:
             guild = ctx.guild
             if not guild:
@@ -506,7 +550,7 @@ class DiscordHelper:
         timeout: int = 60,
         callback=None,
     ):
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         guild_id = ctx.guild.id
         channels = [c for c in ctx.guild.channels if c.type == discord.ChannelType.text]
         channels.sort(key=lambda c: c.position)
@@ -598,7 +642,7 @@ class DiscordHelper:
         max_value: int = 100,
         timeout: int = 60,
     ) -> int:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
 
         def check_user(m):
             same = m.author.id == ctx.author.id
@@ -781,7 +825,7 @@ class DiscordHelper:
         select_callback: typing.Callable = None,
         # timeout_callback: typing.Callable = None,
     ) -> typing.Union[discord.Role, None]:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         guild_id = ctx.guild.id
 
         async def role_select_callback(select: RoleSelect, interaction: discord.Interaction):
@@ -853,7 +897,7 @@ class DiscordHelper:
     async def add_remove_roles(
         self, user: discord.Member, check_list: list, add_list: list, remove_list: list, allow_everyone: bool = False
     ) -> None:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         if user is None or user.guild is None:
             self.log.warn(0, f"{self._module}.{self._class}.{_method}", "User or guild is None")
             return
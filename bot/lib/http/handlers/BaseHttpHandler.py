@@ -45,7 +45,6 @@ responses (``{"error": "..."}``). The base class itself only logs and
 returns simple booleans where appropriate.
 """
 
-import inspect
 import json
 import os
 import random
@@ -53,7 +52,7 @@ import string
 import traceback
 import typing
 
-from bot.lib import discordhelper, logger, settings
+from bot.lib import discordhelper, logger, settings, utils
 from bot.lib.enums import loglevel
 from bot.lib.messaging import Messaging
 from bot.lib.mongodb.tracking import TrackingDatabase
@@ -170,7 +169,7 @@ class BaseHttpHandler:
             ``True`` if the presented token matches the configured
             webhook token; ``False`` otherwise (including on exception).
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             settings_obj = self.settings.get_settings(0, self.WEBHOOK_SETTINGS_SECTION)
             if not settings_obj:
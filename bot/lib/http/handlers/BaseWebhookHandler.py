@@ -40,7 +40,6 @@ configuration. Derived handlers are expected to translate those into
 consistent JSON HTTP error responses (``{"error": "..."}``).
 """
 
-import inspect
 import json
 import os
 import random
@@ -48,7 +47,7 @@ import string
 import traceback
 import typing
 
-from bot.lib import discordhelper, logger, settings
+from bot.lib import discordhelper, logger, settings, utils
 from bot.lib.enums import loglevel
 from bot.lib.messaging import Messaging
 from bot.lib.mongodb.tracking import TrackingDatabase
@@ -164,7 +163,7 @@ class BaseWebhookHandler:
         bool
             ``True`` if validation succeeds; otherwise ``False``.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             settings_obj = self.settings.get_settings(0, self.WEBHOOK_SETTINGS_SECTION)
             if not settings_obj:
@@ -1,10 +1,9 @@
-import inspect
 import json
 import os
 import typing
 from http import HTTPMethod
 
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
 from bot.lib.models import openapi
@@ -13,6 +12,7 @@ from bot.lib.models.DiscordChannel import DiscordChannel
 from bot.lib.models.DiscordGuildChannels import DiscordGuildChannels
 from bot.lib.models.ErrorStatusCodePayload import ErrorStatusCodePayload
 from bot.lib.models.GuildItemIdBatchRequestBody import GuildItemIdBatchRequestBody
+from bot.lib.mongodb import executor
 from bot.tacobot import TacoBot
 from httpserver.EndpointDecorators import uri_variable_mapping
 from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
@@ -49,7 +49,7 @@ class GuildChannelsApiHandler(BaseHttpHandler):
         name="guild_id", description="Discord guild (server) ID", methods=[HTTPMethod.GET], schema=str
     )
     @openapi.security("X-AUTH-TOKEN", "X-TACOBOT-TOKEN")
-    def get_guild_categories(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_categories(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """List all channel categories in a guild including their child channels.
 
         Path: /api/v1/guild/{guild_id}/categories
@@ -59,12 +59,12 @@ class GuildChannelsApiHandler(BaseHttpHandler):
                 400 - missing/invalid guild_id
                 404 - guild not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
 
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 self._create_error_response(401, "Unauthorized", headers=headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
@@ -149,7 +149,7 @@ class GuildChannelsApiHandler(BaseHttpHandler):
         description="Internal server error",
     )
     @openapi.security("X-AUTH-TOKEN", "X-TACOBOT-TOKEN")
-    def get_guild_category(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_category(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """Get a single category (and its channels) by ID.
 
         Path: /api/v1/guild/{guild_id}/category/{category_id}
@@ -159,7 +159,7 @@ class GuildChannelsApiHandler(BaseHttpHandler):
                 400 - missing/invalid guild_id
                 404 - guild or category not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
@@ -251,7 +251,7 @@ class GuildChannelsApiHandler(BaseHttpHandler):
         schema=ErrorStatusCodePayload,
         description="Internal server error",
     )
-    def get_guild_channels(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_channels(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """List top-level (non-category) channels plus include category definitions.
 
         Path: /api/v1/guild/{guild_id}/channels
@@ -262,7 +262,7 @@ class GuildChannelsApiHandler(BaseHttpHandler):
                 400 - missing/invalid guild_id
                 404 - guild not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
@@ -382,7 +382,7 @@ class GuildChannelsApiHandler(BaseHttpHandler):
         schema=ErrorStatusCodePayload,
         description="Internal server error",
     )
-    def get_guild_channels_batch_by_ids(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_channels_batch_by_ids(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """Batch fetch specific channels by ID.
 
         Path: /api/v1/guild/{guild_id}/channels/batch/ids
@@ -396,7 +396,7 @@ class GuildChannelsApiHandler(BaseHttpHandler):
                 400 - missing/invalid guild_id or malformed body
                 404 - guild not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
@@ -1,12 +1,13 @@
-import inspect
 import json
 import os
 import typing
 from http import HTTPMethod
 
+from bot.lib import utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
 from bot.lib.models.DiscordEmoji import DiscordEmoji
+from bot.lib.mongodb import executor
 from bot.tacobot import TacoBot
 from httpserver.EndpointDecorators import uri_variable_mapping
 from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
@@ -65,7 +66,7 @@ class GuildEmojisApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.GET],
     )
     @openapi.managed()
-    def get_guild_emojis(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_emojis(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """List all emojis in the specified guild.
 
         Returns a JSON array of guild emoji objects (custom emojis only).
@@ -77,11 +78,11 @@ class GuildEmojisApiHandler(BaseHttpHandler):
         Raises:
                 HttpResponseException: For validation, lookup, or internal errors.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers=headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
@@ -144,7 +145,7 @@ class GuildEmojisApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.GET],
     )
     @openapi.managed()
-    def get_guild_emoji(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_emoji(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """Get a single emoji by numeric ID.
 
         Path: /api/v1/guild/{guild_id}/emoji/id/{emoji_id}
@@ -154,12 +155,12 @@ class GuildEmojisApiHandler(BaseHttpHandler):
             400 - missing/invalid guild_id or emoji_id
             404 - guild or emoji not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
 
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers=headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
@@ -230,7 +231,7 @@ class GuildEmojisApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.GET],
     )
     @openapi.managed()
-    def get_guild_emoji_by_name(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_emoji_by_name(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """Get a single emoji by name.
 
         Path: /api/v1/guild/{guild_id}/emoji/name/{emoji_name}
@@ -240,12 +241,12 @@ class GuildEmojisApiHandler(BaseHttpHandler):
             400 - missing/invalid guild_id or emoji_name
             404 - guild or emoji not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
 
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers=headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
@@ -323,7 +324,7 @@ class GuildEmojisApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.POST],
     )
     @openapi.managed()
-    def get_guild_emojis_batch_by_ids(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_emojis_batch_by_ids(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """Batch fetch emojis by IDs.
         Path: /api/v1/guild/{guild_id}/emojis/ids/batch
         Method: POST
@@ -336,12 +337,12 @@ class GuildEmojisApiHandler(BaseHttpHandler):
             400 - missing/invalid guild_id or invalid body JSON
             404 - guild not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
 
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers=headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
@@ -436,7 +437,7 @@ class GuildEmojisApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.POST],
     )
     @openapi.managed()
-    def get_guild_emojis_batch_by_names(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_emojis_batch_by_names(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """Batch fetch emojis by names.
 
         Path: /api/v1/guild/{guild_id}/emojis/names/batch
@@ -450,12 +451,12 @@ class GuildEmojisApiHandler(BaseHttpHandler):
             400 - missing/invalid guild_id or invalid body JSON
             404 - guild not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
 
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers=headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
@@ -1,12 +1,13 @@
-import inspect
 import json
 import os
 import typing
 from http import HTTPMethod
 
+from bot.lib import utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
 from bot.lib.models.DiscordGuild import DiscordGuild
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.settings import Settings
 from bot.tacobot import TacoBot
@@ -183,7 +184,7 @@ class GuildLookupApiHandler(BaseHttpHandler):
             404 - guild not found
             500 - internal server error
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
 
@@ -360,7 +361,7 @@ class GuildLookupApiHandler(BaseHttpHandler):
             400 - invalid JSON body
             500 - internal server error
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -452,7 +453,7 @@ class GuildLookupApiHandler(BaseHttpHandler):
     )
     @openapi.tags("guilds")
     @openapi.managed()
-    def get_guilds(self, request: HttpRequest) -> HttpResponse:
+    async def get_guilds(self, request: HttpRequest) -> HttpResponse:
         """List all guilds the bot is currently a member of.
 
         Path: /api/v1/guilds
@@ -462,12 +463,12 @@ class GuildLookupApiHandler(BaseHttpHandler):
             500 - internal server error
         Notes: This reflects the real-time in-memory guild cache of the connected bot session.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
 
         try:
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized: Missing or invalid API token.", headers)
 
             guilds = [
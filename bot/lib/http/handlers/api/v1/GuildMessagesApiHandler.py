@@ -1,10 +1,10 @@
-import inspect
 import json
 import os
 import typing
 from http import HTTPMethod
 
 import discord
+from bot.lib import utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
 from bot.lib.models.DiscordMessage import DiscordMessage
@@ -108,7 +108,7 @@ class GuildMessagesApiHandler(BaseHttpHandler):
             404 - guild or channel not found
         Notes: Individual message serialization failures are skipped silently.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -228,7 +228,7 @@ class GuildMessagesApiHandler(BaseHttpHandler):
             404 - guild, channel or message not found
         Notes: Forbidden access is surfaced as not accessible error.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -344,7 +344,7 @@ class GuildMessagesApiHandler(BaseHttpHandler):
             404 - guild or channel not found
         Notes: Missing / not found / un-fetchable messages are skipped.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -538,7 +538,7 @@ class GuildMessagesApiHandler(BaseHttpHandler):
             - Each message's reactions list is sorted by descending count then emoji key.
             - Reaction counts are per message (no cross-message aggregation).
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
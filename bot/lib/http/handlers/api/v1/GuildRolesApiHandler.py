@@ -1,14 +1,15 @@
-import inspect
 import json
 import os
 import traceback
 import typing
 from http import HTTPMethod
 
+from bot.lib import utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
 from bot.lib.models.DiscordRole import DiscordRole
 from bot.lib.models.DiscordUser import DiscordUser
+from bot.lib.mongodb import executor
 from bot.tacobot import TacoBot
 from httpserver.EndpointDecorators import uri_variable_mapping
 from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
@@ -69,7 +70,7 @@ class GuildRolesApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.GET],
     )
     @openapi.managed()
-    def get_guild_roles(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_roles(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """List all roles in a guild.
 
         Path: /api/v1/guild/{guild_id}/roles
@@ -79,12 +80,12 @@ class GuildRolesApiHandler(BaseHttpHandler):
             400 - missing/invalid guild_id
             404 - guild not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
 
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers)
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
             if guild_id is None:
@@ -157,7 +158,7 @@ class GuildRolesApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.POST],
     )
     @openapi.managed()
-    def get_guild_roles_batch_by_ids(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_roles_batch_by_ids(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """Batch fetch roles by IDs.
 
         Path: /api/v1/guild/{guild_id}/roles/batch/ids
@@ -171,12 +172,12 @@ class GuildRolesApiHandler(BaseHttpHandler):
             400 - missing/invalid guild_id
             404 - guild not found
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
 
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
@@ -264,7 +265,7 @@ class GuildRolesApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.POST],
     )
     @openapi.managed()
-    def get_guild_mentionables_batch_by_ids(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_mentionables_batch_by_ids(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """Batch fetch mentionables (roles or users) by IDs.
 
         Path: /api/v1/guild/{guild_id}/mentionables/batch/ids
@@ -279,11 +280,11 @@ class GuildRolesApiHandler(BaseHttpHandler):
             404 - guild not found
         Notes: Duplicate and non-numeric IDs are ignored silently.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
@@ -384,7 +385,7 @@ class GuildRolesApiHandler(BaseHttpHandler):
         methods=[HTTPMethod.GET],
     )
     @openapi.managed()
-    def get_guild_mentionables(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
+    async def get_guild_mentionables(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:
         """List all mentionables (roles and users) in a guild.
 
         Path: /api/v1/guild/{guild_id}/mentionables
@@ -396,12 +397,12 @@ class GuildRolesApiHandler(BaseHttpHandler):
             404 - guild not found
             500 - internal server error
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
 
-            if not self.validate_auth_token(request):
+            if not await executor.run(self.validate_auth_token, request):
                 return self._create_error_response(401, "Unauthorized", headers)
 
             guild_id: typing.Optional[str] = uri_variables.get("guild_id")
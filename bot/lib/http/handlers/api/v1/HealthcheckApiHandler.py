@@ -27,14 +27,15 @@ Design Notes:
         JSON object enumerating subsystem statuses.
 """
 
-import inspect
 import os
 import traceback
 import typing
 from http import HTTPMethod
 
+from bot.lib import utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.minecraft import MinecraftDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.settings import Settings
@@ -88,7 +89,7 @@ class HealthcheckApiHandler(BaseHttpHandler):
         methods=HTTPMethod.GET,
     )
     @openapi.managed()
-    def healthcheck(self, request: HttpRequest) -> HttpResponse:
+    async def healthcheck(self, request: HttpRequest) -> HttpResponse:
         """Return basic service health status.
 
         Paths:
@@ -111,12 +112,12 @@ class HealthcheckApiHandler(BaseHttpHandler):
         Notes:
             Response bodies for success/failure are plain strings (probe friendly).
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "text/plain")
 
-            whitelist = self.minecraft_db.get_whitelist(self.settings.primary_guild_id)
+            whitelist = await executor.run(self.minecraft_db.get_whitelist, self.settings.primary_guild_id)
             success = whitelist is not None and len(list(whitelist)) > 0 and self.bot.is_ready()
 
             if success:
@@ -34,13 +34,13 @@ Invalid or out-of-range values produce a 400 error.
 
 from __future__ import annotations
 
-import inspect
 import json
 import os
 import traceback
 import typing
 from http import HTTPMethod
 
+from bot.lib import utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
 from bot.lib.models.JoinWhitelistUser import JoinWhitelistAddedBy, JoinWhitelistUser
@@ -154,7 +154,7 @@ class JoinWhitelistApiHandler(BaseHttpHandler):
         Returns: Array[JoinWhitelistUser]
         Notes: For large lists, prefer the paginated variant.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -234,7 +234,7 @@ class JoinWhitelistApiHandler(BaseHttpHandler):
             skip (int, default 0)
             take (int, default 50, max 200)
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -317,7 +317,7 @@ class JoinWhitelistApiHandler(BaseHttpHandler):
         Body JSON:
             { "user_id": "123", "added_by": "456" }
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -401,7 +401,7 @@ class JoinWhitelistApiHandler(BaseHttpHandler):
             { "added_by": "<id>" }
         If omitted, added_by defaults to target user (self-added scenario).
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -460,7 +460,7 @@ class JoinWhitelistApiHandler(BaseHttpHandler):
     @openapi.managed()
     def delete_join_whitelist_user(self, request: HttpRequest, uri_variables: dict) -> HttpResponse:  # noqa: ARG002
         """Remove a user from the join whitelist."""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -34,7 +34,6 @@ Legacy Aliases:
     `/taco/` for backward compatibility with older clients / dashboards.
 """
 
-import inspect
 import json
 import os
 import traceback
@@ -42,6 +41,7 @@ import typing
 from http import HTTPMethod
 
 import requests
+from bot.lib import utils
 from bot.lib.enums.minecraft_player_events import MinecraftPlayerEvents
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
@@ -51,6 +51,7 @@ from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.settings import Settings
 from httpserver.EndpointDecorators import uri_mapping, uri_variable_mapping
 from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
+from httpserver.response_cache import cache_response
 from httpserver.server import HttpResponseException
 from lib import discordhelper
 from lib.models import ErrorStatusCodePayload
@@ -100,6 +101,7 @@ class MinecraftApiHandler(BaseHttpHandler):
     @uri_mapping(f"/api/{API_VERSION}/minecraft/whitelist.json", method=HTTPMethod.GET)
     @uri_mapping("/tacobot/minecraft/whitelist.json", method=HTTPMethod.GET)
     @uri_mapping("/taco/minecraft/whitelist.json", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("minecraft.users", "settings"))
     @openapi.summary("Get Minecraft whitelist")
     @openapi.description("Return the current Minecraft whitelist.")
     @openapi.response(
@@ -146,6 +148,7 @@ class MinecraftApiHandler(BaseHttpHandler):
     @uri_mapping("/tacobot/minecraft/ops.json", method=HTTPMethod.GET)
     @uri_mapping("/taco/minecraft/ops.json", method=HTTPMethod.GET)
     @uri_mapping(f"/api/{API_VERSION}/minecraft/ops.json", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("minecraft.users", "settings"))
     @openapi.summary("Get Minecraft operator list")
     @openapi.description("Return enabled operator (op) entries.")
     @openapi.response(
@@ -228,7 +231,7 @@ class MinecraftApiHandler(BaseHttpHandler):
         Errors:
             500 - Server unreachable or unexpected error.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
@@ -335,7 +338,7 @@ class MinecraftApiHandler(BaseHttpHandler):
             Actual persistence call is currently commented out; once enabled it
             should upsert the provided settings document.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -376,6 +379,7 @@ class MinecraftApiHandler(BaseHttpHandler):
     @uri_mapping("/tacobot/minecraft/version", method=HTTPMethod.GET)
     @uri_mapping("/taco/minecraft/version", method=HTTPMethod.GET)
     @uri_mapping(f"/api/{API_VERSION}/minecraft/version", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("settings",))
     @openapi.tags("minecraft")
     @openapi.security("X-AUTH-TOKEN", "X-TACOBOT-TOKEN")
     @openapi.summary("Get Minecraft settings")
@@ -411,7 +415,7 @@ class MinecraftApiHandler(BaseHttpHandler):
             401 - invalid authentication token
             500 - internal server error
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
@@ -472,7 +476,7 @@ class MinecraftApiHandler(BaseHttpHandler):
         Errors:
             500 - internal server error
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
@@ -493,6 +497,7 @@ class MinecraftApiHandler(BaseHttpHandler):
     @uri_mapping("/tacobot/minecraft/worlds", method=HTTPMethod.GET)
     @uri_mapping("/taco/minecraft/worlds", method=HTTPMethod.GET)
     @uri_mapping(f"/api/{API_VERSION}/minecraft/worlds", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("minecraft.worlds", "settings"))
     @openapi.tags("minecraft")
     @openapi.summary("List all known Minecraft worlds")
     @openapi.description("List all known worlds for the primary guild.")
@@ -518,7 +523,7 @@ class MinecraftApiHandler(BaseHttpHandler):
         Errors:
             500 - internal server error
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
@@ -539,6 +544,7 @@ class MinecraftApiHandler(BaseHttpHandler):
     @uri_mapping("/tacobot/minecraft/world", method=HTTPMethod.GET)
     @uri_mapping("/taco/minecraft/world", method=HTTPMethod.GET)
     @uri_mapping(f"/api/{API_VERSION}/minecraft/world", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("minecraft.worlds", "settings"))
     @openapi.tags("minecraft")
     @openapi.summary("Get the currently active Minecraft world")
     @openapi.description("Return the currently active world for the primary guild.")
@@ -572,7 +578,7 @@ class MinecraftApiHandler(BaseHttpHandler):
             404 - no active worlds
             500 - internal server error
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             headers = HttpHeaders()
             headers.add("Content-Type", "application/json")
@@ -644,7 +650,7 @@ class MinecraftApiHandler(BaseHttpHandler):
         Side Effects:
             Marks the specified world active via ``set_active_world``.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -713,7 +719,7 @@ class MinecraftApiHandler(BaseHttpHandler):
             Queries Mojang public API at
             https://api.mojang.com/users/profiles/minecraft/{username}
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -804,7 +810,7 @@ class MinecraftApiHandler(BaseHttpHandler):
         Notes:
             This endpoint is a placeholder for future implementation.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -887,7 +893,7 @@ class MinecraftApiHandler(BaseHttpHandler):
         Notes:
             This method is a placeholder for future implementation.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -954,7 +960,7 @@ class MinecraftApiHandler(BaseHttpHandler):
         Notes:
             This method is a placeholder for future implementation.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
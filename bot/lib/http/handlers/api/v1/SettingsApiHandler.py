@@ -19,12 +19,12 @@ Error Model:
     maintain consistency across the API surface.
 """
 
-import inspect
 import json
 import os
 import typing
 from http import HTTPMethod
 
+from bot.lib import utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
 from bot.lib.mongodb.minecraft import MinecraftDatabase
@@ -32,6 +32,7 @@ from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.settings import Settings
 from httpserver.EndpointDecorators import uri_variable_mapping
 from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
+from httpserver.response_cache import cache_response
 from lib import discordhelper
 from lib.models.ErrorStatusCodePayload import ErrorStatusCodePayload
 from lib.models.openapi import openapi
@@ -77,6 +78,7 @@ class SettingsApiHandler(BaseHttpHandler):
         return self.settings.get_settings(guild_id, section)
 
     @uri_variable_mapping("/api/v1/settings/{section}", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("settings",))
     @openapi.summary("Get settings for a guild and section")
     @openapi.description("Retrieves the settings document for the primary guild and the specified section.")
     @openapi.security("X-AUTH-TOKEN", "X-TACOBOT-TOKEN")
@@ -143,6 +145,7 @@ class SettingsApiHandler(BaseHttpHandler):
         )
 
     @uri_variable_mapping("/api/v1/guilds/{guild_id}/settings/{section}", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("settings",))
     @openapi.summary("Get settings for a guild and section")
     @openapi.description("Retrieves the settings document for the guild and the specified section.")
     @openapi.security("X-AUTH-TOKEN", "X-TACOBOT-TOKEN")
@@ -204,7 +207,7 @@ class SettingsApiHandler(BaseHttpHandler):
             404 JSON {"error": "Settings not found"}
             500 JSON {"error": "Internal server error: <details>"}
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
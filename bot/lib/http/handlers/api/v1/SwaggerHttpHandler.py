@@ -11,6 +11,9 @@ Behavior:
             ``.swagger.{API_VERSION}.yaml``.
         * Returns the raw YAML with an appropriate ``Content-Type`` header
             (``text/vnd.yaml``) so browsers / tooling can render or download it.
+        * Keeps the document and its gzip / deflate variants in memory, reloading
+            them only when the file changes, so the server does not compress the
+            same ~140 KB on every request.
         * On unexpected errors logs the traceback and returns a JSON error body
             consistent with the rest of the API error model.
 
@@ -19,21 +22,23 @@ Error Model:
         500 - {"error": "Internal server error: <details>"}
 
 Notes:
-        Consider enabling simple caching (ETag / Last-Modified) if the document
-        becomes large or frequently requested; omitted here for simplicity.
+        Responses go through the response cache (``cache_response``), so they
+        carry an ``ETag`` and repeat requests with ``If-None-Match`` get a 304.
 """
 
-import inspect
 import os
 import traceback
 import typing
 from http import HTTPMethod
 
+from bot.lib import utils
 from bot.lib.http.handlers.api.v1.const import API_VERSION  # noqa: F401
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
 from bot.lib.mongodb.tracking import TrackingDatabase
+from httpserver import compression
 from httpserver.EndpointDecorators import uri_mapping
 from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
+from httpserver.response_cache import cache_response
 from httpserver.server import HttpResponseException
 from lib import discordhelper
 from lib.models import ErrorStatusCodePayload, openapi
@@ -60,9 +65,12 @@ class SwaggerHttpHandler(BaseHttpHandler):
 
         self.tracking_db = TrackingDatabase()
         self.discord_helper = discord_helper or discordhelper.DiscordHelper(bot)
+        # (file mtime, document, precompressed variants)
+        self._swagger: typing.Optional[typing.Tuple[int, bytes, typing.Dict[str, bytes]]] = None
 
     @uri_mapping("/swagger.yaml", method=HTTPMethod.GET)
     @uri_mapping(f"/api/{API_VERSION}/swagger.yaml", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("swagger",))
     @openapi.tags("swagger")
     @openapi.summary("Serve the OpenAPI/Swagger YAML document")
     @openapi.description("Serve the OpenAPI/Swagger YAML document")
@@ -85,19 +93,26 @@ class SwaggerHttpHandler(BaseHttpHandler):
             500: JSON error body if the swagger file cannot be read.
 
         Notes:
-            The file lookup is synchronous; given its small size this is
-            acceptable. If expanded substantially consider async file IO or
-            caching the contents in memory on first request.
+            Only a ``stat`` runs per request; the file is read and compressed
+            again when its modification time changes.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "text/vnd.yaml")
         try:
-            with open(f".swagger.{API_VERSION}.yaml", "r", encoding="utf-8") as file:
-                swagger = file.read()
-            return HttpResponse(200, headers, bytearray(swagger, "utf-8"))
+            swagger, encoded = self._load_swagger()
+            return HttpResponse(200, headers, swagger, encoded_bodies=encoded)
         except HttpResponseException as e:
             return self._create_error_from_exception(exception=e)
         except Exception as e:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
             return self._create_error_response(500, f"Internal server error: {str(e)}", headers)
+
+    def _load_swagger(self) -> typing.Tuple[bytes, typing.Dict[str, bytes]]:
+        path = f".swagger.{API_VERSION}.yaml"
+        mtime = os.stat(path).st_mtime_ns
+        if self._swagger is None or self._swagger[0] != mtime:
+            with open(path, "rb") as file:
+                swagger = file.read()
+            self._swagger = (mtime, swagger, compression.precompress(swagger))
+        return self._swagger[1], self._swagger[2]
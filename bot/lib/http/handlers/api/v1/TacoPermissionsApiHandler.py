@@ -26,15 +26,16 @@ Error Handling Philosophy:
     500 JSON error consistent with the broader API.
 """
 
-import inspect
 import json
 import os
 import typing
 from http import HTTPMethod
 
+from bot.lib import utils
 from bot.lib.enums.permissions import TacoPermissions
 from bot.lib.http.handlers.api.v1.const import API_VERSION
 from bot.lib.http.handlers.BaseHttpHandler import BaseHttpHandler
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.permissions import PermissionsDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.settings import Settings
@@ -80,13 +81,13 @@ class TacoPermissionsApiHandler(BaseHttpHandler):
         Returns:
             List[str]: Permission names (stringified enum values). Empty list on invalid inputs or errors.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = int(guildId)
             user_id = int(userId)
             if guild_id <= 0 or user_id <= 0:
                 return []
-            data = self.permissions_db.get_user_permissions(guild_id, user_id)
+            data = await executor.run(self.permissions_db.get_user_permissions, guild_id, user_id)
             # convert to string array
             return [str(perm) for perm in data]
         except Exception as ex:
@@ -191,7 +192,7 @@ class TacoPermissionsApiHandler(BaseHttpHandler):
             500 JSON error on unexpected failure
 
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -211,14 +212,14 @@ class TacoPermissionsApiHandler(BaseHttpHandler):
         @openapi: ignore
         Returns True on success, False on invalid input or error.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = int(guildId)
             user_id = int(userId)
             if guild_id <= 0 or user_id <= 0 or not permission:
                 return False
             tacoPermission = TacoPermissions.from_str(permission)
-            self.permissions_db.remove_user_permission(guild_id, user_id, tacoPermission)
+            await executor.run(self.permissions_db.remove_user_permission, guild_id, user_id, tacoPermission)
             return True
         except Exception as ex:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", f"{ex}")
@@ -277,7 +278,7 @@ class TacoPermissionsApiHandler(BaseHttpHandler):
             404 {"error": "Invalid authentication token" | "Not found"}
             500 {"error": "Internal server error: ..."}
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -298,14 +299,14 @@ class TacoPermissionsApiHandler(BaseHttpHandler):
 
     async def _add_permission(self, guildId: str, userId: str, permission: str) -> bool:
         """Add a permission to a user. Returns True on success, False otherwise."""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             guild_id = int(guildId)
             user_id = int(userId)
             if guild_id <= 0 or user_id <= 0 or not permission:
                 return False
             tacoPermission = TacoPermissions.from_str(permission)
-            self.permissions_db.add_user_permission(guild_id, user_id, tacoPermission)
+            await executor.run(self.permissions_db.add_user_permission, guild_id, user_id, tacoPermission)
             return True
         except Exception as ex:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", f"{ex}")
@@ -363,7 +364,7 @@ class TacoPermissionsApiHandler(BaseHttpHandler):
             404 {"error": "Invalid authentication token" | "Failed"}
             500 internal error JSON
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -447,7 +448,7 @@ class TacoPermissionsApiHandler(BaseHttpHandler):
         Auth required.
         Returns follow POST semantics (200 ok / 404 invalid or failed / 500 error).
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         headers = HttpHeaders()
         headers.add("Content-Type", "application/json")
         try:
@@ -26,7 +26,6 @@ Extensibility Notes:
         * Future localization could parameterize static strings (e.g. "Ends", "FREE").
 """
 
-import inspect
 import json
 import os
 import traceback
@@ -34,7 +33,9 @@ import typing
 from http import HTTPMethod
 
 import discord
+from bot.lib import utils
 from bot.lib.http.handlers.BaseWebhookHandler import BaseWebhookHandler
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.free_game_keys import FreeGameKeysDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.UrlShortener import UrlShortener
@@ -128,7 +129,7 @@ class FreeGameWebhookHandler(BaseWebhookHandler):
         4. Guild resolution & filtering
         5. Discord broadcasting & tracking
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         try:
             # Phase 1: Validate & Parse
@@ -229,8 +230,12 @@ class FreeGameWebhookHandler(BaseWebhookHandler):
             delete_after=None,
         )
 
-        self.tracking_db.track_free_game_key(
-            guildId=guild_id, channelId=channel.id, messageId=message.id, gameId=int(game_id)
+        await executor.run(
+            self.tracking_db.track_free_game_key,
+            guildId=guild_id,
+            channelId=channel.id,
+            messageId=message.id,
+            gameId=int(game_id),
         )
 
     def _build_notify_message(self, role_ids: typing.List[int]) -> str:
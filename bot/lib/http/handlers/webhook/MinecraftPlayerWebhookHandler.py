@@ -31,7 +31,6 @@ Extensibility:
         can retry aggressively.
 """
 
-import inspect
 import json
 import traceback
 import typing
@@ -41,7 +40,7 @@ from time import time
 from typing import Optional
 
 import discord
-from bot.lib import discordhelper
+from bot.lib import discordhelper, utils
 from bot.lib.enums.minecraft_player_events import MinecraftPlayerEvents
 from bot.lib.http.handlers.BaseWebhookHandler import BaseWebhookHandler
 from httpserver.EndpointDecorators import uri_mapping
@@ -126,7 +125,7 @@ class MinecraftPlayerWebhookHandler(BaseWebhookHandler):
             4xx JSON error for missing/invalid fields or unknown event.
             500 JSON error for unexpected processing failures.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         request_id = str(uuid.uuid4())[:8]
         start_time = time()
 
@@ -205,7 +204,7 @@ class MinecraftPlayerWebhookHandler(BaseWebhookHandler):
 
         Returns: 200 JSON with standardized structure or 500 on failure.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         try:
             self.log.debug(
@@ -247,7 +246,7 @@ class MinecraftPlayerWebhookHandler(BaseWebhookHandler):
         headers: HttpHeaders,
     ) -> HttpResponse:
         """Construct response for a LOGOUT event (mirror of login handler)."""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         try:
             self.log.debug(
@@ -287,7 +286,7 @@ class MinecraftPlayerWebhookHandler(BaseWebhookHandler):
         headers: HttpHeaders,
     ) -> HttpResponse:
         """Construct response for a DEATH event."""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         try:
             self.log.debug(
@@ -27,7 +27,6 @@ Extensibility notes:
 """
 
 import html
-import inspect
 import json
 import os
 import traceback
@@ -38,6 +37,7 @@ import discord
 from bot.lib import utils
 from bot.lib.http.handlers.BaseWebhookHandler import BaseWebhookHandler
 from bot.lib.models import openapi
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.shift_codes import ShiftCodesDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.ui.MultipleExternalUrlButtonView import ButtonData, MultipleExternalUrlButtonView
@@ -128,7 +128,7 @@ class ShiftCodeWebhookHandler(BaseWebhookHandler):
             400/401: JSON error for client issues.
             500: JSON error for unexpected failures.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         try:
             headers = HttpHeaders()
@@ -306,16 +306,16 @@ class ShiftCodeWebhookHandler(BaseWebhookHandler):
         if not sc_settings.get("enabled", False):
             self.log.debug(
                 0,
-                f"{self._module}.{self._class}.{inspect.stack()[0][3]}",
+                f"{self._module}.{self._class}.{utils.get_method_name()}",
                 f"Shift Codes is disabled for guild {guild_id}",
             )
             return
 
         # Check if code already tracked
-        if self.shift_codes_db.is_code_tracked(guild_id, code):
+        if await executor.run(self.shift_codes_db.is_code_tracked, guild_id, code):
             self.log.debug(
                 0,
-                f"{self._module}.{self._class}.{inspect.stack()[0][3]}",
+                f"{self._module}.{self._class}.{utils.get_method_name()}",
                 f"Code `{code}` for guild '{guild_id}' is already being tracked",
             )
             return
@@ -344,7 +344,9 @@ class ShiftCodeWebhookHandler(BaseWebhookHandler):
         channel_ids = settings.get("channel_ids", [])
         if not channel_ids or len(channel_ids) == 0:
             self.log.debug(
-                0, f"{self._module}.{self._class}.{inspect.stack()[0][3]}", f"No channel ids found for guild {guild_id}"
+                0,
+                f"{self._module}.{self._class}.{utils.get_method_name()}",
+                f"No channel ids found for guild {guild_id}",
             )
             return []
 
@@ -356,7 +358,7 @@ class ShiftCodeWebhookHandler(BaseWebhookHandler):
 
         if len(channels) == 0:
             self.log.debug(
-                0, f"{self._module}.{self._class}.{inspect.stack()[0][3]}", f"No channels found for guild {guild_id}"
+                0, f"{self._module}.{self._class}.{utils.get_method_name()}", f"No channels found for guild {guild_id}"
             )
 
         return channels
@@ -427,8 +429,10 @@ class ShiftCodeWebhookHandler(BaseWebhookHandler):
 
             if message:
                 await self._add_validation_reactions(message)
-                self.shift_codes_db.add_shift_code(
-                    payload, {"guildId": guild_id, "channelId": channel.id, "messageId": message.id}
+                await executor.run(
+                    self.shift_codes_db.add_shift_code,
+                    payload,
+                    {"guildId": guild_id, "channelId": channel.id, "messageId": message.id},
                 )
 
     async def _add_validation_reactions(self, message: discord.Message) -> None:
@@ -87,7 +87,6 @@ All exceptions are normalized into consistent JSON responses via
 ``HttpResponseException`` where possible.
 """
 
-import inspect
 import json
 import os
 import traceback
@@ -95,11 +94,13 @@ from http import HTTPMethod
 from typing import Any, Dict, Optional, Tuple
 
 import discord
+from bot.lib import utils
 from bot.lib.enums.tacotypes import TacoTypes
 from bot.lib.http.handlers.BaseWebhookHandler import BaseWebhookHandler
 from bot.lib.models import openapi
 from bot.lib.models.ErrorStatusCodePayload import ErrorStatusCodePayload
 from bot.lib.models.TacoWebhookMinecraftTacosPayload import TacoWebhookMinecraftTacosPayload
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.tacos import TacosDatabase
 from bot.lib.mongodb.tracking import TrackingDatabase
 from bot.lib.users_utils import UsersUtils
@@ -197,7 +198,7 @@ class TacosWebhookHandler(BaseWebhookHandler):
     )
     async def give_tacos(self, request: HttpRequest) -> HttpResponse:
         """Grant (or revoke) tacos between users."""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         try:
             headers = HttpHeaders()
@@ -217,8 +218,8 @@ class TacosWebhookHandler(BaseWebhookHandler):
             limits = self._load_rate_limit_settings(data["guild_id"])
 
             # 5. Resolve user IDs
-            to_user_id, from_user_id = self._resolve_user_ids(
-                data["to_twitch_user"], data["to_user_id"], data["from_twitch_user"], headers
+            to_user_id, from_user_id = await executor.run(
+                self._resolve_user_ids, data["to_twitch_user"], data["to_user_id"], data["from_twitch_user"], headers
             )
 
             # 6. Fetch Discord users
@@ -231,8 +232,12 @@ class TacosWebhookHandler(BaseWebhookHandler):
 
             # 8. Enforce rate limits (if not immune)
             if not limit_immune:
-                usage = self._calculate_rate_limits(
-                    data["guild_id"], data["from_twitch_user"], data["to_twitch_user"], limits
+                usage = await executor.run(
+                    self._calculate_rate_limits,
+                    data["guild_id"],
+                    data["from_twitch_user"],
+                    data["to_twitch_user"],
+                    limits,
                 )
                 self._enforce_rate_limits(data["amount"], usage, limits, headers)
 
@@ -622,7 +627,7 @@ class TacosWebhookHandler(BaseWebhookHandler):
         """
         await self.discord_helper.taco_give_user(guild_id, from_user, to_user, reason, taco_type, taco_amount=amount)
 
-        total_tacos = self.tacos_db.get_tacos_count(guild_id, to_user.id)
+        total_tacos = await executor.run(self.tacos_db.get_tacos_count, guild_id, to_user.id)
         return total_tacos if total_tacos is not None else 0
 
     def _build_success_response(self, payload: Dict[str, Any], total_tacos: int, headers: HttpHeaders) -> HttpResponse:
@@ -5,6 +5,7 @@ from typing import Callable, List, Optional
 
 import discord
 from bot.lib import discordhelper
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.free_game_keys import FreeGameKeysDatabase
 
 
@@ -46,7 +47,7 @@ class GuildResolver:
         resolved = []
 
         for guild in guilds:
-            guild_config = self._get_guild_config(guild.id, game_id, settings_section)
+            guild_config = await self._get_guild_config(guild.id, game_id, settings_section)
 
             if not guild_config:
                 continue  # Guild disabled or already tracked
@@ -63,7 +64,7 @@ class GuildResolver:
 
         return resolved
 
-    def _get_guild_config(self, guild_id: int, game_id: int, settings_section: str) -> Optional[dict]:
+    async def _get_guild_config(self, guild_id: int, game_id: int, settings_section: str) -> Optional[dict]:
         """Get guild config if eligible for notification.
 
         Returns None if guild is ineligible.
@@ -73,7 +74,7 @@ class GuildResolver:
         if not settings.get("enabled", False):
             return None
 
-        if self.freegame_db.is_game_tracked(guild_id, game_id):
+        if await executor.run(self.freegame_db.is_game_tracked, guild_id, game_id):
             return None
 
         channel_ids = settings.get("channel_ids", [])
@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+import typing
+
+from bot.lib import utils
+from bot.lib.colors import Colors
+from bot.lib.enums import loglevel
+
+FORMAT_TEXT = "text"
+FORMAT_JSON = "json"
+
+COLOR_AUTO = "auto"
+COLOR_ALWAYS = "always"
+COLOR_NEVER = "never"
+
+
+class LogOutput:
+    """Writes log lines to stdout / stderr.
+
+    ``text`` output is the familiar ``[LEVEL] [method] [guild] message`` line. It is only colorized when
+    the target stream is a TTY, unless ``color`` is ``always`` or ``never``. ``json`` output writes one
+    uncolored JSON object per line, for log collectors.
+    """
+
+    def __init__(self, log_format: str = FORMAT_TEXT, color: str = COLOR_AUTO) -> None:
+        if log_format not in (FORMAT_TEXT, FORMAT_JSON):
+            raise ValueError(f"Unknown log format '{log_format}'")
+        if color not in (COLOR_AUTO, COLOR_ALWAYS, COLOR_NEVER):
+            raise ValueError(f"Unknown log color mode '{color}'")
+        self.log_format = log_format
+        self.color = color
+
+    @classmethod
+    def from_environment(cls) -> "LogOutput":
+        log_format = utils.dict_get(os.environ, "LOG_FORMAT", default_value=FORMAT_TEXT).lower()
+        color = utils.dict_get(os.environ, "LOG_COLOR", default_value=COLOR_AUTO).lower()
+        # https://no-color.org/
+        if "NO_COLOR" in os.environ:
+            color = COLOR_NEVER
+        return cls(log_format=log_format, color=color)
+
+    def use_color(self, file: typing.IO) -> bool:
+        if self.log_format == FORMAT_JSON or self.color == COLOR_NEVER:
+            return False
+        if self.color == COLOR_ALWAYS:
+            return True
+        try:
+            return file.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def write(
+        self,
+        guildId: typing.Optional[int],
+        level: loglevel.LogLevel,
+        method: str,
+        message: str,
+        stack: typing.Optional[str] = None,
+        file: typing.IO = sys.stdout,
+        color: typing.Optional[str] = None,
+        bold: bool = False,
+    ) -> None:
+        if self.log_format == FORMAT_JSON:
+            payload = {
+                "timestamp": utils.get_timestamp(),
+                "level": level.name,
+                "guild_id": str(guildId),
+                "method": method,
+                "message": message,
+            }
+            if stack:
+                payload["stack_trace"] = stack
+            print(json.dumps(payload), file=file)
+            return
+
+        if not self.use_color(file):
+            print(f"[{level.name}] [{method}] [{guildId}] {message}", file=file)
+            if stack:
+                print(stack, file=file)
+            return
+
+        if color is None:
+            color = Colors.get_color(level)
+        m_level = Colors.colorize(color, f"[{level.name}]", bold=True)
+        m_method = Colors.colorize(Colors.HEADER, f"[{method}]", bold=bold)
+        m_guild = Colors.colorize(Colors.OKGREEN, f"[{guildId}]", bold=bold)
+        m_message = f"{Colors.colorize(color, message)}"
+        print(f"{m_level} {m_method} {m_guild} {m_message}", file=file)
+        if stack:
+            print(Colors.colorize(color, stack), file=file)
@@ -1,50 +1,73 @@
 import sys
 import typing
 
-from bot.lib.colors import Colors
 from bot.lib.enums import loglevel
+from bot.lib.log_output import LogOutput
 from bot.lib.mongodb.logs import LogsDatabase
 
+# a message may be passed as a callable so expensive formatting only happens if the level is enabled
+LogMessage = typing.Union[str, typing.Callable[[], str]]
+
+# messages below the minimum level return before anything is formatted, printed or stored
+_DEBUG = loglevel.LogLevel.DEBUG.value
+_INFO = loglevel.LogLevel.INFO.value
+_WARNING = loglevel.LogLevel.WARNING.value
+_ERROR = loglevel.LogLevel.ERROR.value
+_FATAL = loglevel.LogLevel.FATAL.value
+
 
 class Log:
     def __init__(self, minimumLogLevel: loglevel.LogLevel = loglevel.LogLevel.DEBUG) -> None:
         self.logs_db = LogsDatabase()
         self.minimum_log_level = minimumLogLevel
+        self.output = LogOutput.from_environment()
         pass
 
+    @property
+    def minimum_log_level(self) -> loglevel.LogLevel:
+        return self._minimum_log_level
+
+    @minimum_log_level.setter
+    def minimum_log_level(self, level: loglevel.LogLevel) -> None:
+        self._minimum_log_level = level
+        # plain int so the per-call level check avoids the LogLevel comparison operators
+        self._minimum_value = level.value
+
+    def is_enabled_for(self, level: loglevel.LogLevel) -> bool:
+        return level.value >= self._minimum_value
+
     def __write(
         self,
         guildId: int,
         level: loglevel.LogLevel,
         method: str,
-        message: str,
+        message: LogMessage,
         stack: typing.Optional[str] = None,
         file: typing.IO = sys.stdout,
     ) -> None:
-        color = Colors.get_color(level)
-        m_level = Colors.colorize(color, f"[{level.name}]", bold=True)
-        m_method = Colors.colorize(Colors.HEADER, f"[{method}]", bold=False)
-        m_message = f"{Colors.colorize(color, message)}"
-        m_guild = Colors.colorize(Colors.OKGREEN, f"[{guildId}]", bold=False)
-        str_out = f"{m_level} {m_method} {m_guild} {m_message}"
-        print(str_out, file=file)
-        if stack:
-            print(Colors.colorize(color, stack), file=file)
+        if callable(message):
+            message = message()
 
-        if level >= self.minimum_log_level:
-            self.logs_db.insert_log(guildId=guildId, level=level, method=method, message=message, stack=stack)
+        self.output.write(guildId=guildId, level=level, method=method, message=message, stack=stack, file=file)
+        self.logs_db.insert_log(guildId=guildId, level=level, method=method, message=message, stack=stack)
 
-    def debug(self, guildId: int, method: str, message: str, stack: typing.Optional[str] = None) -> None:
+    def debug(self, guildId: int, method: str, message: LogMessage, stack: typing.Optional[str] = None) -> None:
+        if self._minimum_value > _DEBUG:
+            return
         self.__write(
             guildId=guildId, level=loglevel.LogLevel.DEBUG, method=method, message=message, stack=stack, file=sys.stdout
         )
 
-    def info(self, guildId: int, method: str, message: str, stack: typing.Optional[str] = None) -> None:
+    def info(self, guildId: int, method: str, message: LogMessage, stack: typing.Optional[str] = None) -> None:
+        if self._minimum_value > _INFO:
+            return
         self.__write(
             guildId=guildId, level=loglevel.LogLevel.INFO, method=method, message=message, stack=stack, file=sys.stdout
         )
 
-    def warn(self, guildId: int, method: str, message: str, stack: typing.Optional[str] = None) -> None:
+    def warn(self, guildId: int, method: str, message: LogMessage, stack: typing.Optional[str] = None) -> None:
+        if self._minimum_value > _WARNING:
+            return
         self.__write(
             guildId=guildId,
             level=loglevel.LogLevel.WARNING,
@@ -54,12 +77,16 @@ class Log:
             file=sys.stdout,
         )
 
-    def error(self, guildId: int, method: str, message: str, stack: typing.Optional[str] = None) -> None:
+    def error(self, guildId: int, method: str, message: LogMessage, stack: typing.Optional[str] = None) -> None:
+        if self._minimum_value > _ERROR:
+            return
         self.__write(
             guildId=guildId, level=loglevel.LogLevel.ERROR, method=method, message=message, stack=stack, file=sys.stderr
         )
 
-    def fatal(self, guildId: int, method: str, message: str, stack: typing.Optional[str] = None) -> None:
+    def fatal(self, guildId: int, method: str, message: LogMessage, stack: typing.Optional[str] = None) -> None:
+        if self._minimum_value > _FATAL:
+            return
         self.__write(
             guildId=guildId, level=loglevel.LogLevel.FATAL, method=method, message=message, stack=stack, file=sys.stderr
         )
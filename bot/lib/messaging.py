@@ -1,4 +1,3 @@
-import inspect
 import os
 import typing
 
@@ -9,7 +8,7 @@ from bot.lib.enums import loglevel
 
 class Messaging:
     def __init__(self, bot) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self.settings = settings.Settings()
@@ -1,7 +1,7 @@
-import inspect
 import os
 import traceback
 
+from bot.lib import utils
 from bot.lib.mongodb.migration_base import MigrationBase
 
 
@@ -13,7 +13,7 @@ class Migration(MigrationBase):
         self._version = 0
 
     def run(self) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
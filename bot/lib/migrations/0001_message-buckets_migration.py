@@ -0,0 +1,115 @@
+import os
+import traceback
+
+from bot.lib import utils
+from bot.lib.mongodb.migration_base import MigrationBase
+
+
+class Migration(MigrationBase):
+    def __init__(self) -> None:
+        super().__init__()
+        self._class = self.__class__.__name__
+        self._module = os.path.basename(__file__)[:-3]
+        self._version = 1
+
+    def run(self) -> None:
+        _method = utils.get_method_name()
+        try:
+            if self.connection is None:
+                self.open()
+
+            # move the per-user array documents out of the way first, so a re-run after a failure reads the same
+            # source. track_message no longer writes to `messages`.
+            collections = self.connection.list_collection_names()
+            if "messages" in collections and "messages_archive" not in collections:
+                self.connection.messages.rename("messages_archive")
+            elif "messages_archive" not in collections:
+                self.log.info(0, f"{self._module}.{self._class}.{_method}", "No message documents to migrate")
+                self.track_run(True)
+                return
+
+            # $merge needs a unique index on its "on" fields; same spec as TrackingDatabase's INDEXES
+            self.connection.messages_daily.create_index(
+                [("guild_id", 1), ("user_id", 1), ("day", 1)], name="guild_id_1_user_id_1_day_1", unique=True
+            )
+
+            # fold every pushed message into per-day counters, server side
+            self.connection.messages_archive.aggregate(
+                [
+                    {"$unwind": "$messages"},
+                    {
+                        "$project": {
+                            "guild_id": 1,
+                            "user_id": 1,
+                            "channel_id": "$messages.channel_id",
+                            "message_id": "$messages.message_id",
+                            "timestamp": "$messages.timestamp",
+                            "day": {"$subtract": ["$messages.timestamp", {"$mod": ["$messages.timestamp", 86400]}]},
+                        }
+                    },
+                    {"$sort": {"timestamp": 1}},
+                    {
+                        "$group": {
+                            "_id": {
+                                "guild_id": "$guild_id",
+                                "user_id": "$user_id",
+                                "day": "$day",
+                                "channel_id": "$channel_id",
+                            },
+                            "count": {"$sum": 1},
+                            "last_message_id": {"$last": "$message_id"},
+                            "last_timestamp": {"$last": "$timestamp"},
+                        }
+                    },
+                    {"$sort": {"last_timestamp": 1}},
+                    {
+                        "$group": {
+                            "_id": {"guild_id": "$_id.guild_id", "user_id": "$_id.user_id", "day": "$_id.day"},
+                            "count": {"$sum": "$count"},
+                            "channels": {"$push": {"k": "$_id.channel_id", "v": "$count"}},
+                            "last_channel_id": {"$last": "$_id.channel_id"},
+                            "last_message_id": {"$last": "$last_message_id"},
+                            "last_timestamp": {"$last": "$last_timestamp"},
+                        }
+                    },
+                    {
+                        "$project": {
+                            "_id": 0,
+                            "guild_id": "$_id.guild_id",
+                            "user_id": "$_id.user_id",
+                            "day": "$_id.day",
+                            "count": 1,
+                            "channels": {"$arrayToObject": "$channels"},
+                            "last_channel_id": 1,
+                            "last_message_id": 1,
+                            "last_timestamp": 1,
+                        }
+                    },
+                    {
+                        "$merge": {
+                            "into": "messages_daily",
+                            "on": ["guild_id", "user_id", "day"],
+                            "whenMatched": "replace",
+                            "whenNotMatched": "insert",
+                        }
+                    },
+                ],
+                allowDiskUse=True,
+            )
+
+            buckets = self.connection.messages_daily.count_documents({})
+            self.log.info(
+                0,
+                f"{self._module}.{self._class}.{_method}",
+                f"Migrated tracked messages into {buckets} daily buckets; originals kept in messages_archive",
+            )
+            self.track_run(True)
+        except Exception as ex:
+            self.log.error(
+                0,
+                f"{self._module}.{self._class}.{_method}",
+                f"Failed to run migration: {ex}",
+                stack=traceback.format_exc(),
+            )
+
+            self.track_run(False)
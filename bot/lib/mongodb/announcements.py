@@ -18,7 +18,6 @@ Design Choices:
 """
 
 import datetime
-import inspect
 import os
 import traceback
 
@@ -59,7 +58,7 @@ class AnnouncementsDatabase(Database):
         * Performs an upsert keyed on (guild_id, channel_id, message_id)
             to avoid duplicate records and to reflect message edits/deletions.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
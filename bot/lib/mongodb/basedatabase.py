@@ -1,4 +1,3 @@
-import inspect
 import os
 import sys
 import traceback
@@ -7,6 +6,8 @@ import typing
 from bot.lib import utils
 from bot.lib.colors import Colors
 from bot.lib.enums import loglevel
+from bot.lib.log_output import LogOutput
+from bot.lib.mongodb.log_shipper import LogShipper
 from bot.lib.mongodb.mongo_singleton import MongoClientSingleton
 
 
@@ -21,6 +22,10 @@ class BaseDatabase:
         self.db_url = utils.dict_get(
             os.environ, "MONGODB_URL", default_value=f"mongodb://localhost:27017/{self.database_name}"
         )
+        self.minimum_log_level = loglevel.LogLevel[
+            utils.dict_get(os.environ, "LOG_LEVEL", default_value="DEBUG").upper()
+        ]
+        self.log_output = LogOutput.from_environment()
 
     def getConnection(self, database: typing.Optional[str] = None) -> typing.Any:
         if self.connection is None:
@@ -48,7 +53,7 @@ class BaseDatabase:
             self.connection = self.client[self.database_name]
 
     def close(self) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.client:
                 self.client.close()
@@ -63,38 +68,47 @@ class BaseDatabase:
                 stackTrace=traceback.format_exc(),
             )
 
+    def invalidate_responses(self, *tags: str) -> None:
+        """Drop cached HTTP responses declared with any of ``tags`` (see ``httpserver/response_cache.py``)."""
+        # imported here: httpserver imports the DAOs, so importing it at module level would be circular
+        from httpserver.response_cache import ResponseCache
+
+        ResponseCache.get_instance().invalidate(*tags)
+
     def log(
         self,
         guildId: typing.Optional[int],
         level: loglevel.LogLevel,
         method: str,
-        message: str,
+        message: typing.Union[str, typing.Callable[[], str]],
         stackTrace: typing.Optional[str] = None,
         outIO: typing.Optional[typing.IO] = None,
         colorOverride: typing.Optional[str] = None,
     ) -> None:
-        _method = inspect.stack()[0][3]
+        # PRINT is used for failures of the logging path itself and is never filtered
+        if level != loglevel.LogLevel.PRINT and not level >= self.minimum_log_level:
+            return
+        _method = utils.get_method_name()
         if guildId is None:
             guildId = 0
-        if colorOverride is None:
-            color = Colors.get_color(level)
-        else:
-            color = colorOverride
-
-        m_level = Colors.colorize(color, f"[{level.name}]", bold=True)
-        m_method = Colors.colorize(Colors.HEADER, f"[{method}]", bold=True)
-        m_guild = Colors.colorize(Colors.OKGREEN, f"[{guildId}]", bold=True)
-        m_message = f"{Colors.colorize(color, message)}"
+        if callable(message):
+            message = message()
 
-        str_out = f"{m_level} {m_method} {m_guild} {m_message}"
         if outIO is None:
             stdoe = sys.stdout if level < loglevel.LogLevel.ERROR else sys.stderr
         else:
             stdoe = outIO
 
-        print(str_out, file=stdoe)
-        if stackTrace:
-            print(Colors.colorize(color, stackTrace), file=stdoe)
+        self.log_output.write(
+            guildId=guildId,
+            level=level,
+            method=method,
+            message=message,
+            stack=stackTrace,
+            file=stdoe,
+            color=colorOverride,
+            bold=True,
+        )
         try:
             if level >= loglevel.LogLevel.INFO:
                 self.insert_log(guildId=guildId, level=level, method=method, message=message, stack=stackTrace)
@@ -112,10 +126,8 @@ class BaseDatabase:
     def insert_log(
         self, guildId: int, level: loglevel.LogLevel, method: str, message: str, stack: typing.Optional[str] = None
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
-            if self.connection is None or self.client is None:
-                self.open()
             payload = {
                 "guild_id": str(guildId),
                 "timestamp": utils.get_timestamp(),
@@ -124,7 +136,8 @@ class BaseDatabase:
                 "message": message,
                 "stack_trace": stack if stack else "",
             }
-            self.connection.logs.insert_one(payload)  # type: ignore
+            # written in batches by the background shipper, off the event loop
+            LogShipper.get_instance().submit(payload)
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -19,7 +18,7 @@ class BirthdaysDatabase(Database):
         pass
 
     def add_user_birthday(self, guildId: int, userId: int, month: int, day: int):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -44,7 +43,7 @@ class BirthdaysDatabase(Database):
             )
 
     def get_user_birthday(self, guildId: int, userId: int) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -59,7 +58,7 @@ class BirthdaysDatabase(Database):
             )
 
     def get_user_birthdays(self, guildId: int, month: int, day: int) -> typing.Optional[typing.List[dict]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -75,7 +74,7 @@ class BirthdaysDatabase(Database):
             return None
 
     def track_birthday_check(self, guildId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -92,7 +91,7 @@ class BirthdaysDatabase(Database):
             )
 
     def untrack_birthday_check(self, guildId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -107,7 +106,7 @@ class BirthdaysDatabase(Database):
             )
 
     def birthday_was_checked_today(self, guildId: int) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
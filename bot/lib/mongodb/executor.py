@@ -0,0 +1,48 @@
+import asyncio
+import functools
+import os
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from bot.lib import utils
+
+T = typing.TypeVar("T")
+
+_executor: typing.Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Shared thread pool used to run blocking MongoDB calls off the event loop.
+
+    Sized by ``MONGODB_EXECUTOR_WORKERS`` (default 16), well under pymongo's default connection pool
+    of 100, so every worker can always get a connection.
+    """
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                workers = int(utils.dict_get(os.environ, "MONGODB_EXECUTOR_WORKERS", default_value="16"))
+                _executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="tacobot-db")
+    return _executor
+
+
+async def run(func: typing.Callable[..., T], /, *args: typing.Any, **kwargs: typing.Any) -> T:
+    """Await a blocking call, usually a DAO method, on the shared database executor.
+
+    ``await executor.run(self.tacos_db.add_tacos, guild_id, user_id, 5)`` is the awaitable equivalent of
+    ``self.tacos_db.add_tacos(guild_id, user_id, 5)``: same arguments, same return value, same exceptions.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop the shared executor, waiting for queued calls to finish when ``wait`` is true."""
+    global _executor
+    with _lock:
+        executor = _executor
+        _executor = None
+    if executor is not None:
+        executor.shutdown(wait=wait)
@@ -1,7 +1,7 @@
-import inspect
 import os
 import traceback
 
+from bot.lib import utils
 from bot.lib.enums.loglevel import LogLevel
 from bot.lib.mongodb.database import Database
 
@@ -15,7 +15,7 @@ class FreeGameKeysDatabase(Database):
         pass
 
     def is_game_tracked(self, guild_id: int, game_id: int) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
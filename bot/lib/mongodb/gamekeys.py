@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -19,7 +18,7 @@ class GameKeysDatabase(Database):
         pass
 
     def find_open_game_key_offer(self, guild_id: int, channel_id: int) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -46,7 +45,7 @@ class GameKeysDatabase(Database):
         channel_id: int,
         expires: typing.Optional[datetime.datetime] = None,
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -78,7 +77,7 @@ class GameKeysDatabase(Database):
             )
 
     def close_game_key_offer_by_message(self, guild_id: int, message_id: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -93,7 +92,7 @@ class GameKeysDatabase(Database):
             )
 
     def close_game_key_offer(self, guild_id: int, game_key_id: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -108,7 +107,7 @@ class GameKeysDatabase(Database):
             )
 
     def claim_game_key_offer(self, game_key_id: str, user_id: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -126,7 +125,7 @@ class GameKeysDatabase(Database):
             raise ex
 
     def get_game_key_offer_data(self, guild_id: int, game_key_id: str) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -157,7 +156,7 @@ class GameKeysDatabase(Database):
             )
 
     def get_game_key_data(self, game_key_id: str) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -183,7 +182,7 @@ class GameKeysDatabase(Database):
             )
 
     def get_random_game_key_data(self, guild_id: int) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -212,7 +211,7 @@ class GameKeysDatabase(Database):
             )
 
     def get_claimed_key_count_in_timeframe(self, guild_id: int, user_id: int, timeframe: int) -> int:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
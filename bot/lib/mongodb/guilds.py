@@ -1,9 +1,17 @@
-import inspect
+import datetime
 import os
 import traceback
+import typing
 
+from bot.lib import utils
 from bot.lib.enums import loglevel
 from bot.lib.mongodb.database import Database
+from bot.lib.mongodb.indexes import IndexSpec
+
+INDEXES = [
+    # one document per guild holding the hash of the app command tree last synced to it
+    IndexSpec("app_command_syncs", (("guild_id", 1),), unique=True),
+]
 
 
 class GuildsDatabase(Database):
@@ -17,7 +25,7 @@ class GuildsDatabase(Database):
     # unused
     def get_guild_ids(self) -> list:
         """Get all guild IDs."""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -31,3 +39,42 @@ class GuildsDatabase(Database):
                 stackTrace=traceback.format_exc(),
             )
             return []
+
+    def get_app_command_hashes(self) -> typing.Dict[str, str]:
+        """Return ``guild_id -> hash`` of the app command tree last synced to each guild."""
+        _method = utils.get_method_name()
+        try:
+            if self.connection is None or self.client is None:
+                self.open()
+            cursor = self.connection.app_command_syncs.find({}, {"_id": 0, "guild_id": 1, "hash": 1})
+            return {doc["guild_id"]: doc["hash"] for doc in cursor if doc.get("hash")}
+        except Exception as ex:
+            self.log(
+                guildId=0,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"{ex}",
+                stackTrace=traceback.format_exc(),
+            )
+            return {}
+
+    def set_app_command_hash(self, guildId: int, hash: str) -> None:
+        """Record that the app command tree with ``hash`` was synced to the guild."""
+        _method = utils.get_method_name()
+        try:
+            if self.connection is None or self.client is None:
+                self.open()
+            timestamp = utils.to_timestamp(datetime.datetime.utcnow())
+            self.connection.app_command_syncs.update_one(
+                {"guild_id": str(guildId)},
+                {"$set": {"guild_id": str(guildId), "hash": hash, "timestamp": timestamp}},
+                upsert=True,
+            )
+        except Exception as ex:
+            self.log(
+                guildId=guildId,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"{ex}",
+                stackTrace=traceback.format_exc(),
+            )
@@ -0,0 +1,199 @@
+import importlib
+import os
+import traceback
+import typing
+from dataclasses import dataclass, field
+
+from bot.lib import utils
+from bot.lib.enums import loglevel
+from bot.lib.mongodb.basedatabase import BaseDatabase
+
+IndexKeys = typing.Tuple[typing.Tuple[str, int], ...]
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """A single index a DAO expects on one of its collections.
+
+    DAO modules declare these in a module level ``INDEXES`` list, next to the queries that need them.
+    ``keys`` uses the same ``(field, direction)`` pairs as ``create_index``.
+    """
+
+    collection: str
+    keys: IndexKeys
+    unique: bool = False
+    sparse: bool = False
+    name: typing.Optional[str] = None
+
+    @property
+    def index_name(self) -> str:
+        # same naming scheme pymongo uses when no name is given
+        return self.name or "_".join(f"{key}_{direction}" for key, direction in self.keys)
+
+
+@dataclass
+class IndexReport:
+    """Result of ensuring or checking the index manifest.
+
+    ``unused`` lists indexes (managed or not) with no recorded use in ``$indexStats``; the counters reset
+    when the server restarts, so treat it as a hint. ``unmanaged`` lists indexes that exist on a
+    manifest collection but are not declared by any DAO.
+    """
+
+    created: typing.List[str] = field(default_factory=list)
+    existing: typing.List[str] = field(default_factory=list)
+    missing: typing.List[str] = field(default_factory=list)
+    conflicts: typing.List[str] = field(default_factory=list)
+    failed: typing.List[str] = field(default_factory=list)
+    unmanaged: typing.List[str] = field(default_factory=list)
+    unused: typing.List[str] = field(default_factory=list)
+
+
+def collect_specs() -> typing.List[IndexSpec]:
+    """Gather the ``INDEXES`` declared by every module in ``bot/lib/mongodb``."""
+    specs: typing.List[IndexSpec] = []
+    for file in sorted(os.listdir(os.path.dirname(__file__))):
+        if not file.endswith(".py") or file.startswith("_"):
+            continue
+        module = importlib.import_module(f"bot.lib.mongodb.{file[:-3]}")
+        specs.extend(getattr(module, "INDEXES", []))
+    return specs
+
+
+def _normalize_keys(keys: typing.Iterable) -> IndexKeys:
+    normalized = []
+    for key, direction in keys:
+        if isinstance(direction, float):
+            direction = int(direction)
+        normalized.append((key, direction))
+    return tuple(normalized)
+
+
+class IndexManager(BaseDatabase):
+    """Creates the declared indexes that are missing and reports on the rest.
+
+    Existing indexes are never dropped or rebuilt: an index with the same keys but different options is
+    reported as a conflict for someone to resolve by hand.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._module = os.path.basename(__file__)[:-3]
+        self._class = self.__class__.__name__
+
+    def ensure_indexes(self, specs: typing.Optional[typing.List[IndexSpec]] = None) -> IndexReport:
+        return self._apply(specs, create=True)
+
+    def check_indexes(self, specs: typing.Optional[typing.List[IndexSpec]] = None) -> IndexReport:
+        return self._apply(specs, create=False)
+
+    def _apply(self, specs: typing.Optional[typing.List[IndexSpec]], create: bool) -> IndexReport:
+        _method = utils.get_method_name(1)
+        report = IndexReport()
+        if specs is None:
+            specs = collect_specs()
+        if self.connection is None or self.client is None:
+            self.open()
+
+        by_collection: typing.Dict[str, typing.List[IndexSpec]] = {}
+        for spec in specs:
+            by_collection.setdefault(spec.collection, []).append(spec)
+
+        for collection_name, collection_specs in by_collection.items():
+            try:
+                collection = self.connection[collection_name]  # type: ignore
+                existing = {
+                    _normalize_keys(info["key"]): (name, info) for name, info in collection.index_information().items()
+                }
+                declared = set()
+                for spec in collection_specs:
+                    label = f"{collection_name}.{spec.index_name}"
+                    keys = _normalize_keys(spec.keys)
+                    declared.add(keys)
+                    current = existing.get(keys)
+                    if current is not None:
+                        _, info = current
+                        if (
+                            bool(info.get("unique", False)) != spec.unique
+                            or bool(info.get("sparse", False)) != spec.sparse
+                        ):
+                            report.conflicts.append(label)
+                        else:
+                            report.existing.append(label)
+                        continue
+                    if not create:
+                        report.missing.append(label)
+                        continue
+                    try:
+                        collection.create_index(
+                            list(spec.keys), name=spec.index_name, unique=spec.unique, sparse=spec.sparse
+                        )
+                        report.created.append(label)
+                    except Exception as ex:
+                        # most likely duplicate documents blocking a unique index
+                        report.failed.append(label)
+                        self.log(
+                            guildId=0,
+                            level=loglevel.LogLevel.ERROR,
+                            method=f"{self._module}.{self._class}.{_method}",
+                            message=f"Failed to create index {label}: {ex}",
+                            stackTrace=traceback.format_exc(),
+                        )
+
+                for keys, (name, _) in existing.items():
+                    if name != "_id_" and keys not in declared:
+                        report.unmanaged.append(f"{collection_name}.{name}")
+                report.unused.extend(self._unused_indexes(collection_name, collection))
+            except Exception as ex:
+                self.log(
+                    guildId=0,
+                    level=loglevel.LogLevel.ERROR,
+                    method=f"{self._module}.{self._class}.{_method}",
+                    message=f"Failed to process indexes for {collection_name}: {ex}",
+                    stackTrace=traceback.format_exc(),
+                )
+
+        self.log(
+            guildId=0,
+            level=loglevel.LogLevel.INFO,
+            method=f"{self._module}.{self._class}.{_method}",
+            message=(
+                f"Indexes: {len(report.created)} created, {len(report.existing)} existing, "
+                f"{len(report.missing)} missing, {len(report.conflicts)} conflicting, {len(report.failed)} failed"
+            ),
+        )
+        for label in report.missing + report.conflicts:
+            kind = "missing" if label in report.missing else "conflicts with declared options"
+            self.log(
+                guildId=0,
+                level=loglevel.LogLevel.WARNING,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"Index {label} {kind}",
+            )
+        if report.unmanaged or report.unused:
+            self.log(
+                guildId=0,
+                level=loglevel.LogLevel.INFO,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"Unmanaged indexes: {report.unmanaged or 'none'}; unused indexes: {report.unused or 'none'}",
+            )
+        return report
+
+    def _unused_indexes(self, collection_name: str, collection: typing.Any) -> typing.List[str]:
+        _method = utils.get_method_name()
+        try:
+            stats = collection.aggregate([{"$indexStats": {}}])
+            return [
+                f"{collection_name}.{stat['name']}"
+                for stat in stats
+                if stat.get("name") != "_id_" and int(stat.get("accesses", {}).get("ops", 0)) == 0
+            ]
+        except Exception as ex:
+            # $indexStats needs the clusterMonitor role or equivalent; not having it is not an error
+            self.log(
+                guildId=0,
+                level=loglevel.LogLevel.DEBUG,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"Unable to read index usage for {collection_name}: {ex}",
+            )
+            return []
@@ -1,8 +1,8 @@
-import inspect
 import os
 import traceback
 import typing
 
+from bot.lib import utils
 from bot.lib.enums import loglevel
 from bot.lib.mongodb.database import Database
 
@@ -16,7 +16,7 @@ class IntroductionsDatabase(Database):
         pass
 
     def get_user_introductions(self, guild_id: int) -> list:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -32,7 +32,7 @@ class IntroductionsDatabase(Database):
             return []
 
     def get_user_introduction(self, guild_id: int, user_id: int) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
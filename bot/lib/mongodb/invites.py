@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -18,7 +17,7 @@ class InvitesDatabase(Database):
         pass
 
     def track_invite_code(self, guildId: int, inviteCode: str, inviteInfo: dict, userInvite: dict) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -45,7 +44,7 @@ class InvitesDatabase(Database):
 
     # unused?
     def get_invite_code(self, guildId: int, inviteCode: str) -> typing.Any:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
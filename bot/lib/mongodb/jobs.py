@@ -0,0 +1,99 @@
+import datetime
+import os
+import traceback
+import typing
+
+from bot.lib import utils
+from bot.lib.enums import loglevel
+from bot.lib.mongodb.database import Database
+from bot.lib.mongodb.indexes import IndexSpec
+from pymongo.errors import DuplicateKeyError
+
+INDEXES = [IndexSpec("job_runs", (("job", 1), ("guild_id", 1)), unique=True)]
+
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class JobsDatabase(Database):
+    """Leases for scheduled jobs in the ``job_runs`` collection.
+
+    There is one document per job and guild. ``run_key`` names the run being claimed (for daily jobs the
+    guild's local date), so a run is claimed at most once no matter how many processes try. A lease left
+    ``running`` past ``expires_at`` (the owner died mid-run) or marked ``failed`` can be claimed again.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._module = os.path.basename(__file__)[:-3]
+        self._class = self.__class__.__name__
+
+    def acquire_lease(
+        self, job: str, guildId: int, runKey: str, owner: str, leaseSeconds: float
+    ) -> typing.Optional[bool]:
+        """Claim ``runKey`` of ``job`` for the guild.
+
+        Returns ``False`` if the run is done or held by a live lease, and ``None`` if the database could not
+        be reached, so the caller can retry later instead of treating the run as done.
+        """
+        _method = utils.get_method_name()
+        try:
+            if self.connection is None or self.client is None:
+                self.open()
+            now = utils.to_timestamp(datetime.datetime.utcnow())
+            claimable = {
+                "$or": [
+                    {"run_key": {"$ne": runKey}},
+                    {"status": STATUS_FAILED},
+                    {"status": STATUS_RUNNING, "expires_at": {"$lt": now}},
+                ]
+            }
+            payload = {
+                "job": job,
+                "guild_id": str(guildId),
+                "run_key": runKey,
+                "status": STATUS_RUNNING,
+                "owner": owner,
+                "started_at": now,
+                "expires_at": now + leaseSeconds,
+            }
+            # when the document exists but is not claimable the upsert collides with the unique index
+            result = self.connection.job_runs.update_one(  # type: ignore
+                {"job": job, "guild_id": str(guildId), **claimable}, {"$set": payload}, upsert=True
+            )
+            return result.matched_count > 0 or result.upserted_id is not None
+        except DuplicateKeyError:
+            return False
+        except Exception as ex:
+            self.log(
+                guildId=guildId,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"{ex}",
+                stackTrace=traceback.format_exc(),
+            )
+            return None
+
+    def release_lease(self, job: str, guildId: int, runKey: str, owner: str, succeeded: bool) -> None:
+        _method = utils.get_method_name()
+        try:
+            if self.connection is None or self.client is None:
+                self.open()
+            self.connection.job_runs.update_one(  # type: ignore
+                {"job": job, "guild_id": str(guildId), "run_key": runKey, "owner": owner},
+                {
+                    "$set": {
+                        "status": STATUS_DONE if succeeded else STATUS_FAILED,
+                        "completed_at": utils.to_timestamp(datetime.datetime.utcnow()),
+                    }
+                },
+            )
+        except Exception as ex:
+            self.log(
+                guildId=guildId,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"{ex}",
+                stackTrace=traceback.format_exc(),
+            )
@@ -1,6 +1,6 @@
 import datetime
-import inspect
 import os
+import threading
 import traceback
 import typing
 
@@ -9,7 +9,92 @@ from bot.lib.enums import loglevel
 from bot.lib.mongodb.database import Database
 
 
+class LiveIndex:
+    """In-memory copy of ``live_tracked``: the platforms each (guild, user) is currently tracked as live on.
+
+    Seeded once from the collection and kept in step by ``LiveDatabase.track_live`` / ``untrack_live``, so
+    presence updates can tell a real go-live or go-offline transition from noise without a query.
+    ``platforms`` returns ``None`` until the index is seeded; callers then fall back to the database.
+    Platforms are stored the way ``live_tracked`` stores them: upper-case and stripped.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seeded = False
+        self._live: typing.Dict[typing.Tuple[str, str], typing.Set[str]] = {}
+        self.claims = 0
+        self.seeds = 0
+
+    @staticmethod
+    def normalize(platform: str) -> str:
+        return platform.upper().strip()
+
+    @property
+    def seeded(self) -> bool:
+        return self._seeded
+
+    def seed(self, entries: typing.Iterable[typing.Tuple[str, str, str]]) -> None:
+        """Replace the index with ``(guild_id, user_id, platform)`` entries read from ``live_tracked``."""
+        live: typing.Dict[typing.Tuple[str, str], typing.Set[str]] = {}
+        for guildId, userId, platform in entries:
+            live.setdefault((str(guildId), str(userId)), set()).add(self.normalize(platform))
+        with self._lock:
+            self._live = live
+            self._seeded = True
+            self.seeds += 1
+
+    def platforms(self, guildId: int, userId: int) -> typing.Optional[typing.FrozenSet[str]]:
+        with self._lock:
+            if not self._seeded:
+                return None
+            return frozenset(self._live.get((str(guildId), str(userId)), ()))
+
+    def claim(self, guildId: int, userId: int, platform: str) -> bool:
+        """Mark the user live on ``platform``. Returns ``False`` if they already were.
+
+        Test and insert happen under one lock, so duplicate events for one change (``on_presence_update`` and
+        ``on_member_update`` can both carry it) cannot both start the go-live handling.
+        """
+        key = (str(guildId), str(userId))
+        platform = self.normalize(platform)
+        with self._lock:
+            platforms = self._live.setdefault(key, set())
+            if platform in platforms:
+                return False
+            platforms.add(platform)
+            self.claims += 1
+            return True
+
+    def add(self, guildId: int, userId: int, platform: str) -> None:
+        with self._lock:
+            self._live.setdefault((str(guildId), str(userId)), set()).add(self.normalize(platform))
+
+    def remove(self, guildId: int, userId: int, platform: typing.Optional[str] = None) -> None:
+        """Forget ``platform`` for the user, or every platform if ``platform`` is ``None``."""
+        key = (str(guildId), str(userId))
+        with self._lock:
+            platforms = self._live.get(key)
+            if platforms is None:
+                return
+            if platform is not None:
+                platforms.discard(self.normalize(platform))
+            if platform is None or not platforms:
+                del self._live[key]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._live = {}
+            self._seeded = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"live": len(self._live), "claims": self.claims, "seeds": self.seeds}
+
+
 class LiveDatabase(Database):
+    # shared by every instance so the live_now cog and anything else tracking live users see the same state
+    live = LiveIndex()
+
     def __init__(self) -> None:
         super().__init__()
         # get the file name without the extension and without the directory
@@ -18,7 +103,7 @@ class LiveDatabase(Database):
         pass
 
     def track_live_activity(self, guildId: int, userId: int, live: bool, platform: str, url: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -50,7 +135,7 @@ class LiveDatabase(Database):
         messageId: typing.Union[int, None] = None,
         url: typing.Union[str, None] = None,
     ):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -77,6 +162,7 @@ class LiveDatabase(Database):
                 {"$set": payload},
                 upsert=True,
             )
+            self.live.add(guildId, userId, platform)
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -87,7 +173,7 @@ class LiveDatabase(Database):
             )
 
     def get_tracked_live(self, guildId: int, userId: int, platform: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -106,7 +192,7 @@ class LiveDatabase(Database):
             )
 
     def get_tracked_live_by_url(self, guildId: int, url: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -121,7 +207,7 @@ class LiveDatabase(Database):
             )
 
     def get_tracked_live_by_user(self, guildId: int, userId: int):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -136,13 +222,14 @@ class LiveDatabase(Database):
             )
 
     def untrack_live(self, guildId: int, userId: int, platform: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
             self.connection.live_tracked.delete_many(
                 {"guild_id": str(guildId), "user_id": str(userId), "platform": platform.upper().strip()}
             )
+            self.live.remove(guildId, userId, platform)
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -151,3 +238,28 @@ class LiveDatabase(Database):
                 message=f"{ex}",
                 stackTrace=traceback.format_exc(),
             )
+
+    def seed_live_index(self) -> None:
+        """Load every ``live_tracked`` entry into ``LiveDatabase.live``."""
+        _method = utils.get_method_name()
+        try:
+            if self.connection is None or self.client is None:
+                self.open()
+            cursor = self.connection.live_tracked.find({}, {"_id": 0, "guild_id": 1, "user_id": 1, "platform": 1})
+            self.live.seed(
+                (doc["guild_id"], doc["user_id"], doc["platform"]) for doc in cursor if doc.get("platform")
+            )
+            self.log(
+                guildId=0,
+                level=loglevel.LogLevel.DEBUG,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=lambda: f"Seeded live index: {self.live.stats()['live']} live users",
+            )
+        except Exception as ex:
+            self.log(
+                guildId=0,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"Failed to seed live index: {ex}",
+                stackTrace=traceback.format_exc(),
+            )
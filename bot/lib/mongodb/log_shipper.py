@@ -0,0 +1,209 @@
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+import typing
+
+from bot.lib import utils
+from bot.lib.colors import Colors
+from bot.lib.mongodb.mongo_singleton import MongoClientSingleton
+
+DATABASE_NAME = "tacobot"
+
+FULL_POLICY_DROP = "drop"
+FULL_POLICY_BLOCK = "block"
+
+
+class _Flush:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class _Stop(_Flush):
+    pass
+
+
+def _insert_many(batch: typing.List[dict]) -> None:
+    db_url = utils.dict_get(os.environ, "MONGODB_URL", default_value=f"mongodb://localhost:27017/{DATABASE_NAME}")
+    client = MongoClientSingleton.get_client(db_url)
+    client[DATABASE_NAME].logs.insert_many(batch, ordered=False)
+
+
+class LogShipper:
+    """Background writer for the ``logs`` collection.
+
+    Log records are put on a bounded queue and written by a daemon worker thread with ``insert_many``,
+    so logging never waits on a MongoDB round-trip. A batch is written when it reaches ``batch_size``
+    records or when ``flush_interval`` seconds have passed since its first record.
+
+    When the queue is full the ``drop`` policy discards the new record immediately, while the ``block``
+    policy waits up to ``block_timeout`` seconds for room before discarding it.
+    """
+
+    _instance: typing.Optional["LogShipper"] = None
+    _lock = threading.Lock()
+    thread_name = "tacobot-log-shipper"
+
+    def __init__(
+        self,
+        writer: typing.Callable[..., None] = _insert_many,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        full_policy: str = FULL_POLICY_DROP,
+        block_timeout: float = 0.5,
+        shutdown_timeout: float = 5.0,
+    ) -> None:
+        if full_policy not in (FULL_POLICY_DROP, FULL_POLICY_BLOCK):
+            raise ValueError(f"Unknown log shipper full policy '{full_policy}'")
+        self._writer = writer
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.full_policy = full_policy
+        self.block_timeout = block_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queue_size))
+        self._counter_lock = threading.Lock()
+        self._closed = False
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self._worker = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def get_instance(cls) -> "LogShipper":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        batch_size=int(utils.dict_get(os.environ, "LOG_SHIPPER_BATCH_SIZE", default_value="100")),
+                        flush_interval=float(
+                            utils.dict_get(os.environ, "LOG_SHIPPER_FLUSH_INTERVAL", default_value="1.0")
+                        ),
+                        max_queue_size=int(utils.dict_get(os.environ, "LOG_SHIPPER_QUEUE_SIZE", default_value="10000")),
+                        full_policy=utils.dict_get(
+                            os.environ, "LOG_SHIPPER_FULL_POLICY", default_value=FULL_POLICY_DROP
+                        ).lower(),
+                    )
+                    atexit.register(cls._instance.close)
+        return cls._instance
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush and stop the shared shipper, if one was started."""
+        with cls._lock:
+            instance = cls._instance
+            cls._instance = None
+        if instance is not None:
+            instance.close()
+
+    def submit(self, record: dict) -> bool:
+        """Queue a log record. Returns ``False`` if the record was dropped."""
+        if self._closed:
+            self._count(dropped=1)
+            return False
+        try:
+            if self.full_policy == FULL_POLICY_BLOCK:
+                self._queue.put(record, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(record)
+        except queue.Full:
+            self._count(dropped=1)
+            return False
+        self._count(submitted=1)
+        return True
+
+    def flush(self, timeout: typing.Optional[float] = None) -> bool:
+        """Write everything queued so far. Returns ``False`` if the worker did not finish in time."""
+        if self._closed or not self._worker.is_alive():
+            return False
+        wait = self.shutdown_timeout if timeout is None else timeout
+        deadline = time.monotonic() + wait
+        marker = _Flush()
+        try:
+            self._queue.put(marker, timeout=wait)
+        except queue.Full:
+            return False
+        return marker.done.wait(max(0.0, deadline - time.monotonic()))
+
+    def close(self) -> None:
+        """Flush the queue and stop the worker thread. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._worker.is_alive():
+            return
+        marker = _Stop()
+        try:
+            self._queue.put(marker, timeout=self.shutdown_timeout)
+        except queue.Full:
+            return
+        self._worker.join(self.shutdown_timeout)
+
+    def stats(self) -> dict:
+        with self._counter_lock:
+            return {
+                "queued": self._queue.qsize(),
+                "submitted": self.submitted,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "batches": self.batches,
+            }
+
+    def _count(self, submitted: int = 0, written: int = 0, dropped: int = 0, failed: int = 0, batches: int = 0):
+        with self._counter_lock:
+            self.submitted += submitted
+            self.written += written
+            self.dropped += dropped
+            self.failed += failed
+            self.batches += batches
+
+    def _run(self) -> None:
+        batch: typing.List[dict] = []
+        deadline = 0.0
+        while True:
+            timeout = None if not batch else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write(batch)
+                batch = []
+                continue
+
+            if isinstance(item, _Flush):
+                self._write(batch)
+                batch = []
+                item.done.set()
+                if isinstance(item, _Stop):
+                    return
+                continue
+
+            if not batch:
+                deadline = time.monotonic() + self.flush_interval
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch: typing.List[dict]) -> None:
+        if not batch:
+            return
+        try:
+            self._writer(batch)
+            self._count(written=len(batch), batches=1)
+        except Exception as ex:
+            self._count(failed=len(batch))
+            print(
+                Colors.colorize(
+                    Colors.FAIL, f"[PRINT] [log_shipper.LogShipper._write] Failed to write {len(batch)} logs: {ex}"
+                ),
+                file=sys.stderr,
+            )
+            print(Colors.colorize(Colors.FAIL, traceback.format_exc()), file=sys.stderr)
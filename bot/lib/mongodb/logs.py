@@ -1,9 +1,12 @@
-import inspect
 import os
 import traceback
 
+from bot.lib import utils
 from bot.lib.enums import loglevel
 from bot.lib.mongodb.database import Database
+from bot.lib.mongodb.indexes import IndexSpec
+
+INDEXES = [IndexSpec("logs", (("guild_id", 1), ("timestamp", -1)))]
 
 
 class LogsDatabase(Database):
@@ -15,11 +18,11 @@ class LogsDatabase(Database):
         pass
 
     def clear_log(self, guildId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
-            self.connection.logs.delete_many({"guild_id": guildId})
+            self.connection.logs.delete_many({"guild_id": str(guildId)})
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -19,7 +18,7 @@ class MetricsDatabase(Database):
         pass
 
     def get_permission_counts(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             # read the permissions collection
             # get the permissions for each user
@@ -68,7 +67,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_sum_all_tacos(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -87,7 +86,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_sum_all_gift_tacos(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -105,7 +104,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_sum_all_taco_reactions(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -123,7 +122,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_sum_all_twitch_tacos(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -142,7 +141,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_live_now_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -160,7 +159,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_twitch_channel_bot_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -178,7 +177,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_twitch_linked_accounts_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -198,7 +197,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_tqotd_questions_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -216,7 +215,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_tqotd_answers_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -234,7 +233,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_invited_users_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -252,7 +251,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_sum_live_by_platform(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -273,7 +272,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_wdyctw_questions_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -291,7 +290,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_wdyctw_answers_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -309,7 +308,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_techthurs_questions_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -327,7 +326,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_techthurs_answers_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -345,7 +344,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_mentalmondays_questions_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -363,7 +362,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_mentalmondays_answers_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -381,7 +380,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_tacotuesday_questions_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -399,7 +398,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_tacotuesday_answers_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -418,7 +417,7 @@ class MetricsDatabase(Database):
 
     # need to update data here to include guild_id
     def get_game_keys_available_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -437,7 +436,7 @@ class MetricsDatabase(Database):
 
     # need to update data here to include guild_id
     def get_game_keys_redeemed_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -455,7 +454,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_user_game_keys_redeemed_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -488,7 +487,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_user_game_keys_submitted_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -522,7 +521,7 @@ class MetricsDatabase(Database):
 
     # need to update data here to include guild_id
     def get_minecraft_whitelisted_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -540,7 +539,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_logs(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -565,7 +564,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_team_requests_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -583,7 +582,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_birthdays_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -602,7 +601,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_first_messages_today_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -628,12 +627,12 @@ class MetricsDatabase(Database):
             return None
 
     def get_messages_tracked_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
-            return self.connection.messages.aggregate(  # type: ignore
-                [{"$group": {"_id": "$guild_id", "total": {"$sum": {"$size": "$messages"}}}}]
+            return self.connection.messages_daily.aggregate(  # type: ignore
+                [{"$group": {"_id": "$guild_id", "total": {"$sum": "$count"}}}]
             )
         except Exception as ex:
             self.log(
@@ -646,7 +645,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_user_messages_tracked(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -654,14 +653,9 @@ class MetricsDatabase(Database):
             # join the users collection to get the username
             # sort by count descending
 
-            return self.connection.messages.aggregate(  # type: ignore
+            return self.connection.messages_daily.aggregate(  # type: ignore
                 [
-                    {
-                        "$group": {
-                            "_id": {"guild_id": "$guild_id", "user_id": "$user_id"},
-                            "total": {"$sum": {"$size": "$messages"}},
-                        }
-                    },
+                    {"$group": {"_id": {"guild_id": "$guild_id", "user_id": "$user_id"}, "total": {"$sum": "$count"}}},
                     {
                         "$lookup": {
                             "from": "users",
@@ -688,7 +682,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_users_by_status(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -714,7 +708,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_known_users(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -751,7 +745,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_top_taco_gifters(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -784,7 +778,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_top_taco_reactors(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -817,7 +811,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_top_taco_receivers(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -850,7 +844,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_live_activity(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -889,7 +883,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_suggestions(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -907,7 +901,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_user_join_leave(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -925,7 +919,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_photo_posts_count(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -963,7 +957,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_taco_logs_counts(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -986,7 +980,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_system_action_counts(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1007,7 +1001,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_guilds(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1024,7 +1018,7 @@ class MetricsDatabase(Database):
 
     # get trivia questions, expand the correct users and incorrect users into separate lists of user objects
     def get_trivia_questions(self) -> typing.Optional[typing.List[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1069,7 +1063,7 @@ class MetricsDatabase(Database):
 
     # TODO: this is not working
     def get_trivia_answer_status_per_user(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1132,7 +1126,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_invites_by_user(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1173,7 +1167,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_introductions(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1191,7 +1185,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_stream_avatar_duel_winners(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1248,7 +1242,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_free_game_keys(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1277,7 +1271,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_shift_code_counts(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -1316,7 +1310,7 @@ class MetricsDatabase(Database):
             return None
 
     def get_tracked_shift_codes_counts(self) -> typing.Optional[typing.Iterator[dict[str, typing.Any]]]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
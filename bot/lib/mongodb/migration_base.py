@@ -1,8 +1,7 @@
-import inspect
 import os
 import traceback
 
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
 from bot.lib.mongodb.mongo_singleton import MongoClientSingleton
 
@@ -28,7 +27,7 @@ class MigrationBase:
         pass
 
     def needs_run(self) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if self.connection is None:
             self.open()
 
@@ -48,7 +47,7 @@ class MigrationBase:
             return False
 
     def track_run(self, success: bool) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if self.connection is None:
             self.open()
 
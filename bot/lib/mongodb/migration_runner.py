@@ -1,9 +1,9 @@
-import inspect
 import os
 import traceback
 
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
+from bot.lib.mongodb.indexes import IndexManager
 
 
 class MigrationRunner:
@@ -26,7 +26,7 @@ class MigrationRunner:
 
     # load migrations and run them if they haven't been run yet
     def start_migrations(self) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         for migration in self._migrations:
             try:
                 module = __import__(f"bot.lib.migrations.{migration['name']}", fromlist=["Migration"])
@@ -47,3 +47,23 @@ class MigrationRunner:
                     stack=traceback.format_exc(),
                 )
                 break
+
+        self.ensure_indexes()
+
+    # create the indexes declared next to each DAO (INDEXES) that don't exist yet, or only report on them
+    # when MONGODB_ENSURE_INDEXES is false
+    def ensure_indexes(self) -> None:
+        _method = utils.get_method_name()
+        try:
+            manager = IndexManager()
+            if utils.str2bool(utils.dict_get(os.environ, "MONGODB_ENSURE_INDEXES", default_value="true")):
+                manager.ensure_indexes()
+            else:
+                manager.check_indexes()
+        except Exception as ex:
+            self.log.error(
+                0,
+                f"{self._module}.{self._class}.{_method}",
+                f"Failed to ensure indexes: {ex}",
+                stack=traceback.format_exc(),
+            )
@@ -1,8 +1,8 @@
-import inspect
 import os
 import traceback
 import typing
 
+from bot.lib import utils
 from bot.lib.enums import loglevel
 from bot.lib.enums.minecraft_op import MinecraftOpLevel
 from bot.lib.models.minecraft.whitelist_user import MinecraftWhitelistUser
@@ -20,7 +20,7 @@ class MinecraftDatabase(Database):
         pass
 
     def get_minecraft_user(self, guildId: int, userId: int) -> typing.Union[dict, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -40,7 +40,7 @@ class MinecraftDatabase(Database):
     def whitelist_minecraft_user(
         self, guildId: int, userId: int, username: str, uuid: str, whitelist: bool = True
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -54,6 +54,7 @@ class MinecraftDatabase(Database):
             self.connection.minecraft_users.update_one(  # type: ignore
                 {"user_id": str(userId), "guild_id": str(guildId)}, {"$set": payload}, upsert=True
             )
+            self.invalidate_responses("minecraft.users")
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -73,7 +74,7 @@ class MinecraftDatabase(Database):
         level: MinecraftOpLevel = MinecraftOpLevel.LEVEL1,
         bypassPlayerCount: bool = False,
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -84,6 +85,7 @@ class MinecraftDatabase(Database):
                 "op": {"enabled": op, "level": int(level), "bypassesPlayerLimit": bypassPlayerCount},
             }
             self.connection.minecraft_users.update_one({"user_id": str(userId)}, {"$set": payload}, upsert=True)  # type: ignore
+            self.invalidate_responses("minecraft.users")
         except Exception as ex:
             self.log(
                 guildId=0,
@@ -94,7 +96,7 @@ class MinecraftDatabase(Database):
             )
 
     def get_whitelist(self, guildId: int, status: bool = True) -> typing.List[MinecraftWhitelistUser]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -114,7 +116,7 @@ class MinecraftDatabase(Database):
             return []
 
     def get_oplist(self, guildId: int, status: bool = True) -> typing.List[MinecraftWhitelistUser]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -136,7 +138,7 @@ class MinecraftDatabase(Database):
             return []
 
     def get_worlds(self, guildId: int, active: typing.Optional[bool] = None):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -165,7 +167,7 @@ class MinecraftDatabase(Database):
             return []
 
     def set_active_world(self, guildId: int, worldId: str, name: str, active: bool) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -184,6 +186,7 @@ class MinecraftDatabase(Database):
             self.connection.minecraft_worlds.update_one(  # type: ignore
                 {"guild_id": str(guildId), "world": worldId}, {"$set": payload}, upsert=True
             )
+            self.invalidate_responses("minecraft.worlds")
             return True
         except Exception as ex:
             self.log(
@@ -1,8 +1,8 @@
-import inspect
 import os
 import traceback
 import typing
 
+from bot.lib import utils
 from bot.lib.enums import loglevel
 from bot.lib.enums.permissions import TacoPermissions
 from bot.lib.mongodb.basedatabase import BaseDatabase
@@ -18,7 +18,7 @@ class PermissionsDatabase(BaseDatabase):
         """
         Check if a user has a specific permission.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if self.connection is None or self.client is None:
             self.open()
         permissions = self.connection.permissions.find_one(  # type: ignore
@@ -32,7 +32,7 @@ class PermissionsDatabase(BaseDatabase):
         """
         Get the permissions for a user.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -56,7 +56,7 @@ class PermissionsDatabase(BaseDatabase):
         """
         Add a permission to a user.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -78,7 +78,7 @@ class PermissionsDatabase(BaseDatabase):
         """
         Remove a permission from a user.
         """
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
 
         try:
             if self.connection is None or self.client is None:
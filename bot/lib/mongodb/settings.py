@@ -1,22 +1,135 @@
+import copy
 import datetime
-import inspect
 import os
+import threading
+import time
 import traceback
 import typing
 
 from bot.lib import utils
 from bot.lib.enums import loglevel
 from bot.lib.mongodb.basedatabase import BaseDatabase
+from bot.lib.mongodb.indexes import IndexSpec
+
+INDEXES = [IndexSpec("settings", (("guild_id", 1), ("name", 1)), unique=True)]
+
+
+class SettingsCache:
+    """In-memory (guild, section) cache for documents in the ``settings`` collection.
+
+    Entries live for ``ttl`` seconds. Sections that do not exist for a guild are cached as ``None``
+    (negative caching) so the usual "guild, then global guild 0" fallback does not hit the database
+    on every event. A ``ttl`` of 0 or less disables the cache.
+
+    ``generation`` increases on every invalidation. ``section_generation`` only moves when one
+    (guild, section) is invalidated, so structures derived from a section (such as ``ChannelConfigIndex``)
+    can tell that it was written without re-reading it, and are not disturbed by writes to other guilds.
+    """
+
+    def __init__(self, ttl: float, clock: typing.Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: typing.Dict[typing.Tuple[str, str], typing.Tuple[float, typing.Optional[dict]]] = {}
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.generation = 0
+        self._clears = 0
+        self._guild_generations: typing.Dict[str, int] = {}
+        self._section_generations: typing.Dict[typing.Tuple[str, str], int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, guildId: int, name: str) -> typing.Tuple[bool, typing.Optional[dict]]:
+        """Return ``(found, settings)``. ``found`` is ``False`` when the database must be queried."""
+        if not self.enabled:
+            return False, None
+        key = (str(guildId), name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            if entry[1] is None:
+                self.negative_hits += 1
+                return True, None
+            self.hits += 1
+        # hand out a copy so callers that modify the settings dict do not modify the cache
+        return True, copy.deepcopy(entry[1])
+
+    def section_generation(self, guildId: int, name: str) -> int:
+        """A counter that moves whenever the section is invalidated: on its own, with its guild, or by ``clear``."""
+        with self._lock:
+            return self._section_generation(str(guildId), name)
+
+    def _section_generation(self, guild: str, name: str) -> int:
+        # every term only grows, so the sum changes exactly when one of them does
+        return self._clears + self._guild_generations.get(guild, 0) + self._section_generations.get((guild, name), 0)
+
+    def set(
+        self, guildId: int, name: str, settings: typing.Optional[dict], generation: typing.Optional[int] = None
+    ) -> None:
+        """Store a section read from the database.
+
+        Skipped when ``generation`` (the ``section_generation`` read before the query) is out of date.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._section_generation(str(guildId), name):
+                return
+            self._entries[(str(guildId), name)] = (self._clock() + self.ttl, copy.deepcopy(settings))
+
+    def invalidate(self, guildId: int, name: typing.Optional[str] = None) -> None:
+        """Drop the cached section ``name`` for the guild, or every section of the guild if ``name`` is None."""
+        with self._lock:
+            self.generation += 1
+            if name is not None:
+                key = (str(guildId), name)
+                self._section_generations[key] = self._section_generations.get(key, 0) + 1
+                keys = [key]
+            else:
+                self._guild_generations[str(guildId)] = self._guild_generations.get(str(guildId), 0) + 1
+                keys = [k for k in self._entries if k[0] == str(guildId)]
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._clears += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
 
 
 class SettingsDatabase(BaseDatabase):
+    # shared by every instance so a write through any SettingsDatabase invalidates reads everywhere
+    cache = SettingsCache(ttl=float(utils.dict_get(os.environ, "SETTINGS_CACHE_TTL", default_value="60")))
+
     def __init__(self) -> None:
         super().__init__()
         self._module = os.path.basename(__file__)[:-3]
         self._class = self.__class__.__name__
 
     def add_settings(self, guildId: int, name: str, settings: dict) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -26,6 +139,8 @@ class SettingsDatabase(BaseDatabase):
             self.connection.settings.update_one(  # type: ignore
                 {"guild_id": str(guildId), "name": name}, {"$set": payload}, upsert=True
             )
+            self.cache.invalidate(guildId, name)
+            self.invalidate_responses("settings")
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -37,19 +152,19 @@ class SettingsDatabase(BaseDatabase):
 
     # add or update a setting value in the settings collection, under the settings property
     def set_setting(self, guildId: int, name: str, key: str, value: typing.Any) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
-            # get the settings object
-            settings = self.get_settings(guildId, name)
-            # if the settings object is None, create a new one
-            if settings is None:
-                settings = {}
-            # set the key to the value
-            settings[key] = value
-            # update the settings object in the database
-            self.add_settings(guildId, name, settings)
+            timestamp = utils.to_timestamp(datetime.datetime.utcnow())
+            # set only this key, so a write to another key of the section since it was cached is kept
+            self.connection.settings.update_one(  # type: ignore
+                {"guild_id": str(guildId), "name": name},
+                {"$set": {f"settings.{key}": value, "timestamp": timestamp}},
+                upsert=True,
+            )
+            self.cache.invalidate(guildId, name)
+            self.invalidate_responses("settings")
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -60,14 +175,21 @@ class SettingsDatabase(BaseDatabase):
             )
 
     def get_settings(self, guildId: int, name: str) -> typing.Union[dict, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
+            found, cached = self.cache.get(guildId, name)
+            if found:
+                return cached
+            # a write that lands while the query runs must not be overwritten by the value read before it
+            generation = self.cache.section_generation(guildId, name)
             if self.connection is None or self.client is None:
                 self.open()
             settings = self.connection.settings.find_one({"guild_id": str(guildId), "name": name})  # type: ignore
             # explicitly return None if no settings are found
             if settings is None:
+                self.cache.set(guildId, name, None, generation)
                 return None
+            self.cache.set(guildId, name, settings['settings'], generation)
             # return the settings object
             return settings['settings']
         except Exception as ex:
@@ -1,7 +1,7 @@
-import inspect
 import os
 import traceback
 
+from bot.lib import utils
 from bot.lib.enums.loglevel import LogLevel
 from bot.lib.mongodb.database import Database
 
@@ -15,7 +15,7 @@ class ShiftCodesDatabase(Database):
         pass
 
     def add_shift_code(self, payload: dict, track: dict) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -44,7 +44,7 @@ class ShiftCodesDatabase(Database):
             return
 
     def is_code_tracked(self, guild_id: int, code: str) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -61,7 +61,7 @@ class ShiftCodesDatabase(Database):
             return False
 
     def get_all_untracked_codes(self, guild_id: int, limit: int) -> list[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -21,7 +20,7 @@ class SuggestionsDatabase(Database):
 
     # unused?
     def add_suggestion_create_message(self, guildId: int, channelId: int, messageId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -55,7 +54,7 @@ class SuggestionsDatabase(Database):
 
     # unused?
     def remove_suggestion_create_message(self, guildId: int, channelId: int, messageId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -78,7 +77,7 @@ class SuggestionsDatabase(Database):
             )
 
     def get_suggestion(self, guildId: int, messageId: int) -> typing.Union[dict, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -99,7 +98,7 @@ class SuggestionsDatabase(Database):
 
     # unused?
     def get_suggestion_by_id(self, guildId: int, suggestionId: str) -> typing.Union[dict, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -119,7 +118,7 @@ class SuggestionsDatabase(Database):
             )
 
     def set_state_suggestion_by_id(self, guildId: int, suggestionId: str, state: str, userId: int, reason: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -149,7 +148,7 @@ class SuggestionsDatabase(Database):
 
     # unused?
     def set_state_suggestion(self, guildId: int, messageId: int, state: str, userId: int, reason: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -177,7 +176,7 @@ class SuggestionsDatabase(Database):
             )
 
     def has_user_voted_on_suggestion(self, suggestionId: str, userId: int) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -200,7 +199,7 @@ class SuggestionsDatabase(Database):
             return False
 
     def unvote_suggestion_by_id(self, guildId: int, suggestionId: str, userId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -221,7 +220,7 @@ class SuggestionsDatabase(Database):
 
     # unused?
     def unvote_suggestion(self, guildId: int, messageId: int, userId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -241,7 +240,7 @@ class SuggestionsDatabase(Database):
             )
 
     def get_suggestion_votes_by_id(self, suggestionId: str) -> typing.Union[dict, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -260,7 +259,7 @@ class SuggestionsDatabase(Database):
 
     # unused?
     def vote_suggestion(self, guildId: int, messageId: int, userId: int, vote: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -281,7 +280,7 @@ class SuggestionsDatabase(Database):
             )
 
     def vote_suggestion_by_id(self, suggestionId: str, userId: int, vote: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -300,7 +299,7 @@ class SuggestionsDatabase(Database):
             )
 
     def add_suggestion(self, guildId: int, messageId: int, suggestion: dict) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -329,7 +328,7 @@ class SuggestionsDatabase(Database):
             )
 
     def delete_suggestion_by_id(self, guildId: int, suggestionId: str, userId: int, reason: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
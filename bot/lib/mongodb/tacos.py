@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -7,6 +6,16 @@ import typing
 from bot.lib import utils
 from bot.lib.enums import loglevel
 from bot.lib.mongodb.database import Database
+from bot.lib.mongodb.indexes import IndexSpec
+from pymongo import ReturnDocument, UpdateOne
+
+INDEXES = [
+    # one balance document per user; add_tacos / remove_tacos upsert on this key
+    IndexSpec("tacos", (("guild_id", 1), ("user_id", 1)), unique=True),
+    IndexSpec("taco_gifts", (("guild_id", 1), ("user_id", 1), ("timestamp", 1))),
+    IndexSpec("tacos_reactions", (("guild_id", 1), ("user_id", 1), ("timestamp", 1)), unique=True),
+    IndexSpec("tacos_reactions", (("guild_id", 1), ("user_id", 1), ("channel_id", 1), ("message_id", 1))),
+]
 
 
 class TacosDatabase(Database):
@@ -19,13 +28,13 @@ class TacosDatabase(Database):
 
     # Tacos
     def remove_all_tacos(self, guildId: int, userId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             self.log(
                 guildId=guildId,
                 level=loglevel.LogLevel.DEBUG,
                 method=f"{self._module}.{self._class}.{_method}",
-                message=f"Removing tacos for user {userId}",
+                message=lambda: f"Removing tacos for user {userId}",
             )
             if self.connection is None or self.client is None or self.connection.tacos is None:
                 self.open()
@@ -40,40 +49,16 @@ class TacosDatabase(Database):
             )
 
     def add_tacos(self, guildId: int, userId: int, count: int) -> int:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
-
-            user_tacos = self.get_tacos_count(guildId, userId)
-            if user_tacos is None:
-                self.log(
-                    guildId=guildId,
-                    level=loglevel.LogLevel.DEBUG,
-                    method=f"{self._module}.{self._class}.{_method}",
-                    message=f"User {userId} not in table",
-                )
-                user_tacos = 0
-            else:
-                user_tacos = user_tacos or 0
-                self.log(
-                    guildId=guildId,
-                    level=loglevel.LogLevel.DEBUG,
-                    method=f"{self._module}.{self._class}.{_method}",
-                    message=f"User {userId} has {user_tacos} tacos",
-                )
-
-            user_tacos += count
+            user_tacos = self._apply_taco_delta(guildId, userId, count)
             self.log(
                 guildId=guildId,
                 level=loglevel.LogLevel.DEBUG,
                 method=f"{self._module}.{self._class}.{_method}",
-                message=f"User {userId} has {user_tacos} tacos",
-            )
-            if self.connection is None or self.client is None:
-                self.open()
-            self.connection.tacos.update_one(
-                {"guild_id": str(guildId), "user_id": str(userId)}, {"$set": {"count": user_tacos}}, upsert=True
+                message=lambda: f"User {userId} now has {user_tacos} tacos",
             )
             return user_tacos
         except Exception as ex:
@@ -87,7 +72,7 @@ class TacosDatabase(Database):
             return 0
 
     def remove_tacos(self, guildId: int, userId: int, count: int):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if count < 0:
                 self.log(
@@ -99,42 +84,55 @@ class TacosDatabase(Database):
                 return 0
             if self.connection is None or self.client is None:
                 self.open()
-
-            user_tacos = self.get_tacos_count(guildId, userId)
-            if user_tacos is None:
-                self.log(
-                    guildId=guildId,
-                    level=loglevel.LogLevel.DEBUG,
-                    method=f"{self._module}.{self._class}.{_method}",
-                    message=f"User {userId} not in table",
-                )
-                user_tacos = 0
-            else:
-                user_tacos = user_tacos or 0
-                self.log(
-                    guildId=guildId,
-                    level=loglevel.LogLevel.DEBUG,
-                    method=f"{self._module}.{self._class}.{_method}",
-                    message=f"User {userId} has {user_tacos} tacos",
-                )
-
-            user_tacos -= count
-            if user_tacos < 0:
-                user_tacos = 0
-
+            user_tacos = self._apply_taco_delta(guildId, userId, -count)
             self.log(
                 guildId=guildId,
                 level=loglevel.LogLevel.DEBUG,
                 method=f"{self._module}.{self._class}.{_method}",
-                message=f"User {userId} now has {user_tacos} tacos",
+                message=lambda: f"User {userId} now has {user_tacos} tacos",
             )
+            return user_tacos
+        except Exception as ex:
+            self.log(
+                guildId=guildId,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"{ex}",
+                stackTrace=traceback.format_exc(),
+            )
+
+    def add_tacos_bulk(
+        self, guildId: int, deltas: typing.Union[typing.Mapping[int, int], typing.Iterable[typing.Tuple[int, int]]]
+    ) -> int:
+        """Apply many balance changes for one guild in a single ``bulk_write``.
+
+        ``deltas`` maps user ids to the number of tacos to add (negative to remove); repeated users are
+        summed first. Balances are clamped at zero like ``add_tacos``. Returns the number of balances
+        written.
+        """
+        _method = utils.get_method_name()
+        try:
+            items = deltas.items() if isinstance(deltas, typing.Mapping) else deltas
+            totals: typing.Dict[int, int] = {}
+            for userId, count in items:
+                totals[userId] = totals.get(userId, 0) + count
+            requests = [
+                UpdateOne(self._taco_filter(guildId, userId), self._taco_delta_pipeline(count), upsert=True)
+                for userId, count in totals.items()
+                if count != 0
+            ]
+            if not requests:
+                return 0
             if self.connection is None or self.client is None:
                 self.open()
-
-            self.connection.tacos.update_one(
-                {"guild_id": str(guildId), "user_id": str(userId)}, {"$set": {"count": user_tacos}}, upsert=True
+            result = self.connection.tacos.bulk_write(requests, ordered=False)
+            self.log(
+                guildId=guildId,
+                level=loglevel.LogLevel.DEBUG,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=lambda: f"Applied taco changes for {len(requests)} users",
             )
-            return user_tacos
+            return result.matched_count + result.upserted_count
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -143,9 +141,30 @@ class TacosDatabase(Database):
                 message=f"{ex}",
                 stackTrace=traceback.format_exc(),
             )
+            return 0
+
+    def _apply_taco_delta(self, guildId: int, userId: int, count: int) -> int:
+        # one round-trip: the update and the read of the new balance happen atomically on the server
+        result = self.connection.tacos.find_one_and_update(
+            self._taco_filter(guildId, userId),
+            self._taco_delta_pipeline(count),
+            projection={"_id": 0, "count": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return int(result.get("count", 0)) if result else 0
+
+    @staticmethod
+    def _taco_filter(guildId: int, userId: int) -> dict:
+        return {"guild_id": str(guildId), "user_id": str(userId)}
+
+    @staticmethod
+    def _taco_delta_pipeline(count: int) -> list:
+        # an update pipeline so the balance is clamped at zero by the server, not read and rewritten here
+        return [{"$set": {"count": {"$max": [0, {"$add": [{"$ifNull": ["$count", 0]}, count]}]}}}]
 
     def get_tacos_count(self, guildId: int, userId: int) -> typing.Union[int, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -155,7 +174,7 @@ class TacosDatabase(Database):
                     guildId=guildId,
                     level=loglevel.LogLevel.DEBUG,
                     method=f"{self._module}.{self._class}.{_method}",
-                    message=f"User {userId} not in table",
+                    message=lambda: f"User {userId} not in table",
                 )
                 return None
             return data['count']
@@ -169,7 +188,7 @@ class TacosDatabase(Database):
             )
 
     def get_total_gifted_tacos(self, guildId: int, userId: int, timespan_seconds: int = 86400) -> int:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -196,7 +215,7 @@ class TacosDatabase(Database):
             return 0
 
     def add_taco_gift(self, guildId: int, userId: int, count: int) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -217,7 +236,7 @@ class TacosDatabase(Database):
             return False
 
     def add_taco_reaction(self, guildId: int, userId: int, channelId: int, messageId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -234,7 +253,7 @@ class TacosDatabase(Database):
                 guildId=guildId,
                 level=loglevel.LogLevel.DEBUG,
                 method=f"{self._module}.{self._class}.{_method}",
-                message=f"Adding taco reaction for user {userId}",
+                message=lambda: f"Adding taco reaction for user {userId}",
             )
             self.connection.tacos_reactions.update_one(
                 {"guild_id": str(guildId), "user_id": str(userId), "timestamp": timestamp},
@@ -251,7 +270,7 @@ class TacosDatabase(Database):
             )
 
     def get_taco_reaction(self, guildId: int, userId: int, channelId: int, messageId: int) -> typing.Union[dict, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -276,7 +295,7 @@ class TacosDatabase(Database):
             )
 
     def track_tacos_log(self, guildId: int, fromUserId: int, toUserId: int, count: int, type: str, reason: str) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -303,7 +322,7 @@ class TacosDatabase(Database):
             )
 
     def get_total_gifted_tacos_for_channel(self, guild_id: int, channel: str, timespan_seconds: int = 86400) -> int:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
@@ -332,7 +351,7 @@ class TacosDatabase(Database):
     def get_total_gifted_tacos_to_user(
         self, guild_id: int, channel: str, user: str, timespan_seconds: int = 86400
     ) -> int:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None:
                 self.open()
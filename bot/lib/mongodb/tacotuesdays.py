@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -27,7 +26,7 @@ class TacoTuesdaysDatabase(Database):
         message_id: typing.Optional[int] = None,
         tweet: typing.Optional[str] = None,
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -58,7 +57,7 @@ class TacoTuesdaysDatabase(Database):
             )
 
     def track_taco_tuesday(self, guild_id: int, user_id: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -110,7 +109,7 @@ class TacoTuesdaysDatabase(Database):
 
     # unused
     def taco_tuesday_user_tracked(self, guildId: int, userId: int) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # was this message, for this user, already used to answer the taco tuesday?
         try:
             if self.connection is None or self.client is None:
@@ -149,7 +148,7 @@ class TacoTuesdaysDatabase(Database):
             raise ex
 
     def taco_tuesday_set_user(self, guildId: int, userId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -197,7 +196,7 @@ class TacoTuesdaysDatabase(Database):
             raise ex
 
     def taco_tuesday_get_by_message(self, guildId: int, channelId: int, messageId: int) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -218,7 +217,7 @@ class TacoTuesdaysDatabase(Database):
     def taco_tuesday_update_message(
         self, guildId: int, channelId: int, messageId: int, newChannelId: int, newMessageId: int
     ) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
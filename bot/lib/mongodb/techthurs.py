@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -18,7 +17,7 @@ class TechThursDatabase(Database):
         pass
 
     def track_techthurs_answer(self, guild_id: int, user_id: int, message_id: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -85,7 +84,7 @@ class TechThursDatabase(Database):
         channel_id: typing.Optional[int] = None,
         message_id: typing.Optional[int] = None,
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -115,7 +114,7 @@ class TechThursDatabase(Database):
             )
 
     def techthurs_user_message_tracked(self, guildId: int, userId: int, messageId: int):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # was this message, for this user, already used to answer the techthurs?
         try:
             if self.connection is None or self.client is None:
@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 
@@ -23,7 +22,7 @@ class TQOTDDatabase(Database):
         return timestamp
 
     def save_tqotd(self, guildId: int, question: str, author: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -48,7 +47,7 @@ class TQOTDDatabase(Database):
             )
 
     def track_tqotd_answer(self, guildId: int, userId: int, message_id: int):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -93,7 +92,7 @@ class TQOTDDatabase(Database):
             )
 
     def tqotd_user_message_tracked(self, guildId: int, userId: int, messageId: int):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # was this message, for this user, already used to answer the TQOTD?
         try:
             if self.connection is None or self.client is None:
@@ -128,7 +127,7 @@ class TQOTDDatabase(Database):
             raise ex
 
     def get_all_tqotd_questions(self, guildId: int):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
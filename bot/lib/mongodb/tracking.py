@@ -1,6 +1,9 @@
 import datetime
-import inspect
+import hashlib
+import json
 import os
+import threading
+import time
 import traceback
 import typing
 
@@ -12,9 +15,99 @@ from bot.lib.enums.system_actions import SystemActions
 from bot.lib.models.DiscordUser import DiscordUser
 from bot.lib.models.triviaquestion import TriviaQuestion
 from bot.lib.mongodb.database import Database
+from bot.lib.mongodb.indexes import IndexSpec
+from bot.lib.mongodb.write_buffer import WriteBuffer
+from pymongo import UpdateOne
+
+INDEXES = [
+    IndexSpec("first_message", (("guild_id", 1), ("user_id", 1), ("timestamp", 1)), unique=True),
+    # seed_first_messages reads a whole day at startup and after every UTC rollover
+    IndexSpec("first_message", (("timestamp", 1),)),
+    # track_message keeps one counter document per user per day
+    IndexSpec("messages_daily", (("guild_id", 1), ("user_id", 1), ("day", 1)), unique=True),
+    # track_discord_user / import_discord_users upsert by member, get_discord_user_hashes reads a guild
+    IndexSpec("users", (("guild_id", 1), ("user_id", 1))),
+]
+
+
+class FirstMessageTracker:
+    """Per-UTC-day set of the (guild, user) pairs that already sent their first message.
+
+    The set for the current day is seeded from ``first_message`` (once at startup and again after the day
+    rolls over) and updated as first messages are claimed, so only a user's first message of the day
+    needs a database round-trip. ``claim`` returns ``None`` while the current day is not seeded; callers
+    then fall back to querying ``first_message``.
+
+    ``seed_lock`` is held while a day is seeded, so when the day rolls over one thread reads it and the
+    others wait for that read instead of running the same query.
+    """
+
+    def __init__(self, clock: typing.Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.seed_lock = threading.Lock()
+        self._day: typing.Optional[float] = None
+        self._seen: typing.Set[typing.Tuple[str, str]] = set()
+        self.hits = 0
+        self.claims = 0
+        self.seeds = 0
+
+    def today(self) -> float:
+        """Epoch timestamp of the current UTC midnight, the ``timestamp`` stored in ``first_message``."""
+        now = self._clock()
+        return float(now - now % 86400)
+
+    def is_seeded(self, day: float) -> bool:
+        with self._lock:
+            return self._day == day
+
+    def seed(self, day: float, pairs: typing.Iterable[typing.Tuple[str, str]]) -> None:
+        """Replace the tracked day with ``day`` and the pairs already recorded for it."""
+        seen = {(str(guildId), str(userId)) for guildId, userId in pairs}
+        with self._lock:
+            if self._day == day:
+                self._seen.update(seen)
+                return
+            self._day = day
+            self._seen = seen
+            self.seeds += 1
+
+    def claim(self, day: float, guildId: int, userId: int) -> typing.Optional[bool]:
+        """Return ``True`` the first time a user is seen on ``day``, ``False`` afterwards.
+
+        Test and insert happen under one lock, so two messages racing on executor threads cannot both
+        be counted as the first.
+        """
+        key = (str(guildId), str(userId))
+        with self._lock:
+            if self._day != day:
+                return None
+            if key in self._seen:
+                self.hits += 1
+                return False
+            self._seen.add(key)
+            self.claims += 1
+            return True
+
+    def add(self, day: float, guildId: int, userId: int) -> None:
+        with self._lock:
+            if self._day == day:
+                self._seen.add((str(guildId), str(userId)))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._day = None
+            self._seen = set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._seen), "hits": self.hits, "claims": self.claims, "seeds": self.seeds}
 
 
 class TrackingDatabase(Database):
+    # shared by every instance; one process-wide view of today's first messages
+    first_messages = FirstMessageTracker()
+
     def __init__(self) -> None:
         super().__init__()
         # get the file name without the extension and without the directory
@@ -22,6 +115,15 @@ class TrackingDatabase(Database):
         self._class = self.__class__.__name__
         pass
 
+    def _insert_behind(self, collection: str, payload: dict) -> None:
+        # append-only analytics nothing reads back right away: the WriteBuffer worker batches the insert
+        if WriteBuffer.enabled():
+            WriteBuffer.get_instance().add(collection, payload)
+            return
+        if self.connection is None or self.client is None:
+            self.open()
+        self.connection[collection].insert_one(payload)  # type: ignore
+
     def track_command_usage(
         self,
         guildId: int,
@@ -31,10 +133,8 @@ class TrackingDatabase(Database):
         subcommand: typing.Optional[str] = None,
         args: typing.Optional[typing.List[dict]] = None,
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
-            if self.connection is None or self.client is None:
-                self.open()
             date = datetime.datetime.utcnow().date()
             ts_date = datetime.datetime.combine(date, datetime.time.min)
             timestamp = utils.to_timestamp(ts_date)
@@ -47,7 +147,7 @@ class TrackingDatabase(Database):
                 "arguments": args,
                 "timestamp": timestamp,
             }
-            self.connection.commands_usage.insert_one(payload)  # type: ignore
+            self._insert_behind("commands_usage", payload)
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -57,13 +157,11 @@ class TrackingDatabase(Database):
             )
 
     def track_first_message(self, guildId: int, userId: int, channelId: int, messageId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
-            date = datetime.datetime.utcnow().date()
-            ts_date = datetime.datetime.combine(date, datetime.time.min)
-            timestamp = utils.to_timestamp(ts_date)
+            timestamp = self.first_messages.today()
             payload = {
                 "guild_id": str(guildId),
                 "channel_id": str(channelId),
@@ -78,6 +176,7 @@ class TrackingDatabase(Database):
                 {"$set": payload},
                 upsert=True,
             )
+            self.first_messages.add(timestamp, guildId, userId)
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -88,41 +187,27 @@ class TrackingDatabase(Database):
             )
 
     def track_message(self, guildId: int, userId: int, channelId: int, messageId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
-            date = datetime.datetime.utcnow()
-            timestamp = utils.to_timestamp(date)
+            now = datetime.datetime.utcnow()
+            timestamp = utils.to_timestamp(now)
+            day = utils.to_timestamp(datetime.datetime.combine(now.date(), datetime.time.min))
 
-            payload = {"guild_id": str(guildId), "user_id": str(userId)}
-
-            result = self.connection.messages.find_one(  # type: ignore
-                {"guild_id": str(guildId), "user_id": str(userId)}
-            )
-            if result:
-                self.connection.messages.update_one(  # type: ignore
-                    {"guild_id": str(guildId), "user_id": str(userId)},
-                    {
-                        "$push": {
-                            "messages": {
-                                "channel_id": str(channelId),
-                                "message_id": str(messageId),
-                                "timestamp": timestamp,
-                            }
-                        }
+            # one bounded document per user per UTC day, counted with a single upsert
+            self.connection.messages_daily.update_one(  # type: ignore
+                {"guild_id": str(guildId), "user_id": str(userId), "day": day},
+                {
+                    "$inc": {"count": 1, f"channels.{channelId}": 1},
+                    "$set": {
+                        "last_channel_id": str(channelId),
+                        "last_message_id": str(messageId),
+                        "last_timestamp": timestamp,
                     },
-                    upsert=True,
-                )
-            else:
-                self.connection.messages.insert_one(  # type: ignore
-                    {
-                        **payload,
-                        "messages": [
-                            {"channel_id": str(channelId), "message_id": str(messageId), "timestamp": timestamp}
-                        ],
-                    }
-                )
+                },
+                upsert=True,
+            )
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -133,13 +218,26 @@ class TrackingDatabase(Database):
             )
 
     def is_first_message_today(self, guildId: int, userId: int) -> bool:
-        _method = inspect.stack()[0][3]
+        """Return ``True`` for a user's first message of the UTC day, ``False`` for every later one.
+
+        Answered from ``TrackingDatabase.first_messages``; ``first_message`` is only read to seed the
+        current day. A ``True`` answer claims the day for the user, so ``track_first_message`` should follow.
+        """
+        _method = utils.get_method_name()
         try:
+            timestamp = self.first_messages.today()
+            if not self.first_messages.is_seeded(timestamp):
+                with self.first_messages.seed_lock:
+                    # another thread may have seeded the day while this one waited
+                    if not self.first_messages.is_seeded(timestamp):
+                        self.seed_first_messages(timestamp)
+            first = self.first_messages.claim(timestamp, guildId, userId)
+            if first is not None:
+                return first
+
+            # seeding failed; ask the database directly
             if self.connection is None or self.client is None:
                 self.open()
-            date = datetime.datetime.utcnow().date()
-            ts_date = datetime.datetime.combine(date, datetime.time.min)
-            timestamp = utils.to_timestamp(ts_date)
             result = self.connection.first_message.find_one(  # type: ignore
                 {"guild_id": str(guildId), "user_id": str(userId), "timestamp": timestamp}
             )
@@ -156,8 +254,35 @@ class TrackingDatabase(Database):
             )
             return False
 
+    def seed_first_messages(self, timestamp: typing.Optional[float] = None) -> None:
+        """Load the (guild, user) pairs recorded in ``first_message`` for the day (default: today)."""
+        _method = utils.get_method_name()
+        try:
+            if timestamp is None:
+                timestamp = self.first_messages.today()
+            if self.connection is None or self.client is None:
+                self.open()
+            cursor = self.connection.first_message.find(  # type: ignore
+                {"timestamp": timestamp}, {"_id": 0, "guild_id": 1, "user_id": 1}
+            )
+            self.first_messages.seed(timestamp, ((doc["guild_id"], doc["user_id"]) for doc in cursor))
+            self.log(
+                guildId=0,
+                level=loglevel.LogLevel.DEBUG,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=lambda: f"Seeded first messages for {timestamp}: {self.first_messages.stats()['entries']}",
+            )
+        except Exception as ex:
+            self.log(
+                guildId=0,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"Failed to seed first messages: {ex}",
+                stackTrace=traceback.format_exc(),
+            )
+
     def track_discord_user(self, user: DiscordUser) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -166,6 +291,7 @@ class TrackingDatabase(Database):
             user.timestamp = timestamp
             payload = user.to_dict()
             payload["timestamp"] = timestamp
+            payload["content_hash"] = self.discord_user_hash(payload)
 
             self.log(
                 guildId=int(user.guild_id),
@@ -187,6 +313,89 @@ class TrackingDatabase(Database):
                 stackTrace=traceback.format_exc(),
             )
 
+    @staticmethod
+    def discord_user_hash(payload: dict) -> str:
+        """Hash of a serialized ``DiscordUser``, ignoring the write timestamp and the hash itself."""
+        content = {k: v for k, v in payload.items() if k not in ("timestamp", "content_hash")}
+        return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get_discord_user_hashes(self, guildId: int) -> typing.Dict[str, str]:
+        """Return ``user_id -> content_hash`` for every stored member of the guild."""
+        _method = utils.get_method_name()
+        try:
+            if self.connection is None or self.client is None:
+                self.open()
+            cursor = self.connection.users.find(  # type: ignore
+                {"guild_id": str(guildId)}, {"_id": 0, "user_id": 1, "content_hash": 1}
+            )
+            return {doc["user_id"]: doc["content_hash"] for doc in cursor if doc.get("content_hash")}
+        except Exception as ex:
+            self.log(
+                guildId=guildId,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"{ex}",
+                stackTrace=traceback.format_exc(),
+            )
+            return {}
+
+    def import_discord_users(
+        self,
+        guildId: int,
+        users: typing.Iterable[DiscordUser],
+        hashes: typing.Optional[typing.Dict[str, str]] = None,
+        chunk_size: int = 500,
+    ) -> int:
+        """Upsert many members of one guild with unordered ``bulk_write`` calls of ``chunk_size`` each.
+
+        ``hashes`` maps user ids to the ``content_hash`` last written for them (see
+        ``get_discord_user_hashes``). Members whose hash is unchanged are skipped, and the map is updated in
+        place for every member written. Returns the number of members written.
+        """
+        _method = utils.get_method_name()
+        hashes = hashes if hashes is not None else {}
+        written = 0
+        try:
+            timestamp = utils.to_timestamp(datetime.datetime.now(pytz.UTC))
+            pending: typing.List[typing.Tuple[str, str, UpdateOne]] = []
+            for user in users:
+                payload = user.to_dict()
+                content_hash = self.discord_user_hash(payload)
+                if hashes.get(str(user.id)) == content_hash:
+                    continue
+                payload["timestamp"] = timestamp
+                payload["content_hash"] = content_hash
+                request = UpdateOne(
+                    {"guild_id": str(user.guild_id), "user_id": str(user.id)}, {"$set": payload}, upsert=True
+                )
+                pending.append((str(user.id), content_hash, request))
+
+            if pending and (self.connection is None or self.client is None):
+                self.open()
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start : start + chunk_size]
+                self.connection.users.bulk_write([request for _, _, request in chunk], ordered=False)  # type: ignore
+                for userId, content_hash, _ in chunk:
+                    hashes[userId] = content_hash
+                written += len(chunk)
+
+            self.log(
+                guildId=guildId,
+                level=loglevel.LogLevel.DEBUG,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=lambda: f"Imported {written} changed users",
+            )
+            return written
+        except Exception as ex:
+            self.log(
+                guildId=guildId,
+                level=loglevel.LogLevel.ERROR,
+                method=f"{self._module}.{self._class}.{_method}",
+                message=f"{ex}",
+                stackTrace=traceback.format_exc(),
+            )
+            return written
+
     # def track_user(
     #     self,
     #     guildId: int,
@@ -200,7 +409,7 @@ class TrackingDatabase(Database):
     #     system: bool = False,
     #     status: typing.Optional[typing.Union[str, MemberStatus]] = None,
     # ) -> None:
-    #     _method = inspect.stack()[0][3]
+    #     _method = utils.get_method_name()
     #     try:
     #         if self.connection is None or self.client is None:
     #             self.open()
@@ -236,10 +445,8 @@ class TrackingDatabase(Database):
     def track_photo_post(
         self, guildId: int, userId: int, channelId: int, messageId: int, message: str, image: str, channelName: str
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
-            if self.connection is None or self.client is None:
-                self.open()
             date = datetime.datetime.utcnow()
             timestamp = utils.to_timestamp(date)
             payload = {
@@ -253,7 +460,7 @@ class TrackingDatabase(Database):
                 "timestamp": timestamp,
             }
 
-            self.connection.photo_posts.insert_one(payload)  # type: ignore
+            self._insert_behind("photo_posts", payload)
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -264,10 +471,8 @@ class TrackingDatabase(Database):
             )
 
     def track_user_join_leave(self, guildId: int, userId: int, join: bool) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
-            if self.connection is None or self.client is None:
-                self.open()
             date = datetime.datetime.utcnow()
             timestamp = utils.to_timestamp(date)
             payload = {
@@ -277,7 +482,7 @@ class TrackingDatabase(Database):
                 "timestamp": timestamp,
             }
 
-            self.connection.user_join_leave.insert_one(payload)  # type: ignore
+            self._insert_behind("user_join_leave", payload)
         except Exception as ex:
             self.log(
                 guildId=guildId,
@@ -288,7 +493,7 @@ class TrackingDatabase(Database):
             )
 
     def track_guild(self, guild: discord.Guild) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -318,7 +523,7 @@ class TrackingDatabase(Database):
             )
 
     def track_trivia_question(self, triviaQuestion: TriviaQuestion) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -356,10 +561,8 @@ class TrackingDatabase(Database):
         self, guild_id: int, action: typing.Union[SystemActions, str], data: typing.Optional[dict] = None
     ) -> None:
         """Track a system action."""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
-            if self.connection is None or self.client is None:
-                self.open()
             date = datetime.datetime.utcnow()
             timestamp = utils.to_timestamp(date)
 
@@ -369,7 +572,7 @@ class TrackingDatabase(Database):
                 "timestamp": timestamp,
                 "data": data,
             }
-            self.connection.system_actions.insert_one(payload)  # type: ignore
+            self._insert_behind("system_actions", payload)
         except Exception as ex:
             self.log(
                 guildId=guild_id,
@@ -383,7 +586,7 @@ class TrackingDatabase(Database):
         self, guild_id: int, user_id: int, message_id: int, channel_id: int, approved: bool
     ) -> None:
         """Track a user introduction."""
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -412,7 +615,7 @@ class TrackingDatabase(Database):
             )
 
     def track_free_game_key(self, guildId: int, channelId: int, messageId: int, gameId: int):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -444,7 +647,7 @@ class TrackingDatabase(Database):
             )
 
     def track_shift_code(self, guildId: int, channelId: int, messageId: int, code: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
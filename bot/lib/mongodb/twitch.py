@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 import typing
@@ -7,6 +6,9 @@ import typing
 from bot.lib import utils
 from bot.lib.enums import loglevel
 from bot.lib.mongodb.database import Database
+from bot.lib.mongodb.indexes import IndexSpec
+
+INDEXES = [IndexSpec("twitch_user", (("user_id", 1),), unique=True), IndexSpec("twitch_user", (("twitch_name", 1),))]
 
 
 class TwitchDatabase(Database):
@@ -18,7 +20,7 @@ class TwitchDatabase(Database):
         pass
 
     def get_twitch_user(self, userId: int) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -33,7 +35,7 @@ class TwitchDatabase(Database):
             )
 
     def get_user_id_from_twitch_name(self, twitchName: str) -> typing.Optional[int]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -52,7 +54,7 @@ class TwitchDatabase(Database):
 
     # twitchId: typing.Optional[str] = None,
     def set_user_twitch_info(self, userId: int, twitchName: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -69,7 +71,7 @@ class TwitchDatabase(Database):
             )
 
     def get_user_twitch_info(self, userId: int) -> typing.Optional[dict]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -84,7 +86,7 @@ class TwitchDatabase(Database):
             )
 
     def add_stream_team_request(self, guildId: int, userId: int, twitchName: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -115,7 +117,7 @@ class TwitchDatabase(Database):
             )
 
     def remove_stream_team_request(self, guildId: int, userId: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -130,7 +132,7 @@ class TwitchDatabase(Database):
             )
 
     def add_twitchbot_to_channel(self, guildId: int, twitch_channel: str) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -155,7 +157,7 @@ class TwitchDatabase(Database):
             raise ex
 
     def set_twitch_discord_link_code(self, userId: int, code: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -177,7 +179,7 @@ class TwitchDatabase(Database):
             raise ex
 
     def link_twitch_to_discord_from_code(self, userId: int, code: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -204,7 +206,7 @@ class TwitchDatabase(Database):
             raise ex
 
     def _get_twitch_name(self, userId: int) -> typing.Union[str, None]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -1,5 +1,4 @@
 import datetime
-import inspect
 import os
 import traceback
 
@@ -17,7 +16,7 @@ class WDYCTWDatabase(Database):
         pass
 
     def track_wdyctw_answer(self, guild_id: int, user_id: int, message_id: int) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -78,7 +77,7 @@ class WDYCTWDatabase(Database):
     def save_wdyctw(
         self, guildId: int, message: str, image: str, author: int, channel_id: int = None, message_id: int = None
     ) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             if self.connection is None or self.client is None:
                 self.open()
@@ -108,7 +107,7 @@ class WDYCTWDatabase(Database):
             )
 
     def wdyctw_user_message_tracked(self, guildId: int, userId: int, messageId: int) -> bool:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # was this message, for this user, already used to answer the WDYCTW?
         try:
             if self.connection is None or self.client is None:
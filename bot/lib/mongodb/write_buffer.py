@@ -0,0 +1,166 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import traceback
+import typing
+
+from bot.lib import utils
+from bot.lib.colors import Colors
+from bot.lib.mongodb.log_shipper import DATABASE_NAME, FULL_POLICY_DROP, LogShipper
+from bot.lib.mongodb.mongo_singleton import MongoClientSingleton
+from pymongo.errors import BulkWriteError
+
+
+def _insert_many(collection: str, documents: typing.List[dict]) -> None:
+    db_url = utils.dict_get(os.environ, "MONGODB_URL", default_value=f"mongodb://localhost:27017/{DATABASE_NAME}")
+    client = MongoClientSingleton.get_client(db_url)
+    client[DATABASE_NAME][collection].insert_many(documents, ordered=False)
+
+
+class WriteBuffer(LogShipper):
+    """Write-behind buffer for append-only collections (``commands_usage``, ``system_actions``, ...).
+
+    Uses the ``LogShipper`` worker: ``add`` queues a document and returns right away, and the worker writes
+    each batch with one ``insert_many`` per collection, by size or after ``flush_interval``. ``close`` (and
+    ``shutdown`` for the shared instance) flushes what is queued.
+
+    If ``spill_path`` is set, documents that could not be written because MongoDB was unreachable are
+    appended to that file as JSON lines and written again after the next successful batch, or by the next
+    process. Documents MongoDB rejected (a ``BulkWriteError``) are counted as failed and not retried.
+    """
+
+    _instance: typing.Optional["WriteBuffer"] = None
+    _lock = threading.Lock()
+    thread_name = "tacobot-write-buffer"
+
+    def __init__(
+        self,
+        writer: typing.Callable[[str, typing.List[dict]], None] = _insert_many,
+        spill_path: typing.Optional[str] = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        self.spill_path = spill_path or None
+        self._spill_lock = threading.Lock()
+        self.spilled = 0
+        self.replayed = 0
+        # a spill file left by a previous process is replayed after the first successful write
+        self._has_spill = bool(self.spill_path and os.path.exists(self.spill_path))
+        super().__init__(writer=writer, **kwargs)
+
+    @classmethod
+    def get_instance(cls) -> "WriteBuffer":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        batch_size=int(utils.dict_get(os.environ, "WRITE_BUFFER_BATCH_SIZE", default_value="100")),
+                        flush_interval=float(
+                            utils.dict_get(os.environ, "WRITE_BUFFER_FLUSH_INTERVAL", default_value="5.0")
+                        ),
+                        max_queue_size=int(
+                            utils.dict_get(os.environ, "WRITE_BUFFER_QUEUE_SIZE", default_value="10000")
+                        ),
+                        full_policy=FULL_POLICY_DROP,
+                        spill_path=utils.dict_get(os.environ, "WRITE_BUFFER_SPILL_PATH", default_value=""),
+                    )
+                    atexit.register(cls._instance.close)
+        return cls._instance
+
+    @staticmethod
+    def enabled() -> bool:
+        return utils.str2bool(utils.dict_get(os.environ, "WRITE_BUFFER_ENABLED", default_value="true"))
+
+    def add(self, collection: str, document: dict) -> bool:
+        """Queue ``document`` for ``collection``. Returns ``False`` if it was dropped."""
+        return self.submit({"collection": collection, "document": document})
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._counter_lock:
+            stats["spilled"] = self.spilled
+            stats["replayed"] = self.replayed
+        return stats
+
+    def _write(self, batch: typing.List[dict]) -> None:
+        if not batch:
+            return
+        wrote = False
+        for collection, documents in self._group(batch).items():
+            wrote = self._write_collection(collection, documents) or wrote
+        if wrote and self._has_spill:
+            self._replay()
+
+    def _write_collection(self, collection: str, documents: typing.List[dict]) -> bool:
+        try:
+            self._writer(collection, documents)
+            self._count(written=len(documents), batches=1)
+            return True
+        except BulkWriteError as ex:
+            self._count(failed=len(documents))
+            self._report(f"MongoDB rejected {len(documents)} {collection} documents: {ex}")
+        except Exception as ex:
+            if self._spill(collection, documents):
+                self._report(f"Spilled {len(documents)} {collection} documents to {self.spill_path}: {ex}")
+            else:
+                self._count(failed=len(documents))
+                self._report(f"Failed to write {len(documents)} {collection} documents: {ex}")
+        return False
+
+    def _spill(self, collection: str, documents: typing.List[dict]) -> bool:
+        if not self.spill_path:
+            return False
+        try:
+            with self._spill_lock, open(self.spill_path, "a", encoding="utf-8") as f:
+                for document in documents:
+                    # insert_many sets _id even when the write fails; let the replay get a fresh one
+                    document = {k: v for k, v in document.items() if k != "_id"}
+                    f.write(json.dumps({"collection": collection, "document": document}, default=str) + "\n")
+            self._has_spill = True
+            with self._counter_lock:
+                self.spilled += len(documents)
+            return True
+        except OSError:
+            return False
+
+    def _replay(self) -> None:
+        assert self.spill_path is not None
+        replaying = f"{self.spill_path}.replay"
+        with self._spill_lock:
+            try:
+                os.replace(self.spill_path, replaying)
+            except FileNotFoundError:
+                self._has_spill = False
+                return
+            self._has_spill = False
+        try:
+            with open(replaying, "r", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError) as ex:
+            self._report(f"Could not read spilled documents from {replaying}: {ex}")
+            return
+        for collection, documents in self._group(records).items():
+            try:
+                self._writer(collection, documents)
+                self._count(written=len(documents), batches=1)
+                with self._counter_lock:
+                    self.replayed += len(documents)
+            except BulkWriteError as ex:
+                self._count(failed=len(documents))
+                self._report(f"MongoDB rejected {len(documents)} spilled {collection} documents: {ex}")
+            except Exception:
+                # unreachable again: keep them for the next successful batch
+                self._spill(collection, documents)
+        os.remove(replaying)
+
+    @staticmethod
+    def _group(batch: typing.List[dict]) -> typing.Dict[str, typing.List[dict]]:
+        groups: typing.Dict[str, typing.List[dict]] = {}
+        for record in batch:
+            groups.setdefault(record["collection"], []).append(record["document"])
+        return groups
+
+    def _report(self, message: str) -> None:
+        print(Colors.colorize(Colors.FAIL, f"[PRINT] [write_buffer.WriteBuffer._write] {message}"), file=sys.stderr)
+        print(Colors.colorize(Colors.FAIL, traceback.format_exc()), file=sys.stderr)
@@ -0,0 +1,219 @@
+import asyncio
+import datetime
+import os
+import socket
+import time
+import traceback
+import typing
+from dataclasses import dataclass
+
+import pytz
+from bot.lib import logger, settings, utils
+from bot.lib.enums import loglevel
+from bot.lib.mongodb import executor
+from bot.lib.mongodb.jobs import JobsDatabase
+
+# (local time of day, timezone) for a guild, or None when the job should not run for it
+DailySchedule = typing.Optional[typing.Tuple[datetime.time, datetime.tzinfo]]
+DailyCallback = typing.Callable[[int, datetime.date], typing.Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class DailyJob:
+    name: str
+    callback: DailyCallback
+    schedule: typing.Callable[[int], DailySchedule]
+
+
+def _localize(tz: datetime.tzinfo, day: datetime.date, at: datetime.time) -> datetime.datetime:
+    naive = datetime.datetime.combine(day, at)
+    # pytz zones need localize() to pick the right UTC offset (DST)
+    localize = getattr(tz, "localize", None)
+    return localize(naive) if localize is not None else naive.replace(tzinfo=tz)
+
+
+class Scheduler:
+    """Runs jobs once per guild per day at each guild's configured local time.
+
+    Cogs register a ``DailyJob`` (usually in ``cog_load``). The scheduler wakes when the next job is due
+    (at least every ``SCHEDULER_MAX_SLEEP_SECONDS``, so new guilds and settings changes are picked up),
+    claims the run through a ``job_runs`` lease keyed on the guild's local date and only then calls the
+    job. Restarts and additional bot processes therefore never repeat a day's run. If the bot starts after
+    the scheduled time, a run that has not happened yet today starts right away. A failed run is retried
+    after ``SCHEDULER_RETRY_SECONDS``.
+    """
+
+    def __init__(
+        self,
+        bot: typing.Any,
+        clock: typing.Callable[[], datetime.datetime] = lambda: datetime.datetime.now(tz=pytz.utc),
+    ) -> None:
+        self._module = os.path.basename(__file__)[:-3]
+        self._class = self.__class__.__name__
+        self.bot = bot
+        self._clock = clock
+        self.settings = settings.Settings()
+        self.log = logger.Log(minimumLogLevel=loglevel.LogLevel[self.settings.log_level.upper()])
+        self.jobs_db = JobsDatabase()
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = float(utils.dict_get(os.environ, "SCHEDULER_LEASE_SECONDS", default_value="600"))
+        self.retry_seconds = float(utils.dict_get(os.environ, "SCHEDULER_RETRY_SECONDS", default_value="900"))
+        self.max_sleep_seconds = float(utils.dict_get(os.environ, "SCHEDULER_MAX_SLEEP_SECONDS", default_value="300"))
+        self._jobs: typing.Dict[str, DailyJob] = {}
+        # (job, guild id) -> run key known to be done, so finished days do not touch the database again
+        self._completed: typing.Dict[typing.Tuple[str, int], str] = {}
+        self._retry_at: typing.Dict[typing.Tuple[str, int], datetime.datetime] = {}
+        self._task: typing.Optional[asyncio.Task] = None
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+
+    def add_daily(self, name: str, callback: DailyCallback, schedule: typing.Callable[[int], DailySchedule]) -> None:
+        self._jobs[name] = DailyJob(name, callback, schedule)
+
+    def remove(self, name: str) -> None:
+        self._jobs.pop(name, None)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_pending(self) -> float:
+        """Run every job that is due now and return the number of seconds until the next one is due."""
+        now = self._clock()
+        next_due = now + datetime.timedelta(seconds=self.max_sleep_seconds)
+        due = []
+        for job in list(self._jobs.values()):
+            for guild in list(self.bot.guilds):
+                when = self._next_run(job, guild.id, now)
+                if when is None:
+                    continue
+                if when <= now:
+                    due.append(self._run(job, guild.id, now))
+                else:
+                    next_due = min(next_due, when)
+        if due:
+            await asyncio.gather(*due)
+        return max(0.0, (next_due - self._clock()).total_seconds())
+
+    async def run_now(self, name: str, guildId: int) -> bool:
+        """Run today's ``name`` job for the guild now, unless it already ran today. Returns whether it ran."""
+        job = self._jobs.get(name)
+        if job is None:
+            return False
+        return await self._run(job, guildId, self._clock())
+
+    def next_run(self, name: str, guildId: int) -> typing.Optional[datetime.datetime]:
+        job = self._jobs.get(name)
+        if job is None:
+            return None
+        return self._next_run(job, guildId, self._clock())
+
+    def stats(self) -> dict:
+        return {
+            "jobs": len(self._jobs),
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "completed": len(self._completed),
+        }
+
+    def _local_day(
+        self, job: DailyJob, guildId: int, now: datetime.datetime
+    ) -> typing.Optional[typing.Tuple[datetime.date, datetime.time, datetime.tzinfo]]:
+        schedule = job.schedule(guildId)
+        if schedule is None:
+            return None
+        at, tz = schedule
+        return now.astimezone(tz).date(), at, tz
+
+    def _next_run(self, job: DailyJob, guildId: int, now: datetime.datetime) -> typing.Optional[datetime.datetime]:
+        _method = utils.get_method_name()
+        try:
+            local = self._local_day(job, guildId, now)
+        except Exception as e:
+            self.log.warn(guildId, f"{self._module}.{self._class}.{_method}", f"{job.name}: invalid schedule: {e}")
+            return None
+        if local is None:
+            return None
+        day, at, tz = local
+        key = (job.name, guildId)
+        if self._completed.get(key) == day.isoformat():
+            return _localize(tz, day + datetime.timedelta(days=1), at)
+        scheduled = _localize(tz, day, at)
+        if scheduled > now:
+            return scheduled
+        return self._retry_at.get(key, now)
+
+    async def _run(self, job: DailyJob, guildId: int, now: datetime.datetime) -> bool:
+        _method = utils.get_method_name()
+        key = (job.name, guildId)
+        try:
+            local = self._local_day(job, guildId, now)
+        except Exception as e:
+            self.log.warn(guildId, f"{self._module}.{self._class}.{_method}", f"{job.name}: invalid schedule: {e}")
+            return False
+        if local is None:
+            return False
+        day = local[0]
+        run_key = day.isoformat()
+        if self._completed.get(key) == run_key:
+            return False
+
+        acquired = await executor.run(
+            self.jobs_db.acquire_lease, job.name, guildId, run_key, self.owner, self.lease_seconds
+        )
+        if acquired is None:
+            # the database is unavailable; try again later rather than skipping the day
+            self._retry_at[key] = now + datetime.timedelta(seconds=self.retry_seconds)
+            return False
+        if not acquired:
+            # done today already, or another process is running it right now
+            self.skipped += 1
+            self._completed[key] = run_key
+            self._retry_at.pop(key, None)
+            return False
+
+        start = time.perf_counter()
+        try:
+            await job.callback(guildId, day)
+        except Exception as e:
+            self.failures += 1
+            self._retry_at[key] = now + datetime.timedelta(seconds=self.retry_seconds)
+            self.log.error(
+                guildId, f"{self._module}.{self._class}.{_method}", f"{job.name} failed: {e}", traceback.format_exc()
+            )
+            await executor.run(self.jobs_db.release_lease, job.name, guildId, run_key, self.owner, False)
+            return False
+
+        self.runs += 1
+        self._completed[key] = run_key
+        self._retry_at.pop(key, None)
+        await executor.run(self.jobs_db.release_lease, job.name, guildId, run_key, self.owner, True)
+        self.log.info(
+            guildId,
+            f"{self._module}.{self._class}.{_method}",
+            f"{job.name} ran for {run_key} in {(time.perf_counter() - start) * 1000:.0f}ms",
+        )
+        return True
+
+    async def _loop(self) -> None:
+        _method = utils.get_method_name()
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                delay = await self.run_pending()
+            except Exception as e:
+                self.log.error(0, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
+                delay = self.max_sleep_seconds
+            await asyncio.sleep(min(delay, self.max_sleep_seconds))
@@ -1,7 +1,8 @@
 import glob
-import inspect
 import json
 import os
+import threading
+import types
 import typing
 
 from bot.lib import utils  # pylint: disable=no-name-in-module
@@ -9,49 +10,90 @@ from bot.lib.mongodb.settings import SettingsDatabase
 
 
 class Settings:
+    """Process-wide settings and language string registry.
+
+    ``Settings()`` returns the same instance for the lifetime of the process. The app manifest,
+    environment values and language string tables are loaded once, the first time the class is
+    constructed, and shared by every cog, handler and database helper that holds a reference.
+    Call ``reload()`` to re-read everything from disk in place.
+    """
+
     APP_VERSION = "1.0.0-snapshot"
 
+    _instance: typing.Optional["Settings"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls) -> "Settings":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._load()
+                    cls._instance = instance
+        return cls._instance
+
     def __init__(self) -> None:
-        _method = inspect.stack()[0][3]
+        # all loading happens once, in __new__ / reload
+        pass
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the shared instance so the next ``Settings()`` call loads from scratch."""
+        with cls._lock:
+            cls._instance = None
+
+    def reload(self) -> None:
+        """Re-read the app manifest, environment and language files and drop cached guild settings."""
+        with self._lock:
+            self._load()
+        SettingsDatabase.cache.clear()
+
+    def _load(self) -> None:
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
 
-        # setup properties that are needed
-        self.changelog = ""
-        self.name = ""
-        self.version = ""
-        self.languages = {}
-        self.strings = {}
-        self.commands = {}
-        self.primary_guild_id = 0
-
-        self.settings_db = SettingsDatabase()
+        # everything is read into ``values`` first and applied in one update at the end: handlers read the
+        # live registry from executor threads while ``reload()`` runs
+        values: typing.Dict[str, typing.Any] = {
+            "changelog": "",
+            "name": "",
+            "version": "",
+            "commands": {},
+            "primary_guild_id": 0,
+        }
 
         try:
             with open('app.manifest', encoding="UTF-8") as json_file:
-                self.__dict__.update(json.load(json_file))
+                values.update(json.load(json_file))
         except Exception as e:
             raise e
 
-        self.bot_owner = utils.dict_get(os.environ, 'BOT_OWNER', default_value='262031734260891648')
-        self.log_level = utils.dict_get(os.environ, 'LOG_LEVEL', default_value='DEBUG')
-        self.language = utils.dict_get(os.environ, "LANGUAGE", default_value="en-us").lower()
-        self.db_url = utils.dict_get(os.environ, "MONGODB_URL", default_value="mongodb://localhost:27017/tacobot")
-        self.strawpoll_api_key = utils.dict_get(os.environ, "STRAWPOLL_API_KEY", default_value="")
-        self.giphy_api_key = utils.dict_get(os.environ, "GIPHY_API_KEY", default_value="")
-        self.timezone = utils.dict_get(os.environ, "TZ", default_value="America/Chicago")
-        self.primary_guild_id = int(utils.dict_get(os.environ, "PRIMARY_GUILD_ID", default_value=0))
-
-        self.sync_app_commands = utils.dict_get(os.environ, "SYNC_APP_COMMANDS", default_value="true").lower() == "true"
-
-        # log_level = loglevel.LogLevel[self.log_level.upper()]
-        # if not log_level:
-        #     log_level = loglevel.LogLevel.DEBUG
-
-        # self.log = logger.Log(minimumLogLevel=self.log_level)
-
-        self.load_language_manifest()
-        self.load_strings()
+        values["bot_owner"] = utils.dict_get(os.environ, 'BOT_OWNER', default_value='262031734260891648')
+        values["log_level"] = utils.dict_get(os.environ, 'LOG_LEVEL', default_value='DEBUG')
+        values["language"] = utils.dict_get(os.environ, "LANGUAGE", default_value="en-us").lower()
+        values["db_url"] = utils.dict_get(os.environ, "MONGODB_URL", default_value="mongodb://localhost:27017/tacobot")
+        values["strawpoll_api_key"] = utils.dict_get(os.environ, "STRAWPOLL_API_KEY", default_value="")
+        values["giphy_api_key"] = utils.dict_get(os.environ, "GIPHY_API_KEY", default_value="")
+        values["timezone"] = utils.dict_get(os.environ, "TZ", default_value="America/Chicago")
+        values["primary_guild_id"] = int(utils.dict_get(os.environ, "PRIMARY_GUILD_ID", default_value=0))
+
+        values["sync_app_commands"] = (
+            utils.dict_get(os.environ, "SYNC_APP_COMMANDS", default_value="true").lower() == "true"
+        )
+
+        values["languages"] = self._read_language_manifest()
+        values["strings"] = self._read_strings()
+        # guilds mapped with set_guild_strings keep their language across a reload
+        guild_languages: typing.Dict[str, str] = dict(self.__dict__.get("_guild_languages", {}))
+        for guild_id, lang in guild_languages.items():
+            if lang in values["strings"]:
+                values["strings"][guild_id] = values["strings"][lang]
+        values["_guild_languages"] = guild_languages
+        if "settings_db" not in self.__dict__:
+            values["settings_db"] = SettingsDatabase()
+
+        self.__dict__.update(values)
 
     def get(self, name, default_value=None) -> typing.Any:
         return utils.dict_get(self.__dict__, name, default_value)
@@ -60,7 +102,7 @@ class Settings:
         return self.settings_db.get_settings(guildId, name)
 
     def get_string(self, guildId: int, key: str, *args, **kwargs) -> str:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         if not key:
             # self.log.debug(guildId, f"settings.{_method}", f"KEY WAS EMPTY")
             return ''
@@ -81,13 +123,16 @@ class Settings:
                 return utils.str_replace(f"{key}", *args, **kwargs)
 
     def set_guild_strings(self, guildId: int, lang: typing.Optional[str] = None) -> None:
-        _method = inspect.stack()[1][3]
+        _method = utils.get_method_name(1)
         # guild_settings = self.settings_db.get_guild_settings(guildId)
         if not lang:
             lang = self.language
         # if guild_settings:
         #     lang = guild_settings.language
-        self.strings[str(guildId)] = self.strings[lang]
+        # under the registry lock so a concurrent reload() carries the mapping over
+        with self._lock:
+            self.strings[str(guildId)] = self.strings[lang]
+            self._guild_languages[str(guildId)] = lang
         # self.log.debug(guildId, f"settings.{_method}", f"Guild Language Set: {lang}")
 
     def get_language(self, guildId: int) -> str:
@@ -97,13 +142,22 @@ class Settings:
         # return guild_setting.language or self.settings.language
 
     def load_strings(self) -> None:
-        _method = inspect.stack()[1][3]
-        self.strings = {}
+        strings = self._read_strings()
+        for guild_id, lang in self._guild_languages.items():
+            if lang in strings:
+                strings[guild_id] = strings[lang]
+        # swap the whole table in one assignment so readers never see a partially loaded registry
+        self.strings = strings
+
+    def load_language_manifest(self) -> None:
+        self.languages = self._read_language_manifest()
+
+    def _read_strings(self) -> typing.Dict[str, typing.Mapping[str, str]]:
+        strings: typing.Dict[str, typing.Mapping[str, str]] = {}
 
         lang_files = glob.glob(os.path.join(os.path.dirname(__file__), "../../languages", "[a-z][a-z]-[a-z][a-z].json"))
         languages = [os.path.basename(f)[:-5] for f in lang_files if os.path.isfile(f)]
         for lang in languages:
-            self.strings[lang] = {}
             try:
                 lang_json = os.path.join("languages", f"{lang}.json")
                 if not os.path.exists(lang_json) or not os.path.isfile(lang_json):
@@ -112,13 +166,16 @@ class Settings:
                     continue
 
                 with open(lang_json, encoding="UTF-8") as lang_file:
-                    self.strings[lang].update(json.load(lang_file))
+                    # string tables are shared by every holder of the registry, so hand out read-only views
+                    strings[lang] = types.MappingProxyType(json.load(lang_file))
             except Exception as e:
                 raise e
+        return strings
 
-    def load_language_manifest(self) -> None:
+    def _read_language_manifest(self) -> dict:
         lang_manifest = os.path.join(os.path.dirname(__file__), "../../languages/manifest.json")
-        self.languages = {}
+        languages = {}
         if os.path.exists(lang_manifest):
             with open(lang_manifest, encoding="UTF-8") as manifest_file:
-                self.languages.update(json.load(manifest_file))
+                languages.update(json.load(manifest_file))
+        return languages
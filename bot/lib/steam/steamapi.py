@@ -1,15 +1,14 @@
-import inspect
 import os
 import traceback
 
 import requests
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
 
 
 class SteamApiClient:
     def __init__(self):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -25,7 +24,7 @@ class SteamApiClient:
         self.log = logger.Log(minimumLogLevel=log_level)
 
     def get_app_id_from_url(self, url: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         if 'store.steampowered.com' not in url:
             self.log.warn(0, f"{self._module}.{self._class}.{_method}", f"Not Steam URL: {url}")
             return None
@@ -46,7 +45,7 @@ class SteamApiClient:
         return None
 
     def get_app_details(self, app_id: str):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             url = f'{self.base_url}/appdetails?appids={app_id}&cc=us&l=en'
             response = requests.get(url, headers=self.headers)
@@ -1,16 +1,15 @@
-import inspect
 import os
 import traceback
 import typing
 
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
 from bot.lib.mongodb.twitch import TwitchDatabase
 
 
 class UsersUtils:
     def __init__(self):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self._class = self.__class__.__name__
@@ -24,7 +23,7 @@ class UsersUtils:
         self.twitch_db = TwitchDatabase()
 
     def twitch_user_to_discord_user(self, twitch_user: str) -> typing.Optional[int]:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         try:
             twitch_user_id = self.twitch_db.get_user_id_from_twitch_name(twitch_user)
             if twitch_user_id:
@@ -3,6 +3,7 @@ import json
 import random
 import re
 import string
+import sys
 import typing
 
 import discord
@@ -36,6 +37,12 @@ def dict_get(dictionary, key, default_value=None) -> typing.Any:
         return default_value
 
 
+def get_method_name(depth: int = 0) -> str:
+    # name of the calling function (depth=0) or one of its callers, read from the frame without building
+    # the full stack (and source context) that inspect.stack() creates.
+    return sys._getframe(depth + 1).f_code.co_name
+
+
 def get_scalar_result(conn, sql, default_value=None, *args) -> typing.Any:
     cursor = conn.cursor()
     try:
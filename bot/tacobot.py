@@ -1,19 +1,26 @@
-import inspect
+import asyncio
 import os
 import traceback
 import typing
 
 import discord
 import discordhealthcheck
-from bot.lib import logger, settings
+from bot.lib import discordhelper, logger, settings, utils
+from bot.lib.discord.command_sync import CommandSync
+from bot.lib.discord.message_pipeline import MessagePipeline
+from bot.lib.discord.reaction_router import ReactionRouter
 from bot.lib.enums import loglevel
+from bot.lib.mongodb import executor
 from bot.lib.mongodb.guilds import GuildsDatabase
+from bot.lib.mongodb.log_shipper import LogShipper
+from bot.lib.mongodb.write_buffer import WriteBuffer
+from bot.lib.scheduler import Scheduler
 from discord.ext import commands
 
 
 class TacoBot(commands.Bot):
     def __init__(self, *, intents: discord.Intents) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self._class = self.__class__.__name__
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
@@ -21,6 +28,21 @@ class TacoBot(commands.Bot):
         self.guilds_db = GuildsDatabase()
         super().__init__(command_prefix=self.get_prefix, intents=intents, case_insensitive=True)
         self.remove_command("help")
+        # one on_message listener for every cog; cogs register with a MessageInterest instead of their own listener
+        self.message_pipeline = MessagePipeline(self)
+        self.add_listener(self.message_pipeline.dispatch, "on_message")
+        # same for raw reactions; cogs register a ReactionInterest and get an on_reaction(ctx) call
+        self.reaction_router = ReactionRouter(self)
+        self.add_listener(self.reaction_router.dispatch, "on_raw_reaction_add")
+        self.add_listener(self.reaction_router.dispatch, "on_raw_reaction_remove")
+        # REST fetches shared by every DiscordHelper; gateway updates/deletes drop the affected entries
+        discordhelper.DiscordHelper.cache.listen(self)
+        # daily per-guild jobs (birthdays, ...); cogs add theirs in cog_load
+        self.scheduler = Scheduler(self)
+        self.fetch_cache_stats_seconds = float(
+            utils.dict_get(os.environ, "DISCORD_FETCH_CACHE_STATS_SECONDS", default_value="900")
+        )
+        self._fetch_cache_stats_task: typing.Optional[asyncio.Task] = None
 
         self.initDB()
 
@@ -33,7 +55,7 @@ class TacoBot(commands.Bot):
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", f"Logger initialized with level {log_level.name}")
 
     async def setup_hook(self) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Setup hook called")
         # cogs that dont start with an underscore are loaded
         cogs = [
@@ -54,42 +76,57 @@ class TacoBot(commands.Bot):
                 )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Setting up bot")
-        guilds = [int(g) for g in self.guilds_db.get_guild_ids()]
-        # guilds = [g for g in self.guilds]
-        for gid in guilds:
-            try:
-                # gid = guild.id
-                if self.settings.sync_app_commands:
-                    guild = discord.Object(id=gid)
-                    self.tree.clear_commands(guild=guild)
-                    self.log.debug(
-                        gid, f"{self._module}.{self._class}.{_method}", f"Clearing app commands for guild {gid}"
-                    )
-                    self.tree.copy_global_to(guild=guild)
-
-                    await self.tree.sync(guild=guild)
-                    self.log.debug(
-                        gid, f"{self._module}.{self._class}.{_method}", f"Synced app commands for guild {gid}"
-                    )
-                else:
-                    self.log.info(
-                        gid,
-                        f"{self._module}.{self._class}.{_method}",
-                        f"Skipping sync app commands for guild {gid} due to SYNC_APP_COMMANDS being false",
-                    )
-            except discord.errors.Forbidden as fe:
-                self.log.debug(
-                    gid, f"{self._module}.{self._class}.{_method}", f"Failed to sync app commands for guild {gid}: {fe}"
-                )
+        guilds = [int(g) for g in await executor.run(self.guilds_db.get_guild_ids)]
+        if self.settings.sync_app_commands:
+            await CommandSync(self).sync(guilds)
+        else:
+            self.log.info(
+                0,
+                f"{self._module}.{self._class}.{_method}",
+                f"Skipping sync app commands for {len(guilds)} guilds due to SYNC_APP_COMMANDS being false",
+            )
 
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Starting Healthcheck Server")
         self.healthcheck_server = await discordhealthcheck.start(self)
+        self.scheduler.start()
+        if self.fetch_cache_stats_seconds > 0:
+            self._fetch_cache_stats_task = asyncio.create_task(self._log_fetch_cache_stats())
+
+    async def close(self) -> None:
+        if self._fetch_cache_stats_task is not None:
+            self._fetch_cache_stats_task.cancel()
+        await self.scheduler.stop()
+        await super().close()
+        # let in-flight database calls finish, then flush buffered tracking documents and log records
+        # before the process goes away
+        await asyncio.to_thread(executor.shutdown)
+        await asyncio.to_thread(WriteBuffer.shutdown)
+        await asyncio.to_thread(LogShipper.shutdown)
+
+    async def _log_fetch_cache_stats(self) -> None:
+        """Log the shared fetch cache's hit rates every ``DISCORD_FETCH_CACHE_STATS_SECONDS`` (0 disables)."""
+        _method = utils.get_method_name()
+        while True:
+            await asyncio.sleep(self.fetch_cache_stats_seconds)
+            stats = discordhelper.DiscordHelper.cache.stats()
+            kinds = ", ".join(
+                f"{kind} {counters['hit_rate']:.0%} (hits={counters['hits']} coalesced={counters['coalesced']} "
+                f"misses={counters['misses']} refreshes={counters['refreshes']})"
+                for kind, counters in sorted(stats["kinds"].items())
+            )
+            self.log.info(
+                0,
+                f"{self._module}.{self._class}.{_method}",
+                f"Fetch cache: hit rate {stats['hit_rate']:.0%}, {stats['entries']} entries, "
+                f"{stats['inflight']} in flight, {stats['evictions']} evictions, "
+                f"{stats['invalidations']} invalidations; {kinds or 'no lookups'}",
+            )
 
     def initDB(self) -> None:
         pass
 
     async def get_prefix(self, message) -> typing.List[str]:
-        _method: str = inspect.stack()[0][3]
+        _method: str = utils.get_method_name()
         # default prefixes
         # sets the prefixes, you can keep it as an array of only 1 item if you need only one prefix
         prefixes: typing.List[str] = [".taco ", "?taco ", "!taco "]
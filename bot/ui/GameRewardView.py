@@ -1,10 +1,9 @@
-import inspect
 import os
 import traceback
 import typing
 
 import discord
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
 from bot.ui.ExternalUrlButtonView import ExternalUrlButton
 
@@ -23,7 +22,7 @@ class GameRewardView(discord.ui.View):
         external_link: typing.Optional[str] = None,
     ):
         super().__init__(timeout=timeout)
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # get the file name without the extension and without the directory
         self._module = os.path.basename(__file__)[:-3]
         self.settings = settings.Settings()
@@ -66,7 +65,7 @@ class GameRewardView(discord.ui.View):
         pass
 
     async def reset_callback(self, interaction: discord.Interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # check if the user who clicked the button is the same as the user who started the command
         if interaction.user.id != self.ctx.author.id:
             return
@@ -79,7 +78,7 @@ class GameRewardView(discord.ui.View):
             self.stop()
 
     async def claim_callback(self, interaction: discord.Interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         # check if the user who clicked the button is the same as the user who started the command
         if interaction.user.id != self.ctx.author.id:
             return
@@ -97,5 +96,5 @@ class GameRewardView(discord.ui.View):
         pass
 
     async def on_error(self, error, item, interaction) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.error(self.ctx.guild.id, f"{self._module}.{_method}", str(error), traceback.format_exc())
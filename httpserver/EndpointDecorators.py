@@ -90,6 +90,7 @@ def _uri_route_decorator(
     http_method: HTTP_METHODS | list[Literal[HTTP_METHODS]],
     uri_variables: list[str] | None = None,
     auth_callback: types.FunctionType | None = None,
+    template: str | None = None,
 ):
     """Core decorator implementation.
 
@@ -105,6 +106,8 @@ def _uri_route_decorator(
         Ordered names extracted from a variable template path (only for variable mapping).
     auth_callback : FunctionType | None
         Optional authorization predicate or hook retained on the `UriRoute` object.
+    template : str | None
+        The `{variable}` template of a variable mapping, used by the router to match by segment.
 
     Returns
     -------
@@ -113,7 +116,7 @@ def _uri_route_decorator(
     """
 
     args_specs = inspect.getfullargspec(f)
-    route = UriRoute(path, http_method, uri_variables, args_specs.args, auth_callback)
+    route = UriRoute(path, http_method, uri_variables, args_specs.args, auth_callback, template)
 
     routes = getattr(f, '_http_routes', [])
     routes.append(route)
@@ -201,4 +204,4 @@ def uri_variable_mapping(path: str, method: HTTP_METHODS | list[Literal[HTTP_MET
     """
 
     uri_variables, uri_regex = _uri_variable_to_pattern(path)
-    return lambda f: _uri_route_decorator(f, uri_regex, method, uri_variables)
+    return lambda f: _uri_route_decorator(f, uri_regex, method, uri_variables, template=path)
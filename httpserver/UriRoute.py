@@ -30,6 +30,8 @@ class UriRoute:
     uri_variables: typing.Optional[list[str]]
     call_args: list[str]
     auth_callback: typing.Optional[types.FunctionType] = None
+    # the `{variable}` template a variable route was declared with; the router splits it into segments
+    template: typing.Optional[str] = None
 
     def is_static(self) -> bool:
         return not isinstance(self.path, re.Pattern)
@@ -0,0 +1,158 @@
+"""Negotiated response compression used by :class:`httpserver.server.HttpServer`.
+
+The client's ``Accept-Encoding`` header is matched against the codecs the standard library provides
+(``gzip`` and ``deflate``). The response body is compressed when it has a text-like ``Content-Type`` and is
+at least ``min_size`` bytes long. Smaller bodies are sent as they are; compressing a few hundred bytes costs
+more time than it saves on the wire.
+
+Handlers that serve the same static document on every request (e.g. the swagger YAML) can compress it once
+with :func:`precompress` and return the variants in ``HttpResponse.encoded_bodies``. The server then picks
+the negotiated variant instead of compressing the body again.
+"""
+
+import gzip
+import typing
+import zlib
+
+from bot.lib.mongodb import executor
+from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
+
+MIN_SIZE = 1024
+LEVEL = 6
+# bodies this large are compressed on the executor so a big batch response does not stall the event loop
+OFFLOAD_SIZE = 256 * 1024
+
+CODECS: typing.Dict[str, typing.Callable[[bytes, int], bytes]] = {
+    # mtime=0 keeps the output identical for identical bodies
+    "gzip": lambda body, level: gzip.compress(body, compresslevel=level, mtime=0),
+    # HTTP "deflate" is the zlib format, not a raw deflate stream
+    "deflate": lambda body, level: zlib.compress(body, level),
+}
+# server preference when the client rates several codings the same
+PREFERENCE = ("gzip", "deflate")
+
+_COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "application/yaml",
+        "application/x-yaml",
+        "image/svg+xml",
+    }
+)
+
+
+def is_compressible(content_type: typing.Optional[str]) -> bool:
+    if not content_type:
+        return False
+    mime = content_type.split(";", 1)[0].strip().lower()
+    return mime.startswith("text/") or mime in _COMPRESSIBLE_TYPES or mime.endswith(("+json", "+xml"))
+
+
+def negotiate(
+    accept_encoding: typing.Optional[str], available: typing.Iterable[str] = PREFERENCE
+) -> typing.Optional[str]:
+    """The coding to respond with for an ``Accept-Encoding`` value, or ``None`` for the identity coding.
+
+    Codings with ``q=0`` are refused, ``*`` stands for every coding not listed, and ties go to the first
+    coding in ``available``.
+    """
+    if not accept_encoding:
+        return None
+    weights: typing.Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+
+    best, best_weight = None, 0.0
+    for coding in available:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def precompress(body: bytes, level: int = 9, codings: typing.Iterable[str] = PREFERENCE) -> typing.Dict[str, bytes]:
+    """Every ``codings`` variant of a static body, for ``HttpResponse.encoded_bodies``."""
+    return {coding: CODECS[coding](body, level) for coding in codings}
+
+
+class ResponseCompressor:
+    def __init__(self, min_size: int = MIN_SIZE, level: int = LEVEL, enabled: bool = True) -> None:
+        self.min_size = min_size
+        self.level = level
+        self.enabled = enabled
+
+    def _eligible(self, response: HttpResponse, headers: HttpHeaders) -> bool:
+        if not response.body or response.status_code < 200 or response.status_code in (204, 304):
+            return False
+        if headers.get("content-encoding") is not None:
+            return False
+        if "no-transform" in (headers.get("cache-control") or "").lower():
+            return False
+        if not is_compressible(headers.get("content-type")):
+            return False
+        return bool(response.encoded_bodies) or len(response.body) >= self.min_size
+
+    async def compress(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """The response to send for ``request``: ``response`` itself, or a copy with an encoded body.
+
+        ``response.headers`` must already be an ``HttpHeaders``; it is copied, never changed.
+        """
+        headers = response.headers
+        if not self.enabled or not isinstance(headers, HttpHeaders) or not self._eligible(response, headers):
+            return response
+
+        available = tuple(response.encoded_bodies) if response.encoded_bodies else PREFERENCE
+        coding = negotiate(request.headers.get("accept-encoding"), available)
+
+        out_headers = HttpHeaders()
+        out_headers.merge(headers)
+        # the body depends on Accept-Encoding even when it goes out uncompressed
+        vary = headers.get("vary")
+        if not vary:
+            out_headers.set("Vary", "Accept-Encoding")
+        elif "accept-encoding" not in vary.lower():
+            out_headers.set("Vary", f"{vary}, Accept-Encoding")
+
+        if coding is None:
+            return HttpResponse(response.status_code, out_headers, response.body)
+        if response.encoded_bodies:
+            body = response.encoded_bodies[coding]
+        elif len(response.body) >= OFFLOAD_SIZE:
+            body = await executor.run(CODECS[coding], response.body, self.level)
+        else:
+            body = CODECS[coding](response.body, self.level)
+        if len(body) >= len(response.body):
+            return HttpResponse(response.status_code, out_headers, response.body)
+        out_headers.set("Content-Encoding", coding)
+        etag = out_headers.get("etag")
+        if etag and etag.endswith('"'):
+            # a strong ETag names one representation, and every coding is a different one
+            out_headers.set("ETag", f'{etag[:-1]}-{coding}"')
+        return HttpResponse(response.status_code, out_headers, body)
+
+    async def precompress_response(self, response: HttpResponse) -> None:
+        """Fill ``response.encoded_bodies`` with every codec, so a response that is cached is compressed once."""
+        if isinstance(response.headers, HttpHeaders):
+            headers = response.headers
+        else:
+            headers = HttpHeaders.from_dict(response.headers or {})
+        if not self.enabled or response.encoded_bodies or not self._eligible(response, headers):
+            return
+        if len(response.body) >= OFFLOAD_SIZE:
+            response.encoded_bodies = await executor.run(precompress, response.body, self.level)
+        else:
+            response.encoded_bodies = precompress(response.body, self.level)
@@ -17,7 +17,6 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
 import os
 import typing
 from collections.abc import Generator, KeysView
@@ -26,7 +25,7 @@ from http import HTTPMethod, HTTPStatus
 from time import monotonic
 from urllib.parse import parse_qs
 
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
 
 
@@ -106,6 +105,8 @@ class HttpResponse:
     headers: HttpHeaders | None | dict[str, str] = None
     body: bytes | None = None
     file_path: str | None = None
+    # precompressed variants of ``body`` keyed by content coding; see httpserver/compression.py
+    encoded_bodies: dict[str, bytes] | None = None
 
 
 def _clean_path(path):
@@ -125,47 +126,150 @@ def _parse_path(path):
     return path[:index], parse_qs(path[index + 1 :])
 
 
-async def http_parser(
-    reader: asyncio.StreamReader, timeout: float, http_trace: bool = False
-) -> typing.Optional[HttpRequest]:
-    line = await asyncio.wait_for(reader.readuntil(b'\r\n'), timeout)
-    if not line:
-        return None
+# request limits; HttpServer passes its configured values
+MAX_HEADER_BYTES = 16 * 1024
+MAX_HEADERS = 100
+MAX_BODY_BYTES = 10 * 1024 * 1024
+_HEX_DIGITS = b'0123456789abcdefABCDEF'
 
-    http_dump = HttpDebugDump()
-    words = line.decode().split()
 
-    method, path, version = (words[0], words[1], words[2])
-    path = _clean_path(path)
-    path, query_params = _parse_path(path)
+class HttpParseError(Exception):
+    """A request that cannot be served. ``status_code`` is the response to send before closing."""
 
-    headers = HttpHeaders()
-    while True:
-        line = await asyncio.wait_for(reader.readuntil(b'\r\n'), timeout)
-        if not line or line == b'\r\n':
-            break
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
 
-        key, value = line.decode().split(': ', 1)
-        headers.add(key.strip(), value.strip())
 
-    content_length = headers.get('content-length', -1, int)
+async def http_parser(
+    reader: asyncio.StreamReader,
+    timeout: float,
+    http_trace: bool = False,
+    *,
+    max_header_bytes: int = MAX_HEADER_BYTES,
+    max_headers: int = MAX_HEADERS,
+    max_body_bytes: int = MAX_BODY_BYTES,
+    idle_timeout: typing.Optional[float] = None,
+) -> typing.Optional[HttpRequest]:
+    """Read one request from ``reader``, or return ``None`` if the client closed the connection.
+
+    The whole request (request line, headers and body) must arrive within ``timeout`` seconds. The head is
+    read with a single ``readuntil`` and parsed in one pass; bodies are read by ``Content-Length`` or
+    ``Transfer-Encoding: chunked``. Malformed or oversized requests raise ``HttpParseError``.
+
+    With ``idle_timeout`` (keep-alive connections between requests), the parser first waits up to that long
+    for the request to start and returns ``None`` if it does not; ``timeout`` then runs from the first byte.
+    """
+    prefix = b''
+    if idle_timeout is not None:
+        try:
+            prefix = await asyncio.wait_for(reader.read(1), idle_timeout)
+        except (TimeoutError, asyncio.TimeoutError):
+            return None
+        if not prefix:
+            return None
+    request = await asyncio.wait_for(
+        _read_request(reader, max_header_bytes, max_headers, max_body_bytes, prefix), timeout
+    )
+    if request is not None and http_trace:
+        HttpDebugDump().dump_http_request(request)
+    return request
+
 
-    if content_length and content_length > 0:
-        body = await asyncio.wait_for(reader.readexactly(content_length), timeout)
+async def _read_request(
+    reader: asyncio.StreamReader, max_header_bytes: int, max_headers: int, max_body_bytes: int, prefix: bytes = b''
+) -> typing.Optional[HttpRequest]:
+    try:
+        head = prefix + await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError as e:
+        if not (prefix + e.partial).strip():
+            # closed between requests
+            return None
+        raise
+    except asyncio.LimitOverrunError:
+        raise HttpParseError(431, 'request head too large')
+    if len(head) > max_header_bytes:
+        raise HttpParseError(431, 'request head too large')
+
+    try:
+        lines = head[:-4].decode().split('\r\n')
+    except UnicodeDecodeError:
+        raise HttpParseError(400, 'request head is not valid UTF-8')
+
+    words = lines[0].split(' ')
+    if len(words) != 3 or not words[0].isalpha() or not words[1] or not words[2].startswith('HTTP/1.'):
+        raise HttpParseError(400, 'malformed request line')
+    method, path, version = words
+    path, query_params = _parse_path(_clean_path(path))
+
+    if len(lines) - 1 > max_headers:
+        raise HttpParseError(431, 'too many headers')
+    headers = HttpHeaders()
+    for line in lines[1:]:
+        key, sep, value = line.partition(':')
+        if not sep or not key or key != key.strip() or ' ' in key:
+            raise HttpParseError(400, 'malformed header line')
+        headers.add(key, value.strip())
+
+    transfer_encoding = headers.get('transfer-encoding')
+    content_lengths = headers.get_list('content-length')
+    if transfer_encoding is not None:
+        if content_lengths:
+            raise HttpParseError(400, 'both Content-Length and Transfer-Encoding given')
+        if transfer_encoding.lower() != 'chunked':
+            raise HttpParseError(501, f'unsupported transfer encoding {transfer_encoding}')
+        body = await _read_chunked_body(reader, max_body_bytes, max_headers)
+    elif content_lengths:
+        if len(set(content_lengths)) != 1 or not content_lengths[0].isdigit():
+            raise HttpParseError(400, 'invalid Content-Length')
+        content_length = int(content_lengths[0])
+        if content_length > max_body_bytes:
+            raise HttpParseError(413, 'request body too large')
+        body = await reader.readexactly(content_length) if content_length > 0 else None
     else:
         body = None
 
-    request = HttpRequest(monotonic(), method, path, query_params, version, headers, body)
-    if http_trace:
-        http_dump.dump_http_request(request)
-    return request
+    return HttpRequest(monotonic(), method, path, query_params, version, headers, body)
+
+
+async def _read_chunked_body(
+    reader: asyncio.StreamReader, max_body_bytes: int, max_headers: int
+) -> typing.Optional[bytes]:
+    body = bytearray()
+    while True:
+        try:
+            line = await reader.readuntil(b'\r\n')
+        except asyncio.LimitOverrunError:
+            raise HttpParseError(400, 'chunk size line too long')
+        size_text = line[:-2].split(b';', 1)[0].strip()
+        # int() alone would also take signs, "0x" and underscores
+        if not size_text or len(size_text) > 16 or size_text.strip(_HEX_DIGITS):
+            raise HttpParseError(400, 'invalid chunk size')
+        size = int(size_text, 16)
+        if size == 0:
+            break
+        if len(body) + size > max_body_bytes:
+            raise HttpParseError(413, 'request body too large')
+        chunk = await reader.readexactly(size + 2)
+        if chunk[-2:] != b'\r\n':
+            raise HttpParseError(400, 'chunk not terminated by CRLF')
+        body += memoryview(chunk)[:-2]
+
+    # trailers are not used; read up to the blank line that ends them
+    for _ in range(max_headers + 1):
+        try:
+            line = await reader.readuntil(b'\r\n')
+        except asyncio.LimitOverrunError:
+            raise HttpParseError(431, 'trailer line too long')
+        if line == b'\r\n':
+            return bytes(body) if body else None
+    raise HttpParseError(431, 'too many trailers')
 
 
 async def http_send_response(
     writer: asyncio.StreamWriter, request: HttpRequest, response: HttpResponse, http_trace: bool = False
 ) -> HttpRequest:
     http_status = HTTPStatus(response.status_code)
-    http_dump = HttpDebugDump()
 
     if response.headers and isinstance(response.headers, dict):
         headers: HttpHeaders = HttpHeaders.from_dict(response.headers)
@@ -179,10 +283,12 @@ async def http_send_response(
         content_length = len(response.body)
     elif response.file_path:
         content_length = os.stat(response.file_path).st_size
-    headers.set('content-length', content_length)
+    # a 304 has no body; a Content-Length of 0 would describe the cached representation wrongly
+    if http_status != HTTPStatus.NOT_MODIFIED:
+        headers.set('content-length', content_length)
 
     if http_trace:
-        http_dump.dump_http_response(request, response)
+        HttpDebugDump().dump_http_response(request, response)
 
     writer.write(f'HTTP/1.1 {http_status.value} {http_status.phrase}\r\n'.encode('utf-8'))
     for key, value in headers.items():
@@ -217,7 +323,7 @@ class HttpDebugDump:
         headers: typing.Optional[typing.Union[HttpHeaders, dict[str, str]]],
         body: typing.Optional[bytes],
     ):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         content_type = headers.get('content-type', None) if headers else None
         if body:
             if content_type and content_type.startswith('text/') or content_type == 'application/json':
@@ -228,7 +334,7 @@ class HttpDebugDump:
             self.log.debug(0, f"{self._module}.{self._class}.{_method}", f"{tag}: length:0 NO-BODY")
 
     def dump_http_request(self, request: HttpRequest):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", f'REQUEST: {request.method} {request.path}')
         self.log.debug(
             0, f"{self._module}.{self._class}.{_method}", f'REQUEST-HEADERS: {dict(request.headers.items())}'
@@ -236,7 +342,7 @@ class HttpDebugDump:
         self._dump_http_body('REQUEST-HEADERS', request.headers, request.body)
 
     def dump_http_response(self, request: HttpRequest, response: HttpResponse):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(
             0,
             f"{self._module}.{self._class}.{_method}",
@@ -0,0 +1,271 @@
+"""In-memory response cache and conditional GET support for :class:`httpserver.server.HttpServer`.
+
+GET handlers opt in with :func:`cache_response`::
+
+    @uri_mapping("/api/v1/minecraft/whitelist.json", method=HTTPMethod.GET)
+    @cache_response(ttl=60, tags=("minecraft.users",))
+    def minecraft_whitelist(self, request): ...
+
+A ``200`` response from such a handler is kept for ``ttl`` seconds. The key is made of the handler, the
+route variables, the query string and the request's auth headers, so every alias path of a handler shares
+one entry and callers with different tokens never see each other's responses. Every cached response carries
+a strong ``ETag``. A request whose ``If-None-Match`` matches it is answered ``304`` without calling the
+handler. Concurrent misses for the same key wait for one handler call.
+
+Code that changes the data behind a cached response calls ``ResponseCache.get_instance().invalidate(tag)``
+with a tag the handler declared; DAO write methods use ``BaseDatabase.invalidate_responses(tag)``.
+Invalidation is safe from executor threads. Handlers that check a token must also declare ``"settings"``:
+a cache hit skips the handler, so a rotated token is only enforced once the entry is dropped. Responses
+cached for requests with auth headers get the tag either way.
+"""
+
+import asyncio
+import collections
+import hashlib
+import os
+import threading
+import time
+import typing
+from dataclasses import dataclass
+
+from bot.lib import utils
+from httpserver import compression
+from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
+
+# headers that decide what a caller is allowed to see; they are part of every cache key
+AUTH_HEADERS = ("authorization", "x-tacobot-token", "x-auth-token")
+# tokens are validated against settings, so rotating one is a settings write: responses cached for a
+# request that carried auth headers are always dropped with this tag
+AUTH_TAG = "settings"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: float
+    tags: typing.Tuple[str, ...] = ()
+
+
+def cache_response(ttl: float, tags: typing.Iterable[str] = ()):
+    """Cache the handler's ``200`` GET responses for ``ttl`` seconds; ``tags`` name what invalidates them.
+
+    The function is not wrapped, so it can be combined with the route and ``openapi`` decorators in any order.
+    """
+
+    def decorator(f):
+        f._http_cache = CachePolicy(ttl, tuple(tags))
+        return f
+
+    return decorator
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: typing.Optional[str], etag: str) -> typing.Optional[str]:
+    """The tag from ``If-None-Match`` that matches ``etag``, or ``None``.
+
+    ``If-None-Match`` uses weak comparison, and compressed responses carry ``etag`` with a ``-<coding>``
+    suffix (see ``httpserver.compression``), so both forms match.
+    """
+    if not if_none_match:
+        return None
+    opaque = etag.strip('"')
+    suffixed = {f"{opaque}-{coding}" for coding in compression.PREFERENCE}
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return etag
+        value = candidate[2:] if candidate.startswith("W/") else candidate
+        value = value.strip('"')
+        if value == opaque or value in suffixed:
+            return candidate
+    return None
+
+
+@dataclass
+class _Entry:
+    expires: float
+    tags: typing.Tuple[str, ...]
+    status_code: int
+    headers: HttpHeaders
+    body: bytes
+    encoded_bodies: typing.Optional[typing.Dict[str, bytes]]
+    etag: str
+
+    def response(self) -> HttpResponse:
+        # a fresh header set per response: the server merges default headers into it
+        headers = HttpHeaders()
+        headers.merge(self.headers)
+        return HttpResponse(self.status_code, headers, self.body, encoded_bodies=self.encoded_bodies)
+
+
+class ResponseCache:
+    """LRU of handler responses, bounded to ``max_entries``. A ``max_entries`` of 0 or less disables it.
+
+    ``generation`` increases on every invalidation; a response produced while an invalidation ran is
+    returned to its caller but not stored.
+    """
+
+    _instance: typing.Optional["ResponseCache"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = 512, clock: typing.Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[tuple, _Entry]" = collections.OrderedDict()
+        # only touched on the event loop
+        self._inflight: typing.Dict[tuple, asyncio.Future] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    @classmethod
+    def get_instance(cls) -> "ResponseCache":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        max_entries=int(utils.dict_get(os.environ, "HTTP_RESPONSE_CACHE_SIZE", default_value="512"))
+                    )
+        return cls._instance
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def key(self, request: HttpRequest, handler: typing.Callable, uri_variables: typing.Optional[dict]) -> tuple:
+        scope = "\0".join(request.headers.get(name) or "" for name in AUTH_HEADERS)
+        return (
+            f"{getattr(handler, '__module__', '')}.{getattr(handler, '__qualname__', repr(handler))}",
+            tuple(sorted((uri_variables or {}).items())),
+            tuple(sorted((name, tuple(values)) for name, values in request.query_params.items())),
+            # hashed so tokens are not kept in memory as plain text
+            hashlib.sha256(scope.encode("utf-8")).hexdigest() if scope.strip("\0") else "",
+        )
+
+    def get(self, key: tuple) -> typing.Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self, key: tuple, policy: CachePolicy, response: HttpResponse, generation: typing.Optional[int] = None
+    ) -> typing.Optional[_Entry]:
+        """Store a ``200`` response; ``None`` if it cannot be cached or ``generation`` is out of date."""
+        if not self.enabled or response.status_code != 200 or response.body is None or response.file_path:
+            return None
+        if isinstance(response.headers, HttpHeaders):
+            headers = HttpHeaders()
+            headers.merge(response.headers)
+        else:
+            headers = HttpHeaders.from_dict(response.headers or {})
+        body = bytes(response.body)
+        etag = headers.get("etag") or make_etag(body)
+        headers.set("ETag", etag)
+        entry = _Entry(
+            self._clock() + policy.ttl,
+            policy.tags,
+            response.status_code,
+            headers,
+            body,
+            response.encoded_bodies,
+            etag,
+        )
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return None
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every entry declared with one of ``tags``; returns how many were dropped."""
+        wanted = set(tags)
+        with self._lock:
+            self.generation += 1
+            keys = [key for key, entry in self._entries.items() if wanted.intersection(entry.tags)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "not_modified": self.not_modified,
+                "invalidations": self.invalidations,
+            }
+
+    async def serve(
+        self,
+        request: HttpRequest,
+        handler: typing.Callable,
+        uri_variables: typing.Optional[dict],
+        policy: CachePolicy,
+        produce: typing.Callable[[], typing.Awaitable[HttpResponse]],
+    ) -> HttpResponse:
+        """The response for ``request``: ``304``, a cached copy, or whatever ``produce`` returns."""
+        if not self.enabled:
+            return await produce()
+        key = self.key(request, handler, uri_variables)
+        if key[-1] and AUTH_TAG not in policy.tags:
+            policy = CachePolicy(policy.ttl, policy.tags + (AUTH_TAG,))
+        entry = self.get(key)
+        if entry is None:
+            entry = await self._fill(key, policy, produce)
+            if isinstance(entry, HttpResponse):
+                return entry
+
+        matched = etag_matches(request.headers.get("if-none-match"), entry.etag)
+        if matched is not None:
+            with self._lock:
+                self.not_modified += 1
+            return HttpResponse(304, HttpHeaders().set("ETag", matched))
+        return entry.response()
+
+    async def _fill(
+        self, key: tuple, policy: CachePolicy, produce: typing.Callable[[], typing.Awaitable[HttpResponse]]
+    ) -> typing.Union[_Entry, HttpResponse]:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            with self._lock:
+                self.coalesced += 1
+            entry = await asyncio.shield(inflight)
+            # the first caller's response could not be cached (an error, or invalidated meanwhile)
+            return entry if entry is not None else await produce()
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        entry = None
+        try:
+            generation = self.generation
+            response = await produce()
+            entry = self.put(key, policy, response, generation)
+            return entry if entry is not None else response
+        finally:
+            self._inflight.pop(key, None)
+            future.set_result(entry)
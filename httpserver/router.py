@@ -0,0 +1,130 @@
+"""Segment-tree router used by :class:`httpserver.server.HttpServer`.
+
+Routes registered with ``uri_mapping`` go into a dict keyed by method and path. Routes registered with
+``uri_variable_mapping`` are split on ``/`` into a tree. Each node has literal children, segment-pattern
+children (segments that mix text and variables, e.g. ``{name}.json``) and at most one whole-segment
+variable child. A lookup walks the tree once, so its cost grows with the number of path segments and not
+with the number of routes. The variable values are collected on the way down, so handlers do not have to
+re-run the route regex.
+
+At each node, literal segments are tried before patterns and patterns before variables. The walk backs up
+when a branch has no route for the path and method. Raw ``uri_pattern_mapping`` regexes cannot be split
+into segments; they are tried in registration order after the tree.
+"""
+
+import re
+import typing
+
+from httpserver.UriRoute import UriRoute
+
+RouteMatch = typing.Tuple[typing.Optional[UriRoute], typing.Optional[typing.Callable], typing.Dict[str, str]]
+
+_VARIABLE = re.compile(r'\{(.*?)\}')
+
+
+class _Node:
+    __slots__ = ("literals", "patterns", "variable", "handlers")
+
+    def __init__(self) -> None:
+        self.literals: typing.Dict[str, "_Node"] = {}
+        self.patterns: typing.List[typing.Tuple[re.Pattern, "_Node"]] = []
+        self.variable: typing.Optional["_Node"] = None
+        # http method -> (route, handler); the first registration for a method wins
+        self.handlers: typing.Dict[str, typing.Tuple[UriRoute, typing.Callable]] = {}
+
+
+def _segment_pattern(segment: str) -> re.Pattern:
+    parts = []
+    last_index = 0
+    for m in _VARIABLE.finditer(segment):
+        start, end = m.span()
+        parts.append(re.escape(segment[last_index:start]))
+        parts.append('([^/]*)')
+        last_index = end
+    parts.append(re.escape(segment[last_index:]))
+    return re.compile(''.join(parts))
+
+
+class Router:
+    def __init__(self) -> None:
+        self._static: typing.Dict[typing.Tuple[str, str], typing.Tuple[UriRoute, typing.Callable]] = {}
+        self._root = _Node()
+        self._regex: typing.List[typing.Tuple[UriRoute, typing.Callable]] = []
+
+    def add(self, route: UriRoute, handler: typing.Callable) -> None:
+        if route.is_static():
+            for http_method in route.http_methods():
+                self._static.setdefault((str(http_method), typing.cast(str, route.path)), (route, handler))
+        elif route.template is not None:
+            node = self._root
+            for segment in route.template.split('/'):
+                node = self._child(node, segment)
+            for http_method in route.http_methods():
+                node.handlers.setdefault(str(http_method), (route, handler))
+        else:
+            self._regex.append((route, handler))
+
+    def find(self, http_method: str, path: str) -> RouteMatch:
+        """Return ``(route, handler, uri_variables)``, or ``(None, None, {})`` when nothing matches."""
+        mapping = self._static.get((http_method, path))
+        if mapping is not None:
+            return mapping[0], mapping[1], {}
+
+        values: typing.List[str] = []
+        found = self._walk(self._root, path.split('/'), 0, http_method, values)
+        if found is not None:
+            route, handler = found
+            return route, handler, dict(zip(route.uri_variables or [], values))
+
+        for route, handler in self._regex:
+            if http_method not in route.http_methods():
+                continue
+            m = typing.cast(re.Pattern, route.path).match(path)
+            if m is not None:
+                return route, handler, m.groupdict()
+        return None, None, {}
+
+    def _child(self, node: _Node, segment: str) -> _Node:
+        m = _VARIABLE.fullmatch(segment)
+        if m is not None and '{' not in m.group(1):
+            if node.variable is None:
+                node.variable = _Node()
+            return node.variable
+        if '{' in segment:
+            pattern = _segment_pattern(segment)
+            for existing, child in node.patterns:
+                if existing.pattern == pattern.pattern:
+                    return child
+            child = _Node()
+            node.patterns.append((pattern, child))
+            return child
+        return node.literals.setdefault(segment, _Node())
+
+    def _walk(
+        self, node: _Node, segments: typing.List[str], index: int, http_method: str, values: typing.List[str]
+    ) -> typing.Optional[typing.Tuple[UriRoute, typing.Callable]]:
+        if index == len(segments):
+            return node.handlers.get(http_method)
+
+        segment = segments[index]
+        child = node.literals.get(segment)
+        if child is not None:
+            found = self._walk(child, segments, index + 1, http_method, values)
+            if found is not None:
+                return found
+        for pattern, child in node.patterns:
+            m = pattern.fullmatch(segment)
+            if m is None:
+                continue
+            values.extend(m.groups())
+            found = self._walk(child, segments, index + 1, http_method, values)
+            if found is not None:
+                return found
+            del values[len(values) - len(m.groups()) :]
+        if node.variable is not None:
+            values.append(segment)
+            found = self._walk(node.variable, segments, index + 1, http_method, values)
+            if found is not None:
+                return found
+            values.pop()
+        return None
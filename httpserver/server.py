@@ -25,14 +25,26 @@ import traceback
 import types
 import typing
 from collections.abc import Generator
+from time import monotonic
 
-from bot.lib import logger, settings
+from bot.lib import logger, settings, utils
 from bot.lib.enums import loglevel
-from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse, http_parser, http_send_response
+from bot.lib.mongodb import executor
+from httpserver import compression, http_util
+from httpserver.http_util import (
+    HttpHeaders,
+    HttpParseError,
+    HttpRequest,
+    HttpResponse,
+    http_parser,
+    http_send_response,
+)
+from httpserver.response_cache import ResponseCache
+from httpserver.router import Router
 from httpserver.UriRoute import UriRoute
 
 
-def _convert_params(request: HttpRequest, route: UriRoute, method):
+def _convert_params(request: HttpRequest, route: UriRoute, method, uri_variables: dict[str, str] | None = None):
     args_index = 0 if isinstance(method, types.FunctionType) else 1  # skip 'self'
     args = []
     for param_name in route.call_args[args_index:]:
@@ -49,9 +61,10 @@ def _convert_params(request: HttpRequest, route: UriRoute, method):
         elif param_name == 'auth_callback':
             args.append(route.auth_callback)
         elif param_name == 'uri_variables':
-            if len(route.uri_variables) == 1:
+            # normally captured by the router while matching; otherwise extract them from the route regex
+            if uri_variables is None and len(route.uri_variables) == 1:
                 uri_variables = dict(zip(route.uri_variables, re.findall(route.path, request.path)))
-            else:
+            elif uri_variables is None:
                 uri_variables = dict(zip(route.uri_variables, re.findall(route.path, request.path)[0]))
             args.append(uri_variables)
         else:
@@ -84,11 +97,37 @@ class HttpServer:
         self._module = os.path.basename(__file__)[:-3]
 
         self.read_timeout = 10.0
+        self.max_header_bytes = int(
+            utils.dict_get(os.environ, "HTTP_MAX_HEADER_BYTES", default_value=str(http_util.MAX_HEADER_BYTES))
+        )
+        self.max_headers = int(utils.dict_get(os.environ, "HTTP_MAX_HEADERS", default_value=str(http_util.MAX_HEADERS)))
+        self.max_body_bytes = int(
+            utils.dict_get(os.environ, "HTTP_MAX_BODY_BYTES", default_value=str(http_util.MAX_BODY_BYTES))
+        )
+        # connection management; see docs/http/server.md
+        self.max_connections = int(utils.dict_get(os.environ, "HTTP_MAX_CONNECTIONS", default_value="256"))
+        self.keepalive_timeout = float(utils.dict_get(os.environ, "HTTP_KEEPALIVE_TIMEOUT", default_value="5"))
+        self.max_requests_per_connection = int(
+            utils.dict_get(os.environ, "HTTP_MAX_REQUESTS_PER_CONNECTION", default_value="100")
+        )
+        self.shutdown_grace = float(utils.dict_get(os.environ, "HTTP_SHUTDOWN_GRACE", default_value="10"))
+        self._compressor = compression.ResponseCompressor(
+            min_size=int(
+                utils.dict_get(os.environ, "HTTP_COMPRESSION_MIN_BYTES", default_value=str(compression.MIN_SIZE))
+            ),
+            level=int(utils.dict_get(os.environ, "HTTP_COMPRESSION_LEVEL", default_value=str(compression.LEVEL))),
+            enabled=utils.str2bool(utils.dict_get(os.environ, "HTTP_COMPRESSION_ENABLED", default_value="true")),
+        )
         self._default_response_headers = HttpHeaders()
-        self._static_routes = {}
-        self._regex_routes = []
+        self._router = Router()
+        # shared, so DAO writes can invalidate cached responses; see httpserver/response_cache.py
+        self._response_cache = ResponseCache.get_instance()
         self._server = None
         self._debug_http = True
+        # connection task -> True while it is handling a request, False while idle between requests
+        self._connections: dict[asyncio.Task, bool] = {}
+        self._closing = False
+        self.rejected_connections = 0
 
         self.settings = settings.Settings()
         log_level = loglevel.LogLevel[self.settings.log_level.upper()]
@@ -110,23 +149,22 @@ class HttpServer:
         self._default_response_headers.merge(headers)
 
     def add_handler(self, handler):
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", f'Register handler {handler}')
         for method, route in _scan_handler_for_uri_routes(handler):
+            self._router.add(route, method)
             if route.is_static():
                 for http_method in route.http_methods():
-                    self._static_routes[f'{http_method}:{route.path}'] = (route, method)
                     self.log.debug(
                         0,
                         f"{self._module}.{self._class}.{_method}",
                         f'Register static route {http_method} {route.path} to {method}',
                     )
             else:
-                self._regex_routes.append((route, method))
                 self.log.debug(
                     0,
                     f"{self._module}.{self._class}.{_method}",
-                    f'Register regex route {route.http_method} {route.path} to {method}',
+                    f'Register regex route {route.http_method} {route.template or route.path} to {method}',
                 )
 
     async def is_running(self):
@@ -136,12 +174,40 @@ class HttpServer:
         if self._server is not None:
             raise RuntimeError('Server already started')
 
-        self._server = await asyncio.start_server(self._handle_client, host, port)
+        self._closing = False
+        # the stream buffer never needs to hold more than one request head (or chunk size line)
+        self._server = await asyncio.start_server(self._handle_client, host, port, limit=self.max_header_bytes)
 
     async def close(self):
-        if self._server is not None:
-            self._server.close()
-            self._server = None
+        """Stop accepting connections and drain the open ones.
+
+        Idle keep-alive connections are closed right away. Requests in progress get up to ``shutdown_grace``
+        seconds to finish (their responses carry ``Connection: close``); whatever is left is cancelled.
+        """
+        if self._server is None:
+            return
+        self._closing = True
+        self._server.close()
+        self._server = None
+        for task, busy in list(self._connections.items()):
+            if not busy:
+                task.cancel()
+        busy_tasks = [task for task, busy in self._connections.items() if busy]
+        if busy_tasks:
+            _, pending = await asyncio.wait(busy_tasks, timeout=self.shutdown_grace)
+            for task in pending:
+                task.cancel()
+        if self._connections:
+            await asyncio.wait(list(self._connections), timeout=1)
+
+    def connection_stats(self) -> dict:
+        busy = sum(1 for active in self._connections.values() if active)
+        return {
+            "open": len(self._connections),
+            "busy": busy,
+            "idle": len(self._connections) - busy,
+            "rejected": self.rejected_connections,
+        }
 
     async def serve_forever(self):
         if self._server is None:
@@ -159,24 +225,48 @@ class HttpServer:
         return ', '.join(str(sock.getsockname()) for sock in self._server.sockets)
 
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
-        _method = inspect.stack()[0][3]
+        _method = utils.get_method_name()
+        if self._closing or len(self._connections) >= self.max_connections:
+            await self._reject_connection(reader, writer)
+            return
+
+        task = asyncio.current_task()
+        self._connections[task] = False
+        handled = 0
         try:
             while True:
-                request = await http_parser(reader, self.read_timeout, self._debug_http)
+                try:
+                    request = await http_parser(
+                        reader,
+                        self.read_timeout,
+                        self._debug_http,
+                        max_header_bytes=self.max_header_bytes,
+                        max_headers=self.max_headers,
+                        max_body_bytes=self.max_body_bytes,
+                        # the first request must arrive within read_timeout; later ones may idle for a while
+                        idle_timeout=self.keepalive_timeout if handled else None,
+                    )
+                except HttpParseError as e:
+                    self.log.warn(0, f"{self._module}.{self._class}.{_method}", f"rejected request: {e}")
+                    await self._send_connection_error(writer, e.status_code)
+                    break
                 if request is None:
                     break
+                self._connections[task] = True
+                handled += 1
+                close = not self._keep_alive(request, handled)
                 self.log.debug(
                     0, f"{self._module}.{self._class}.{_method}", f'received request {request.method} {request.path}'
                 )
 
-                route, method = self._find_route(request)
+                route, method, uri_variables = self._find_route(request)
                 if method:
                     self.log.debug(
                         0,
                         f"{self._module}.{self._class}.{_method}",
                         f"found matching route: '{route}'. calling method: '{method}'",
                     )
-                    await self._process_request(writer, route, method, request)
+                    await self._process_request(writer, route, method, request, uri_variables, close=close)
                 else:
                     self.log.warn(
                         0,
@@ -184,33 +274,110 @@ class HttpServer:
                         f"unable to find any matching route for {request.method} {request.path}",
                     )
                     response = self.build_http_404_response(request.method, request.path)
-                    await self._send_response(writer, request, response)
+                    await self._send_response(writer, request, response, close=close)
+                if close or self._closing:
+                    break
+                self._connections[task] = False
         except (ConnectionResetError, asyncio.IncompleteReadError):
             pass
+        except asyncio.CancelledError:
+            # close() cancelled the connection; finish normally so the stream callback does not report it
+            if not self._closing:
+                raise
         except (TimeoutError, asyncio.TimeoutError) as e:
             self.log.warn(0, f"{self._module}.{self._class}.{_method}", str(e))
         except Exception as e:
             self.log.error(0, f"{self._module}.{self._class}.{_method}", str(e), traceback.format_exc())
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+
+    def _keep_alive(self, request: HttpRequest, handled: int) -> bool:
+        if self._closing or handled >= self.max_requests_per_connection:
+            return False
+        connection = (request.headers.get('connection') or '').lower()
+        if request.version == 'HTTP/1.0':
+            return 'keep-alive' in connection
+        return 'close' not in connection
+
+    async def _reject_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer 503 without doing any work for the request, so clients back off instead of queueing."""
+        self.rejected_connections += 1
+        try:
+            # read the head first: closing with unread data makes the client see a reset instead of the 503
+            await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), min(self.read_timeout, 1.0))
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, TimeoutError, asyncio.TimeoutError):
+            pass
+        try:
+            await self._send_connection_error(writer, 503, HttpHeaders().set('Retry-After', '1'))
+        except (ConnectionResetError, BrokenPipeError):
+            pass
         finally:
             writer.close()
 
+    async def _send_connection_error(self, writer, status_code: int, headers: HttpHeaders | None = None) -> None:
+        # no usable request was read and the rest of the stream cannot be trusted, so the connection is closed
+        request = HttpRequest(monotonic(), '', '', {}, 'HTTP/1.1', HttpHeaders())
+        await self._send_response(writer, request, HttpResponse(status_code, headers), close=True)
+
     def build_http_404_response(self, _method: str, _path: str) -> HttpResponse:
         return HttpResponse(404)
 
     def build_http_500_response(self, _exception: Exception) -> HttpResponse:
         return HttpResponse(500)
 
-    async def _process_request(self, writer, route, method, request: HttpRequest):
-        _method = inspect.stack()[0][3]
+    async def _process_request(
+        self, writer, route, method, request: HttpRequest, uri_variables=None, close: bool = False
+    ):
+        denied = self._check_auth(route, request)
+        if denied is not None:
+            await self._send_response(writer, request, denied, close=close)
+            return
+
+        policy = getattr(method, '_http_cache', None)
+        if policy is not None and request.method in ('GET', 'HEAD'):
+
+            async def produce() -> HttpResponse:
+                response = await self._call_handler(route, method, request, uri_variables)
+                if response.status_code == 200:
+                    # compress once here instead of on every cache hit
+                    await self._compressor.precompress_response(response)
+                return response
+
+            response = await self._response_cache.serve(request, method, uri_variables, policy, produce)
+        else:
+            response = await self._call_handler(route, method, request, uri_variables)
+        await self._send_response(writer, request, response, close=close)
+
+    def _check_auth(self, route, request: HttpRequest) -> HttpResponse | None:
+        """Run the route's auth callback; return the response to send instead of the handler's, if any."""
+        if not route.auth_callback:
+            return None
+        _method = utils.get_method_name()
         try:
-            if route.auth_callback:
-                if not route.auth_callback(request):
-                    response = HttpResponse(401)
-                    await self._send_response(writer, request, response)
-                    return
-
-            args = _convert_params(request, route, method)
-            response = method(*args)
+            return None if route.auth_callback(request) else HttpResponse(401)
+        except HttpResponseException as e:
+            self.log.warn(0, f"{self._module}.{self._class}.{_method}", f"Failure during execution of request => {e}")
+            return e.response
+        except Exception as e:
+            self.log.error(
+                0,
+                f"{self._module}.{self._class}.{_method}",
+                f"Failure during execution of request => {request.method} {request.path} => {e}",
+                traceback.format_exc(),
+            )
+            return self.build_http_500_response(e)
+
+    async def _call_handler(self, route, method, request: HttpRequest, uri_variables=None) -> HttpResponse:
+        _method = utils.get_method_name()
+        try:
+            args = _convert_params(request, route, method, uri_variables)
+            if inspect.iscoroutinefunction(method):
+                response = await method(*args)
+            else:
+                # synchronous handlers do blocking MongoDB / HTTP work; keep it off the event loop.
+                # Handlers that read discord.py caches are async and only send their DAO calls here.
+                response = await executor.run(method, *args)
             if asyncio.iscoroutine(response):
                 response = await response
 
@@ -223,10 +390,10 @@ class HttpServer:
                     resp_headers = HttpHeaders()
                     resp_headers.set('Content-Type', 'application/json')
                     response = HttpResponse(200, resp_headers, body)
-            await self._send_response(writer, request, response)
+            return response
         except HttpResponseException as e:
             self.log.warn(0, f"{self._module}.{self._class}.{_method}", f"Failure during execution of request => {e}")
-            await self._send_response(writer, request, e.response)
+            return e.response
         except Exception as e:
             self.log.error(
                 0,
@@ -234,10 +401,9 @@ class HttpServer:
                 f"Failure during execution of request => {request.method} {request.path} => {e}",
                 traceback.format_exc(),
             )
-            response = self.build_http_500_response(e)
-            await self._send_response(writer, request, response)
+            return self.build_http_500_response(e)
 
-    async def _send_response(self, writer, request: HttpRequest, response: HttpResponse):
+    async def _send_response(self, writer, request: HttpRequest, response: HttpResponse, close: bool = False):
         if response.headers:
             # if headers are HttpHeaders object, merge with default headers
             if isinstance(response.headers, HttpHeaders):
@@ -249,14 +415,13 @@ class HttpServer:
                 response.headers = r_headers
         else:
             response.headers = self._default_response_headers
+        response = await self._compressor.compress(request, response)
+        if close or self._closing:
+            # a drain may start while the handler runs; copy, so the shared default headers are not changed
+            headers = HttpHeaders()
+            headers.merge(response.headers)
+            response.headers = headers.set('Connection', 'close')
         await http_send_response(writer, request, response, self._debug_http)
 
     def _find_route(self, request: HttpRequest):
-        mapping = self._static_routes.get(f'{request.method}:{request.path}')
-        if mapping:
-            return mapping
-
-        for route, method in self._regex_routes:
-            if route.match(request.method, request.path):
-                return route, method
-        return None, None
+        return self._router.find(request.method, request.path)
@@ -1,11 +1,10 @@
-import inspect
 import os
 import traceback
 
 from bot.lib.enums.loglevel import LogLevel
 from bot.lib.logger import Log
 from bot.lib.settings import Settings
-from bot.lib.utils import dict_get
+from bot.lib.utils import dict_get, get_method_name
 from metrics.config import TacoBotMetricsConfig
 from metrics.tacobot import TacoBotMetrics
 from prometheus_client import start_http_server
@@ -13,7 +12,7 @@ from prometheus_client import start_http_server
 
 class MetricsExporter:
     def __init__(self):
-        _method = inspect.stack()[0][3]
+        _method = get_method_name()
         self._class = self.__class__.__name__
         self._module = os.path.basename(__file__)[:-3]
         self.settings = Settings()
@@ -25,7 +24,7 @@ class MetricsExporter:
         self.log.debug(0, f"{self._module}.{self._class}.{_method}", "Exporter initialized")
 
     def run(self):
-        _method = inspect.stack()[1][3]
+        _method = get_method_name(1)
         try:
             config_file = dict_get(os.environ, "TBE_CONFIG_FILE", default_value="./config/.configuration.yaml")
             config = TacoBotMetricsConfig(config_file)
@@ -1,4 +1,3 @@
-import inspect
 import os
 import socket
 import time
@@ -9,14 +8,14 @@ from bot.lib.enums.loglevel import LogLevel
 from bot.lib.enums.permissions import TacoPermissions
 from bot.lib.mongodb.metrics import MetricsDatabase
 from bot.lib.settings import Settings
-from bot.lib.utils import dict_get
+from bot.lib.utils import dict_get, get_method_name
 from prometheus_client import Gauge
 
 
 class TacoBotMetrics:
     def __init__(self, config):
         # get the class name
-        _method = inspect.stack()[0][3]
+        _method = get_method_name()
         self._class = self.__class__.__name__
         self._module = os.path.basename(__file__)[:-3]
 
@@ -404,7 +403,7 @@ class TacoBotMetrics:
 
     def check_health(self):
         """Check the health of the bot"""
-        _method = inspect.stack()[1][3]
+        _method = get_method_name(1)
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 try:
@@ -423,7 +422,7 @@ class TacoBotMetrics:
 
     def run_metrics_loop(self):
         """Metrics fetching loop"""
-        _method = inspect.stack()[1][3]
+        _method = get_method_name(1)
         try:
             while True:
                 self.log.info(0, f"{self._module}.{self._class}.{_method}", "Begin metrics fetch")
@@ -440,7 +439,7 @@ class TacoBotMetrics:
 
     def fetch(self):
         """Fetch metrics from the database"""
-        _method = inspect.stack()[1][3]
+        _method = get_method_name(1)
 
         self.check_health()
 
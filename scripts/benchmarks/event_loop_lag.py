@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""Event-loop lag benchmark for blocking vs executor-backed DAO calls.
+
+Replays a burst of gateway-style events against a fake DAO whose methods block for a fixed
+round-trip time (like a synchronous pymongo call). Each event handler makes a few DAO calls, either
+inline (the previous behavior of every cog listener) or through ``executor.run``. A probe coroutine
+wakes up every few milliseconds and records how late it was scheduled, which is the lag every other
+listener, heartbeat and HTTP request sees.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/event_loop_lag.py --events 400 --rate 200 --db-latency-ms 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from bot.lib.mongodb import executor  # noqa: E402
+
+
+class _FakeDatabase:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def is_first_message_today(self, guild_id: int, user_id: int) -> bool:
+        time.sleep(self.latency)
+        return False
+
+    def track_message(self, guild_id: int, user_id: int, channel_id: int, message_id: int) -> None:
+        time.sleep(self.latency)
+
+
+async def _handler_inline(db: _FakeDatabase, i: int) -> None:
+    if db.is_first_message_today(1, i):
+        return
+    db.track_message(1, i, 2, i)
+
+
+async def _handler_executor(db: _FakeDatabase, i: int) -> None:
+    if await executor.run(db.is_first_message_today, 1, i):
+        return
+    await executor.run(db.track_message, 1, i, 2, i)
+
+
+async def _probe(interval: float, samples: list, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def _replay(handler, db: _FakeDatabase, events: int, rate: float, probe_interval: float) -> dict:
+    samples: list = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(probe_interval, samples, stop))
+    start = time.perf_counter()
+    tasks = []
+    for i in range(events):
+        tasks.append(asyncio.create_task(handler(db, i)))
+        await asyncio.sleep(1 / rate)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    samples.sort()
+    return {
+        "elapsed": elapsed,
+        "lag_mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "lag_p99_ms": samples[int(len(samples) * 0.99) - 1] * 1000 if samples else 0.0,
+        "lag_max_ms": samples[-1] * 1000 if samples else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=400, help="Number of events to replay")
+    parser.add_argument("--rate", type=float, default=200, help="Events per second")
+    parser.add_argument("--db-latency-ms", type=float, default=5.0, help="Simulated round-trip per DAO call")
+    parser.add_argument("--probe-interval-ms", type=float, default=5.0, help="Loop lag probe interval")
+    args = parser.parse_args()
+
+    db = _FakeDatabase(args.db_latency_ms / 1000)
+    for label, handler in (("inline", _handler_inline), ("executor", _handler_executor)):
+        result = asyncio.run(_replay(handler, db, args.events, args.rate, args.probe_interval_ms / 1000))
+        print(
+            f"{label:<9} events={args.events} elapsed={result['elapsed']:.2f}s "
+            f"lag_mean={result['lag_mean_ms']:7.2f}ms lag_p99={result['lag_p99_ms']:7.2f}ms "
+            f"lag_max={result['lag_max_ms']:7.2f}ms"
+        )
+    executor.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
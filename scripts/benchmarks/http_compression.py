@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""Response compression benchmark for ``httpserver.compression``.
+
+Builds representative API payloads shaped like the ``DiscordRole``, ``DiscordChannel``, ``DiscordEmoji`` and
+``DiscordMessage`` models returned by the guild handlers (``--roles``, ``--channels``, ``--emojis`` and
+``--messages`` items; snowflake ids, realistic names and message text) plus the swagger document. For each
+payload, coding and level, the script prints the bytes on the wire, the time spent compressing, and the
+estimated response latency (compression time plus transfer time at ``--mbps``), next to the uncompressed
+(``identity``) response.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/http_compression.py --mbps 10 --levels 1 6 9
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from httpserver import compression  # noqa: E402
+
+GUILD_ID = "942532970706485288"
+WORDS = "taco stream tonight raid thanks gg hype emote clip chat mod game new pog lol when live vod".split()
+
+
+def _snowflake(rng: random.Random) -> str:
+    return str(rng.randrange(10**17, 10**18))
+
+
+def _roles(rng: random.Random, count: int) -> list:
+    return [
+        {
+            "type": "role",
+            "id": (role_id := _snowflake(rng)),
+            "guild_id": GUILD_ID,
+            "color": rng.randrange(0, 0xFFFFFF),
+            "created_at": 1600000000 + rng.randrange(10**8),
+            "display_icon": None,
+            "flags": 0,
+            "hoist": rng.random() < 0.2,
+            "icon": None,
+            "managed": rng.random() < 0.1,
+            "mention": f"<@&{role_id}>",
+            "mentionable": rng.random() < 0.5,
+            "name": f"{rng.choice(WORDS)}-{rng.choice(WORDS)}",
+            "permissions": rng.choice([0, 104324673, 2147483647]),
+            "position": i,
+            "secondary_color": 0,
+            "tertiary_color": 0,
+            "unicode_emoji": None,
+        }
+        for i in range(count)
+    ]
+
+
+def _channels(rng: random.Random, count: int) -> list:
+    return [
+        {
+            "id": _snowflake(rng),
+            "name": f"{rng.choice(WORDS)}-{rng.choice(WORDS)}",
+            "type": rng.choice(["text", "voice", "category", "forum"]),
+            "guild_id": GUILD_ID,
+            "position": i,
+            "topic": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(0, 12))) or None,
+            "nsfw": False,
+            "bitrate": None,
+            "user_limit": None,
+            "created_at": 1600000000 + rng.randrange(10**8),
+            "category_id": _snowflake(rng),
+        }
+        for i in range(count)
+    ]
+
+
+def _emojis(rng: random.Random, count: int) -> list:
+    return [
+        {
+            "type": "emoji",
+            "id": (emoji_id := _snowflake(rng)),
+            "animated": rng.random() < 0.3,
+            "available": True,
+            "created_at": 1600000000 + rng.randrange(10**8),
+            "guild_id": GUILD_ID,
+            "managed": False,
+            "require_colons": True,
+            "name": f"{rng.choice(WORDS)}{rng.choice(WORDS).title()}",
+            "url": f"https://cdn.discordapp.com/emojis/{emoji_id}.png",
+        }
+        for _ in range(count)
+    ]
+
+
+def _messages(rng: random.Random, count: int) -> list:
+    channel_id = _snowflake(rng)
+    return [
+        {
+            "type": "message",
+            "id": (message_id := _snowflake(rng)),
+            "channel_id": channel_id,
+            "guild_id": GUILD_ID,
+            "author_id": _snowflake(rng),
+            "content": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(3, 40))),
+            "created_at": 1700000000 + rng.randrange(10**7),
+            "jump_url": f"https://discord.com/channels/{GUILD_ID}/{channel_id}/{message_id}",
+            "edited_at": 0,
+            "mention_everyone": False,
+            "mentions": [],
+            "attachments": [],
+            "embeds": [],
+            "reactions": [{"emoji": "🌮", "count": rng.randrange(1, 20)}] if rng.random() < 0.3 else [],
+            "nonce": None,
+            "pinned": False,
+            "message_type": 0,
+        }
+        for _ in range(count)
+    ]
+
+
+def _payloads(args) -> list:
+    rng = random.Random(42)
+    payloads = [
+        (f"roles[{args.roles}]", json.dumps(_roles(rng, args.roles)).encode("utf-8")),
+        (f"channels[{args.channels}]", json.dumps(_channels(rng, args.channels)).encode("utf-8")),
+        (f"emojis[{args.emojis}]", json.dumps(_emojis(rng, args.emojis)).encode("utf-8")),
+        (f"messages[{args.messages}]", json.dumps(_messages(rng, args.messages)).encode("utf-8")),
+    ]
+    swagger = ".swagger.v1.yaml"
+    if os.path.exists(swagger):
+        with open(swagger, "rb") as file:
+            payloads.append(("swagger.yaml", file.read()))
+    return payloads
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--roles", type=int, default=250, help="Roles in the roles payload")
+    parser.add_argument("--channels", type=int, default=500, help="Channels in the channels payload")
+    parser.add_argument("--emojis", type=int, default=200, help="Emojis in the emojis payload")
+    parser.add_argument("--messages", type=int, default=100, help="Messages in the messages batch payload")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9], help="Compression levels")
+    parser.add_argument("--mbps", type=float, default=10.0, help="Link speed used to estimate transfer time")
+    parser.add_argument("--repeat", type=int, default=20, help="Compressions averaged per measurement")
+    args = parser.parse_args()
+
+    bytes_per_ms = args.mbps * 1e6 / 8 / 1000
+    for name, body in _payloads(args):
+        print(
+            f"{name:<15} identity  bytes={len(body):>8} ratio= 1.000 compress_ms=  0.000 "
+            f"latency_ms={len(body) / bytes_per_ms:8.2f}"
+        )
+        for coding in compression.PREFERENCE:
+            for level in args.levels:
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    encoded = compression.CODECS[coding](body, level)
+                compress_ms = (time.perf_counter() - start) / args.repeat * 1000
+                print(
+                    f"{name:<15} {coding}-{level:<{8 - len(coding)}} bytes={len(encoded):>8} "
+                    f"ratio={len(encoded) / len(body):6.3f} compress_ms={compress_ms:7.3f} "
+                    f"latency_ms={compress_ms + len(encoded) / bytes_per_ms:8.2f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
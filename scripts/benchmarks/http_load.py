@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Local load generator for ``HttpServer`` connection handling.
+
+Starts an ``HttpServer`` on a free local port with one endpoint that sleeps ``--handler-ms`` before
+answering, then opens ``--clients`` keep-alive connections that each send ``--requests`` requests back to
+back (reconnecting when the server closes the connection). The script prints requests per second, how
+many requests were answered ``200`` and ``503``, and the peak number of open connections seen by the
+server, which stays at or below ``--max-connections``.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/http_load.py --clients 200 --requests 20 --max-connections 64 --handler-ms 20
+"""
+
+import argparse
+import asyncio
+import collections
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from httpserver.EndpointDecorators import uri_mapping  # noqa: E402
+from httpserver.server import HttpServer  # noqa: E402
+
+
+class _Handler:
+    def __init__(self, server: HttpServer, delay: float) -> None:
+        self.server = server
+        self.delay = delay
+        self.peak_connections = 0
+
+    @uri_mapping("/work", method="GET")
+    async def work(self, request):
+        self.peak_connections = max(self.peak_connections, len(self.server._connections))
+        await asyncio.sleep(self.delay)
+        return {"ok": True}
+
+
+async def _client(port: int, requests: int, statuses: collections.Counter) -> None:
+    sent = 0
+    while sent < requests:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            statuses["connect_error"] += 1
+            sent += 1
+            continue
+        try:
+            while sent < requests:
+                writer.write(b"GET /work HTTP/1.1\r\nHost: bench\r\n\r\n")
+                await writer.drain()
+                head = (await reader.readuntil(b"\r\n\r\n")).decode().lower()
+                sent += 1
+                statuses[int(head.split(" ", 2)[1])] += 1
+                length = 0
+                for line in head.split("\r\n"):
+                    if line.startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                await reader.readexactly(length)
+                if "connection: close" in head:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            statuses["reset"] += 1
+        finally:
+            writer.close()
+
+
+async def _run(args) -> None:
+    server = HttpServer()
+    noop = lambda *a, **kw: None  # noqa: E731
+    server.log = SimpleNamespace(debug=noop, info=noop, warn=noop, error=noop)
+    server.set_http_debug_enabled(False)
+    server.max_connections = args.max_connections
+    handler = _Handler(server, args.handler_ms / 1000)
+    server.add_handler(handler)
+    await server.start("127.0.0.1", 0)
+    port = server._server.sockets[0].getsockname()[1]
+
+    statuses = collections.Counter()
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(port, args.requests, statuses) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    await server.close()
+
+    total = sum(statuses.values())
+    print(
+        f"clients={args.clients} requests={total} requests_per_sec={total / elapsed:9.1f} "
+        f"ok={statuses[200]} rejected_503={statuses[503]} other={total - statuses[200] - statuses[503]} "
+        f"peak_open={handler.peak_connections} max_connections={args.max_connections}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent client connections")
+    parser.add_argument("--requests", type=int, default=20, help="Requests sent by each client")
+    parser.add_argument("--max-connections", type=int, default=64, help="HttpServer.max_connections")
+    parser.add_argument("--handler-ms", type=float, default=20.0, help="Time the endpoint takes to answer")
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""Polling benchmark for the ``HttpServer`` response cache.
+
+Starts an ``HttpServer`` on a free local port with a whitelist-style endpoint that waits ``--query-ms`` (a
+stand-in for the MongoDB query) and serializes ``--players`` entries, once without and once with
+``@cache_response``. ``--clients`` keep-alive clients then poll it ``--polls`` times each, the way Node-RED
+and the Minecraft servers poll ``whitelist.json``. Three modes are measured:
+
+* ``uncached``: every poll runs the handler
+* ``cached``: polls are answered from the cache
+* ``cached+etag``: clients send the last ``ETag`` in ``If-None-Match`` and get ``304`` with no body
+
+For each mode the script prints polls per second, the number of handler calls and the response bytes read.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/http_response_cache.py --clients 10 --polls 200 --players 200 --query-ms 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from httpserver.EndpointDecorators import uri_mapping  # noqa: E402
+from httpserver.response_cache import ResponseCache, cache_response  # noqa: E402
+from httpserver.server import HttpServer  # noqa: E402
+
+
+class _Handler:
+    def __init__(self, players: int, query_seconds: float) -> None:
+        self.players = players
+        self.query_seconds = query_seconds
+        self.calls = 0
+
+    def _whitelist(self) -> list:
+        self.calls += 1
+        time.sleep(self.query_seconds)
+        return [{"uuid": f"{i:032x}", "name": f"player_{i}"} for i in range(self.players)]
+
+    @uri_mapping("/uncached/whitelist.json", method="GET")
+    def uncached(self, request):
+        return self._whitelist()
+
+    @uri_mapping("/cached/whitelist.json", method="GET")
+    @cache_response(ttl=60, tags=("minecraft.users",))
+    def cached(self, request):
+        return self._whitelist()
+
+
+async def _client(port: int, path: str, polls: int, conditional: bool) -> int:
+    received = 0
+    etag = None
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(polls):
+            extra = f"If-None-Match: {etag}\r\n" if conditional and etag else ""
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n{extra}\r\n".encode())
+            await writer.drain()
+            head = (await reader.readuntil(b"\r\n\r\n")).decode().lower()
+            length = 0
+            for line in head.split("\r\n"):
+                if line.startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+                elif line.startswith("etag:"):
+                    etag = line.split(":", 1)[1].strip()
+            await reader.readexactly(length)
+            received += len(head) + length
+    finally:
+        writer.close()
+    return received
+
+
+async def _run(args) -> None:
+    server = HttpServer()
+    noop = lambda *a, **kw: None  # noqa: E731
+    server.log = SimpleNamespace(debug=noop, info=noop, warn=noop, error=noop)
+    server.set_http_debug_enabled(False)
+    server.max_requests_per_connection = args.polls + 1
+    server._response_cache = ResponseCache()
+    handler = _Handler(args.players, args.query_ms / 1000)
+    server.add_handler(handler)
+    await server.start("127.0.0.1", 0)
+    port = server._server.sockets[0].getsockname()[1]
+
+    modes = (
+        ("uncached", "/uncached/whitelist.json", False),
+        ("cached", "/cached/whitelist.json", False),
+        ("cached+etag", "/cached/whitelist.json", True),
+    )
+    for name, path, conditional in modes:
+        server._response_cache.clear()
+        handler.calls = 0
+        start = time.perf_counter()
+        received = await asyncio.gather(*(_client(port, path, args.polls, conditional) for _ in range(args.clients)))
+        elapsed = time.perf_counter() - start
+        polls = args.clients * args.polls
+        print(
+            f"{name:<12} polls={polls:<6} polls_per_sec={polls / elapsed:9.1f} handler_calls={handler.calls:<6} "
+            f"bytes_read={sum(received):>10}"
+        )
+    await server.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=10, help="Concurrent polling clients")
+    parser.add_argument("--polls", type=int, default=200, help="Polls sent by each client")
+    parser.add_argument("--players", type=int, default=200, help="Entries in the whitelist response")
+    parser.add_argument("--query-ms", type=float, default=5.0, help="Simulated database query time")
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
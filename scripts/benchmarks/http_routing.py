@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""Route lookup benchmark for ``HttpServer``.
+
+Collects the routes declared by every handler class in ``bot/lib/http/handlers`` (without starting the
+bot) and resolves a request for each variable route, with its variables filled in. Two lookups are
+measured:
+
+* ``legacy``: static dict, then a linear scan of every variable route calling ``UriRoute.match``, then
+  ``re.findall`` again to extract ``uri_variables`` (the previous ``_find_route`` / ``_convert_params``)
+* ``router``: ``httpserver.router.Router.find``, which returns the variables from the same walk
+
+``--scale`` repeats the route table under extra prefixes (``/bench1/...``) to show how each lookup
+grows with the number of routes. Both lookups must pick the same handler; mismatches are reported.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/http_routing.py --lookups 20000 --scale 1 10
+"""
+
+import argparse
+import importlib
+import inspect
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+# some handlers import ``lib.*`` the way the bot's own entry point resolves them
+sys.path.insert(1, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "bot")))
+
+from httpserver.EndpointDecorators import uri_variable_mapping  # noqa: E402
+from httpserver.router import Router  # noqa: E402
+
+HANDLERS_DIR = os.path.join("bot", "lib", "http", "handlers")
+SNOWFLAKE = "123456789012345678"
+
+
+def _collect_routes() -> list:
+    """``(route, function)`` for every route declared on a handler class."""
+    routes = []
+    for root, _, files in os.walk(HANDLERS_DIR):
+        for file in sorted(files):
+            if not file.endswith(".py") or file.startswith("_"):
+                continue
+            module_name = os.path.join(root, file[:-3]).replace(os.sep, ".")
+            try:
+                module = importlib.import_module(module_name)
+            except Exception as e:
+                print(f"skipping {module_name}: {e}", file=sys.stderr)
+                continue
+            for _, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__:
+                    continue
+                for _, function in inspect.getmembers(cls, inspect.isfunction):
+                    for route in getattr(function, "_http_routes", []):
+                        routes.append((route, function))
+    return routes
+
+
+def _scaled(routes: list, scale: int) -> list:
+    out = list(routes)
+    for i in range(1, scale):
+        for route, function in routes:
+            if route.template is None:
+                continue
+
+            def copy(*args, **kwargs):
+                return None
+
+            copy._http_routes = []
+            uri_variable_mapping(f"/bench{i}{route.template}", method=route.http_method)(copy)
+            copy_route = copy._http_routes[0]
+            copy_route.call_args = route.call_args
+            out.append((copy_route, function))
+    return out
+
+
+class _LegacyRouter:
+    def __init__(self, routes: list) -> None:
+        self._static = {}
+        self._regex = []
+        for route, function in routes:
+            if route.is_static():
+                for http_method in route.http_methods():
+                    self._static[f"{http_method}:{route.path}"] = (route, function)
+            else:
+                self._regex.append((route, function))
+
+    def find(self, http_method: str, path: str):
+        mapping = self._static.get(f"{http_method}:{path}")
+        if mapping:
+            return mapping[0], mapping[1], {}
+        for route, function in self._regex:
+            if route.match(http_method, path):
+                if len(route.uri_variables) == 1:
+                    variables = dict(zip(route.uri_variables, re.findall(route.path, path)))
+                else:
+                    variables = dict(zip(route.uri_variables, re.findall(route.path, path)[0]))
+                return route, function, variables
+        return None, None, {}
+
+
+def _requests(routes: list) -> list:
+    requests = []
+    for route, _ in routes:
+        if route.template is None:
+            continue
+        path = re.sub(r"\{(.*?)\}", SNOWFLAKE, route.template)
+        for http_method in route.http_methods():
+            requests.append((str(http_method), path))
+    return requests
+
+
+def _time(find, requests: list, lookups: int) -> float:
+    start = time.perf_counter()
+    for i in range(lookups):
+        http_method, path = requests[i % len(requests)]
+        find(http_method, path)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=20000, help="Route lookups per measurement")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10], help="Route table multipliers")
+    args = parser.parse_args()
+
+    base = _collect_routes()
+    for scale in args.scale:
+        routes = _scaled(base, scale)
+        legacy = _LegacyRouter(routes)
+        router = Router()
+        for route, function in routes:
+            router.add(route, function)
+        requests = _requests(routes)
+        mismatches = sum(
+            1
+            for http_method, path in requests
+            if legacy.find(http_method, path)[1] != router.find(http_method, path)[1]
+        )
+        variable_routes = sum(1 for route, _ in routes if not route.is_static())
+        for name, find in (("legacy", legacy.find), ("router", router.find)):
+            elapsed = _time(find, requests, args.lookups)
+            print(
+                f"{name:<7} scale={scale:<3} variable_routes={variable_routes:<5} "
+                f"us_per_lookup={elapsed / args.lookups * 1e6:8.2f} lookups_per_sec={args.lookups / elapsed:12.1f}"
+            )
+        print(f"mismatches={mismatches}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
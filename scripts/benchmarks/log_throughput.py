@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Throughput benchmark for ``Log.debug`` at ``DEBUG`` vs ``INFO`` minimum levels.
+
+At ``DEBUG`` every call is formatted, printed and handed to the log store; at ``INFO`` a debug call
+should return after a single level comparison. Output goes to ``os.devnull`` and the log store is
+replaced with a no-op so the numbers measure only the logger itself.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/log_throughput.py --iterations 100000
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from bot.lib.enums import loglevel  # noqa: E402
+from bot.lib.logger import Log  # noqa: E402
+
+
+class _NullLogsDatabase:
+    def insert_log(self, **kwargs) -> None:
+        pass
+
+
+def _run(level: loglevel.LogLevel, iterations: int, lazy: bool) -> float:
+    log = Log(minimumLogLevel=level)
+    log.logs_db = _NullLogsDatabase()  # type: ignore[assignment]
+    user_id = 262031734260891648
+    user_tacos = 42
+    with open(os.devnull, "w", encoding="UTF-8") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        if lazy:
+            for _ in range(iterations):
+                log.debug(0, "tacos.TacosDatabase.add_tacos", lambda: f"User {user_id} has {user_tacos} tacos")
+        else:
+            for _ in range(iterations):
+                log.debug(0, "tacos.TacosDatabase.add_tacos", f"User {user_id} has {user_tacos} tacos")
+        return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100000, help="Log.debug calls per measurement")
+    args = parser.parse_args()
+
+    for level in (loglevel.LogLevel.DEBUG, loglevel.LogLevel.INFO):
+        for lazy in (False, True):
+            elapsed = _run(level, args.iterations, lazy)
+            label = "lazy" if lazy else "eager"
+            print(
+                f"minimum={level.name:<6} message={label:<6} calls/sec={args.iterations / elapsed:14,.0f} "
+                f"per_call={(elapsed / args.iterations) * 1_000_000:8.3f}us"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
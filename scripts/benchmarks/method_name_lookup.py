@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""Micro-benchmark for call-site attribution in log method names.
+
+Compares ``inspect.stack()[0][3]`` (the previous way every cog, handler and DAO method looked up its
+own name) with ``utils.get_method_name()``, at a shallow call depth and at a depth closer to a cog
+listener running under the discord.py dispatcher.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/method_name_lookup.py --iterations 2000
+"""
+
+import argparse
+import inspect
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from bot.lib import utils  # noqa: E402
+
+
+def _inspect_stack() -> str:
+    return inspect.stack()[0][3]
+
+
+def _get_method_name() -> str:
+    return utils.get_method_name()
+
+
+def _nested(depth: int, func):
+    if depth <= 0:
+        return func()
+    return _nested(depth - 1, func)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    for depth in (0, 25):
+        for label, func in (("inspect.stack()[0][3]", _inspect_stack), ("utils.get_method_name()", _get_method_name)):
+            elapsed = min(timeit.repeat(lambda: _nested(depth, func), number=args.iterations, repeat=3))
+            per_call_us = (elapsed / args.iterations) * 1_000_000
+            print(f"depth={depth:<3} {label:<24} per_call={per_call_us:10.3f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""Presence-update throughput benchmark for the ``live_now`` cog.
+
+Replays presence updates through ``LiveNow.on_streaming_update``. Most events are not a streaming
+change (status, game or custom status changes); ``--streaming-ratio`` of them come from members who
+are already live and still streaming. A fake ``LiveDatabase`` blocks for ``--db-latency-ms`` per call,
+like a synchronous pymongo round-trip run on the database executor.
+
+Two modes are measured:
+
+* ``legacy``: the live index is not seeded, so every event reads settings and asks ``live_tracked``
+  (the previous behavior; its one-second ``asyncio.sleep`` per streaming event is skipped here, so the
+  legacy number is an upper bound)
+* ``indexed``: the live index is seeded, so only real go-live / go-offline transitions reach settings
+  or the database
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/presence_updates.py --events 2000 --streaming-ratio 0.05 --db-latency-ms 2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import discord  # noqa: E402
+from bot.cogs import live_now  # noqa: E402
+from bot.lib.mongodb.live import LiveDatabase  # noqa: E402
+
+
+class _FakeLiveDatabase:
+    def __init__(self, latency: float, live_users: set) -> None:
+        self.latency = latency
+        self.live_users = live_users
+        self.calls = 0
+
+    def _round_trip(self) -> None:
+        self.calls += 1
+        time.sleep(self.latency)
+
+    def get_tracked_live(self, guild_id: int, user_id: int, platform: str) -> list:
+        self._round_trip()
+        return [{"platform": platform}] if user_id in self.live_users else []
+
+    def get_tracked_live_by_user(self, guildId: int, userId: int) -> list:
+        self._round_trip()
+        return []
+
+
+class _FakeDiscordHelper:
+    async def add_remove_roles(self, **kwargs) -> None:
+        return None
+
+
+def _member(user_id: int, streaming: bool) -> SimpleNamespace:
+    activities = []
+    if streaming:
+        activities.append(discord.Streaming(name="Twitch", url="https://twitch.tv/example", details="stream"))
+    return SimpleNamespace(id=user_id, guild=SimpleNamespace(id=1), activities=tuple(activities), display_name="x")
+
+
+def _cog(db: _FakeLiveDatabase) -> "live_now.LiveNow":
+    cog = object.__new__(live_now.LiveNow)
+    cog._module = "live_now"
+    cog._class = "LiveNow"
+    noop = lambda *args, **kwargs: None  # noqa: E731
+    cog.log = SimpleNamespace(debug=noop, info=noop, warn=noop, error=noop)
+    cog.live_db = db
+    cog.discord_helper = _FakeDiscordHelper()
+    # settings reads are served by the settings cache either way; keep them cheap and equal in both modes
+    cog.get_cog_settings = lambda guildId=0: {"enabled": True, "watch": []}
+    cog.get_tacos_settings = lambda guildId=0: {}
+    return cog
+
+
+async def _replay(cog, events: list) -> float:
+    start = time.perf_counter()
+    for before, after in events:
+        await cog.on_streaming_update(before, after)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=2000, help="Presence updates to replay")
+    parser.add_argument("--streaming-ratio", type=float, default=0.05, help="Share of events from live members")
+    parser.add_argument("--db-latency-ms", type=float, default=2.0, help="Simulated MongoDB round-trip time")
+    args = parser.parse_args()
+
+    every = max(1, int(1 / args.streaming_ratio)) if args.streaming_ratio > 0 else 0
+    live_users = {i for i in range(args.events) if every and i % every == 0}
+    events = [(_member(i, i in live_users), _member(i, i in live_users)) for i in range(args.events)]
+
+    async def _no_sleep(delay: float) -> None:
+        return None
+
+    live_now.asyncio = SimpleNamespace(sleep=_no_sleep)  # type: ignore[assignment]
+
+    for mode in ("legacy", "indexed"):
+        db = _FakeLiveDatabase(args.db_latency_ms / 1000, live_users)
+        LiveDatabase.live.reset()
+        if mode == "indexed":
+            LiveDatabase.live.seed((1, user_id, "TWITCH") for user_id in live_users)
+        elapsed = asyncio.run(_replay(_cog(db), events))
+        print(
+            f"{mode:<8} events={args.events:<6} total={elapsed * 1000:9.2f}ms "
+            f"events_per_sec={args.events / elapsed:12.1f} db_calls={db.calls}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
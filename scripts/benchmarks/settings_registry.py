@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""Startup / memory benchmark for the shared ``Settings`` registry.
+
+Compares the per-construction cost of the process-wide registry (``Settings()`` returning the
+shared instance) against the previous behavior, where every construction re-read ``app.manifest``,
+globbed ``languages/``, re-parsed every language file and created a new ``SettingsDatabase``.
+
+The previous behavior is reproduced by building a fresh, unshared instance and calling its loader
+directly, so both sides run the exact same file parsing code.
+
+Usage (from the repository root):
+
+    python scripts/benchmarks/settings_registry.py --constructions 30
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from bot.lib.settings import Settings  # noqa: E402
+
+
+def _legacy_settings() -> Settings:
+    instance = object.__new__(Settings)
+    instance._load()
+    return instance
+
+
+def _measure(label: str, factory, constructions: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = [factory() for _ in range(constructions)]
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_call_us = (elapsed / constructions) * 1_000_000
+    print(
+        f"{label:<10} constructions={constructions:<6} total={elapsed * 1000:9.2f}ms "
+        f"per_call={per_call_us:10.2f}us retained={current / 1024:9.1f}KiB peak={peak / 1024:9.1f}KiB "
+        f"distinct_instances={len({id(h) for h in held})}"
+    )
+    del held
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--constructions",
+        type=int,
+        default=30,
+        help="Number of Settings() constructions to simulate (the bot performs roughly 30 at startup)",
+    )
+    args = parser.parse_args()
+
+    Settings.reset()
+    _measure("legacy", _legacy_settings, args.constructions)
+    Settings.reset()
+    _measure("shared", Settings, args.constructions)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
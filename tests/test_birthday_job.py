@@ -0,0 +1,59 @@
+"""Tests for the daily birthday job in ``bot.cogs.birthday``.
+
+These tests cover:
+* a failed birthday read raising, so the scheduler retries the day instead of completing it
+* a guild without birthdays completing and recording the check
+"""
+
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+import pytest
+from bot.cogs.birthday import Birthday
+
+DAY = datetime.date(2024, 5, 17)
+
+
+class FakeBirthdaysDatabase:
+    def __init__(self, birthdays):
+        self.birthdays = birthdays
+        self.checks = []
+
+    def get_user_birthdays(self, guild_id, month, day):
+        # the DAO logs and returns None when the query fails
+        return self.birthdays
+
+    def track_birthday_check(self, guild_id):
+        self.checks.append(guild_id)
+
+
+def _cog(birthdays):
+    cog = Birthday.__new__(Birthday)
+    cog._module = "birthday"
+    cog._class = "Birthday"
+    cog.log = SimpleNamespace(debug=lambda *a: None, warn=lambda *a: None)
+    cog.bot = SimpleNamespace(get_guild=lambda guild_id: SimpleNamespace(id=guild_id))
+    cog.birthdays_db = FakeBirthdaysDatabase(birthdays)
+    cleared = []
+
+    async def clear_birthday_role(guild):
+        cleared.append(guild.id)
+
+    cog.clear_birthday_role = clear_birthday_role
+    return cog, cleared
+
+
+def test_failed_read_raises_for_retry():
+    cog, cleared = _cog(None)
+    with pytest.raises(Exception, match="Unable to read birthdays"):
+        asyncio.run(cog._birthday_job(1, DAY))
+    assert cleared == []
+    assert cog.birthdays_db.checks == []
+
+
+def test_no_birthdays_completes():
+    cog, cleared = _cog([])
+    asyncio.run(cog._birthday_job(1, DAY))
+    assert cleared == [1]
+    assert cog.birthdays_db.checks == [1]
@@ -0,0 +1,172 @@
+"""Tests for ``bot.lib.discord.channel_index.ChannelConfigIndex`` and the restricted channel routes.
+
+These tests cover:
+* lookups in unconfigured channels not reading settings again
+* the global guild ``0`` fallback
+* rebuilding after a settings write (cache generation) and after ``refresh_seconds``
+* writes to other guilds and sections not making a guild stale
+* lookups on the event loop serving current routes while the refresh runs on the executor
+* an unchanged re-check keeping the prepared routes
+* a channel with an invalid pattern being skipped without dropping the others
+* ``RestrictedChannel`` allowed / denied matching with compiled patterns
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from bot.cogs.restricted import RestrictedChannel
+from bot.lib.discord.channel_index import ChannelConfigIndex
+from bot.lib.mongodb.settings import SettingsCache, SettingsDatabase
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSettings:
+    def __init__(self, sections):
+        self.sections = sections
+        self.calls = 0
+
+    def get_settings(self, guild_id, section):
+        self.calls += 1
+        return self.sections.get((guild_id, section))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_settings():
+    return FakeSettings(
+        {
+            (1, "restricted"): {
+                "channels": [
+                    {"id": "10", "allowed": [r"^\.taco "], "denied": [r"^\.taco give"]},
+                    {"id": "11", "allowed": [r"["]},
+                ]
+            },
+            (0, "restricted"): {"channels": [{"id": "20", "allowed": [".*"]}]},
+        }
+    )
+
+
+@pytest.fixture
+def make_index(monkeypatch, clock, fake_settings):
+    monkeypatch.setattr(SettingsDatabase, "cache", SettingsCache(ttl=60, clock=clock))
+
+    def factory(**kwargs) -> ChannelConfigIndex:
+        index = ChannelConfigIndex("restricted", clock=clock, **kwargs)
+        index.settings = fake_settings
+        index.log = SimpleNamespace(error=lambda *a: None)
+        return index
+
+    return factory
+
+
+def test_lookups_use_built_routes(make_index, fake_settings):
+    index = make_index()
+    assert index.get(1, 10)["id"] == "10"
+    assert index.get(1, 99) is None
+    assert index.get(1, "10")["id"] == "10"
+    assert fake_settings.calls == 1
+    assert index.stats() == {"guilds": 1, "channels": 2, "builds": 1, "refreshes": 1}
+
+
+def test_falls_back_to_global_settings(make_index):
+    index = make_index()
+    assert index.get(2, 20)["id"] == "20"
+    assert index.get(3, 10) is None
+
+
+def test_settings_write_rebuilds(make_index, fake_settings):
+    index = make_index()
+    assert index.get(1, 12) is None
+
+    fake_settings.sections[(1, "restricted")] = {"channels": [{"id": "12"}]}
+    SettingsDatabase.cache.invalidate(1, "restricted")
+
+    assert index.get(1, 12) == {"id": "12"}
+    assert index.get(1, 10) is None
+
+
+def test_unrelated_writes_keep_routes(make_index, fake_settings):
+    index = make_index()
+    index.get(1, 10)
+    SettingsDatabase.cache.invalidate(1, "announcements")
+    SettingsDatabase.cache.invalidate(2, "restricted")
+    index.get(1, 10)
+    assert fake_settings.calls == 1
+
+    # the global section is the fallback, so writing it re-checks every guild
+    SettingsDatabase.cache.invalidate(0, "restricted")
+    index.get(1, 10)
+    assert fake_settings.calls == 2
+
+
+def test_lookups_on_the_loop_refresh_in_the_background(make_index, fake_settings):
+    index = make_index()
+
+    async def run():
+        assert index.get(1, 10) is None
+        assert index.get(1, 10) is None
+        await asyncio.gather(*index._refreshing.values())
+        routes = index.get(1, 10)
+
+        fake_settings.sections[(1, "restricted")] = {"channels": [{"id": "12"}]}
+        SettingsDatabase.cache.invalidate(1, "restricted")
+        # stale routes keep answering until the refresh lands
+        assert index.get(1, 10) is routes
+        await asyncio.gather(*index._refreshing.values())
+        return routes
+
+    routes = asyncio.run(run())
+    assert routes["id"] == "10"
+    assert index.get(1, 12) == {"id": "12"}
+    assert fake_settings.calls == 2
+    assert not index._refreshing
+
+
+def test_refresh_interval_rechecks_settings(make_index, clock, fake_settings):
+    index = make_index(refresh_seconds=30)
+    routes = index.get(1, 10)
+
+    clock.now += 31
+    assert index.get(1, 10) is routes
+    assert fake_settings.calls == 2
+    assert index.builds == 1
+
+    fake_settings.sections[(1, "restricted")]["channels"].pop(0)
+    clock.now += 31
+    assert index.get(1, 10) is None
+    assert index.builds == 2
+
+
+def test_invalid_channel_is_skipped(make_index):
+    index = make_index(prepare=RestrictedChannel.from_settings)
+    assert index.get(1, 11) is None
+    assert isinstance(index.get(1, 10), RestrictedChannel)
+
+
+def test_warm_builds_ahead_of_messages(make_index, fake_settings):
+    index = make_index()
+    index.warm([1, 2])
+    assert fake_settings.calls == 3
+    index.get(1, 10)
+    index.get(2, 20)
+    assert fake_settings.calls == 3
+
+
+@pytest.mark.parametrize("content, allowed", [(".taco help", True), (".taco give @user 5", False), ("hello", False)])
+def test_restricted_channel_allows(content, allowed):
+    channel = RestrictedChannel.from_settings({"id": "10", "allowed": [r"^\.taco "], "denied": [r"^\.taco give"]})
+    assert channel.silent is True
+    assert channel.deny_message is None
+    assert channel.allows(content) is allowed
@@ -0,0 +1,124 @@
+"""Tests for hash-gated app command sync in ``bot.lib.discord.command_sync``.
+
+These tests cover:
+* guilds whose command tree hash matches the last synced hash being skipped
+* a changed command tree syncing every guild again and recording the new hashes
+* syncs running concurrently, bounded by ``concurrency``
+* a failed sync not recording a hash, so the next start retries it
+* ``force`` ignoring the stored hashes
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+from bot.lib.discord.command_sync import CommandSync
+from discord import app_commands
+
+
+class FakeGuildsDatabase:
+    def __init__(self):
+        self.hashes = {}
+
+    def get_app_command_hashes(self):
+        return dict(self.hashes)
+
+    def set_app_command_hash(self, guildId, hash):
+        self.hashes[str(guildId)] = hash
+
+
+class FakeTree(app_commands.CommandTree):
+    def __init__(self, client):
+        super().__init__(client)
+        self.synced = []
+        self.failing = set()
+        self.active = 0
+        self.max_active = 0
+
+    async def sync(self, *, guild=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if guild.id in self.failing:
+                raise discord.HTTPException(SimpleNamespace(status=500, reason="error"), "boom")
+            self.synced.append(guild.id)
+            return []
+        finally:
+            self.active -= 1
+
+
+def _command(name):
+    async def callback(interaction: discord.Interaction) -> None:
+        pass
+
+    return app_commands.Command(name=name, description=f"{name} command", callback=callback)
+
+
+@pytest.fixture
+def bot():
+    client = discord.Client(intents=discord.Intents.none())
+    tree = FakeTree(client)
+    tree.add_command(_command("tacos"))
+    noop = lambda *args, **kwargs: None  # noqa: E731
+    return SimpleNamespace(tree=tree, application_id=42, log=SimpleNamespace(debug=noop, info=noop, error=noop))
+
+
+def _sync(bot, guild_ids, db, **kwargs):
+    syncer = CommandSync(bot, **kwargs)
+    syncer.guilds_db = db
+    asyncio.run(syncer.sync(guild_ids))
+    return syncer
+
+
+def test_unchanged_guilds_are_skipped(bot):
+    db = FakeGuildsDatabase()
+    first = _sync(bot, [1, 2, 3], db, concurrency=2)
+    assert sorted(bot.tree.synced) == [1, 2, 3]
+    assert first.synced == 3
+
+    bot.tree.synced.clear()
+    second = _sync(bot, [1, 2, 3], db, concurrency=2)
+    assert bot.tree.synced == []
+    assert second.skipped == 3
+
+
+def test_changed_tree_syncs_again(bot):
+    db = FakeGuildsDatabase()
+    _sync(bot, [1, 2], db)
+    before = dict(db.hashes)
+
+    bot.tree.add_command(_command("birthday"))
+    bot.tree.synced.clear()
+    _sync(bot, [1, 2], db)
+
+    assert sorted(bot.tree.synced) == [1, 2]
+    assert db.hashes["1"] != before["1"]
+
+
+def test_syncs_are_bounded(bot):
+    _sync(bot, list(range(10)), FakeGuildsDatabase(), concurrency=3)
+    assert len(bot.tree.synced) == 10
+    assert bot.tree.max_active == 3
+
+
+def test_failed_sync_is_retried_next_start(bot):
+    db = FakeGuildsDatabase()
+    bot.tree.failing = {2}
+    first = _sync(bot, [1, 2], db)
+    assert first.failed == 1
+    assert "2" not in db.hashes
+
+    bot.tree.failing = set()
+    bot.tree.synced.clear()
+    _sync(bot, [1, 2], db)
+    assert bot.tree.synced == [2]
+
+
+def test_force_ignores_stored_hashes(bot):
+    db = FakeGuildsDatabase()
+    _sync(bot, [1], db)
+    bot.tree.synced.clear()
+    _sync(bot, [1], db, force=True)
+    assert bot.tree.synced == [1]
@@ -0,0 +1,185 @@
+"""Tests for the Discord REST fetch cache in ``bot.lib.discord.fetch_cache``.
+
+These tests cover:
+* concurrent fetches for one key sharing a single REST call (single-flight)
+* entries expiring after their TTL, including per-kind TTL overrides
+* least-recently-used eviction once ``maxsize`` is reached
+* invalidation discarding the result of a fetch that was already running
+* ``refresh`` fetching past a cached entry, being joined by later callers and not being overwritten
+* failed fetches and ``None`` results not being cached
+* hit-rate counters
+"""
+
+import asyncio
+
+import pytest
+from bot.lib.discord.fetch_cache import FetchCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRest:
+    """Counts calls and returns ``value-<n>`` after yielding, so concurrent callers overlap."""
+
+    def __init__(self, fail: bool = False, result=True) -> None:
+        self.calls = 0
+        self.fail = fail
+        self.result = result
+
+    async def fetch(self):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("rate limited")
+        return f"value-{call}" if self.result else None
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return FetchCache(maxsize=3, ttl=60, ttls={"message": 5}, clock=clock)
+
+
+def test_concurrent_fetches_are_coalesced(cache):
+    rest = FakeRest()
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_fetch(("user", 1), rest.fetch) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == ["value-1"] * 5
+    assert rest.calls == 1
+    stats = cache.stats()["kinds"]["user"]
+    assert stats["misses"] == 1
+    assert stats["coalesced"] == 4
+
+
+def test_entries_expire_per_kind(cache, clock):
+    rest = FakeRest()
+    asyncio.run(cache.get_or_fetch(("user", 1), rest.fetch))
+    asyncio.run(cache.get_or_fetch(("message", 10, 100), rest.fetch))
+
+    clock.now += 6
+    assert asyncio.run(cache.get_or_fetch(("user", 1), rest.fetch)) == "value-1"
+    assert asyncio.run(cache.get_or_fetch(("message", 10, 100), rest.fetch)) == "value-3"
+
+    clock.now += 60
+    assert asyncio.run(cache.get_or_fetch(("user", 1), rest.fetch)) == "value-4"
+
+
+def test_least_recently_used_is_evicted(cache):
+    rest = FakeRest()
+    for user_id in (1, 2, 3):
+        asyncio.run(cache.get_or_fetch(("user", user_id), rest.fetch))
+    # touch 1 so 2 is the oldest
+    asyncio.run(cache.get_or_fetch(("user", 1), rest.fetch))
+    asyncio.run(cache.get_or_fetch(("user", 4), rest.fetch))
+
+    assert cache.get(("user", 2)) is None
+    assert cache.get(("user", 1)) == "value-1"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidation_discards_running_fetch(cache):
+    rest = FakeRest()
+
+    async def run():
+        first = asyncio.ensure_future(cache.get_or_fetch(("message", 10, 100), rest.fetch))
+        await asyncio.sleep(0)
+        # the gateway reports an edit while the first fetch is still running
+        cache.invalidate(("message", 10, 100))
+        second = await cache.get_or_fetch(("message", 10, 100), rest.fetch)
+        return await first, second
+
+    first, second = asyncio.run(run())
+
+    assert (first, second) == ("value-1", "value-2")
+    assert rest.calls == 2
+    assert cache.get(("message", 10, 100)) == "value-2"
+
+
+def test_refresh_replaces_cached_entry(cache):
+    rest = FakeRest()
+
+    async def run():
+        await cache.get_or_fetch(("message", 10, 100), rest.fetch)
+        older = asyncio.ensure_future(cache.refresh(("message", 10, 100), rest.fetch))
+        await asyncio.sleep(0)
+        # a reaction handler needs counts newer than the refresh already running
+        newer = asyncio.ensure_future(cache.refresh(("message", 10, 100), rest.fetch))
+        await asyncio.sleep(0)
+        joined = await cache.get_or_fetch(("message", 10, 100), rest.fetch)
+        return await older, await newer, joined
+
+    older, newer, joined = asyncio.run(run())
+
+    assert (older, newer, joined) == ("value-2", "value-3", "value-3")
+    assert rest.calls == 3
+    assert cache.get(("message", 10, 100)) == "value-3"
+    assert cache.stats()["kinds"]["message"]["refreshes"] == 2
+
+
+def test_invalidate_where_matches_kind(cache):
+    rest = FakeRest()
+    asyncio.run(cache.get_or_fetch(("message", 10, 100), rest.fetch))
+    asyncio.run(cache.get_or_fetch(("message", 11, 101), rest.fetch))
+
+    cache.invalidate_where("message", lambda key: key[1] == 10)
+
+    assert cache.get(("message", 10, 100)) is None
+    assert cache.get(("message", 11, 101)) == "value-2"
+
+
+def test_failures_and_none_are_not_cached(cache):
+    failing = FakeRest(fail=True)
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_fetch(("channel", 1), failing.fetch) for _ in range(2)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert failing.calls == 1
+
+    missing = FakeRest(result=False)
+    assert asyncio.run(cache.get_or_fetch(("channel", 2), missing.fetch)) is None
+    assert asyncio.run(cache.get_or_fetch(("channel", 2), missing.fetch)) is None
+    assert missing.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_hit_rate(cache):
+    rest = FakeRest()
+    for _ in range(4):
+        asyncio.run(cache.get_or_fetch(("user", 1), rest.fetch))
+
+    stats = cache.stats()
+    assert stats["hit_rate"] == pytest.approx(0.75)
+    assert stats["kinds"]["user"]["hits"] == 3
+
+
+def test_disabled_cache_still_coalesces(clock):
+    cache = FetchCache(maxsize=0, ttl=60, clock=clock)
+    rest = FakeRest()
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_fetch(("user", 1), rest.fetch) for _ in range(3)))
+
+    asyncio.run(run())
+    asyncio.run(cache.get_or_fetch(("user", 1), rest.fetch))
+
+    assert rest.calls == 2
+    assert cache.stats()["entries"] == 0
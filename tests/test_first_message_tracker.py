@@ -0,0 +1,150 @@
+"""Tests for the in-memory first-message-of-the-day tracker in ``bot.lib.mongodb.tracking``.
+
+These tests cover:
+* only a user's first message of the UTC day reaching ``first_message``
+* claims being exclusive, so racing messages award the first message once
+* day rollover re-seeding from ``first_message``, once even when threads race it
+* a restart (fresh tracker) seeding from records written before it
+* falling back to ``find_one`` when seeding fails
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from bot.lib.mongodb.tracking import FirstMessageTracker, TrackingDatabase
+
+DAY = 1_700_006_400.0  # a UTC midnight
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeFirstMessageCollection:
+    def __init__(self):
+        self.docs = []
+        self.find_calls = 0
+        self.find_one_calls = 0
+        self.fail_find = False
+
+    def find(self, query, projection=None):
+        self.find_calls += 1
+        if self.fail_find:
+            raise RuntimeError("connection reset")
+        return [doc for doc in self.docs if doc["timestamp"] == query["timestamp"]]
+
+    def find_one(self, query):
+        self.find_one_calls += 1
+        return next((doc for doc in self.docs if all(doc[k] == v for k, v in query.items())), None)
+
+    def update_one(self, query, update, upsert=False):
+        self.docs = [doc for doc in self.docs if not all(doc[k] == v for k, v in query.items())]
+        self.docs.append(update["$set"])
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(DAY + 3600)
+
+
+@pytest.fixture
+def collection():
+    return FakeFirstMessageCollection()
+
+
+@pytest.fixture
+def make_db(monkeypatch, clock, collection):
+    def factory() -> TrackingDatabase:
+        # a fresh tracker per "process"
+        monkeypatch.setattr(TrackingDatabase, "first_messages", FirstMessageTracker(clock=clock))
+        db = TrackingDatabase()
+        db.connection = SimpleNamespace(first_message=collection)
+        db.client = object()
+        db.log = lambda **kwargs: None
+        return db
+
+    return factory
+
+
+def _first_message(db: TrackingDatabase, guild_id: int, user_id: int) -> bool:
+    # what MessageTracker.on_message does
+    first = db.is_first_message_today(guild_id, user_id)
+    if first:
+        db.track_first_message(guild_id, user_id, 10, 20)
+    return first
+
+
+def test_today_is_utc_midnight(clock):
+    assert FirstMessageTracker(clock=clock).today() == DAY
+
+
+def test_only_first_message_touches_database(make_db, collection):
+    db = make_db()
+    assert _first_message(db, 1, 2) is True
+    assert _first_message(db, 1, 2) is False
+    assert _first_message(db, 1, 2) is False
+    assert _first_message(db, 2, 2) is True
+    assert collection.find_calls == 1
+    assert collection.find_one_calls == 0
+    assert [doc["timestamp"] for doc in collection.docs] == [DAY, DAY]
+
+
+def test_claim_is_exclusive(clock):
+    tracker = FirstMessageTracker(clock=clock)
+    tracker.seed(DAY, [])
+    assert tracker.claim(DAY, 1, 2) is True
+    assert tracker.claim(DAY, 1, 2) is False
+    assert tracker.stats() == {"entries": 1, "hits": 1, "claims": 1, "seeds": 1}
+
+
+def test_rollover_reseeds_for_new_day(make_db, clock, collection):
+    db = make_db()
+    assert _first_message(db, 1, 2) is True
+    clock.now = DAY + 86400 + 5
+    assert _first_message(db, 1, 2) is True
+    assert _first_message(db, 1, 2) is False
+    assert collection.find_calls == 2
+    assert sorted(doc["timestamp"] for doc in collection.docs) == [DAY, DAY + 86400]
+
+
+def test_rollover_seeds_once_for_racing_threads(make_db, clock, collection):
+    db = make_db()
+    original_find = collection.find
+
+    def slow_find(query, projection=None):
+        time.sleep(0.05)
+        return original_find(query, projection)
+
+    collection.find = slow_find
+    threads = [threading.Thread(target=_first_message, args=(db, 1, user_id)) for user_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert collection.find_calls == 1
+    assert db.first_messages.stats()["claims"] == 8
+
+
+def test_restart_seeds_from_database(make_db, collection):
+    db = make_db()
+    assert _first_message(db, 1, 2) is True
+
+    restarted = make_db()
+    restarted.seed_first_messages()
+    assert _first_message(restarted, 1, 2) is False
+    assert _first_message(restarted, 1, 3) is True
+
+
+def test_falls_back_to_find_one_when_seeding_fails(make_db, collection):
+    collection.docs.append({"guild_id": "1", "user_id": "2", "timestamp": DAY})
+    collection.fail_find = True
+    db = make_db()
+    assert db.is_first_message_today(1, 2) is False
+    assert db.is_first_message_today(1, 3) is True
+    assert collection.find_one_calls == 2
@@ -126,56 +126,62 @@ class TestGuildResolverInit:
 class TestGetGuildConfig:
     """Test _get_guild_config method."""
 
-    def test_returns_none_when_disabled(self, resolver, mock_get_settings):
+    @pytest.mark.asyncio
+    async def test_returns_none_when_disabled(self, resolver, mock_get_settings):
         """Test returns None when guild has disabled notifications."""
         mock_get_settings.return_value = {"enabled": False, "channel_ids": [123]}
 
-        result = resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
+        result = await resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
 
         assert result is None
         mock_get_settings.assert_called_once_with(111, "free_games")
 
-    def test_returns_none_when_game_already_tracked(self, resolver, mock_get_settings, mock_freegame_db):
+    @pytest.mark.asyncio
+    async def test_returns_none_when_game_already_tracked(self, resolver, mock_get_settings, mock_freegame_db):
         """Test returns None when game is already tracked for guild."""
         mock_get_settings.return_value = {"enabled": True, "channel_ids": [123]}
         mock_freegame_db.is_game_tracked.return_value = True
 
-        result = resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
+        result = await resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
 
         assert result is None
         mock_freegame_db.is_game_tracked.assert_called_once_with(111, 222)
 
-    def test_returns_none_when_no_channel_ids(self, resolver, mock_get_settings):
+    @pytest.mark.asyncio
+    async def test_returns_none_when_no_channel_ids(self, resolver, mock_get_settings):
         """Test returns None when no channel IDs configured."""
         mock_get_settings.return_value = {"enabled": True, "channel_ids": []}
 
-        result = resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
+        result = await resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
 
         assert result is None
 
-    def test_returns_none_when_channel_ids_missing(self, resolver, mock_get_settings):
+    @pytest.mark.asyncio
+    async def test_returns_none_when_channel_ids_missing(self, resolver, mock_get_settings):
         """Test returns None when channel_ids key is missing."""
         mock_get_settings.return_value = {"enabled": True}
 
-        result = resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
+        result = await resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
 
         assert result is None
 
-    def test_returns_config_when_eligible(self, resolver, mock_get_settings):
+    @pytest.mark.asyncio
+    async def test_returns_config_when_eligible(self, resolver, mock_get_settings):
         """Test returns config dict when guild is eligible."""
         mock_get_settings.return_value = {"enabled": True, "channel_ids": [123, 456], "notify_role_ids": [789, 1011]}
 
-        result = resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
+        result = await resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
 
         assert result is not None
         assert result["channel_ids"] == [123, 456]
         assert result["notify_role_ids"] == [789, 1011]
 
-    def test_returns_config_with_empty_notify_roles(self, resolver, mock_get_settings):
+    @pytest.mark.asyncio
+    async def test_returns_config_with_empty_notify_roles(self, resolver, mock_get_settings):
         """Test returns config with empty notify_role_ids when not specified."""
         mock_get_settings.return_value = {"enabled": True, "channel_ids": [123]}
 
-        result = resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
+        result = await resolver._get_guild_config(guild_id=111, game_id=222, settings_section="free_games")
 
         assert result is not None
         assert result["channel_ids"] == [123]
@@ -0,0 +1,139 @@
+"""Tests for negotiated response compression in ``httpserver.compression``.
+
+These tests cover:
+* ``Accept-Encoding`` negotiation: q-values, ``q=0`` refusals, ``*`` and server preference on ties
+* small, non-text, already-encoded and empty responses being sent as they are
+* ``Vary: Accept-Encoding`` on every compressible response, without changing the handler's headers
+* precompressed ``encoded_bodies`` being used instead of compressing again
+* an end-to-end request through ``HttpServer`` returning a gzip body that decodes to the JSON
+"""
+
+import asyncio
+import gzip
+import json
+import zlib
+from types import SimpleNamespace
+
+import pytest
+from httpserver import compression
+from httpserver.EndpointDecorators import uri_mapping
+from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
+from httpserver.server import HttpServer
+
+BODY = json.dumps([{"id": str(i), "name": f"role-{i}", "color": 0, "position": i} for i in range(100)]).encode()
+
+
+def _request(accept_encoding=None):
+    headers = HttpHeaders()
+    if accept_encoding is not None:
+        headers.set("Accept-Encoding", accept_encoding)
+    return HttpRequest(0.0, "GET", "/", {}, "HTTP/1.1", headers)
+
+
+def _response(body=BODY, content_type="application/json", status_code=200, **kwargs):
+    headers = HttpHeaders()
+    if content_type:
+        headers.set("Content-Type", content_type)
+    return HttpResponse(status_code, headers, body, **kwargs)
+
+
+def _compress(request, response, **kwargs):
+    return asyncio.run(compression.ResponseCompressor(**kwargs).compress(request, response))
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, coding",
+    [
+        (None, None),
+        ("", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip", "gzip"),
+        ("gzip;q=0.5, deflate", "deflate"),
+        ("gzip; q=0, deflate;q=0.1", "deflate"),
+        ("br", None),
+        ("*", "gzip"),
+        ("*;q=0.2, gzip;q=0", "deflate"),
+        ("identity", None),
+        ("GZIP;Q=1.0", "gzip"),
+    ],
+)
+def test_negotiate(accept_encoding, coding):
+    assert compression.negotiate(accept_encoding) == coding
+
+
+def test_compresses_large_json():
+    response = _response()
+    result = _compress(_request("gzip, deflate"), response)
+    assert result.headers.get("content-encoding") == "gzip"
+    assert result.headers.get("vary") == "Accept-Encoding"
+    assert gzip.decompress(result.body) == BODY
+    # the handler's headers are not changed
+    assert response.headers.get("content-encoding") is None
+
+    result = _compress(_request("deflate"), _response())
+    assert zlib.decompress(result.body) == BODY
+
+
+def test_responses_sent_as_they_are():
+    small = _response(b'{"ok": true}')
+    assert _compress(_request("gzip"), small) is small
+    image = _response(content_type="image/png")
+    assert _compress(_request("gzip"), image) is image
+    encoded = _response()
+    encoded.headers.set("Content-Encoding", "br")
+    assert _compress(_request("gzip"), encoded) is encoded
+    empty = _response(None, status_code=204)
+    assert _compress(_request("gzip"), empty) is empty
+    assert _compress(_request("gzip"), _response(), enabled=False).headers.get("content-encoding") is None
+
+    # compressible, but the client did not ask for it: uncompressed, with Vary for caches
+    plain = _compress(_request(), _response())
+    assert plain.body == BODY
+    assert plain.headers.get("content-encoding") is None
+    assert plain.headers.get("vary") == "Accept-Encoding"
+
+
+def test_existing_vary_is_extended():
+    response = _response()
+    response.headers.set("Vary", "Origin")
+    assert _compress(_request("gzip"), response).headers.get("vary") == "Origin, Accept-Encoding"
+
+
+def test_precompressed_bodies_are_used():
+    small = b"openapi: 3.0.0\n" * 10
+    encoded = {"gzip": b"precompressed", "deflate": b"other"}
+    result = _compress(_request("gzip"), _response(small, "text/vnd.yaml", encoded_bodies=encoded))
+    # below min_size, but precompressed variants are always worth sending
+    assert result.body == b"precompressed"
+    assert result.headers.get("content-encoding") == "gzip"
+
+    variants = compression.precompress(BODY)
+    assert gzip.decompress(variants["gzip"]) == BODY
+    assert zlib.decompress(variants["deflate"]) == BODY
+
+
+def test_server_sends_compressed_response():
+    class Handler:
+        @uri_mapping("/roles", method="GET")
+        def roles(self, request):
+            return json.loads(BODY)
+
+    async def run():
+        server = HttpServer()
+        noop = lambda *args, **kwargs: None  # noqa: E731
+        server.log = SimpleNamespace(debug=noop, info=noop, warn=noop, error=noop)
+        server.set_http_debug_enabled(False)
+        server.add_handler(Handler())
+        await server.start("127.0.0.1", 0)
+        port = server._server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /roles HTTP/1.1\r\nAccept-Encoding: gzip\r\nConnection: close\r\n\r\n")
+        data = await reader.read()
+        writer.close()
+        await server.close()
+        return data
+
+    head, body = asyncio.run(run()).split(b"\r\n\r\n", 1)
+    assert b"content-encoding: gzip" in head
+    assert f"content-length: {len(body)}".encode() in head
+    assert json.loads(gzip.decompress(body)) == json.loads(BODY)
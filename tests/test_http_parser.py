@@ -0,0 +1,105 @@
+"""Tests for the buffered HTTP/1.1 request parser in ``httpserver.http_util``.
+
+These tests cover:
+* request line, query string, headers and ``Content-Length`` bodies, including pipelined requests
+* ``Transfer-Encoding: chunked`` bodies with chunk extensions and trailers
+* header count, head size and body size limits (431 / 413)
+* malformed requests being rejected with 400 / 501 before any body is read
+* a closed connection returning ``None`` and one deadline covering the whole request
+"""
+
+import asyncio
+
+import pytest
+from httpserver.http_util import HttpParseError, http_parser
+
+
+def _parse_all(data: bytes, count: int = 1, limit: int = 2**16, **kwargs):
+    async def run():
+        reader = asyncio.StreamReader(limit=limit)
+        reader.feed_data(data)
+        reader.feed_eof()
+        return [await http_parser(reader, 1.0, **kwargs) for _ in range(count)]
+
+    return asyncio.run(run())
+
+
+def _parse(data: bytes, **kwargs):
+    return _parse_all(data, **kwargs)[0]
+
+
+def _status(data: bytes, **kwargs) -> int:
+    with pytest.raises(HttpParseError) as e:
+        _parse(data, **kwargs)
+    return e.value.status_code
+
+
+def test_request_with_content_length_body():
+    request = _parse(
+        b'POST /api/v1/items?x=1&x=2 HTTP/1.1\r\nHost: bot\r\nX-Empty:\r\nContent-Length: 5\r\n\r\nhello'
+    )
+    assert (request.method, request.path, request.version) == ('POST', '/api/v1/items', 'HTTP/1.1')
+    assert request.query_params == {'x': ['1', '2']}
+    assert request.headers.get('host') == 'bot'
+    assert request.headers.get('x-empty') == ''
+    assert request.body == b'hello'
+
+
+def test_pipelined_requests_and_close():
+    first, second, closed = _parse_all(
+        b'GET /a HTTP/1.1\r\n\r\nPOST /b HTTP/1.1\r\nContent-Length: 2\r\n\r\nok', count=3
+    )
+    assert (first.path, first.body) == ('/a', None)
+    assert (second.path, second.body) == ('/b', b'ok')
+    assert closed is None
+
+
+def test_chunked_body():
+    first, second = _parse_all(
+        b'POST /hook HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n'
+        b'5;name=value\r\nhello\r\n6\r\n world\r\n0\r\nX-Trailer: yes\r\n\r\n'
+        b'GET /next HTTP/1.1\r\n\r\n',
+        count=2,
+    )
+    assert first.body == b'hello world'
+    assert second.path == '/next'
+
+
+def test_limits():
+    assert _status(b'GET / HTTP/1.1\r\n' + b'X-A: b\r\n' * 5 + b'\r\n', max_headers=4) == 431
+    assert _status(b'GET / HTTP/1.1\r\nX-A: ' + b'a' * 200 + b'\r\n\r\n', max_header_bytes=100) == 431
+    # larger than the stream buffer itself
+    assert _status(b'GET / HTTP/1.1\r\nX-A: ' + b'a' * 200 + b'\r\n\r\n', limit=64) == 431
+    assert _status(b'POST / HTTP/1.1\r\nContent-Length: 11\r\n\r\nhello world', max_body_bytes=10) == 413
+    chunked = b'POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n6\r\nhello \r\n5\r\nworld\r\n0\r\n\r\n'
+    assert _status(chunked, max_body_bytes=10) == 413
+
+
+@pytest.mark.parametrize(
+    'data, status',
+    [
+        (b'GET /\r\n\r\n', 400),
+        (b'GET / HTTP/2\r\n\r\n', 400),
+        (b'GET / HTTP/1.1\r\nno colon\r\n\r\n', 400),
+        (b'GET / HTTP/1.1\r\nBad Name: x\r\n\r\n', 400),
+        (b'POST / HTTP/1.1\r\nContent-Length: -1\r\n\r\n', 400),
+        (b'POST / HTTP/1.1\r\nContent-Length: 1\r\nContent-Length: 2\r\n\r\nab', 400),
+        (b'POST / HTTP/1.1\r\nContent-Length: 1\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n', 400),
+        (b'POST / HTTP/1.1\r\nTransfer-Encoding: gzip\r\n\r\n', 501),
+        (b'POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n1_0\r\n', 400),
+        (b'POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n2\r\nabcd', 400),
+    ],
+)
+def test_malformed_requests(data, status):
+    assert _status(data) == status
+
+
+def test_one_deadline_for_the_whole_request():
+    async def run():
+        reader = asyncio.StreamReader()
+        # the head arrives, the body never does
+        reader.feed_data(b'POST / HTTP/1.1\r\nContent-Length: 10\r\n\r\nabc')
+        await http_parser(reader, 0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
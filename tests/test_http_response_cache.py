@@ -0,0 +1,214 @@
+"""Tests for the response cache and conditional GET support in ``httpserver.response_cache``.
+
+These tests cover:
+* ``If-None-Match`` matching: weak tags, ``*``, lists and compressed (``-gzip``) variants
+* cache keys shared by alias paths and separated by route variables, query string and auth headers
+* TTL expiry, tag invalidation, LRU eviction and responses produced during an invalidation not being stored
+* concurrent misses waiting for one handler call
+* responses cached for authenticated requests being dropped by a settings write (token rotation)
+* ``HttpServer`` answering repeat requests from the cache and ``304`` without calling the handler
+"""
+
+import asyncio
+import gzip
+import json
+from types import SimpleNamespace
+
+from httpserver.EndpointDecorators import uri_mapping, uri_variable_mapping
+from httpserver.http_util import HttpHeaders, HttpRequest, HttpResponse
+from httpserver.response_cache import CachePolicy, ResponseCache, cache_response, etag_matches, make_etag
+from httpserver.server import HttpServer
+
+POLICY = CachePolicy(ttl=10, tags=("minecraft.users",))
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _request(path="/whitelist.json", query=None, **headers):
+    request_headers = HttpHeaders()
+    for name, value in headers.items():
+        request_headers.set(name.replace("_", "-"), value)
+    return HttpRequest(0.0, "GET", path, query or {}, "HTTP/1.1", request_headers)
+
+
+def _json(payload):
+    return HttpResponse(200, HttpHeaders().set("Content-Type", "application/json"), json.dumps(payload).encode())
+
+
+def handler(request):
+    return None
+
+
+def test_etag_matches():
+    etag = make_etag(b"body")
+    assert etag.startswith('"') and etag.endswith('"')
+    opaque = etag.strip('"')
+    assert etag_matches(None, etag) is None
+    assert etag_matches(etag, etag) == etag
+    assert etag_matches(f'W/{etag}', etag) == f'W/{etag}'
+    assert etag_matches(f'"other", "{opaque}-gzip"', etag) == f'"{opaque}-gzip"'
+    assert etag_matches("*", etag) == etag
+    assert etag_matches('"other"', etag) is None
+    assert etag_matches(f'"{opaque}-other"', etag) is None
+
+
+def test_keys():
+    cache = ResponseCache()
+    base = cache.key(_request(), handler, {})
+    assert cache.key(_request("/alias/whitelist.json"), handler, {}) == base
+    assert cache.key(_request(), handler, {"guild_id": "1"}) != cache.key(_request(), handler, {"guild_id": "2"})
+    assert cache.key(_request(query={"limit": ["5"]}), handler, {}) != base
+    with_token = cache.key(_request(x_tacobot_token="secret"), handler, {})
+    assert with_token != base
+    assert "secret" not in repr(with_token)
+    assert cache.key(_request(x_tacobot_token="other"), handler, {}) != with_token
+
+
+def test_ttl_invalidation_and_eviction():
+    clock = Clock()
+    cache = ResponseCache(max_entries=2, clock=clock)
+    entry = cache.put(("a",), POLICY, _json([1]))
+    assert entry.etag == make_etag(json.dumps([1]).encode())
+    assert cache.get(("a",)).response().headers.get("etag") == entry.etag
+
+    clock.now = 11
+    assert cache.get(("a",)) is None
+
+    cache.put(("a",), POLICY, _json([1]))
+    cache.put(("b",), CachePolicy(ttl=10, tags=("settings",)), _json([2]))
+    assert cache.invalidate("minecraft.users") == 1
+    assert cache.get(("a",)) is None and cache.get(("b",)) is not None
+
+    cache.put(("c",), POLICY, _json([3]))
+    cache.put(("d",), POLICY, _json([4]))
+    # "b" was used least recently
+    assert cache.get(("b",)) is None
+    assert cache.put(("e",), POLICY, HttpResponse(500, None, b"error")) is None
+
+    generation = cache.generation
+    cache.invalidate("settings")
+    assert cache.put(("f",), POLICY, _json([5]), generation) is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_concurrent_misses_call_the_handler_once():
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return _json({"ok": True})
+
+    async def run():
+        cache = ResponseCache()
+        responses = await asyncio.gather(*(cache.serve(_request(), handler, {}, POLICY, produce) for _ in range(5)))
+        return cache, responses
+
+    cache, responses = asyncio.run(run())
+    assert len(calls) == 1
+    assert {response.body for response in responses} == {b'{"ok": true}'}
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_authenticated_responses_are_dropped_by_settings_writes():
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        return _json({"ok": True})
+
+    async def run():
+        cache = ResponseCache()
+        request = _request(x_tacobot_token="secret")
+        await cache.serve(request, handler, {}, POLICY, produce)
+        await cache.serve(_request(), handler, {}, POLICY, produce)
+        # the token was rotated: only the response cached for the authenticated request goes
+        assert cache.invalidate("settings") == 1
+        await cache.serve(request, handler, {}, POLICY, produce)
+        await cache.serve(_request(), handler, {}, POLICY, produce)
+
+    asyncio.run(run())
+    assert len(calls) == 3
+
+
+class Handler:
+    def __init__(self):
+        self.calls = 0
+
+    @uri_mapping("/api/v1/minecraft/whitelist.json", method="GET")
+    @uri_mapping("/taco/minecraft/whitelist.json", method="GET")
+    @cache_response(ttl=60, tags=("minecraft.users",))
+    def whitelist(self, request):
+        self.calls += 1
+        return [{"uuid": f"{i:032x}", "name": f"player{i}"} for i in range(50)]
+
+    @uri_variable_mapping("/api/v1/guilds/{guild_id}/settings", method="GET")
+    @cache_response(ttl=60, tags=("settings",))
+    def settings(self, request, uri_variables):
+        self.calls += 1
+        return HttpResponse(401, HttpHeaders().set("Content-Type", "application/json"), b'{"error": "no"}')
+
+
+async def _get(port, path, headers=""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nConnection: close\r\n{headers}\r\n".encode())
+    data = await reader.read()
+    writer.close()
+    head, body = data.split(b"\r\n\r\n", 1)
+    lines = head.decode().split("\r\n")
+    response_headers = dict(line.lower().split(": ", 1) for line in lines[1:])
+    return int(lines[0].split(" ")[1]), response_headers, body
+
+
+def test_server_serves_cache_hits_and_304s():
+    async def run():
+        server = HttpServer()
+        noop = lambda *args, **kwargs: None  # noqa: E731
+        server.log = SimpleNamespace(debug=noop, info=noop, warn=noop, error=noop)
+        server.set_http_debug_enabled(False)
+        server._response_cache = ResponseCache()
+        handler = Handler()
+        server.add_handler(handler)
+        await server.start("127.0.0.1", 0)
+        port = server._server.sockets[0].getsockname()[1]
+
+        results = {"first": await _get(port, "/api/v1/minecraft/whitelist.json")}
+        etag = results["first"][1]["etag"]
+        results["alias"] = await _get(port, "/taco/minecraft/whitelist.json")
+        results["not_modified"] = await _get(port, "/api/v1/minecraft/whitelist.json", f"If-None-Match: {etag}\r\n")
+        results["gzip"] = await _get(port, "/api/v1/minecraft/whitelist.json", "Accept-Encoding: gzip\r\n")
+        gzip_etag = results["gzip"][1]["etag"]
+        results["gzip_304"] = await _get(
+            port, "/api/v1/minecraft/whitelist.json", f"Accept-Encoding: gzip\r\nIf-None-Match: {gzip_etag}\r\n"
+        )
+        calls_before_invalidate = handler.calls
+        server._response_cache.invalidate("minecraft.users")
+        results["after_invalidate"] = await _get(port, "/api/v1/minecraft/whitelist.json")
+
+        await _get(port, "/api/v1/guilds/1/settings")
+        await _get(port, "/api/v1/guilds/1/settings")
+        await server.close()
+        return results, calls_before_invalidate, handler.calls, server._response_cache.stats()
+
+    results, calls_before_invalidate, calls, stats = asyncio.run(run())
+
+    status, headers, body = results["first"]
+    assert status == 200 and headers["etag"].startswith('"')
+    assert results["alias"][2] == body
+    status, headers, body_304 = results["not_modified"]
+    assert status == 304 and body_304 == b"" and "content-length" not in headers
+    status, headers, gzip_body = results["gzip"]
+    assert headers["content-encoding"] == "gzip" and gzip.decompress(gzip_body) == body
+    assert headers["etag"] != results["first"][1]["etag"]
+    assert results["gzip_304"][0] == 304
+    assert calls_before_invalidate == 1
+    assert results["after_invalidate"][0] == 200
+    # one more whitelist call after the invalidation; errors are never cached
+    assert calls == 1 + 1 + 2
+    assert stats["not_modified"] == 2
@@ -0,0 +1,102 @@
+"""Tests for the segment-tree router in ``httpserver.router``.
+
+These tests cover:
+* static routes, variable routes and raw regex routes resolving to their handler
+* variable values returned from the same walk, in template order
+* literal segments winning over variables, with backtracking when the literal branch has no route
+* method mismatches and extra or missing segments not matching
+* ``_convert_params`` using the captured variables instead of re-running the route regex
+"""
+
+from http import HTTPMethod
+
+from httpserver.EndpointDecorators import uri_mapping, uri_pattern_mapping, uri_variable_mapping
+from httpserver.router import Router
+from httpserver.server import _convert_params, _scan_handler_for_uri_routes
+from httpserver.http_util import HttpHeaders, HttpRequest
+
+
+class Handler:
+    @uri_mapping('/health', method=['GET', 'HEAD'])
+    def health(self, request):
+        return 'health'
+
+    @uri_variable_mapping('/api/v1/guild/{guild_id}/emojis', method=HTTPMethod.GET)
+    @uri_variable_mapping('/tacobot/guild/{guild_id}/emojis', method=HTTPMethod.GET)
+    def emojis(self, request, uri_variables):
+        return 'emojis'
+
+    @uri_variable_mapping('/api/v1/guild/{guild_id}/emoji/{emoji_id}', method=HTTPMethod.GET)
+    def emoji(self, request, uri_variables):
+        return 'emoji'
+
+    @uri_variable_mapping('/api/v1/guild/lookup/{name}', method=HTTPMethod.GET)
+    def lookup(self, request, uri_variables):
+        return 'lookup'
+
+    @uri_variable_mapping('/api/v1/permissions/{guildId}/{userId}/{permission}', method=[HTTPMethod.POST, 'DELETE'])
+    def permission(self, request, uri_variables):
+        return 'permission'
+
+    @uri_variable_mapping('/api/v1/files/{name}.json', method=HTTPMethod.GET)
+    def file(self, request, uri_variables):
+        return 'file'
+
+    @uri_pattern_mapping(r'^/raw/(?P<slug>[a-z]+)$', method=HTTPMethod.GET)
+    def raw(self, request, uri_variables):
+        return 'raw'
+
+
+def _router():
+    router = Router()
+    for method, route in _scan_handler_for_uri_routes(Handler()):
+        router.add(route, method)
+    return router
+
+
+def _name(match):
+    route, handler, _ = match
+    return handler.__name__ if handler else None
+
+
+def test_static_and_variable_routes():
+    router = _router()
+    assert _name(router.find('HEAD', '/health')) == 'health'
+    assert router.find('GET', '/tacobot/guild/42/emojis')[2] == {'guild_id': '42'}
+    assert router.find('GET', '/api/v1/guild/42/emoji/7')[2] == {'guild_id': '42', 'emoji_id': '7'}
+    assert router.find('DELETE', '/api/v1/permissions/1/2/admin')[2] == {
+        'guildId': '1',
+        'userId': '2',
+        'permission': 'admin',
+    }
+    assert router.find('GET', '/api/v1/files/report.json')[2] == {'name': 'report'}
+    assert router.find('GET', '/raw/abc')[2] == {'slug': 'abc'}
+
+
+def test_literal_segment_backtracks_to_variable():
+    router = _router()
+    # "lookup" is a literal child of /guild, but /guild/lookup/emojis only exists under {guild_id}
+    route, handler, variables = router.find('GET', '/api/v1/guild/lookup/emojis')
+    assert handler.__name__ == 'lookup'
+    assert variables == {'name': 'emojis'}
+    route, handler, variables = router.find('GET', '/api/v1/guild/lookup/emoji/9')
+    assert handler.__name__ == 'emoji'
+    assert variables == {'guild_id': 'lookup', 'emoji_id': '9'}
+
+
+def test_non_matches():
+    router = _router()
+    assert router.find('POST', '/api/v1/guild/42/emojis') == (None, None, {})
+    assert router.find('GET', '/api/v1/guild/42') == (None, None, {})
+    assert router.find('GET', '/api/v1/guild/42/emojis/extra') == (None, None, {})
+    assert router.find('GET', '/api/v1/files/report.txt') == (None, None, {})
+    assert router.find('GET', '/raw/ABC') == (None, None, {})
+
+
+def test_convert_params_uses_captured_variables():
+    router = _router()
+    route, handler, variables = router.find('GET', '/api/v1/guild/42/emoji/7')
+    request = HttpRequest(0.0, 'GET', '/api/v1/guild/42/emoji/7', {}, 'HTTP/1.1', HttpHeaders())
+    assert _convert_params(request, route, handler, variables) == [request, {'guild_id': '42', 'emoji_id': '7'}]
+    # without captured variables the route regex is still used
+    assert _convert_params(request, route, handler) == [request, {'guild_id': '42', 'emoji_id': '7'}]
@@ -0,0 +1,174 @@
+"""Tests for ``HttpServer`` connection management, driven by a small local load generator.
+
+These tests cover:
+* keep-alive connections serving several requests, and ``Connection: close`` from the client
+* the per-connection request cap closing the connection after its last response
+* idle keep-alive connections being closed after ``keepalive_timeout``
+* the connection cap answering extra connections with a fast 503 under load
+* ``close()`` closing idle connections and letting in-flight requests finish
+* a failing auth callback answering 500 and keeping the connection usable
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from httpserver.EndpointDecorators import uri_mapping
+from httpserver.server import HttpServer
+
+
+class Handler:
+    def __init__(self, server):
+        self.server = server
+        self.peak_connections = 0
+
+    @uri_mapping('/ping', method='GET')
+    async def ping(self, request):
+        self.peak_connections = max(self.peak_connections, len(self.server._connections))
+        return {'ok': True}
+
+    @uri_mapping('/slow', method='GET')
+    async def slow(self, request):
+        self.peak_connections = max(self.peak_connections, len(self.server._connections))
+        await asyncio.sleep(0.2)
+        return {'ok': True}
+
+    @uri_mapping('/guarded', method='GET', auth_callback=lambda request: request.headers.get('X-Token')['value'])
+    async def guarded(self, request):
+        return {'ok': True}
+
+
+async def _start(**settings):
+    server = HttpServer()
+    noop = lambda *args, **kwargs: None  # noqa: E731
+    server.log = SimpleNamespace(debug=noop, info=noop, warn=noop, error=noop)
+    server.set_http_debug_enabled(False)
+    for key, value in settings.items():
+        setattr(server, key, value)
+    handler = Handler(server)
+    server.add_handler(handler)
+    await server.start('127.0.0.1', 0)
+    port = server._server.sockets[0].getsockname()[1]
+    return server, handler, port
+
+
+async def _request(reader, writer, path='/ping', headers=''):
+    writer.write(f'GET {path} HTTP/1.1\r\nHost: test\r\n{headers}\r\n'.encode())
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode().split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    response_headers = {}
+    for line in lines[1:]:
+        if line:
+            key, value = line.split(': ', 1)
+            response_headers[key.lower()] = value
+    await reader.readexactly(int(response_headers.get('content-length', 0)))
+    return status, response_headers
+
+
+async def _closed(reader) -> bool:
+    return await asyncio.wait_for(reader.read(), 1.0) == b''
+
+
+def test_keep_alive_and_request_cap():
+    async def run():
+        server, _, port = await _start(max_requests_per_connection=3)
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        results = [await _request(reader, writer) for _ in range(3)]
+        closed = await _closed(reader)
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        explicit = await _request(reader, writer, headers='Connection: close\r\n')
+        explicit_closed = await _closed(reader)
+        await server.close()
+        return results, closed, explicit, explicit_closed
+
+    results, closed, explicit, explicit_closed = asyncio.run(run())
+
+    assert [status for status, _ in results] == [200, 200, 200]
+    assert 'connection' not in results[0][1]
+    assert results[2][1]['connection'] == 'close'
+    assert closed
+    assert explicit[1]['connection'] == 'close' and explicit_closed
+
+
+def test_idle_keep_alive_connection_is_closed():
+    async def run():
+        server, _, port = await _start(keepalive_timeout=0.1)
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        status, _ = await _request(reader, writer)
+        closed = await _closed(reader)
+        await asyncio.sleep(0.05)
+        stats = server.connection_stats()
+        await server.close()
+        return status, closed, stats
+
+    status, closed, stats = asyncio.run(run())
+
+    assert status == 200
+    assert closed
+    assert stats['open'] == 0
+
+
+def test_connection_cap_sheds_load_with_503():
+    async def client(port, requests):
+        statuses = []
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        try:
+            for _ in range(requests):
+                status, headers = await _request(reader, writer, path='/slow')
+                statuses.append(status)
+                if headers.get('connection') == 'close':
+                    break
+        finally:
+            writer.close()
+        return statuses
+
+    async def run():
+        server, handler, port = await _start(max_connections=4)
+        results = await asyncio.gather(*(client(port, 3) for _ in range(20)))
+        stats = server.connection_stats()
+        await server.close()
+        return results, handler.peak_connections, stats
+
+    results, peak, stats = asyncio.run(run())
+
+    statuses = [status for result in results for status in result]
+    assert set(statuses) == {200, 503}
+    assert statuses.count(503) == stats['rejected'] >= 16
+    assert peak <= 4
+
+
+def test_close_drains_in_flight_requests():
+    async def run():
+        server, _, port = await _start()
+        idle_reader, idle_writer = await asyncio.open_connection('127.0.0.1', port)
+        await _request(idle_reader, idle_writer)
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        in_flight = asyncio.create_task(_request(reader, writer, path='/slow'))
+        await asyncio.sleep(0.05)
+        await server.close()
+        return await in_flight, await _closed(idle_reader), server.connection_stats()
+
+    (status, headers), idle_closed, stats = asyncio.run(run())
+
+    assert status == 200
+    assert headers['connection'] == 'close'
+    assert idle_closed
+    assert stats['open'] == 0
+
+
+def test_auth_callback_failure_returns_500():
+    async def run():
+        server, _, port = await _start()
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        failed = await _request(reader, writer, path='/guarded')
+        after = await _request(reader, writer)
+        await server.close()
+        return failed, after
+
+    failed, after = asyncio.run(run())
+
+    assert failed[0] == 500
+    assert after[0] == 200
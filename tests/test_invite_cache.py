@@ -0,0 +1,138 @@
+"""Tests for ``bot.lib.discord.invite_cache.InviteCache``.
+
+These tests cover:
+* a burst of joins sharing one refetch, with the uses it finds handed out in join order
+* invite create/delete events updating the cache without a fetch
+* an invite deleted with its last use attributed without a refetch, whichever event arrives first
+* guilds without permission to list invites not being asked again
+* an unseeded guild being seeded by its first join
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+from bot.lib.discord.invite_cache import InviteCache
+
+GUILD = SimpleNamespace(id=1)
+
+
+def _invite(code, uses=0, max_uses=0):
+    return SimpleNamespace(code=code, uses=uses, max_uses=max_uses, guild=GUILD)
+
+
+class FakeFetch:
+    def __init__(self, *invites):
+        self.invites = list(invites)
+        self.calls = 0
+        self.forbidden = False
+
+    def set(self, *invites):
+        self.invites = list(invites)
+
+    async def __call__(self, guild):
+        self.calls += 1
+        if self.forbidden:
+            raise discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "Missing Permissions")
+        return list(self.invites)
+
+
+@pytest.fixture
+def fetch():
+    return FakeFetch(_invite("a", uses=1), _invite("b", uses=5))
+
+
+def _cache(fetch):
+    return InviteCache(fetch=fetch, refetch_delay=0)
+
+
+def test_join_burst_shares_one_fetch(fetch):
+    async def run():
+        cache = _cache(fetch)
+        await cache.refresh(GUILD)
+        fetch.set(_invite("a", uses=3), _invite("b", uses=6))
+        results = await asyncio.gather(*(cache.attribute(GUILD, member) for member in (10, 11, 12)))
+        return cache, results
+
+    cache, results = asyncio.run(run())
+
+    assert fetch.calls == 2
+    assert sorted(invite.code for invite in results) == ["a", "a", "b"]
+    assert cache.stats()["coalesced"] == 2
+    assert cache.get(1, "a").uses == 3
+
+
+def test_create_and_delete_events_update_without_fetch(fetch):
+    async def run():
+        cache = _cache(fetch)
+        await cache.refresh(GUILD)
+        cache.add(_invite("c"))
+        cache.remove(_invite("b"))
+        return cache
+
+    cache = asyncio.run(run())
+
+    assert fetch.calls == 1
+    assert cache.get(1, "c") is not None
+    assert cache.get(1, "b") is None
+
+
+def test_exhausted_invite_is_attributed_without_fetch(fetch):
+    async def run():
+        cache = _cache(fetch)
+        await cache.refresh(GUILD)
+        cache.add(_invite("once", uses=0, max_uses=1))
+        # Discord deletes the invite as the join uses it; the delete event beats the join event
+        cache.remove(_invite("once"))
+        return await cache.attribute(GUILD, 10)
+
+    invite = asyncio.run(run())
+
+    assert invite.code == "once"
+    assert fetch.calls == 1
+
+
+def test_join_before_delete_finds_the_missing_invite(fetch):
+    async def run():
+        cache = _cache(fetch)
+        fetch.set(_invite("a", uses=1), _invite("once", uses=0, max_uses=1))
+        await cache.refresh(GUILD)
+        fetch.set(_invite("a", uses=1))
+        invite = await cache.attribute(GUILD, 10)
+        # the late delete event must not be handed to the next join
+        cache.remove(_invite("once"))
+        return cache, invite
+
+    cache, invite = asyncio.run(run())
+
+    assert invite.code == "once"
+    assert cache._take_exhausted(1) is None
+
+
+def test_forbidden_guild_is_not_refetched(fetch):
+    fetch.forbidden = True
+
+    async def run():
+        cache = _cache(fetch)
+        with pytest.raises(discord.Forbidden):
+            await cache.refresh(GUILD)
+        return [await cache.attribute(GUILD, member) for member in (10, 11)]
+
+    results = asyncio.run(run())
+
+    assert results == [None, None]
+    assert fetch.calls == 1
+
+
+def test_unseeded_guild_is_seeded_by_first_join(fetch):
+    async def run():
+        cache = _cache(fetch)
+        invite = await cache.attribute(GUILD, 10)
+        return cache, invite
+
+    cache, invite = asyncio.run(run())
+
+    assert invite is None
+    assert cache.is_seeded(1)
+    assert cache.stats()["unattributed"] == 1
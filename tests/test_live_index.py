@@ -0,0 +1,166 @@
+"""Tests for the in-memory live index in ``bot.lib.mongodb.live`` and the ``live_now`` presence fast path.
+
+These tests cover:
+* presence updates that do not change what a member streams returning without settings or database I/O
+* a go-live claiming the platform once, so duplicate events do not post twice
+* going offline cleaning up and clearing the index
+* ``track_live`` / ``untrack_live`` keeping the index in step with ``live_tracked``
+* falling back to ``live_tracked`` while the index is not seeded
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+from bot.cogs import live_now
+from bot.lib.mongodb.live import LiveDatabase, LiveIndex
+
+
+class FakeLiveDatabase:
+    def __init__(self):
+        self.calls = []
+        self.tracked = []
+
+    def get_tracked_live(self, guild_id, user_id, platform):
+        self.calls.append("get_tracked_live")
+        return [t for t in self.tracked if t["user_id"] == str(user_id) and t["platform"] == platform.upper()]
+
+    def get_tracked_live_by_user(self, guildId, userId):
+        self.calls.append("get_tracked_live_by_user")
+        return [t for t in self.tracked if t["user_id"] == str(userId)]
+
+    def track_live(self, guildId, userId, platform, channelId=None, messageId=None, url=None):
+        self.calls.append("track_live")
+        self.tracked.append({"user_id": str(userId), "platform": platform.upper(), "url": url})
+        LiveDatabase.live.add(guildId, userId, platform)
+
+    def track_live_activity(self, guildId, userId, live, platform, url):
+        self.calls.append("track_live_activity")
+
+    def untrack_live(self, guildId, userId, platform):
+        self.calls.append("untrack_live")
+        self.tracked = [t for t in self.tracked if not (t["user_id"] == str(userId) and t["platform"] == platform)]
+        LiveDatabase.live.remove(guildId, userId, platform)
+
+
+class FakeDiscordHelper:
+    def __init__(self):
+        self.tacos = 0
+
+    async def add_remove_roles(self, **kwargs):
+        return None
+
+    async def taco_give_user(self, **kwargs):
+        self.tacos += 1
+
+    async def get_or_fetch_member(self, guildId, userId):
+        return _member(userId, streaming=False)
+
+
+def _member(user_id: int, streaming: bool) -> SimpleNamespace:
+    activities = []
+    if streaming:
+        activities.append(discord.Streaming(name="Kick", url="https://example.com/live", details="stream"))
+    return SimpleNamespace(
+        id=user_id,
+        guild=SimpleNamespace(id=1, emojis=[]),
+        activities=tuple(activities),
+        display_name=f"user{user_id}",
+        discriminator="0",
+    )
+
+
+@pytest.fixture
+def live_index(monkeypatch):
+    index = LiveIndex()
+    monkeypatch.setattr(LiveDatabase, "live", index)
+    return index
+
+
+@pytest.fixture
+def cog(live_index):
+    settings_reads = []
+    cog = object.__new__(live_now.LiveNow)
+    cog._module = "live_now"
+    cog._class = "LiveNow"
+    noop = lambda *args, **kwargs: None  # noqa: E731
+    cog.log = SimpleNamespace(debug=noop, info=noop, warn=noop, error=noop)
+    cog.live_db = FakeLiveDatabase()
+    cog.discord_helper = FakeDiscordHelper()
+    cog.settings = SimpleNamespace(get_string=lambda guildId, key: key)
+    cog.bot = SimpleNamespace(user=SimpleNamespace(id=0))
+    cog.get_cog_settings = lambda guildId=0: settings_reads.append(guildId) or {"enabled": True, "watch": []}
+    cog.get_tacos_settings = lambda guildId=0: {}
+    cog.settings_reads = settings_reads
+    return cog
+
+
+def _update(cog, user_id, before_streaming, after_streaming):
+    asyncio.run(cog.on_streaming_update(_member(user_id, before_streaming), _member(user_id, after_streaming)))
+
+
+def test_non_streaming_updates_do_no_io(cog, live_index):
+    live_index.seed([])
+    for user_id in range(50):
+        _update(cog, user_id, False, False)
+
+    assert cog.live_db.calls == []
+    assert cog.settings_reads == []
+
+
+def test_still_live_updates_do_no_io(cog, live_index):
+    live_index.seed([("1", "7", "KICK")])
+    _update(cog, 7, True, True)
+
+    assert cog.live_db.calls == []
+    assert cog.settings_reads == []
+
+
+def test_go_live_is_handled_once(cog, live_index):
+    live_index.seed([])
+
+    async def run():
+        before, after = _member(7, False), _member(7, True)
+        await asyncio.gather(cog.on_streaming_update(before, after), cog.on_streaming_update(before, after))
+
+    asyncio.run(run())
+
+    assert cog.live_db.calls.count("track_live") == 1
+    assert cog.discord_helper.tacos == 1
+    assert live_index.platforms(1, 7) == {"KICK"}
+
+
+def test_go_offline_cleans_up(cog, live_index):
+    live_index.seed([])
+    _update(cog, 7, False, True)
+    _update(cog, 7, True, False)
+
+    assert "untrack_live" in cog.live_db.calls
+    assert live_index.platforms(1, 7) == frozenset()
+    # and the next unrelated update is back on the fast path
+    calls = len(cog.live_db.calls)
+    _update(cog, 7, False, False)
+    assert len(cog.live_db.calls) == calls
+
+
+def test_unseeded_index_falls_back_to_database(cog, live_index, monkeypatch):
+    async def no_sleep(delay):
+        return None
+
+    monkeypatch.setattr(live_now.asyncio, "sleep", no_sleep)
+    _update(cog, 7, False, False)
+
+    assert cog.live_db.calls == ["get_tracked_live_by_user"]
+    assert live_index.platforms(1, 7) is None
+
+
+def test_index_tracks_platforms(live_index):
+    live_index.seed([("1", "2", "twitch ")])
+    assert live_index.platforms(1, 2) == {"TWITCH"}
+    assert not live_index.claim(1, 2, "Twitch")
+    assert live_index.claim(1, 2, "youtube")
+    live_index.remove(1, 2, "TWITCH")
+    assert live_index.platforms(1, 2) == {"YOUTUBE"}
+    live_index.remove(1, 2)
+    assert live_index.platforms(1, 2) == frozenset()
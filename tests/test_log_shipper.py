@@ -0,0 +1,150 @@
+"""Tests for the background ``LogShipper`` used by ``BaseDatabase.insert_log``.
+
+These tests cover:
+* size-triggered and interval-triggered batch writes
+* explicit flush and flush on close
+* flush giving up within its timeout when the queue is full and the writer is stuck
+* drop / block policies when the queue is full
+* written / dropped / failed counters
+"""
+
+import threading
+import time
+
+import pytest
+from bot.lib.enums import loglevel
+from bot.lib.mongodb import basedatabase
+from bot.lib.mongodb.log_shipper import LogShipper
+
+
+class RecordingWriter:
+    def __init__(self, fail: bool = False, gate: threading.Event = None):
+        self.batches = []
+        self.fail = fail
+        self.gate = gate
+
+    def __call__(self, batch):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.fail:
+            raise RuntimeError("mongo is down")
+        self.batches.append(list(batch))
+
+
+def _record(i: int) -> dict:
+    return {"guild_id": "0", "message": f"m{i}"}
+
+
+def test_batches_by_size():
+    writer = RecordingWriter()
+    shipper = LogShipper(writer=writer, batch_size=5, flush_interval=60)
+    for i in range(10):
+        assert shipper.submit(_record(i))
+    assert shipper.flush(timeout=5)
+    shipper.close()
+    assert [len(b) for b in writer.batches] == [5, 5]
+    assert shipper.stats()["written"] == 10
+    assert shipper.stats()["batches"] == 2
+
+
+def test_partial_batch_written_after_interval():
+    writer = RecordingWriter()
+    shipper = LogShipper(writer=writer, batch_size=100, flush_interval=0.05)
+    shipper.submit(_record(1))
+    for _ in range(100):
+        if writer.batches:
+            break
+        threading.Event().wait(0.02)
+    shipper.close()
+    assert writer.batches == [[_record(1)]]
+
+
+def test_close_flushes_pending_records():
+    writer = RecordingWriter()
+    shipper = LogShipper(writer=writer, batch_size=100, flush_interval=60)
+    for i in range(3):
+        shipper.submit(_record(i))
+    shipper.close()
+    assert writer.batches == [[_record(0), _record(1), _record(2)]]
+    assert not shipper.submit(_record(4))
+    assert shipper.stats()["dropped"] == 1
+
+
+def test_drop_policy_counts_dropped_records():
+    gate = threading.Event()
+    writer = RecordingWriter(gate=gate)
+    shipper = LogShipper(writer=writer, batch_size=1, flush_interval=60, max_queue_size=2)
+    # first record is taken by the worker, which then blocks in the writer
+    shipper.submit(_record(0))
+    for _ in range(100):
+        if shipper.stats()["queued"] == 0:
+            break
+        threading.Event().wait(0.01)
+    results = [shipper.submit(_record(i)) for i in range(1, 6)]
+    assert results.count(False) == 3
+    gate.set()
+    shipper.close()
+    stats = shipper.stats()
+    assert stats["dropped"] == 3
+    assert stats["written"] == 3
+
+
+def test_block_policy_waits_for_room():
+    writer = RecordingWriter()
+    shipper = LogShipper(writer=writer, batch_size=1, flush_interval=60, max_queue_size=1, full_policy="block")
+    for i in range(20):
+        assert shipper.submit(_record(i))
+    shipper.close()
+    assert shipper.stats()["written"] == 20
+    assert shipper.stats()["dropped"] == 0
+
+
+def test_flush_times_out_on_full_queue():
+    gate = threading.Event()
+    writer = RecordingWriter(gate=gate)
+    shipper = LogShipper(writer=writer, batch_size=1, flush_interval=60, max_queue_size=1)
+    shipper.submit(_record(0))
+    for _ in range(100):
+        if shipper.stats()["queued"] == 0:
+            break
+        threading.Event().wait(0.01)
+    # the worker is stuck writing record 0 and record 1 fills the queue
+    assert shipper.submit(_record(1))
+    started = time.monotonic()
+    assert not shipper.flush(timeout=0.1)
+    assert time.monotonic() - started < 1
+    gate.set()
+    shipper.close()
+    assert shipper.stats()["written"] == 2
+
+
+def test_failed_writes_are_counted(capsys):
+    shipper = LogShipper(writer=RecordingWriter(fail=True), batch_size=2, flush_interval=60)
+    shipper.submit(_record(0))
+    shipper.submit(_record(1))
+    shipper.close()
+    assert shipper.stats()["failed"] == 2
+    assert "Failed to write 2 logs" in capsys.readouterr().err
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        LogShipper(writer=RecordingWriter(), full_policy="explode")
+
+
+def test_insert_log_submits_to_shipper(monkeypatch):
+    submitted = []
+
+    class FakeShipper:
+        def submit(self, record):
+            submitted.append(record)
+            return True
+
+    monkeypatch.setattr(basedatabase.LogShipper, "get_instance", classmethod(lambda cls: FakeShipper()))
+    db = basedatabase.BaseDatabase()
+    db.insert_log(guildId=42, level=loglevel.LogLevel.INFO, method="tests.method", message="hello")
+    assert len(submitted) == 1
+    assert submitted[0]["guild_id"] == "42"
+    assert submitted[0]["level"] == "INFO"
+    assert submitted[0]["message"] == "hello"
+    assert db.connection is None
@@ -0,0 +1,131 @@
+"""Tests for level gating and console output in ``bot.lib.logger`` / ``bot.lib.log_output``.
+
+These tests cover:
+* messages below the minimum level are not formatted, printed or stored
+* callable (lazy) messages are only evaluated when the level is enabled
+* TTY-aware colorization and the ``json`` output format
+* ``BaseDatabase.log`` honoring ``LOG_LEVEL``
+"""
+
+import io
+import json
+
+import pytest
+from bot.lib.colors import Colors
+from bot.lib.enums import loglevel
+from bot.lib.log_output import LogOutput
+from bot.lib.logger import Log
+from bot.lib.mongodb.basedatabase import BaseDatabase
+
+
+class FakeLogsDatabase:
+    def __init__(self):
+        self.records = []
+
+    def insert_log(self, **kwargs):
+        self.records.append(kwargs)
+
+
+class TtyStream(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.fixture
+def make_log(monkeypatch):
+    monkeypatch.delenv("LOG_FORMAT", raising=False)
+    monkeypatch.delenv("LOG_COLOR", raising=False)
+    monkeypatch.delenv("NO_COLOR", raising=False)
+
+    def factory(level: loglevel.LogLevel) -> Log:
+        log = Log(minimumLogLevel=level)
+        log.logs_db = FakeLogsDatabase()  # type: ignore[assignment]
+        return log
+
+    return factory
+
+
+def test_below_threshold_is_skipped(make_log, capsys):
+    log = make_log(loglevel.LogLevel.INFO)
+    calls = []
+
+    def message():
+        calls.append(1)
+        return "expensive"
+
+    log.debug(0, "tests.method", message)
+    assert calls == []
+    assert capsys.readouterr().out == ""
+    assert log.logs_db.records == []
+
+
+def test_enabled_level_evaluates_lazy_message(make_log, capsys):
+    log = make_log(loglevel.LogLevel.DEBUG)
+    log.debug(1, "tests.method", lambda: "built late")
+    assert "[DEBUG] [tests.method] [1] built late" in capsys.readouterr().out
+    assert log.logs_db.records[0]["message"] == "built late"
+
+
+def test_is_enabled_for(make_log):
+    log = make_log(loglevel.LogLevel.WARNING)
+    assert not log.is_enabled_for(loglevel.LogLevel.INFO)
+    assert log.is_enabled_for(loglevel.LogLevel.ERROR)
+
+
+def test_non_tty_output_is_not_colorized():
+    stream = io.StringIO()
+    LogOutput().write(5, loglevel.LogLevel.INFO, "tests.method", "hello", file=stream)
+    assert stream.getvalue() == "[INFO] [tests.method] [5] hello\n"
+
+
+def test_tty_output_is_colorized():
+    stream = TtyStream()
+    LogOutput().write(5, loglevel.LogLevel.INFO, "tests.method", "hello", file=stream)
+    assert Colors.RESET in stream.getvalue()
+
+
+def test_color_never_overrides_tty():
+    stream = TtyStream()
+    LogOutput(color="never").write(5, loglevel.LogLevel.INFO, "tests.method", "hello", file=stream)
+    assert Colors.RESET not in stream.getvalue()
+
+
+def test_json_format():
+    stream = TtyStream()
+    LogOutput(log_format="json").write(
+        5, loglevel.LogLevel.ERROR, "tests.method", "boom", stack="Traceback...", file=stream
+    )
+    payload = json.loads(stream.getvalue())
+    assert payload["level"] == "ERROR"
+    assert payload["guild_id"] == "5"
+    assert payload["method"] == "tests.method"
+    assert payload["message"] == "boom"
+    assert payload["stack_trace"] == "Traceback..."
+    assert Colors.RESET not in stream.getvalue()
+
+
+def test_from_environment(monkeypatch):
+    monkeypatch.setenv("LOG_FORMAT", "JSON")
+    monkeypatch.setenv("LOG_COLOR", "always")
+    output = LogOutput.from_environment()
+    assert output.log_format == "json"
+    monkeypatch.setenv("LOG_FORMAT", "text")
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert LogOutput.from_environment().color == "never"
+
+
+def test_invalid_format_rejected():
+    with pytest.raises(ValueError):
+        LogOutput(log_format="xml")
+
+
+def test_base_database_log_honors_log_level(monkeypatch, capsys):
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    db = BaseDatabase()
+    inserted = []
+    monkeypatch.setattr(db, "insert_log", lambda **kwargs: inserted.append(kwargs))
+    db.log(guildId=0, level=loglevel.LogLevel.DEBUG, method="tests.method", message=lambda: 1 / 0)
+    assert capsys.readouterr().out == ""
+    db.log(guildId=0, level=loglevel.LogLevel.WARNING, method="tests.method", message=lambda: "kept")
+    assert "kept" in capsys.readouterr().out
+    assert inserted[0]["message"] == "kept"
@@ -0,0 +1,170 @@
+"""Tests for the single ``on_message`` dispatch pipeline in ``bot.lib.discord.message_pipeline``.
+
+These tests cover:
+* one ``MessageContext`` (and one prefix lookup) per message, shared by every handler
+* interest filtering on guild, bots, commands, message types, patterns and predicates
+* a predicate that raises skipping only its handler
+* a failing handler being isolated from the others and counted in ``stats``
+* settings sections memoized per message with the global fallback
+"""
+
+import asyncio
+import re
+from types import SimpleNamespace
+
+import discord
+import pytest
+from bot.lib.discord.message_pipeline import MessageContext, MessageInterest, MessagePipeline
+
+
+class FakeBot:
+    def __init__(self, prefixes=(".taco ",)):
+        self.prefixes = list(prefixes)
+        self.prefix_calls = 0
+
+    async def get_prefix(self, message):
+        self.prefix_calls += 1
+        return self.prefixes
+
+
+class FakeSettings:
+    def __init__(self, sections):
+        self.sections = sections
+        self.calls = []
+
+    def get_settings(self, guild_id, section):
+        self.calls.append((guild_id, section))
+        return self.sections.get((guild_id, section))
+
+
+def _message(content="hello", bot=False, guild=True, type=discord.MessageType.default, system=False):
+    return SimpleNamespace(
+        id=99,
+        content=content,
+        type=type,
+        guild=SimpleNamespace(id=1) if guild else None,
+        channel=SimpleNamespace(id=10),
+        author=SimpleNamespace(bot=bot, system=system),
+    )
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    pipeline = MessagePipeline(FakeBot())
+    pipeline.settings = FakeSettings({})
+    monkeypatch.setattr(
+        pipeline, "log", SimpleNamespace(debug=lambda *a: None, error=lambda *a: None, warn=lambda *a: None)
+    )
+    return pipeline
+
+
+def _recorder(name, seen):
+    async def handler(ctx):
+        seen.append((name, ctx))
+
+    return handler
+
+
+def test_context_is_built_once_per_message(pipeline):
+    seen = []
+    pipeline.register("a", _recorder("a", seen), MessageInterest())
+    pipeline.register("b", _recorder("b", seen), MessageInterest())
+
+    asyncio.run(pipeline.dispatch(_message()))
+
+    assert pipeline.bot.prefix_calls == 1
+    assert sorted(name for name, _ in seen) == ["a", "b"]
+    assert seen[0][1] is seen[1][1]
+
+
+def test_no_handlers_skips_prefix_lookup(pipeline):
+    asyncio.run(pipeline.dispatch(_message()))
+    assert pipeline.bot.prefix_calls == 0
+
+
+@pytest.mark.parametrize(
+    "interest, message, expected",
+    [
+        (MessageInterest(), _message(bot=True), False),
+        (MessageInterest(bots=True), _message(bot=True), True),
+        # only author.bot is filtered; system messages reach handlers unless their predicate drops them
+        (MessageInterest(), _message(system=True), True),
+        (MessageInterest(), _message(guild=False), False),
+        (MessageInterest(guild_only=False), _message(guild=False), True),
+        (MessageInterest(commands=False), _message(".taco help"), False),
+        (MessageInterest(), _message(".taco help"), True),
+        (
+            MessageInterest(message_types=frozenset({discord.MessageType.default})),
+            _message(type=discord.MessageType.reply),
+            False,
+        ),
+        (MessageInterest(patterns=(re.compile(r"https://x\.com/"),)), _message("see https://x.com/a"), True),
+        (MessageInterest(patterns=(re.compile(r"https://x\.com/"),)), _message("nothing here"), False),
+        (MessageInterest(predicate=lambda ctx: ctx.channel_id == 10), _message(), True),
+        (MessageInterest(predicate=lambda ctx: ctx.channel_id == 11), _message(), False),
+    ],
+)
+def test_interest_filtering(pipeline, interest, message, expected):
+    seen = []
+    pipeline.register("handler", _recorder("handler", seen), interest)
+
+    asyncio.run(pipeline.dispatch(message))
+
+    assert bool(seen) is expected
+    assert pipeline.stats()["handler"]["skipped"] == (0 if expected else 1)
+
+
+def test_predicate_error_skips_only_that_handler(pipeline):
+    seen = []
+
+    def missing_settings(ctx):
+        return ctx.get_settings("restricted")
+
+    pipeline.register("broken", _recorder("broken", seen), MessageInterest(predicate=missing_settings))
+    pipeline.register("ok", _recorder("ok", seen), MessageInterest())
+
+    asyncio.run(pipeline.dispatch(_message()))
+
+    assert [name for name, _ in seen] == ["ok"]
+
+
+def test_handler_error_is_isolated(pipeline):
+    seen = []
+
+    async def broken(ctx):
+        raise RuntimeError("boom")
+
+    pipeline.register("broken", broken, MessageInterest())
+    pipeline.register("ok", _recorder("ok", seen), MessageInterest())
+
+    asyncio.run(pipeline.dispatch(_message()))
+    asyncio.run(pipeline.dispatch(_message()))
+
+    stats = pipeline.stats()
+    assert len(seen) == 2
+    assert stats["broken"]["errors"] == 2
+    assert stats["broken"]["calls"] == 2
+    assert stats["ok"]["errors"] == 0
+    assert stats["ok"]["avg_ms"] >= 0
+
+
+def test_unregister_stops_dispatch(pipeline):
+    seen = []
+    pipeline.register("a", _recorder("a", seen), MessageInterest())
+    pipeline.unregister("a")
+
+    asyncio.run(pipeline.dispatch(_message()))
+
+    assert seen == []
+    assert pipeline.stats() == {}
+
+
+def test_context_settings_are_memoized_with_global_fallback():
+    settings = FakeSettings({(0, "tacos"): {"enabled": True}})
+    ctx = MessageContext(_message(), [".taco "], settings)
+
+    assert ctx.get_settings("tacos") == {"enabled": True}
+    assert ctx.get_settings("tacos") == {"enabled": True}
+    assert settings.calls == [(1, "tacos"), (0, "tacos")]
+    with pytest.raises(Exception):
+        ctx.get_settings("missing")
@@ -0,0 +1,112 @@
+"""Tests for bucketed message tracking (``messages_daily``).
+
+These tests cover:
+* ``TrackingDatabase.track_message`` counting into one per-day document with a single upsert
+* the metrics queries summing bucket counts instead of unwinding arrays
+* the ``0001_message-buckets`` migration archiving the array documents and merging them server side
+"""
+
+import datetime
+import importlib
+from types import SimpleNamespace
+
+import pytest
+from bot.lib import utils
+from bot.lib.mongodb.metrics import MetricsDatabase
+from bot.lib.mongodb.tracking import TrackingDatabase
+
+
+class FakeCollection:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return 0
+
+        return record
+
+
+class FakeDatabase(dict):
+    def __init__(self, collections):
+        super().__init__({name: FakeCollection() for name in collections})
+        self.migration_runs = FakeCollection()
+
+    def __getattr__(self, name):
+        return self.setdefault(name, FakeCollection())
+
+    def list_collection_names(self):
+        return [name for name in self if name != "messages_daily"]
+
+
+def test_track_message_single_upsert(monkeypatch):
+    db = TrackingDatabase()
+    db.connection = SimpleNamespace(messages_daily=FakeCollection(), messages=FakeCollection())
+    db.client = object()
+    monkeypatch.setattr(db, "log", lambda **kwargs: None)
+
+    db.track_message(1, 2, 3, 4)
+
+    assert db.connection.messages.calls == []
+    ((name, args, kwargs),) = db.connection.messages_daily.calls
+    assert name == "update_one"
+    query, update = args
+    today = datetime.datetime.combine(datetime.datetime.utcnow().date(), datetime.time.min)
+    assert query == {"guild_id": "1", "user_id": "2", "day": utils.to_timestamp(today)}
+    assert update["$inc"] == {"count": 1, "channels.3": 1}
+    assert update["$set"]["last_message_id"] == "4"
+    assert kwargs == {"upsert": True}
+
+
+@pytest.mark.parametrize("method", ["get_messages_tracked_count", "get_user_messages_tracked"])
+def test_metrics_read_bucket_counts(monkeypatch, method):
+    db = MetricsDatabase()
+    db.connection = SimpleNamespace(messages_daily=FakeCollection())
+    getattr(db, method)()
+    ((name, args, _),) = db.connection.messages_daily.calls
+    assert name == "aggregate"
+    group = args[0][0]["$group"]
+    assert group["total"] == {"$sum": "$count"}
+
+
+@pytest.fixture
+def migration_module():
+    return importlib.import_module("bot.lib.migrations.0001_message-buckets_migration")
+
+
+def test_migration_archives_and_merges(migration_module):
+    migration = migration_module.Migration()
+    migration.connection = FakeDatabase(["messages"])
+
+    migration.run()
+
+    assert [call[0] for call in migration.connection["messages"].calls] == ["rename"]
+    assert migration.connection["messages"].calls[0][1] == ("messages_archive",)
+    ((name, args, kwargs),) = migration.connection["messages_archive"].calls
+    assert name == "aggregate"
+    merge = args[0][-1]["$merge"]
+    assert merge["into"] == "messages_daily"
+    assert merge["on"] == ["guild_id", "user_id", "day"]
+    daily = [call[0] for call in migration.connection["messages_daily"].calls]
+    assert daily[0] == "create_index"
+    assert migration.connection.migration_runs.calls[-1][1][1] == {"$set": {"completed": True}}
+
+
+def test_migration_rerun_reads_archive(migration_module):
+    migration = migration_module.Migration()
+    migration.connection = FakeDatabase(["messages_archive"])
+
+    migration.run()
+
+    assert [call[0] for call in migration.connection["messages_archive"].calls] == ["aggregate"]
+
+
+def test_migration_without_messages_is_a_no_op(migration_module):
+    migration = migration_module.Migration()
+    migration.connection = FakeDatabase([])
+
+    migration.run()
+
+    assert "messages_archive" not in migration.connection
+    assert migration.connection.migration_runs.calls[-1][1][1] == {"$set": {"completed": True}}
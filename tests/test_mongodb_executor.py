@@ -0,0 +1,46 @@
+"""Tests for the executor-backed awaitable DAO calls in ``bot.lib.mongodb.executor``."""
+
+import threading
+
+import pytest
+from bot.lib.mongodb import executor
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.calls = []
+
+    def get_tacos_count(self, guildId: int, userId: int) -> int:
+        self.calls.append((guildId, userId, threading.current_thread().name))
+        return 42
+
+    def add_tacos(self, guildId: int, userId: int, count: int) -> int:
+        raise ValueError("boom")
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    executor.shutdown()
+    yield
+    executor.shutdown()
+
+
+async def test_run_returns_result_from_worker_thread():
+    db = FakeDatabase()
+    result = await executor.run(db.get_tacos_count, 1, userId=2)
+    assert result == 42
+    guild_id, user_id, thread_name = db.calls[0]
+    assert (guild_id, user_id) == (1, 2)
+    assert thread_name.startswith("tacobot-db")
+    assert thread_name != threading.current_thread().name
+
+
+async def test_run_propagates_exceptions():
+    with pytest.raises(ValueError):
+        await executor.run(FakeDatabase().add_tacos, 1, 2, 3)
+
+
+async def test_executor_size_from_environment(monkeypatch):
+    monkeypatch.setenv("MONGODB_EXECUTOR_WORKERS", "3")
+    assert executor.get_executor()._max_workers == 3
+    assert executor.get_executor() is executor.get_executor()
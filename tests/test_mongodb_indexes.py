@@ -0,0 +1,103 @@
+"""Tests for the declarative index manifest in ``bot.lib.mongodb.indexes``.
+
+These tests cover:
+* DAO modules declaring ``INDEXES`` that ``collect_specs`` picks up
+* missing indexes being created once, and left alone on the next run
+* option conflicts and failed creations being reported, not raised
+* check-only mode, unmanaged indexes and the ``$indexStats`` unused report
+"""
+
+import pytest
+from bot.lib.mongodb.indexes import IndexManager, IndexSpec, collect_specs
+
+
+class FakeCollection:
+    def __init__(self, indexes=None, ops=None, fail=False):
+        self.indexes = {"_id_": {"key": [("_id", 1)], "v": 2}}
+        self.indexes.update(indexes or {})
+        self.ops = ops or {}
+        self.fail = fail
+        self.created = []
+
+    def index_information(self):
+        return dict(self.indexes)
+
+    def create_index(self, keys, name, unique=False, sparse=False):
+        if self.fail:
+            raise RuntimeError("E11000 duplicate key error")
+        self.created.append(name)
+        self.indexes[name] = {"key": list(keys), "unique": unique, "v": 2}
+        return name
+
+    def aggregate(self, pipeline):
+        assert pipeline == [{"$indexStats": {}}]
+        return [{"name": name, "accesses": {"ops": self.ops.get(name, 0)}} for name in self.indexes]
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = IndexManager()
+    manager.client = object()
+    manager.connection = {}
+    monkeypatch.setattr(manager, "log", lambda **kwargs: None)
+    return manager
+
+
+TACOS = IndexSpec("tacos", (("guild_id", 1), ("user_id", 1)), unique=True)
+
+
+def test_collect_specs_includes_dao_indexes():
+    specs = {(spec.collection, spec.index_name): spec for spec in collect_specs()}
+    assert specs[("tacos", "guild_id_1_user_id_1")].unique
+    assert specs[("settings", "guild_id_1_name_1")].unique
+    assert ("first_message", "guild_id_1_user_id_1_timestamp_1") in specs
+    assert ("twitch_user", "twitch_name_1") in specs
+    assert ("logs", "guild_id_1_timestamp_-1") in specs
+
+
+def test_ensure_creates_missing_then_is_idempotent(manager):
+    collection = FakeCollection()
+    manager.connection["tacos"] = collection
+    report = manager.ensure_indexes([TACOS])
+    assert report.created == ["tacos.guild_id_1_user_id_1"]
+    assert collection.indexes["guild_id_1_user_id_1"]["unique"] is True
+
+    report = manager.ensure_indexes([TACOS])
+    assert report.created == []
+    assert report.existing == ["tacos.guild_id_1_user_id_1"]
+    assert collection.created == ["guild_id_1_user_id_1"]
+
+
+def test_existing_index_with_other_name_is_matched_by_keys(manager):
+    manager.connection["tacos"] = FakeCollection(
+        {"by_user": {"key": [("guild_id", 1.0), ("user_id", 1.0)], "unique": True}}, ops={"by_user": 3}
+    )
+    report = manager.ensure_indexes([TACOS])
+    assert report.existing == ["tacos.guild_id_1_user_id_1"]
+    assert report.unmanaged == []
+    assert report.unused == []
+
+
+def test_option_conflict_is_reported_not_rebuilt(manager):
+    collection = FakeCollection({"guild_id_1_user_id_1": {"key": [("guild_id", 1), ("user_id", 1)]}})
+    manager.connection["tacos"] = collection
+    report = manager.ensure_indexes([TACOS])
+    assert report.conflicts == ["tacos.guild_id_1_user_id_1"]
+    assert collection.created == []
+
+
+def test_failed_creation_is_reported(manager):
+    manager.connection["tacos"] = FakeCollection(fail=True)
+    report = manager.ensure_indexes([TACOS])
+    assert report.failed == ["tacos.guild_id_1_user_id_1"]
+    assert report.created == []
+
+
+def test_check_only_reports_missing_and_unused(manager):
+    collection = FakeCollection({"legacy_1": {"key": [("legacy", 1)]}})
+    manager.connection["tacos"] = collection
+    report = manager.check_indexes([TACOS])
+    assert report.missing == ["tacos.guild_id_1_user_id_1"]
+    assert report.unmanaged == ["tacos.legacy_1"]
+    assert report.unused == ["tacos.legacy_1"]
+    assert collection.created == []
@@ -0,0 +1,261 @@
+"""Tests for the shared raw-reaction router in ``bot.lib.discord.reaction_router``.
+
+These tests cover:
+* reactions no handler is interested in being dropped without any lookups
+* interested handlers sharing one user / channel / message fetch per event
+* a burst of reactions on one message sharing one message fetch, with fresh fetches only where asked for
+* channel interests receiving every emoji in their channels
+* add-only handlers not receiving removals
+* custom emoji matched by name as well as by their full string
+* the per-guild index rebuilding after a settings write
+* a failing handler being isolated from the others
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+from bot.lib.discord.fetch_cache import FetchCache
+from bot.lib.discord.reaction_router import REACTION_ADD, REACTION_REMOVE, ReactionInterest, ReactionRouter
+from bot.lib.mongodb.settings import SettingsCache, SettingsDatabase
+
+
+class FakeSettings:
+    def __init__(self, sections):
+        self.sections = sections
+        self.calls = 0
+
+    def get_settings(self, guild_id, section):
+        self.calls += 1
+        return self.sections.get((guild_id, section))
+
+
+class FakeChannel:
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.fetches = 0
+
+    async def fetch_message(self, message_id):
+        self.fetches += 1
+        await asyncio.sleep(0)
+        return SimpleNamespace(id=message_id, reactions=[])
+
+
+class FakeDiscordHelper:
+    def __init__(self):
+        self.channel = FakeChannel(10)
+        self.calls = []
+        self.cache = FetchCache(maxsize=0, ttl=0)
+
+    async def get_or_fetch_user(self, userId):
+        self.calls.append("user")
+        await asyncio.sleep(0)
+        return SimpleNamespace(id=userId, bot=False, system=False)
+
+    async def get_or_fetch_member(self, guildId, userId):
+        self.calls.append("member")
+        return SimpleNamespace(id=userId)
+
+    async def get_or_fetch_channel(self, channelId):
+        self.calls.append("channel")
+        await asyncio.sleep(0)
+        return self.channel
+
+    async def get_or_fetch_message(self, channelId, messageId, fresh=False):
+        async def fetch():
+            channel = await self.get_or_fetch_channel(channelId)
+            return await channel.fetch_message(messageId)
+
+        key = ("message", channelId, messageId)
+        if fresh:
+            return await self.cache.refresh(key, fetch)
+        return await self.cache.get_or_fetch(key, fetch)
+
+
+def _payload(emoji="🌮", channel_id=10, event_type=REACTION_ADD, guild_id=1):
+    if isinstance(emoji, str):
+        emoji = discord.PartialEmoji(name=emoji)
+    return SimpleNamespace(
+        guild_id=guild_id,
+        channel_id=channel_id,
+        message_id=500,
+        user_id=42,
+        member=None,
+        emoji=emoji,
+        event_type=event_type,
+    )
+
+
+@pytest.fixture
+def fake_settings():
+    return FakeSettings(
+        {
+            (1, "tacos"): {"reaction_emojis": ["🌮"]},
+            (0, "wdyctw"): {"reaction_emoji": ["🇼"], "import_emoji": ["🇮"]},
+            (1, "suggestions"): {"channels": [{"id": "20"}]},
+            (1, "custom"): {"emoji": ["taco_party"]},
+        }
+    )
+
+
+@pytest.fixture
+def router(monkeypatch, fake_settings):
+    monkeypatch.setattr(SettingsDatabase, "cache", SettingsCache(ttl=60))
+    router = ReactionRouter(SimpleNamespace(), refresh_seconds=60)
+    router.settings = fake_settings
+    router.discord_helper = FakeDiscordHelper()
+    router.permissions = SimpleNamespace()
+    router.log = SimpleNamespace(error=lambda *a: None)
+    return router
+
+
+def _recorder(calls, name, fetch=False, fail=False):
+    async def handler(ctx):
+        calls.append((name, ctx.emoji))
+        if fetch:
+            await ctx.get_user()
+            await ctx.get_message()
+        if fail:
+            raise RuntimeError("boom")
+
+    return handler
+
+
+def test_uninterested_reaction_is_dropped(router):
+    calls = []
+    router.register("tacos", _recorder(calls, "tacos"), ReactionInterest("tacos", lambda s: s["reaction_emojis"]))
+
+    asyncio.run(router.dispatch(_payload("👍")))
+
+    assert calls == []
+    assert router.dropped == 1
+    assert router.discord_helper.calls == []
+
+
+def test_handlers_share_lookups(router):
+    calls = []
+    router.register("tacos", _recorder(calls, "tacos", fetch=True), ReactionInterest("tacos", lambda s: ["🌮"]))
+    router.register("other", _recorder(calls, "other", fetch=True), ReactionInterest(emojis=lambda s: ["🌮"]))
+
+    asyncio.run(router.dispatch(_payload("🌮")))
+
+    assert sorted(name for name, _ in calls) == ["other", "tacos"]
+    assert router.discord_helper.calls.count("user") == 1
+    assert router.discord_helper.calls.count("channel") == 1
+    assert router.discord_helper.channel.fetches == 1
+
+
+def test_reaction_burst_shares_message_fetch(router):
+    router.discord_helper.cache = FetchCache(maxsize=10, ttl=60)
+    seen = []
+
+    async def reader(ctx):
+        seen.append(await ctx.get_message())
+
+    router.register("reader", reader, ReactionInterest(emojis=lambda s: ["🌮"]))
+
+    async def burst():
+        await asyncio.gather(*(router.dispatch(_payload("🌮")) for _ in range(10)))
+
+    asyncio.run(burst())
+    assert len(seen) == 10
+    assert router.discord_helper.channel.fetches == 1
+    assert router.discord_helper.cache.stats()["kinds"]["message"]["coalesced"] == 9
+
+    async def counter(ctx):
+        await ctx.get_message(fresh=True)
+        await ctx.get_message(fresh=True)
+
+    router.register("counter", counter, ReactionInterest(emojis=lambda s: ["🌮"]))
+    asyncio.run(burst())
+    # one fresh fetch per reaction for the counting handler; the reader is served from the cache
+    assert router.discord_helper.channel.fetches == 11
+
+
+def test_global_settings_fallback(router):
+    calls = []
+    router.register(
+        "wdyctw",
+        _recorder(calls, "wdyctw"),
+        ReactionInterest("wdyctw", lambda s: s["reaction_emoji"] + s["import_emoji"]),
+    )
+
+    asyncio.run(router.dispatch(_payload("🇮")))
+
+    assert calls == [("wdyctw", "🇮")]
+
+
+def test_channel_interest_gets_every_emoji(router):
+    calls = []
+    router.register(
+        "suggestions",
+        _recorder(calls, "suggestions"),
+        ReactionInterest("suggestions", channels=lambda s: [c["id"] for c in s["channels"]]),
+    )
+
+    asyncio.run(router.dispatch(_payload("🤷", channel_id=20)))
+    asyncio.run(router.dispatch(_payload("🤷", channel_id=21)))
+
+    assert calls == [("suggestions", "🤷")]
+
+
+def test_events_filter(router):
+    calls = []
+    router.register("add", _recorder(calls, "add"), ReactionInterest(emojis=lambda s: ["🌮"]))
+    router.register(
+        "both",
+        _recorder(calls, "both"),
+        ReactionInterest(emojis=lambda s: ["🌮"], events=frozenset({REACTION_ADD, REACTION_REMOVE})),
+    )
+
+    asyncio.run(router.dispatch(_payload("🌮", event_type=REACTION_REMOVE)))
+
+    assert calls == [("both", "🌮")]
+
+
+def test_custom_emoji_matches_by_name(router):
+    calls = []
+    router.register("custom", _recorder(calls, "custom"), ReactionInterest("custom", lambda s: s["emoji"]))
+
+    asyncio.run(router.dispatch(_payload(discord.PartialEmoji(name="taco_party", id=1234))))
+
+    assert calls == [("custom", "<:taco_party:1234>")]
+
+
+def test_settings_write_rebuilds_index(router, fake_settings):
+    calls = []
+    router.register("tacos", _recorder(calls, "tacos"), ReactionInterest("tacos", lambda s: s["reaction_emojis"]))
+
+    asyncio.run(router.dispatch(_payload("🍕")))
+    builds = router.builds
+    asyncio.run(router.dispatch(_payload("🍕")))
+    assert router.builds == builds
+
+    fake_settings.sections[(1, "tacos")] = {"reaction_emojis": ["🍕"]}
+    SettingsDatabase.cache.invalidate(1, "tacos")
+    asyncio.run(router.dispatch(_payload("🍕")))
+
+    assert calls == [("tacos", "🍕")]
+
+
+def test_failing_handler_is_isolated(router):
+    calls = []
+    router.register("bad", _recorder(calls, "bad", fail=True), ReactionInterest(emojis=lambda s: ["🌮"]))
+    router.register("good", _recorder(calls, "good"), ReactionInterest(emojis=lambda s: ["🌮"]))
+
+    asyncio.run(router.dispatch(_payload("🌮")))
+
+    assert sorted(name for name, _ in calls) == ["bad", "good"]
+    stats = router.stats()["handlers"]
+    assert stats["bad"]["errors"] == 1
+    assert stats["good"]["errors"] == 0
+
+
+def test_direct_messages_are_ignored(router):
+    calls = []
+    router.register("any", _recorder(calls, "any"), ReactionInterest(emojis=lambda s: ["🌮"]))
+
+    asyncio.run(router.dispatch(_payload("🌮", guild_id=None)))
+
+    assert calls == []
@@ -0,0 +1,181 @@
+"""Tests for the daily per-guild job scheduler in ``bot.lib.scheduler``.
+
+These tests cover:
+* a job running once per guild at the guild's local scheduled time
+* a job starting right away when the bot starts after today's scheduled time
+* the ``job_runs`` lease keeping a second process (or a restart) from repeating a day's run
+* a failed run being retried after ``retry_seconds``, and an unreachable database not skipping the day
+* disabled guilds (``schedule`` returning ``None``) never running
+"""
+
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+import pytest
+import pytz
+from bot.lib.scheduler import Scheduler
+
+CHICAGO = pytz.timezone("America/Chicago")
+
+
+class FakeClock:
+    def __init__(self, now: datetime.datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime.datetime:
+        return self.now
+
+    def advance(self, **kwargs) -> None:
+        self.now = self.now + datetime.timedelta(**kwargs)
+
+
+class FakeJobsDatabase:
+    """In-memory ``job_runs``: one lease per (job, guild), claimable for a new run key or after failure."""
+
+    def __init__(self):
+        self.runs = {}
+        self.unavailable = False
+
+    def acquire_lease(self, job, guildId, runKey, owner, leaseSeconds):
+        if self.unavailable:
+            return None
+        current = self.runs.get((job, guildId))
+        if current and current["run_key"] == runKey and current["status"] != "failed":
+            return False
+        self.runs[(job, guildId)] = {"run_key": runKey, "status": "running", "owner": owner}
+        return True
+
+    def release_lease(self, job, guildId, runKey, owner, succeeded):
+        current = self.runs.get((job, guildId))
+        if current and current["run_key"] == runKey and current["owner"] == owner:
+            current["status"] = "done" if succeeded else "failed"
+
+
+def _utc(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=pytz.utc)
+
+
+@pytest.fixture
+def clock():
+    # 2024-03-01 10:00 UTC is 04:00 in Chicago
+    return FakeClock(_utc(2024, 3, 1, 10, 0))
+
+
+@pytest.fixture
+def jobs_db():
+    return FakeJobsDatabase()
+
+
+@pytest.fixture
+def make_scheduler(clock, jobs_db):
+    def factory(guild_ids=(1,), owner="host:1") -> Scheduler:
+        bot = SimpleNamespace(guilds=[SimpleNamespace(id=gid) for gid in guild_ids])
+        scheduler = Scheduler(bot, clock=clock)
+        scheduler.jobs_db = jobs_db
+        scheduler.owner = owner
+        scheduler.retry_seconds = 60
+        scheduler.log = SimpleNamespace(info=lambda *a: None, warn=lambda *a: None, error=lambda *a: None)
+        return scheduler
+
+    return factory
+
+
+def _recorder(calls, fail=False):
+    async def callback(guildId, day):
+        calls.append((guildId, day))
+        if fail:
+            raise RuntimeError("discord is down")
+
+    return callback
+
+
+def test_runs_once_at_local_time(make_scheduler, clock):
+    calls = []
+    scheduler = make_scheduler()
+    scheduler.max_sleep_seconds = 86400
+    scheduler.add_daily("birthday", _recorder(calls), lambda gid: (datetime.time(6, 0), CHICAGO))
+
+    delay = asyncio.run(scheduler.run_pending())
+    assert calls == []
+    assert delay == pytest.approx(2 * 3600)
+
+    clock.advance(hours=2)
+    asyncio.run(scheduler.run_pending())
+    asyncio.run(scheduler.run_pending())
+    assert calls == [(1, datetime.date(2024, 3, 1))]
+
+    # next due tomorrow at 06:00 local
+    assert scheduler.next_run("birthday", 1) == CHICAGO.localize(datetime.datetime(2024, 3, 2, 6, 0))
+
+
+def test_runs_right_away_when_started_late(make_scheduler):
+    calls = []
+    scheduler = make_scheduler(guild_ids=(1, 2))
+    scheduler.add_daily("birthday", _recorder(calls), lambda gid: (datetime.time(0, 0), CHICAGO))
+
+    asyncio.run(scheduler.run_pending())
+
+    assert sorted(calls) == [(1, datetime.date(2024, 3, 1)), (2, datetime.date(2024, 3, 1))]
+    assert scheduler.stats()["runs"] == 2
+
+
+def test_lease_prevents_repeat_run_across_processes(make_scheduler):
+    calls = []
+    first = make_scheduler(owner="host:1")
+    second = make_scheduler(owner="host:2")
+    for scheduler in (first, second):
+        scheduler.add_daily("birthday", _recorder(calls), lambda gid: (datetime.time(0, 0), CHICAGO))
+
+    asyncio.run(first.run_pending())
+    asyncio.run(second.run_pending())
+    # a restart has no in-memory state but still sees the lease
+    restarted = make_scheduler(owner="host:3")
+    restarted.add_daily("birthday", _recorder(calls), lambda gid: (datetime.time(0, 0), CHICAGO))
+    assert asyncio.run(restarted.run_now("birthday", 1)) is False
+
+    assert len(calls) == 1
+    assert second.stats()["skipped"] == 1
+
+
+def test_failed_run_is_retried(make_scheduler, clock):
+    calls = []
+    scheduler = make_scheduler()
+    scheduler.add_daily("birthday", _recorder(calls, fail=True), lambda gid: (datetime.time(0, 0), CHICAGO))
+
+    asyncio.run(scheduler.run_pending())
+    asyncio.run(scheduler.run_pending())
+    assert len(calls) == 1
+    assert scheduler.stats()["failures"] == 1
+
+    clock.advance(seconds=61)
+    asyncio.run(scheduler.run_pending())
+    assert len(calls) == 2
+
+
+def test_unavailable_database_does_not_skip_the_day(make_scheduler, jobs_db, clock):
+    calls = []
+    scheduler = make_scheduler()
+    scheduler.add_daily("birthday", _recorder(calls), lambda gid: (datetime.time(0, 0), CHICAGO))
+
+    jobs_db.unavailable = True
+    asyncio.run(scheduler.run_pending())
+    assert calls == []
+
+    jobs_db.unavailable = False
+    clock.advance(seconds=61)
+    asyncio.run(scheduler.run_pending())
+    assert calls == [(1, datetime.date(2024, 3, 1))]
+
+
+def test_disabled_guild_never_runs(make_scheduler):
+    calls = []
+    scheduler = make_scheduler(guild_ids=(1, 2))
+    scheduler.add_daily(
+        "birthday", _recorder(calls), lambda gid: (datetime.time(0, 0), CHICAGO) if gid == 2 else None
+    )
+
+    asyncio.run(scheduler.run_pending())
+
+    assert calls == [(2, datetime.date(2024, 3, 1))]
+    assert scheduler.next_run("birthday", 1) is None
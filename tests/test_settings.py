@@ -0,0 +1,102 @@
+"""Tests for the process-wide ``Settings`` registry.
+
+These tests cover:
+* ``Settings()`` returning one shared instance per process
+* ``reload()`` re-reading the environment and language files in place, keeping guild string mappings
+* readers never seeing an empty string table while ``reload()`` runs
+* ``reset()`` forcing a fresh load on the next construction
+* read-only language string tables and ``get_string`` fallbacks
+"""
+
+import threading
+
+import pytest
+from bot.lib.settings import Settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    Settings.reset()
+    yield
+    Settings.reset()
+
+
+def test_settings_is_shared_instance():
+    first = Settings()
+    second = Settings()
+    assert first is second
+    assert first.strings is second.strings
+
+
+def test_settings_loads_manifest_and_strings():
+    settings = Settings()
+    assert settings.name
+    assert "en-us" in settings.languages
+    assert "en-us" in settings.strings
+
+
+def test_language_strings_are_read_only():
+    settings = Settings()
+    with pytest.raises(TypeError):
+        settings.strings["en-us"]["first_message_reason"] = "changed"  # type: ignore[index]
+
+
+def test_reload_rereads_environment(monkeypatch):
+    settings = Settings()
+    monkeypatch.setenv("LOG_LEVEL", "ERROR")
+    settings.reload()
+    assert Settings() is settings
+    assert settings.log_level == "ERROR"
+
+
+def test_reload_keeps_guild_strings():
+    settings = Settings()
+    settings.set_guild_strings(12345)
+    settings.reload()
+    assert settings.strings["12345"] is settings.strings[settings.language]
+
+
+def test_get_string_during_reload():
+    settings = Settings()
+    key = "first_message_reason"
+    expected = settings.get_string(0, key)
+    errors = []
+    stop = threading.Event()
+
+    def read():
+        while not stop.is_set():
+            try:
+                assert settings.get_string(0, key) == expected
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+                return
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for _ in range(20):
+        settings.reload()
+    stop.set()
+    reader.join()
+    assert errors == []
+
+
+def test_reset_creates_new_instance():
+    first = Settings()
+    Settings.reset()
+    second = Settings()
+    assert first is not second
+
+
+def test_get_string_falls_back_to_default_language():
+    settings = Settings()
+    key = "first_message_reason"
+    expected = settings.strings[settings.language][key]
+    assert settings.get_string(12345, key) == expected
+    settings.set_guild_strings(12345)
+    assert settings.get_string(12345, key) == expected
+
+
+def test_get_string_unknown_key_returns_key():
+    settings = Settings()
+    assert settings.get_string(0, "this_key_does_not_exist") == "this_key_does_not_exist"
+    assert settings.get_string(0, "") == ""
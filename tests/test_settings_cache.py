@@ -0,0 +1,148 @@
+"""Tests for the cached ``SettingsDatabase.get_settings`` read path.
+
+These tests cover:
+* cache hits avoiding ``find_one`` round-trips
+* negative caching of missing sections (the guild -> guild 0 fallback)
+* TTL expiry and explicit invalidation from ``add_settings`` / ``set_setting``
+* ``set_setting`` keeping other keys written since the section was cached
+* a read racing a write not caching the value read before the write
+* hit / miss counters
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from bot.lib.mongodb.settings import SettingsCache, SettingsDatabase
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSettingsCollection:
+    def __init__(self, docs=None):
+        self.docs = docs or {}
+        self.find_calls = 0
+        self.update_calls = 0
+
+    def find_one(self, flt):
+        self.find_calls += 1
+        return self.docs.get((flt["guild_id"], flt["name"]))
+
+    def update_one(self, flt, update, upsert=False):
+        self.update_calls += 1
+        doc = self.docs.setdefault((flt["guild_id"], flt["name"]), {})
+        for field, value in update["$set"].items():
+            if field.startswith("settings."):
+                doc.setdefault("settings", {})[field[len("settings.") :]] = value
+            else:
+                doc[field] = value
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def db(monkeypatch, clock):
+    monkeypatch.setattr(SettingsDatabase, "cache", SettingsCache(ttl=60, clock=clock))
+    database = SettingsDatabase()
+    collection = FakeSettingsCollection({("1", "tacos"): {"settings": {"reaction_count": 1}}})
+    database.connection = SimpleNamespace(settings=collection)  # type: ignore
+    database.client = object()  # type: ignore[assignment]
+    return database
+
+
+def test_get_settings_cache_hit_skips_database(db):
+    assert db.get_settings(1, "tacos") == {"reaction_count": 1}
+    assert db.get_settings(1, "tacos") == {"reaction_count": 1}
+    assert db.connection.settings.find_calls == 1
+    stats = db.cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_get_settings_returns_copy(db):
+    first = db.get_settings(1, "tacos")
+    first["reaction_count"] = 99
+    assert db.get_settings(1, "tacos") == {"reaction_count": 1}
+
+
+def test_missing_section_is_negatively_cached(db):
+    assert db.get_settings(2, "tacos") is None
+    assert db.get_settings(2, "tacos") is None
+    assert db.connection.settings.find_calls == 1
+    assert db.cache.stats()["negative_hits"] == 1
+
+
+def test_entries_expire_after_ttl(db, clock):
+    db.get_settings(1, "tacos")
+    clock.now += 61
+    db.get_settings(1, "tacos")
+    assert db.connection.settings.find_calls == 2
+
+
+def test_add_settings_invalidates_entry(db):
+    assert db.get_settings(3, "tacos") is None
+    db.add_settings(3, "tacos", {"reaction_count": 5})
+    assert db.get_settings(3, "tacos") == {"reaction_count": 5}
+    assert db.cache.stats()["invalidations"] == 1
+
+
+def test_set_setting_invalidates_entry(db):
+    db.get_settings(1, "tacos")
+    db.set_setting(1, "tacos", "reaction_count", 7)
+    assert db.get_settings(1, "tacos") == {"reaction_count": 7}
+
+
+def test_set_setting_keeps_keys_written_elsewhere(db):
+    db.get_settings(1, "tacos")
+    # another process writes a key while the cached copy is still fresh
+    db.connection.settings.docs[("1", "tacos")]["settings"]["max_gift_tacos"] = 10
+    db.set_setting(1, "tacos", "reaction_count", 7)
+    assert db.get_settings(1, "tacos") == {"reaction_count": 7, "max_gift_tacos": 10}
+
+
+def test_set_setting_creates_missing_section(db):
+    db.set_setting(4, "tacos", "reaction_count", 3)
+    assert db.get_settings(4, "tacos") == {"reaction_count": 3}
+
+
+def test_read_racing_a_write_is_not_cached(db):
+    collection = db.connection.settings
+    original_find_one = collection.find_one
+
+    def find_one_then_write(flt):
+        # the value is read, then another thread writes before the reader stores it
+        doc = original_find_one(flt)
+        db.cache.invalidate(1, "tacos")
+        collection.docs[("1", "tacos")] = {"settings": {"reaction_count": 2}}
+        return doc
+
+    collection.find_one = find_one_then_write
+    assert db.get_settings(1, "tacos") == {"reaction_count": 1}
+    collection.find_one = original_find_one
+    assert db.get_settings(1, "tacos") == {"reaction_count": 2}
+
+
+def test_invalidate_whole_guild(clock):
+    cache = SettingsCache(ttl=60, clock=clock)
+    cache.set(1, "tacos", {"a": 1})
+    cache.set(1, "birthday", None)
+    cache.set(2, "tacos", {"a": 2})
+    cache.invalidate(1)
+    assert cache.get(1, "tacos") == (False, None)
+    assert cache.get(1, "birthday") == (False, None)
+    assert cache.get(2, "tacos") == (True, {"a": 2})
+
+
+def test_disabled_cache_always_misses(clock):
+    cache = SettingsCache(ttl=0, clock=clock)
+    cache.set(1, "tacos", {"a": 1})
+    assert cache.get(1, "tacos") == (False, None)
+    assert cache.stats()["entries"] == 0
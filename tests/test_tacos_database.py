@@ -0,0 +1,102 @@
+"""Tests for taco balance updates in ``bot.lib.mongodb.tacos.TacosDatabase``.
+
+These tests cover:
+* ``add_tacos`` / ``remove_tacos`` issuing a single upserting ``find_one_and_update``
+* balances clamped at zero by the update pipeline
+* ``add_tacos_bulk`` merging repeated users into one ``bulk_write``
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from bot.lib.mongodb.tacos import TacosDatabase
+from pymongo import ReturnDocument
+
+
+def _evaluate(expression, document):
+    """Evaluate the small subset of aggregation expressions the balance pipeline uses."""
+    if isinstance(expression, str) and expression.startswith("$"):
+        return document.get(expression[1:])
+    if isinstance(expression, dict):
+        ((operator, args),) = expression.items()
+        values = [_evaluate(arg, document) for arg in args]
+        if operator == "$ifNull":
+            return values[0] if values[0] is not None else values[1]
+        if operator == "$add":
+            return sum(values)
+        if operator == "$max":
+            return max(values)
+        raise AssertionError(f"unexpected operator {operator}")
+    return expression
+
+
+class FakeTacosCollection:
+    def __init__(self):
+        self.documents = {}
+        self.calls = []
+
+    def _apply(self, query, pipeline):
+        key = (query["guild_id"], query["user_id"])
+        document = self.documents.setdefault(key, dict(query))
+        for stage in pipeline:
+            for name, expression in stage["$set"].items():
+                document[name] = _evaluate(expression, document)
+        return document
+
+    def find_one_and_update(self, query, pipeline, projection=None, upsert=False, return_document=None):
+        self.calls.append("find_one_and_update")
+        assert upsert is True
+        assert return_document == ReturnDocument.AFTER
+        return {"count": self._apply(query, pipeline)["count"]}
+
+    def bulk_write(self, requests, ordered=True):
+        self.calls.append("bulk_write")
+        for request in requests:
+            self._apply(request._filter, request._doc)
+        return SimpleNamespace(matched_count=0, upserted_count=len(requests))
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = TacosDatabase()
+    db.connection = SimpleNamespace(tacos=FakeTacosCollection())
+    db.client = object()
+    monkeypatch.setattr(db, "log", lambda **kwargs: None)
+    return db
+
+
+def test_add_tacos_upserts_in_one_round_trip(db):
+    assert db.add_tacos(1, 2, 5) == 5
+    assert db.add_tacos(1, 2, 3) == 8
+    assert db.connection.tacos.calls == ["find_one_and_update", "find_one_and_update"]
+    assert db.connection.tacos.documents[("1", "2")] == {"guild_id": "1", "user_id": "2", "count": 8}
+
+
+def test_remove_tacos_clamps_at_zero(db):
+    db.add_tacos(1, 2, 3)
+    assert db.remove_tacos(1, 2, 10) == 0
+    assert db.connection.tacos.documents[("1", "2")]["count"] == 0
+
+
+def test_negative_add_clamps_at_zero(db):
+    assert db.add_tacos(1, 3, -4) == 0
+
+
+def test_remove_negative_count_is_ignored(db):
+    assert db.remove_tacos(1, 2, -1) == 0
+    assert db.connection.tacos.calls == []
+
+
+def test_bulk_merges_users_into_one_write(db):
+    db.add_tacos(1, 2, 1)
+    written = db.add_tacos_bulk(1, [(2, 5), (3, 2), (2, -1), (4, 0)])
+    assert written == 2
+    assert db.connection.tacos.calls == ["find_one_and_update", "bulk_write"]
+    assert db.connection.tacos.documents[("1", "2")]["count"] == 5
+    assert db.connection.tacos.documents[("1", "3")]["count"] == 2
+    assert ("1", "4") not in db.connection.tacos.documents
+
+
+def test_bulk_with_nothing_to_do_skips_the_database(db):
+    assert db.add_tacos_bulk(1, {}) == 0
+    assert db.connection.tacos.calls == []
@@ -0,0 +1,129 @@
+"""Tests for the bulk member import behind the ``user_lookup`` cog.
+
+These tests cover:
+* ``TrackingDatabase.import_discord_users`` writing chunked unordered ``bulk_write`` upserts
+* members whose ``content_hash`` is unchanged being skipped, and the hash map updated in place
+* a repeated ``on_guild_available`` (reconnect) writing nothing when no member changed
+* repeated ``on_member_update`` events for one member collapsing into one write of the latest state
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from bot.cogs import user_lookup
+from bot.lib.models.DiscordUser import DiscordUser
+from bot.lib.mongodb.tracking import TrackingDatabase
+
+
+class FakeUsersCollection:
+    def __init__(self):
+        self.docs = {}
+        self.bulk_calls = []
+
+    def bulk_write(self, requests, ordered=True):
+        assert ordered is False
+        self.bulk_calls.append(len(requests))
+        for request in requests:
+            key = (request._filter["guild_id"], request._filter["user_id"])
+            self.docs[key] = dict(request._doc["$set"])
+
+    def find(self, query, projection=None):
+        return [
+            {"user_id": doc["user_id"], "content_hash": doc["content_hash"]}
+            for (guild_id, _), doc in self.docs.items()
+            if guild_id == query["guild_id"]
+        ]
+
+
+@pytest.fixture
+def tracking_db():
+    db = object.__new__(TrackingDatabase)
+    db._module = "tracking"
+    db._class = "TrackingDatabase"
+    db.client = object()
+    db.connection = SimpleNamespace(users=FakeUsersCollection())
+    db.log = lambda *args, **kwargs: None
+    return db
+
+
+def _user(user_id, name="taco", guild_id=1):
+    return DiscordUser({"id": str(user_id), "guild_id": str(guild_id), "name": name})
+
+
+def _member(user_id, name="taco"):
+    return SimpleNamespace(id=user_id, name=name, guild=SimpleNamespace(id=1, name="guild"))
+
+
+def test_import_chunks_and_skips_unchanged(tracking_db):
+    users = tracking_db.connection.users
+    hashes = {}
+
+    assert tracking_db.import_discord_users(1, [_user(i) for i in range(5)], hashes, chunk_size=2) == 5
+    assert users.bulk_calls == [2, 2, 1]
+    assert set(hashes) == {str(i) for i in range(5)}
+    assert users.docs[("1", "3")]["content_hash"] == hashes["3"]
+
+    changed = [_user(i, name="renamed" if i == 4 else "taco") for i in range(5)]
+    assert tracking_db.import_discord_users(1, changed, hashes, chunk_size=2) == 1
+    assert users.bulk_calls[-1] == 1
+    assert users.docs[("1", "4")]["name"] == "renamed"
+
+
+def test_hash_ignores_write_timestamp(tracking_db):
+    payload = _user(1).to_dict()
+    stamped = dict(payload, timestamp=123, content_hash="x")
+    assert TrackingDatabase.discord_user_hash(payload) == TrackingDatabase.discord_user_hash(stamped)
+
+
+@pytest.fixture
+def cog(tracking_db, monkeypatch):
+    monkeypatch.setattr(
+        user_lookup.DiscordUser,
+        "fromUser",
+        staticmethod(lambda m: _user(m.id, name=m.name, guild_id=m.guild.id)),
+    )
+    cog = object.__new__(user_lookup.UserLookupCog)
+    cog._module = "user_lookup"
+    cog._class = "UserLookupCog"
+    noop = lambda *args, **kwargs: None  # noqa: E731
+    cog.log = SimpleNamespace(debug=noop, info=noop, warn=noop, error=noop)
+    cog.tracking_db = tracking_db
+    cog.settings = SimpleNamespace(settings_db=SimpleNamespace(set_setting=noop))
+    cog.get_cog_settings = lambda guildId=0: {"full_import_enabled": True}
+    cog.update_debounce = 0
+    cog._user_hashes = {}
+    cog._pending_updates = {}
+    cog._flush_task = None
+    return cog
+
+
+def test_reconnect_import_writes_only_changes(cog, tracking_db):
+    members = [_member(i) for i in range(3)]
+    guild = SimpleNamespace(id=1, name="guild", members=members)
+    users = tracking_db.connection.users
+
+    async def run():
+        await cog.on_guild_available(guild)
+        await cog.on_guild_available(guild)
+        members[1].name = "renamed"
+        await cog.on_guild_available(guild)
+
+    asyncio.run(run())
+
+    assert users.bulk_calls == [3, 1]
+    assert users.docs[("1", "1")]["name"] == "renamed"
+
+
+def test_member_updates_are_debounced(cog, tracking_db):
+    users = tracking_db.connection.users
+
+    async def run():
+        for name in ("a", "b", "c"):
+            await cog.on_member_update(_member(7), _member(7, name=name))
+        await cog._flush_task
+
+    asyncio.run(run())
+
+    assert users.bulk_calls == [1]
+    assert users.docs[("1", "7")]["name"] == "c"
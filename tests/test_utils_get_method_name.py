@@ -0,0 +1,35 @@
+"""Tests for ``utils.get_method_name`` call-site attribution."""
+
+from bot.lib import utils
+
+
+def _caller_of_helper() -> str:
+    return _helper()
+
+
+def _helper() -> str:
+    return utils.get_method_name(1)
+
+
+class Sample:
+    def method(self) -> str:
+        return utils.get_method_name()
+
+    async def listener(self) -> str:
+        return utils.get_method_name()
+
+
+def test_returns_current_function_name():
+    assert utils.get_method_name() == "test_returns_current_function_name"
+
+
+def test_returns_method_name_inside_class():
+    assert Sample().method() == "method"
+
+
+async def test_returns_coroutine_name():
+    assert await Sample().listener() == "listener"
+
+
+def test_depth_returns_caller_name():
+    assert _caller_of_helper() == "_caller_of_helper"
@@ -0,0 +1,129 @@
+"""Tests for the ``WriteBuffer`` used by ``TrackingDatabase`` for append-only tracking collections.
+
+These tests cover:
+* one ``insert_many`` per collection per batch
+* flush on close
+* spilling to a local file while MongoDB is unreachable and replaying after the next successful write
+* a spill file left by a previous process being replayed
+* rejected documents (``BulkWriteError``) being counted as failed rather than spilled
+* ``TrackingDatabase`` tracking methods queueing instead of writing inline
+"""
+
+import json
+
+from bot.lib.mongodb import tracking
+from bot.lib.mongodb.write_buffer import WriteBuffer
+from pymongo.errors import BulkWriteError
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.writes = []
+        self.down = False
+        self.reject = False
+
+    def __call__(self, collection, documents):
+        if self.down:
+            raise ConnectionError("mongo is down")
+        if self.reject:
+            raise BulkWriteError({"writeErrors": []})
+        self.writes.append((collection, list(documents)))
+
+
+def _doc(i: int) -> dict:
+    return {"guild_id": "1", "n": i}
+
+
+def test_batches_are_grouped_by_collection():
+    writer = RecordingWriter()
+    buffer = WriteBuffer(writer=writer, batch_size=4, flush_interval=60)
+    buffer.add("commands_usage", _doc(0))
+    buffer.add("system_actions", _doc(1))
+    buffer.add("commands_usage", _doc(2))
+    buffer.add("system_actions", _doc(3))
+    assert buffer.flush(timeout=5)
+    buffer.close()
+
+    assert sorted(writer.writes) == [
+        ("commands_usage", [_doc(0), _doc(2)]),
+        ("system_actions", [_doc(1), _doc(3)]),
+    ]
+    assert buffer.stats()["written"] == 4
+
+
+def test_close_flushes_pending_documents():
+    writer = RecordingWriter()
+    buffer = WriteBuffer(writer=writer, batch_size=100, flush_interval=60)
+    buffer.add("photo_posts", _doc(0))
+    buffer.close()
+
+    assert writer.writes == [("photo_posts", [_doc(0)])]
+    assert not buffer.add("photo_posts", _doc(1))
+
+
+def test_spills_while_unreachable_and_replays(tmp_path):
+    spill = tmp_path / "tracking.jsonl"
+    writer = RecordingWriter()
+    buffer = WriteBuffer(writer=writer, batch_size=1, flush_interval=60, spill_path=str(spill))
+
+    writer.down = True
+    buffer.add("user_join_leave", _doc(0))
+    assert buffer.flush(timeout=5)
+    assert [json.loads(line) for line in spill.read_text().splitlines()] == [
+        {"collection": "user_join_leave", "document": _doc(0)}
+    ]
+
+    writer.down = False
+    buffer.add("user_join_leave", _doc(1))
+    buffer.close()
+
+    assert writer.writes == [("user_join_leave", [_doc(1)]), ("user_join_leave", [_doc(0)])]
+    assert not spill.exists()
+    stats = buffer.stats()
+    assert (stats["spilled"], stats["replayed"], stats["failed"]) == (1, 1, 0)
+
+
+def test_spill_from_previous_process_is_replayed(tmp_path):
+    spill = tmp_path / "tracking.jsonl"
+    spill.write_text(json.dumps({"collection": "system_actions", "document": _doc(9)}) + "\n")
+    writer = RecordingWriter()
+    buffer = WriteBuffer(writer=writer, batch_size=1, flush_interval=60, spill_path=str(spill))
+
+    buffer.add("system_actions", _doc(0))
+    buffer.close()
+
+    assert writer.writes == [("system_actions", [_doc(0)]), ("system_actions", [_doc(9)])]
+
+
+def test_rejected_documents_are_not_spilled(tmp_path, capsys):
+    spill = tmp_path / "tracking.jsonl"
+    writer = RecordingWriter()
+    writer.reject = True
+    buffer = WriteBuffer(writer=writer, batch_size=1, flush_interval=60, spill_path=str(spill))
+
+    buffer.add("commands_usage", _doc(0))
+    buffer.close()
+
+    assert not spill.exists()
+    assert buffer.stats()["failed"] == 1
+    assert "rejected 1 commands_usage" in capsys.readouterr().err
+
+
+def test_tracking_methods_queue_documents(monkeypatch):
+    added = []
+
+    class FakeBuffer:
+        def add(self, collection, document):
+            added.append((collection, document))
+            return True
+
+    monkeypatch.setenv("WRITE_BUFFER_ENABLED", "true")
+    monkeypatch.setattr(tracking.WriteBuffer, "get_instance", classmethod(lambda cls: FakeBuffer()))
+    db = tracking.TrackingDatabase()
+    db.track_command_usage(guildId=1, channelId=2, userId=3, command="tacos", subcommand="give")
+    db.track_user_join_leave(guildId=1, userId=3, join=True)
+
+    assert [c for c, _ in added] == ["commands_usage", "user_join_leave"]
+    assert added[0][1]["command"] == "tacos"
+    assert added[1][1]["action"] == "JOIN"
+    assert db.connection is None